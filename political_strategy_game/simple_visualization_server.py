@@ -11,7 +11,6 @@ import asyncio
 from datetime import datetime
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
-import threading
 import time
 
 # Add the src directory to Python path
@@ -20,6 +19,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 try:
     from visualization.integrated_manager import IntegratedVisualizationManager
     from visualization.base import DataPoint
+    from visualization.serving import VisualizationPublisher, VisualizationHTTPServer
     BACKEND_AVAILABLE = True
 except Exception as e:
     print(f"Backend visualization system not available: {e}")
@@ -61,10 +61,10 @@ class VisualizationServer(BaseHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.end_headers()
     
-    def serve_html_page(self):
-        """Serve the live visualization HTML page."""
-        # Embedded HTML content instead of reading from file
-        html_content = '''<!DOCTYPE html>
+    @staticmethod
+    def html_page():
+        """Embedded live visualization HTML page."""
+        return '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -345,12 +345,14 @@ class VisualizationServer(BaseHTTPRequestHandler):
     </script>
 </body>
 </html>'''
-        
+    
+    def serve_html_page(self):
+        """Serve the live visualization HTML page."""
         self.send_response(200)
         self.send_header('Content-type', 'text/html')
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(html_content.encode())
+        self.wfile.write(self.html_page().encode())
     
     def serve_status(self):
         """Serve system status."""
@@ -464,6 +466,8 @@ class VisualizationServerInstance:
         self.timeline_data = {}
         self.dashboard_data = {}
         self.memory_data = {}
+        self.publisher = None
+        self.http_server = None
         self.running = False
     
     async def initialize_backend(self):
@@ -523,18 +527,9 @@ class VisualizationServerInstance:
                     )
                 ]
                 
-                # Update components
+                # Update components; the publisher re-renders them on its own cadence
                 await self.visualization_manager.update_all_components(sample_data)
                 
-                # Fetch rendered data
-                if 'api_network' in self.visualization_manager.components:
-                    rendered = await self.visualization_manager.components['api_network'].render()
-                    self.network_data = rendered.get('data', {})
-                
-                if 'api_timeline' in self.visualization_manager.components:
-                    rendered = await self.visualization_manager.components['api_timeline'].render()
-                    self.timeline_data = rendered.get('data', {})
-                
                 counter += 1
                 await asyncio.sleep(3)  # Update every 3 seconds
                 
@@ -542,6 +537,27 @@ class VisualizationServerInstance:
                 print(f"Error generating data updates: {e}")
                 await asyncio.sleep(5)
     
+    async def serve(self, port=8000):
+        """Serve the backend through the cached async server in this event loop."""
+        if not await self.initialize_backend():
+            return False
+        
+        self.publisher = VisualizationPublisher(self.visualization_manager)
+        for channel in ('network', 'timeline', 'dashboard', 'memory'):
+            self.publisher.publish(channel, f'api_{channel}', 'data')
+        await self.publisher.refresh()
+        publisher_task = asyncio.create_task(self.publisher.run())
+        
+        self.http_server = VisualizationHTTPServer(self.publisher, host='', port=port)
+        self.http_server.add_static('/', VisualizationServer.html_page().encode())
+        try:
+            await self.http_server.serve_forever()
+        finally:
+            self.publisher.stop()
+            publisher_task.cancel()
+            await self.shutdown()
+        return True
+    
     async def shutdown(self):
         """Shutdown the backend."""
         self.running = False
@@ -554,32 +570,7 @@ import math
 # Global server instance
 server_instance = VisualizationServerInstance()
 
-def run_server():
-    """Run the HTTP server."""
-    print("🏛️ Political Strategy Game Visualization Server")
-    print("=" * 50)
-    
-    # Try to initialize backend
-    if BACKEND_AVAILABLE:
-        try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            # Initialize backend in background
-            def init_backend():
-                loop.run_until_complete(server_instance.initialize_backend())
-            
-            backend_thread = threading.Thread(target=init_backend)
-            backend_thread.daemon = True
-            backend_thread.start()
-            
-        except Exception as e:
-            print(f"Could not initialize backend: {e}")
-    
-    # Start HTTP server
-    server_address = ('', 8000)
-    httpd = HTTPServer(server_address, VisualizationServer)
-    
+def print_banner():
     print("🌐 Server running on http://localhost:8000")
     print("📊 Live dashboard: http://localhost:8000")
     print("📋 API status: http://localhost:8000/api/status")
@@ -588,20 +579,38 @@ def run_server():
     print("   - GET /api/timeline  (Political event data)")
     print("   - GET /api/dashboard (Political metrics)")
     print("   - GET /api/memory    (Memory browser data)")
+    print("   - GET /api/stream    (Server-sent snapshot and delta events)")
     print("=" * 50)
     print("🚀 Server started! Open http://localhost:8000 in your browser")
     print("💡 Click 'Connect' in the dashboard to receive live updates")
+
+def run_server():
+    """Run the HTTP server."""
+    print("🏛️ Political Strategy Game Visualization Server")
+    print("=" * 50)
+    
+    # With the backend available, serve cached payloads from a single asyncio loop
+    if BACKEND_AVAILABLE:
+        print_banner()
+        try:
+            if asyncio.run(server_instance.serve()):
+                return
+        except KeyboardInterrupt:
+            print("\n🛑 Shutting down server...")
+            print("✅ Server shut down cleanly")
+            return
+        except Exception as e:
+            print(f"Could not start backend server: {e}")
+    
+    # Fall back to sample data over http.server
+    server_address = ('', 8000)
+    httpd = HTTPServer(server_address, VisualizationServer)
+    print_banner()
     
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print("\n🛑 Shutting down server...")
-        
-        # Shutdown backend
-        if BACKEND_AVAILABLE and server_instance.visualization_manager:
-            loop = asyncio.get_event_loop()
-            loop.run_until_complete(server_instance.shutdown())
-        
         httpd.server_close()
         print("✅ Server shut down cleanly")
 
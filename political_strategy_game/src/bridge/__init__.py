@@ -105,8 +105,11 @@ class BridgeMessage:
     @classmethod
     def from_json(cls, json_str: str) -> 'BridgeMessage':
         """Deserialize message from JSON string."""
-        data = json.loads(json_str)
-        
+        return cls.from_dict(json.loads(json_str))
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'BridgeMessage':
+        """Build a message from its decoded header and payload."""
         header_data = data['header']
         header = MessageHeader(
             message_id=header_data['message_id'],
@@ -122,8 +125,64 @@ class BridgeMessage:
         return cls(header=header, payload=data['payload'])
 
 
+_UNSET = object()
+
+
+class TrackedState:
+    """
+    Change tracking for the state dataclasses.
+
+    Assigning a field after construction bumps the object's version and
+    records the field in its dirty set. Children of a ``GameState`` forward
+    the change to their owner, so the owner knows which children to visit
+    without walking the whole state. In-place edits of containers (appending
+    to a list, updating a dict) cannot be seen and must be reported with
+    ``touch``.
+    """
+    
+    _version = 0
+    _dirty = frozenset()
+    _owner = None  # (GameState, field name, list index) for children
+    
+    def __setattr__(self, name: str, value: Any):
+        current = self.__dict__.get(name, _UNSET)
+        object.__setattr__(self, name, value)
+        if current is not _UNSET and current is not value and name in self.__dataclass_fields__:
+            self._mark_dirty(name)
+    
+    @property
+    def version(self) -> int:
+        """Number of changes recorded since construction."""
+        return self._version
+    
+    def changed_fields(self) -> frozenset:
+        """Fields changed since the last ``clear_changes``."""
+        return frozenset(self._dirty)
+    
+    def touch(self, *field_names: str):
+        """Record in-place changes to the given container fields."""
+        for name in field_names:
+            if name not in self.__dataclass_fields__:
+                raise ValueError(f"{type(self).__name__} has no field {name!r}")
+            self._mark_dirty(name)
+    
+    def clear_changes(self):
+        """Forget recorded changes, typically once they have been synced."""
+        if self._dirty:
+            object.__setattr__(self, '_dirty', frozenset())
+    
+    def _mark_dirty(self, name: str):
+        if not isinstance(self._dirty, set):
+            object.__setattr__(self, '_dirty', set())
+        self._dirty.add(name)
+        object.__setattr__(self, '_version', self._version + 1)
+        if self._owner is not None:
+            owner, field, index = self._owner
+            owner._child_changed(field, index)
+
+
 @dataclass
-class TurnState:
+class TurnState(TrackedState):
     """Current turn state information."""
     turn_number: int
     civilization_id: str
@@ -137,7 +196,7 @@ class TurnState:
 
 
 @dataclass
-class AdvisorState:
+class AdvisorState(TrackedState):
     """Serializable advisor state for game engine."""
     advisor_id: str
     name: str
@@ -157,7 +216,7 @@ class AdvisorState:
 
 
 @dataclass
-class CivilizationState:
+class CivilizationState(TrackedState):
     """Serializable civilization state for game engine."""
     civilization_id: str
     name: str
@@ -176,14 +235,85 @@ class CivilizationState:
 
 
 @dataclass
-class GameState:
-    """Complete game state for synchronization."""
+class GameState(TrackedState):
+    """
+    Complete game state for synchronization.
+    
+    Besides its own dirty fields, the state keeps the ``(field, index)``
+    positions of children that changed since the last sync, which lets the
+    serializer build deltas from the changed objects alone.
+    """
     turn_state: TurnState
     civilizations: List[CivilizationState]
     advisors: List[AdvisorState]
     global_events: List[Dict[str, Any]]
     metadata: Dict[str, Any]
     
+    _dirty_children = frozenset()
+    _baseline = None  # Token of the snapshot this state was last synced to
+    
+    CHILD_FIELDS = ('turn_state', 'civilizations', 'advisors')
+    
+    def __post_init__(self):
+        for field in self.CHILD_FIELDS:
+            self._adopt(field)
+    
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        if name in self.CHILD_FIELDS and name in self._dirty:
+            self._adopt(name)
+    
+    @property
+    def baseline(self) -> Optional[str]:
+        """Token of the snapshot the recorded changes are relative to."""
+        return self._baseline
+    
+    def changed_children(self) -> frozenset:
+        """``(field, index)`` of children changed since the last ``clear_changes``."""
+        return frozenset(self._dirty_children)
+    
+    def touch(self, *field_names: str):
+        """Record in-place changes; touching a child list re-indexes its members."""
+        super().touch(*field_names)
+        for name in field_names:
+            if name in self.CHILD_FIELDS:
+                self._adopt(name)
+    
+    def clear_changes(self, baseline: Optional[str] = None):
+        """Forget recorded changes on the state and its changed children."""
+        if any(field in self._dirty for field in self.CHILD_FIELDS[1:]):
+            # Replaced lists may hold children with stale dirty sets
+            children = [self.turn_state, *self.civilizations, *self.advisors]
+        else:
+            children = [self._child(field, index) for field, index in self._dirty_children]
+        for child in children:
+            if child is not None:
+                child.clear_changes()
+        super().clear_changes()
+        if self._dirty_children:
+            object.__setattr__(self, '_dirty_children', frozenset())
+        object.__setattr__(self, '_baseline', baseline)
+    
+    def _adopt(self, field: str):
+        value = getattr(self, field)
+        if field == 'turn_state':
+            object.__setattr__(value, '_owner', (self, field, None))
+        else:
+            for index, child in enumerate(value):
+                object.__setattr__(child, '_owner', (self, field, index))
+    
+    def _child(self, field: str, index: Optional[int]) -> Optional[TrackedState]:
+        if index is None:
+            return getattr(self, field)
+        children = getattr(self, field)
+        return children[index] if index < len(children) else None
+    
+    def _child_changed(self, field: str, index: Optional[int]):
+        if not isinstance(self._dirty_children, set):
+            object.__setattr__(self, '_dirty_children', set())
+        self._dirty_children.add((field, index))
+        object.__setattr__(self, '_version', self._version + 1)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -236,8 +366,15 @@ class MessageFactory:
     """Factory for creating standardized bridge messages."""
     
     @staticmethod
-    def create_handshake(sender: str, api_version: str = "1.0") -> BridgeMessage:
-        """Create handshake message for connection establishment."""
+    def create_handshake(sender: str, api_version: str = "1.0",
+                         wire_options: Optional[Dict[str, Any]] = None) -> BridgeMessage:
+        """
+        Create handshake message for connection establishment.
+        
+        ``wire_options`` adds the wire format fields: the formats on offer in
+        the server's greeting, the requested format in a client's reply, and
+        the agreed format in the server's acknowledgment.
+        """
         header = MessageHeader(
             message_id=str(uuid.uuid4()),
             message_type=MessageType.HANDSHAKE,
@@ -262,6 +399,10 @@ class MessageFactory:
             }
         }
         
+        if wire_options:
+            payload["capabilities"].append("binary_frames")
+            payload.update(wire_options)
+        
         return BridgeMessage(header=header, payload=payload)
     
     @staticmethod
@@ -330,6 +471,25 @@ class MessageFactory:
         
         return BridgeMessage(header=header, payload=payload)
     
+    @staticmethod
+    def create_incremental_update(sender: str, update: Dict[str, Any]) -> BridgeMessage:
+        """Create incremental game state update message from a serialized update."""
+        header = MessageHeader(
+            message_id=str(uuid.uuid4()),
+            message_type=MessageType.INCREMENTAL_UPDATE,
+            timestamp=datetime.now(),
+            sender=sender,
+            recipient="game_engine",
+            priority=EventPriority.NORMAL
+        )
+        
+        payload = {
+            "update": update,
+            "sync_timestamp": datetime.now().isoformat()
+        }
+        
+        return BridgeMessage(header=header, payload=payload)
+    
     @staticmethod
     def create_political_event(sender: str, event: PoliticalEvent) -> BridgeMessage:
         """Create political event notification message."""
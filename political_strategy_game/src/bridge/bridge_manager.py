@@ -159,19 +159,22 @@ class GameEngineBridgeManager:
             
             # Create incremental update if possible
             incremental_update = None
-            if self.current_game_state:
+            if self.state_serializer.current_snapshot is not None:
                 incremental_update = self.state_serializer.create_incremental_update(game_state)
+            if incremental_update is None and self.state_serializer.current_checksum is None:
+                # Start change tracking from this state
+                self.state_serializer.serialize_full_state(game_state)
             
             # Update current state
             self.current_game_state = game_state
             
-            # Broadcast full state sync if no incremental update
-            if incremental_update is None:
-                self.bridge.queue_game_state_sync(game_state)
-            else:
-                # TODO: Implement incremental update broadcasting
-                # For now, send full state
-                self.bridge.queue_game_state_sync(game_state)
+            # Clients that negotiated state deltas receive the incremental
+            # update; everyone else gets a full state sync
+            self.bridge.queue_game_state_sync(
+                game_state,
+                checksum=self.state_serializer.current_checksum,
+                update=incremental_update.to_dict() if incremental_update is not None else None
+            )
             
             # End performance timing
             if self.performance_profiler:
@@ -3,16 +3,22 @@ Political Event Broadcasting System
 
 This module handles real-time broadcasting of political events to game engines,
 including event filtering, subscription management, and event replay capabilities.
+
+Events are routed through a ``SubscriptionIndex`` rather than by testing
+every subscription, so broadcast cost follows the number of plausible
+subscribers instead of the total number of subscriptions.
 """
 
 import asyncio
+import itertools
 import logging
 import threading
 import time
-from typing import Dict, List, Optional, Callable, Any, Set
+from typing import Dict, List, Optional, Callable, Any, Set, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from queue import Queue, Empty, PriorityQueue
 from collections import defaultdict
 
@@ -34,6 +40,34 @@ class EventCategory(Enum):
     SYSTEM = "system"
 
 
+# Lowest to highest; a subscription's ``min_priority`` is a cutoff in this order
+PRIORITY_ORDER = (EventPriority.LOW, EventPriority.NORMAL, EventPriority.HIGH, EventPriority.CRITICAL)
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITY_ORDER)}
+
+
+@lru_cache(maxsize=1024)
+def determine_event_category(event_type: str) -> EventCategory:
+    """Determine event category from event type."""
+    event_type = event_type.lower()
+    
+    if "advisor" in event_type or "loyalty" in event_type:
+        return EventCategory.ADVISOR
+    elif "crisis" in event_type or "emergency" in event_type:
+        return EventCategory.CRISIS
+    elif "conspiracy" in event_type or "coup" in event_type:
+        return EventCategory.CONSPIRACY
+    elif "diplomatic" in event_type or "negotiation" in event_type:
+        return EventCategory.DIPLOMATIC
+    elif "economic" in event_type or "trade" in event_type:
+        return EventCategory.ECONOMIC
+    elif "military" in event_type or "war" in event_type:
+        return EventCategory.MILITARY
+    elif "social" in event_type or "public" in event_type:
+        return EventCategory.SOCIAL
+    else:
+        return EventCategory.SYSTEM
+
+
 class SubscriptionFilter:
     """Event subscription filter configuration."""
     
@@ -42,28 +76,49 @@ class SubscriptionFilter:
                  severities: Optional[List[str]] = None,
                  civilizations: Optional[List[str]] = None,
                  participants: Optional[List[str]] = None,
-                 keywords: Optional[List[str]] = None):
+                 keywords: Optional[List[str]] = None,
+                 min_priority: Optional[EventPriority] = None,
+                 predicate: Optional[Callable[[PoliticalEvent], bool]] = None):
         """
         Initialize subscription filter.
         
+        Filters are indexed when subscribed; subscribe again after changing
+        one.
+        
         Args:
             categories: Event categories to include
             severities: Event severities to include ("minor", "moderate", "major", "critical")
             civilizations: Civilization IDs to include
             participants: Participant IDs to include (advisor/civilization IDs)
             keywords: Keywords to match in event titles/descriptions
+            min_priority: Lowest broadcast priority to include
+            predicate: Custom check, run after all other criteria pass
         """
         self.categories = categories or []
         self.severities = severities or []
         self.civilizations = civilizations or []
         self.participants = participants or []
         self.keywords = keywords or []
+        self.min_priority = min_priority
+        self.predicate = predicate
     
-    def matches(self, event: PoliticalEvent) -> bool:
-        """Check if event matches this filter."""
+    def matches(self, event: PoliticalEvent, priority: Optional[EventPriority] = None,
+                category: Optional[EventCategory] = None) -> bool:
+        """
+        Check if event matches this filter.
+        
+        The priority cutoff only applies when the broadcast ``priority`` is
+        known. ``category`` can be passed when the caller already
+        determined it.
+        """
+        # Check priority
+        if self.min_priority is not None and priority is not None:
+            if PRIORITY_RANK[priority] < PRIORITY_RANK[self.min_priority]:
+                return False
+        
         # Check categories
         if self.categories:
-            event_category = self._determine_event_category(event)
+            event_category = category or self._determine_event_category(event)
             if event_category not in self.categories:
                 return False
         
@@ -86,28 +141,15 @@ class SubscriptionFilter:
             if not any(keyword.lower() in text for keyword in self.keywords):
                 return False
         
+        # Check custom predicate
+        if self.predicate is not None and not self.predicate(event):
+            return False
+        
         return True
     
     def _determine_event_category(self, event: PoliticalEvent) -> EventCategory:
         """Determine event category from event type."""
-        event_type = event.event_type.lower()
-        
-        if "advisor" in event_type or "loyalty" in event_type:
-            return EventCategory.ADVISOR
-        elif "crisis" in event_type or "emergency" in event_type:
-            return EventCategory.CRISIS
-        elif "conspiracy" in event_type or "coup" in event_type:
-            return EventCategory.CONSPIRACY
-        elif "diplomatic" in event_type or "negotiation" in event_type:
-            return EventCategory.DIPLOMATIC
-        elif "economic" in event_type or "trade" in event_type:
-            return EventCategory.ECONOMIC
-        elif "military" in event_type or "war" in event_type:
-            return EventCategory.MILITARY
-        elif "social" in event_type or "public" in event_type:
-            return EventCategory.SOCIAL
-        else:
-            return EventCategory.SYSTEM
+        return determine_event_category(event.event_type)
 
 
 @dataclass
@@ -148,6 +190,110 @@ class EventBatch:
         }
 
 
+class SubscriptionIndex:
+    """
+    Routing index over event subscriptions.
+    
+    Each subscription is filed under the most selective criterion its
+    filter has, in this order: civilization ids, categories, participants,
+    severities. It goes into one hash bucket per listed value, and filters
+    with none of these criteria go on the wildcard list. Each bucket is split
+    into tiers by the subscription's ``min_priority``, so an event only
+    visits the tiers at or below its broadcast priority. The full filter,
+    including keywords and custom predicates, then runs only on the narrowed
+    candidates.
+    """
+    
+    def __init__(self):
+        self._buckets: Dict[Tuple[str, Any], List[Dict[str, EventSubscription]]] = {}
+        self._wildcard: List[Dict[str, EventSubscription]] = self._new_tiers()
+        self._placements: Dict[str, List[Tuple[str, Any]]] = {}
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._placements)
+    
+    def add(self, subscription: EventSubscription):
+        """Index a subscription, replacing any with the same ID."""
+        with self._lock:
+            self._remove(subscription.subscription_id)
+            
+            filter = subscription.filter
+            tier = PRIORITY_RANK[filter.min_priority] if filter.min_priority is not None else 0
+            keys = self._keys_for(filter)
+            for key in keys:
+                tiers = self._buckets.get(key)
+                if tiers is None:
+                    tiers = self._buckets[key] = self._new_tiers()
+                tiers[tier][subscription.subscription_id] = subscription
+            if not keys:
+                self._wildcard[tier][subscription.subscription_id] = subscription
+            
+            self._placements[subscription.subscription_id] = keys
+            self._sequence[subscription.subscription_id] = self._next_sequence
+            self._next_sequence += 1
+    
+    def remove(self, subscription_id: str) -> bool:
+        """Drop a subscription from the index."""
+        with self._lock:
+            return self._remove(subscription_id)
+    
+    def match(self, event: PoliticalEvent, priority: Optional[EventPriority] = None) -> List[EventSubscription]:
+        """Subscriptions matching the event, in subscription order."""
+        category = determine_event_category(event.event_type)
+        max_tier = PRIORITY_RANK[priority] if priority is not None else len(PRIORITY_ORDER) - 1
+        
+        with self._lock:
+            candidates: Dict[str, EventSubscription] = {}
+            bucket_lists = [self._wildcard]
+            for key in (('civilization', event.civilization_id), ('category', category),
+                        ('severity', event.severity),
+                        *(('participant', participant) for participant in event.participants)):
+                tiers = self._buckets.get(key)
+                if tiers is not None:
+                    bucket_lists.append(tiers)
+            for tiers in bucket_lists:
+                for tier in tiers[:max_tier + 1]:
+                    candidates.update(tier)
+            
+            matching = [subscription for subscription in candidates.values()
+                        if subscription.filter.matches(event, priority, category)]
+            matching.sort(key=lambda subscription: self._sequence[subscription.subscription_id])
+        
+        return matching
+    
+    def _remove(self, subscription_id: str) -> bool:
+        keys = self._placements.pop(subscription_id, None)
+        if keys is None:
+            return False
+        self._sequence.pop(subscription_id, None)
+        for tiers in [self._buckets[key] for key in keys] if keys else [self._wildcard]:
+            for tier in tiers:
+                tier.pop(subscription_id, None)
+        for key in keys:
+            if not any(self._buckets[key]):
+                del self._buckets[key]
+        return True
+    
+    @staticmethod
+    def _keys_for(filter: SubscriptionFilter) -> List[Tuple[str, Any]]:
+        if filter.civilizations:
+            return [('civilization', civilization_id) for civilization_id in set(filter.civilizations)]
+        if filter.categories:
+            return [('category', category) for category in set(filter.categories)]
+        if filter.participants:
+            return [('participant', participant) for participant in set(filter.participants)]
+        if filter.severities:
+            return [('severity', severity) for severity in set(filter.severities)]
+        return []
+    
+    @staticmethod
+    def _new_tiers() -> List[Dict[str, EventSubscription]]:
+        return [{} for _ in PRIORITY_ORDER]
+
+
 class PoliticalEventBroadcaster:
     """
     Manages real-time broadcasting of political events to game engines
@@ -180,6 +326,8 @@ class PoliticalEventBroadcaster:
         # Subscription management
         self.subscriptions: Dict[str, EventSubscription] = {}
         self.connection_subscriptions: Dict[str, List[str]] = defaultdict(list)
+        self.subscription_index = SubscriptionIndex()
+        self._subscription_counter = itertools.count(1)
         
         # Batching
         self.pending_batches: Dict[str, List[PoliticalEvent]] = defaultdict(list)
@@ -249,7 +397,7 @@ class PoliticalEventBroadcaster:
                 # Process events from queue
                 try:
                     priority, timestamp, event = self.event_queue.get(timeout=1)
-                    self._process_event(event)
+                    self._process_event(event, EventPriority(priority))
                     self.metrics["events_processed"] += 1
                 except Empty:
                     continue
@@ -279,7 +427,7 @@ class PoliticalEventBroadcaster:
                 self.logger.error(f"Batch processor loop error: {e}")
                 time.sleep(5)
     
-    def _process_event(self, event: PoliticalEvent):
+    def _process_event(self, event: PoliticalEvent, priority: Optional[EventPriority] = None):
         """Process a single political event."""
         try:
             # Add to history
@@ -287,7 +435,7 @@ class PoliticalEventBroadcaster:
             self._trim_event_history()
             
             # Find matching subscriptions
-            matching_subscriptions = self._find_matching_subscriptions(event)
+            matching_subscriptions = self._find_matching_subscriptions(event, priority)
             
             # Add to batches for matching connections
             for subscription in matching_subscriptions:
@@ -307,15 +455,10 @@ class PoliticalEventBroadcaster:
         except Exception as e:
             self.logger.error(f"Failed to process event {event.event_id}: {e}")
     
-    def _find_matching_subscriptions(self, event: PoliticalEvent) -> List[EventSubscription]:
+    def _find_matching_subscriptions(self, event: PoliticalEvent,
+                                     priority: Optional[EventPriority] = None) -> List[EventSubscription]:
         """Find subscriptions that match the given event."""
-        matching = []
-        
-        for subscription in self.subscriptions.values():
-            if subscription.filter.matches(event):
-                matching.append(subscription)
-        
-        return matching
+        return self.subscription_index.match(event, priority)
     
     def _send_batch(self, connection_id: str):
         """Send pending batch for connection."""
@@ -416,7 +559,7 @@ class PoliticalEventBroadcaster:
         Returns:
             Subscription ID
         """
-        subscription_id = f"sub_{connection_id}_{int(time.time())}"
+        subscription_id = f"sub_{connection_id}_{int(time.time())}_{next(self._subscription_counter)}"
         
         subscription = EventSubscription(
             subscription_id=subscription_id,
@@ -426,6 +569,7 @@ class PoliticalEventBroadcaster:
         )
         
         self.subscriptions[subscription_id] = subscription
+        self.subscription_index.add(subscription)
         self.connection_subscriptions[connection_id].append(subscription_id)
         self.metrics["active_subscriptions"] = len(self.subscriptions)
         
@@ -448,6 +592,7 @@ class PoliticalEventBroadcaster:
             
             # Remove from subscriptions
             del self.subscriptions[subscription_id]
+            self.subscription_index.remove(subscription_id)
             
             # Remove from connection mapping
             if connection_id in self.connection_subscriptions:
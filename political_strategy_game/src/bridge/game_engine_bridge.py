@@ -13,6 +13,7 @@ import time
 import threading
 from typing import Dict, List, Optional, Callable, Any
 from datetime import datetime, timedelta
+from dataclasses import dataclass
 from queue import Queue, Empty
 import websockets
 
@@ -21,6 +22,20 @@ from . import (
     ConnectionStatus, MessageFactory, BridgeErrorCodes,
     GameState, PoliticalEvent, PlayerCommand
 )
+from .wire_protocol import WireCodec, WireOptions, WireProtocolError
+
+
+@dataclass
+class StateBroadcast:
+    """
+    Queued game state for broadcast. Connections that negotiated state
+    deltas and hold the update's base state receive the incremental update;
+    the rest receive the full sync, which is built when the state is queued
+    so it matches ``checksum``.
+    """
+    full_sync: BridgeMessage
+    checksum: Optional[str] = None
+    update: Optional[Dict[str, Any]] = None  # Serialized IncrementalUpdate
 
 
 class GameEngineBridge:
@@ -32,6 +47,9 @@ class GameEngineBridge:
     - Message routing and handling
     - Connection management and health monitoring
     - Event broadcasting and command processing
+    
+    Connections speak JSON text frames unless the client asks for binary
+    frames in its handshake (see ``wire_protocol``).
     """
     
     def __init__(self, 
@@ -61,6 +79,10 @@ class GameEngineBridge:
         self.connection_status = ConnectionStatus.DISCONNECTED
         self.last_heartbeat: Dict[str, datetime] = {}
         
+        # Per-connection wire state, keyed by websocket
+        self.wire_codecs: Dict[Any, WireCodec] = {}
+        self.synced_checksums: Dict[Any, str] = {}
+        
         # Message handling
         self.message_handlers: Dict[MessageType, Callable] = {}
         self.outbound_queue = Queue()
@@ -151,15 +173,32 @@ class GameEngineBridge:
         
         try:
             # Send handshake
-            handshake = MessageFactory.create_handshake("political_engine")
+            handshake = MessageFactory.create_handshake("political_engine", wire_options=WireOptions.offer())
             await self._send_message(websocket, handshake)
             
             # Handle messages
             async for message in websocket:
                 try:
-                    bridge_message = BridgeMessage.from_json(message)
-                    await self._process_message(connection_id, bridge_message)
-                    self.performance_metrics["messages_received"] += 1
+                    if isinstance(message, bytes):
+                        codec = self.wire_codecs.get(websocket)
+                        if codec is None:
+                            raise WireProtocolError("Binary frame received before binary format was negotiated")
+                        bridge_messages = codec.decode(message)
+                    else:
+                        bridge_messages = [BridgeMessage.from_json(message)]
+                    
+                    for bridge_message in bridge_messages:
+                        await self._process_message(connection_id, bridge_message)
+                        self.performance_metrics["messages_received"] += 1
+                    
+                except WireProtocolError as e:
+                    error_msg = MessageFactory.create_error(
+                        "political_engine",
+                        BridgeErrorCodes.INVALID_MESSAGE_FORMAT,
+                        f"Invalid binary frame: {e}"
+                    )
+                    await self._send_message(websocket, error_msg)
+                    self.performance_metrics["errors"] += 1
                     
                 except json.JSONDecodeError as e:
                     error_msg = MessageFactory.create_error(
@@ -191,36 +230,98 @@ class GameEngineBridge:
                 del self.connections[connection_id]
             if connection_id in self.last_heartbeat:
                 del self.last_heartbeat[connection_id]
+            self.wire_codecs.pop(websocket, None)
+            self.synced_checksums.pop(websocket, None)
             self.performance_metrics["connection_count"] = len(self.connections)
     
-    async def _send_message(self, websocket: Any, message: BridgeMessage):
-        """Send message to specific WebSocket connection."""
+    async def _send_message(self, websocket: Any, message: BridgeMessage, json_text: Optional[str] = None) -> bool:
+        """
+        Send message to specific WebSocket connection.
+        
+        ``json_text`` is the message's JSON, when a broadcast has already
+        rendered it. Binary frames are encoded and handed to the socket
+        without awaiting in between, so frames leave in the order their
+        string table and compression state assume.
+        
+        A failed encode leaves the codec untouched, but a binary frame that
+        was encoded and then not delivered leaves the peer's decoder behind,
+        so that connection is closed.
+        
+        Returns:
+            True if the message was sent
+        """
+        codec = self.wire_codecs.get(websocket)
+        try:
+            if codec is not None:
+                data = codec.encode(message)
+            else:
+                data = json_text if json_text is not None else message.to_json()
+        except Exception as e:
+            self.logger.error(f"Failed to encode message: {e}")
+            self.performance_metrics["errors"] += 1
+            return False
+        
         try:
-            await websocket.send(message.to_json())
+            await websocket.send(data)
             self.performance_metrics["messages_sent"] += 1
+            return True
         except Exception as e:
-            if "ConnectionClosed" in str(type(e)):
-                # Connection was closed, remove from active connections
+            # The client no longer holds a known state
+            self.synced_checksums.pop(websocket, None)
+            closed = "ConnectionClosed" in str(type(e))
+            if not closed:
+                self.logger.error(f"Failed to send message: {e}")
+                self.performance_metrics["errors"] += 1
+            if closed or codec is not None:
+                # Remove from active connections
                 connection_id = None
-            for conn_id, ws in self.connections.items():
-                if ws == websocket:
-                    connection_id = conn_id
-                    break
-            if connection_id:
-                del self.connections[connection_id]
-                if connection_id in self.last_heartbeat:
-                    del self.last_heartbeat[connection_id]
-        except Exception as e:
-            self.logger.error(f"Failed to send message: {e}")
-            self.performance_metrics["errors"] += 1
+                for conn_id, ws in self.connections.items():
+                    if ws == websocket:
+                        connection_id = conn_id
+                        break
+                if connection_id:
+                    del self.connections[connection_id]
+                    if connection_id in self.last_heartbeat:
+                        del self.last_heartbeat[connection_id]
+                if not closed:
+                    self.wire_codecs.pop(websocket, None)
+                    try:
+                        await websocket.close()
+                    except Exception:
+                        pass
+            return False
     
     async def broadcast_message(self, message: BridgeMessage, exclude_connections: List[str] = None):
         """Broadcast message to all connected clients."""
         exclude_connections = exclude_connections or []
+        json_text = None
         
         for connection_id, websocket in list(self.connections.items()):
             if connection_id not in exclude_connections:
-                await self._send_message(websocket, message)
+                if json_text is None and websocket not in self.wire_codecs:
+                    json_text = message.to_json()
+                await self._send_message(websocket, message, json_text)
+    
+    async def broadcast_state(self, broadcast: StateBroadcast):
+        """Send each connection the incremental update it can apply, or a full sync."""
+        delta = None
+        full_json = None
+        
+        for websocket in list(self.connections.values()):
+            codec = self.wire_codecs.get(websocket)
+            if (broadcast.update is not None and codec is not None and codec.options.state_deltas
+                    and self.synced_checksums.get(websocket) == broadcast.update['base_checksum']):
+                if delta is None:
+                    delta = MessageFactory.create_incremental_update("political_engine", broadcast.update)
+                sent = await self._send_message(websocket, delta)
+            else:
+                if codec is None and full_json is None:
+                    full_json = broadcast.full_sync.to_json()
+                sent = await self._send_message(websocket, broadcast.full_sync, full_json)
+            
+            # Only a client that received this state can take deltas from it
+            if sent and broadcast.checksum is not None:
+                self.synced_checksums[websocket] = broadcast.checksum
     
     async def _process_message(self, connection_id: str, message: BridgeMessage):
         """Process incoming message."""
@@ -290,7 +391,10 @@ class GameEngineBridge:
                 # Process outbound queue
                 try:
                     message = self.outbound_queue.get_nowait()
-                    await self.broadcast_message(message)
+                    if isinstance(message, StateBroadcast):
+                        await self.broadcast_state(message)
+                    else:
+                        await self.broadcast_message(message)
                 except Empty:
                     pass
                 
@@ -318,16 +422,24 @@ class GameEngineBridge:
     
     # Message handlers
     async def _handle_handshake(self, connection_id: str, message: BridgeMessage):
-        """Handle handshake message."""
+        """Handle handshake message, agreeing on the connection's wire format."""
         self.logger.info(f"Handshake received from {connection_id}")
         
-        # Send acknowledgment
-        ack = MessageFactory.create_handshake("political_engine")
+        websocket = self.connections.get(connection_id)
+        options = WireOptions.negotiate(message.payload)
+        
+        # Send acknowledgment; always as JSON so the client can read the agreed format
+        ack = MessageFactory.create_handshake("political_engine", wire_options=options.to_dict())
         ack.header.correlation_id = message.header.message_id
         
-        websocket = self.connections.get(connection_id)
         if websocket:
+            self.wire_codecs.pop(websocket, None)
+            self.synced_checksums.pop(websocket, None)
             await self._send_message(websocket, ack)
+            if options.binary:
+                self.wire_codecs[websocket] = WireCodec(options)
+                self.logger.info(f"Connection {connection_id} switched to binary frames "
+                                 f"(compression: {options.compression})")
     
     async def _handle_heartbeat(self, connection_id: str, message: BridgeMessage):
         """Handle heartbeat message."""
@@ -406,10 +518,22 @@ class GameEngineBridge:
                     self.logger.error(f"Event callback error: {e}")
     
     # Public API methods
-    def queue_game_state_sync(self, game_state: GameState):
-        """Queue full game state synchronization."""
-        message = MessageFactory.create_game_state_sync("political_engine", game_state)
-        self.outbound_queue.put(message)
+    def queue_game_state_sync(self, game_state: GameState, checksum: Optional[str] = None,
+                              update: Optional[Dict[str, Any]] = None):
+        """
+        Queue game state synchronization.
+        
+        The state is serialized here, on the caller's thread, so later changes
+        to ``game_state`` do not leak into the broadcast.
+        
+        Args:
+            game_state: State to send as a full sync
+            checksum: Serializer checksum of ``game_state``
+            update: Serialized incremental update ending at ``checksum``, for
+                clients that negotiated state deltas
+        """
+        full_sync = MessageFactory.create_game_state_sync("political_engine", game_state)
+        self.outbound_queue.put(StateBroadcast(full_sync, checksum, update))
     
     def queue_political_event(self, event: PoliticalEvent):
         """Queue political event for broadcast."""
@@ -456,6 +580,8 @@ class GameEngineBridge:
         
         self.connections.clear()
         self.last_heartbeat.clear()
+        self.wire_codecs.clear()
+        self.synced_checksums.clear()
         
         if self.server_thread and self.server_thread.is_alive():
             self.server_thread.join(timeout=5)
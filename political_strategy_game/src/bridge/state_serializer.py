@@ -4,13 +4,22 @@ Game State Serialization System
 This module handles serialization and deserialization of political simulation
 state for communication with game engines, including incremental updates
 and state validation.
+
+Change tracking works from the source: the state dataclasses record which
+fields and children changed since the last sync, and the serializer keeps
+immutable snapshots whose unchanged nodes are shared between versions. An
+incremental update for a tracked state therefore touches only the objects
+that changed. States the serializer has not seen before are diffed against
+the current snapshot, skipping every node whose digest matches.
 """
 
 import json
 import logging
 import hashlib
 import gzip
-from typing import Dict, List, Optional, Any, Set, Tuple
+import uuid
+from collections import deque
+from typing import Dict, List, Optional, Any, Set, Tuple, Deque, Iterable
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from copy import deepcopy
@@ -18,6 +27,21 @@ from copy import deepcopy
 from . import GameState, CivilizationState, AdvisorState, TurnState
 
 
+STATE_FORMAT_VERSION = "1.1"
+LEGACY_FORMAT_VERSION = "1.0"  # Checksum over the whole state JSON
+LIST_SECTIONS = ('civilizations', 'advisors')
+VALUE_SECTIONS = ('global_events', 'metadata')
+
+
+def _digest(data: Any) -> str:
+    json_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+
+
+def _combine_digests(digests: Iterable[str]) -> str:
+    return hashlib.sha256(','.join(digests).encode('ascii')).hexdigest()
+
+
 @dataclass
 class SerializationMetadata:
     """Metadata for state serialization."""
@@ -64,6 +88,63 @@ class IncrementalUpdate:
         }
 
 
+@dataclass(frozen=True)
+class SnapshotNode:
+    """Serialized form of one state object, with the digest of its contents."""
+    data: Any
+    digest: str
+    
+    @classmethod
+    def of(cls, data: Any) -> 'SnapshotNode':
+        return cls(data, _digest(data))
+
+
+@dataclass(frozen=True)
+class StateSnapshot:
+    """
+    Immutable serialized view of a ``GameState``.
+    
+    Nodes are never modified after creation, so a snapshot taken after a
+    change shares every unchanged node with its predecessor and a long
+    history costs memory in proportion to what changed. The checksum is
+    built from per-node digests and only changed nodes are rehashed.
+    """
+    token: str
+    turn_state: SnapshotNode
+    civilizations: Tuple[SnapshotNode, ...]
+    advisors: Tuple[SnapshotNode, ...]
+    global_events: SnapshotNode
+    metadata: SnapshotNode
+    list_digests: Dict[str, str]
+    checksum: str
+    
+    @classmethod
+    def build(cls, token: str, turn_state: SnapshotNode,
+              civilizations: Tuple[SnapshotNode, ...], advisors: Tuple[SnapshotNode, ...],
+              global_events: SnapshotNode, metadata: SnapshotNode,
+              previous: Optional['StateSnapshot'] = None) -> 'StateSnapshot':
+        list_digests = {}
+        for field, nodes in zip(LIST_SECTIONS, (civilizations, advisors)):
+            if previous is not None and getattr(previous, field) is nodes:
+                list_digests[field] = previous.list_digests[field]
+            else:
+                list_digests[field] = _combine_digests(node.digest for node in nodes)
+        checksum = _combine_digests([turn_state.digest, list_digests['civilizations'],
+                                     list_digests['advisors'], global_events.digest, metadata.digest])
+        return cls(token, turn_state, civilizations, advisors, global_events, metadata,
+                   list_digests, checksum)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain state dictionary. Nested values are shared with the snapshot and must not be modified."""
+        return {
+            'turn_state': self.turn_state.data,
+            'civilizations': [node.data for node in self.civilizations],
+            'advisors': [node.data for node in self.advisors],
+            'global_events': self.global_events.data,
+            'metadata': self.metadata.data
+        }
+
+
 class GameStateSerializer:
     """
     Handles serialization, deserialization, and incremental updates
@@ -87,9 +168,11 @@ class GameStateSerializer:
         self.max_history = max_history
         
         # State tracking
-        self.state_history: List[Tuple[str, GameState]] = []  # (checksum, state)
-        self.current_state: Optional[GameState] = None
+        self.state_history: Deque[Tuple[str, StateSnapshot]] = deque(maxlen=max_history)  # (checksum, snapshot)
+        self.current_snapshot: Optional[StateSnapshot] = None
         self.current_checksum: Optional[str] = None
+        self._tracking_id = uuid.uuid4().hex
+        self._snapshot_sequence = 0
         
         # Change tracking
         self.tracked_fields: Set[str] = {
@@ -114,6 +197,13 @@ class GameStateSerializer:
         
         self.logger.info("Game State Serializer initialized")
     
+    @property
+    def current_state(self) -> Optional[GameState]:
+        """Last tracked game state, rebuilt from the current snapshot."""
+        if self.current_snapshot is None:
+            return None
+        return self._build_game_state(deepcopy(self.current_snapshot.to_dict()))
+    
     def serialize_full_state(self, game_state: GameState) -> Dict[str, Any]:
         """
         Serialize complete game state to dictionary.
@@ -129,12 +219,16 @@ class GameStateSerializer:
             state_dict = game_state.to_dict()
             
             # Calculate checksum
-            checksum = self._calculate_checksum(state_dict)
+            if self.track_changes:
+                snapshot = self._capture_snapshot(game_state, self.current_snapshot)
+                checksum = snapshot.checksum
+            else:
+                checksum = self._calculate_state_checksum(state_dict)
             
             # Create metadata
             metadata = SerializationMetadata(
                 timestamp=datetime.now(),
-                version="1.0",
+                version=STATE_FORMAT_VERSION,
                 checksum=checksum,
                 compression=self.compress_state,
                 incremental=False
@@ -148,7 +242,7 @@ class GameStateSerializer:
             
             # Update tracking
             if self.track_changes:
-                self._update_state_tracking(checksum, game_state)
+                self._update_state_tracking(snapshot, game_state)
             
             self.logger.debug(f"Serialized full state with checksum: {checksum}")
             return serialized
@@ -183,33 +277,40 @@ class GameStateSerializer:
         """
         Create incremental update from current state to new state.
         
+        When ``new_state`` was last synced by this serializer, only the
+        fields and children in its dirty sets are serialized and compared.
+        Any other state is diffed against the current snapshot.
+        
         Args:
             new_state: New game state to compare against current
             
         Returns:
             Incremental update or None if no changes
         """
-        if not self.track_changes or not self.current_state:
+        if not self.track_changes or self.current_snapshot is None:
             self.logger.warning("Cannot create incremental update - change tracking disabled or no current state")
             return None
         
         try:
-            # Calculate new state checksum
-            new_state_dict = new_state.to_dict()
-            new_checksum = self._calculate_checksum(new_state_dict)
+            previous = self.current_snapshot
             
             # Find changes
-            changes = self._detect_changes(self.current_state, new_state)
+            if new_state.baseline == previous.token:
+                snapshot, changes = self._capture_changes(new_state, previous)
+            else:
+                snapshot = self._capture_snapshot(new_state, previous)
+                changes = self._detect_changes(previous, snapshot)
             
             if not changes:
+                new_state.clear_changes(previous.token)
                 self.logger.debug("No changes detected for incremental update")
                 return None
             
             # Create metadata
             metadata = SerializationMetadata(
                 timestamp=datetime.now(),
-                version="1.0",
-                checksum=new_checksum,
+                version=STATE_FORMAT_VERSION,
+                checksum=snapshot.checksum,
                 compression=False,
                 incremental=True,
                 base_version=self.current_checksum
@@ -223,7 +324,7 @@ class GameStateSerializer:
             )
             
             # Update tracking
-            self._update_state_tracking(new_checksum, new_state)
+            self._update_state_tracking(snapshot, new_state)
             
             self.logger.debug(f"Created incremental update with {len(changes)} changes")
             return update
@@ -261,30 +362,12 @@ class GameStateSerializer:
             
             # Validate checksum if present
             if 'checksum' in metadata:
-                calculated_checksum = self._calculate_checksum(state_data)
+                calculated_checksum = self._checksum_for_version(state_data, metadata.get('version'))
                 if calculated_checksum != metadata['checksum']:
                     raise ValueError(f"Checksum mismatch: expected {metadata['checksum']}, got {calculated_checksum}")
             
             # Reconstruct state objects
-            turn_state = TurnState(**state_data['turn_state'])
-            
-            civilizations = [
-                CivilizationState(**civ_data)
-                for civ_data in state_data['civilizations']
-            ]
-            
-            advisors = [
-                AdvisorState(**advisor_data)
-                for advisor_data in state_data['advisors']
-            ]
-            
-            game_state = GameState(
-                turn_state=turn_state,
-                civilizations=civilizations,
-                advisors=advisors,
-                global_events=state_data['global_events'],
-                metadata=state_data['metadata']
-            )
+            game_state = self._build_game_state(state_data)
             
             self.logger.debug("Successfully deserialized full state")
             return game_state
@@ -333,7 +416,7 @@ class GameStateSerializer:
         try:
             # Validate base state checksum
             base_dict = base_state.to_dict()
-            base_checksum = self._calculate_checksum(base_dict)
+            base_checksum = self._checksum_for_version(base_dict, update.metadata.version)
             
             if base_checksum != update.base_checksum:
                 raise ValueError(f"Base state checksum mismatch: expected {update.base_checksum}, got {base_checksum}")
@@ -348,7 +431,7 @@ class GameStateSerializer:
             updated_state = self.deserialize_full_state({'state': updated_dict, 'metadata': {}})
             
             # Validate final checksum
-            final_checksum = self._calculate_checksum(updated_dict)
+            final_checksum = self._checksum_for_version(updated_dict, update.metadata.version)
             if final_checksum != update.metadata.checksum:
                 raise ValueError(f"Final state checksum mismatch: expected {update.metadata.checksum}, got {final_checksum}")
             
@@ -435,7 +518,7 @@ class GameStateSerializer:
                 'total_crises': sum(len(civ.active_crises) for civ in game_state.civilizations),
                 'total_conspiracies': sum(len(civ.active_conspiracies) for civ in game_state.civilizations),
                 'serialized_size_bytes': len(json.dumps(state_dict)),
-                'checksum': self._calculate_checksum(state_dict),
+                'checksum': self._calculate_state_checksum(state_dict),
                 'timestamp': datetime.now().isoformat()
             }
             
@@ -448,45 +531,170 @@ class GameStateSerializer:
     # Private helper methods
     def _calculate_checksum(self, data: Dict[str, Any]) -> str:
         """Calculate SHA-256 checksum of serialized data."""
-        json_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
-        return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
+        return _digest(data)
+    
+    def _calculate_state_checksum(self, state_dict: Dict[str, Any]) -> str:
+        """Checksum of a state dictionary, composed the same way as ``StateSnapshot.checksum``."""
+        return _combine_digests([
+            _digest(state_dict['turn_state']),
+            *(_combine_digests(_digest(item) for item in state_dict[field]) for field in LIST_SECTIONS),
+            *(_digest(state_dict[field]) for field in VALUE_SECTIONS)
+        ])
+    
+    def _checksum_for_version(self, state_dict: Dict[str, Any], version: Optional[str]) -> str:
+        if version == LEGACY_FORMAT_VERSION:
+            return self._calculate_checksum(state_dict)
+        return self._calculate_state_checksum(state_dict)
+    
+    def _build_game_state(self, state_data: Dict[str, Any]) -> GameState:
+        """Reconstruct state objects from a state dictionary."""
+        return GameState(
+            turn_state=TurnState(**state_data['turn_state']),
+            civilizations=[CivilizationState(**civ_data) for civ_data in state_data['civilizations']],
+            advisors=[AdvisorState(**advisor_data) for advisor_data in state_data['advisors']],
+            global_events=state_data['global_events'],
+            metadata=state_data['metadata']
+        )
+    
+    def _next_token(self) -> str:
+        self._snapshot_sequence += 1
+        return f"{self._tracking_id}:{self._snapshot_sequence}"
+    
+    def _capture_snapshot(self, state: GameState, previous: Optional[StateSnapshot] = None) -> StateSnapshot:
+        """Serialize every node of ``state``, reusing nodes of ``previous`` whose digest is unchanged."""
+        def share(node: SnapshotNode, old: Optional[SnapshotNode]) -> SnapshotNode:
+            return old if old is not None and old.digest == node.digest else node
+        
+        lists = {}
+        for field in LIST_SECTIONS:
+            old_nodes = getattr(previous, field) if previous is not None else ()
+            nodes = tuple(
+                share(SnapshotNode.of(item.to_dict()), old_nodes[index] if index < len(old_nodes) else None)
+                for index, item in enumerate(getattr(state, field))
+            )
+            if len(nodes) == len(old_nodes) and all(node is old for node, old in zip(nodes, old_nodes)):
+                nodes = old_nodes
+            lists[field] = nodes
+        
+        return StateSnapshot.build(
+            self._next_token(),
+            share(SnapshotNode.of(state.turn_state.to_dict()), previous.turn_state if previous else None),
+            lists['civilizations'],
+            lists['advisors'],
+            *(share(SnapshotNode.of(deepcopy(getattr(state, field))),
+                    getattr(previous, field) if previous else None) for field in VALUE_SECTIONS),
+            previous=previous
+        )
+    
+    def _capture_changes(self, state: GameState,
+                         previous: StateSnapshot) -> Tuple[StateSnapshot, List[StateChange]]:
+        """Build the next snapshot and its changes from the dirty sets of ``state``."""
+        dirty = state.changed_fields()
+        dirty_children = state.changed_children()
+        changes: List[StateChange] = []
+        
+        turn_state = previous.turn_state
+        if 'turn_state' in dirty or ('turn_state', None) in dirty_children:
+            turn_state = SnapshotNode.of(state.turn_state.to_dict())
+            if turn_state.digest != previous.turn_state.digest:
+                self._compare_fields('turn_state', previous.turn_state.data, turn_state.data, changes)
+            else:
+                turn_state = previous.turn_state
+        
+        lists = {}
+        for field in LIST_SECTIONS:
+            old_nodes = getattr(previous, field)
+            items = getattr(state, field)
+            if field in dirty or len(items) != len(old_nodes):
+                # Replaced or resized in place: reserialize the whole list
+                nodes = tuple(SnapshotNode.of(item.to_dict()) for item in items)
+                self._compare_sections(field, old_nodes, nodes, changes)
+            else:
+                indices = sorted(index for child_field, index in dirty_children if child_field == field)
+                nodes = old_nodes
+                if indices:
+                    updated = list(old_nodes)
+                    for index in indices:
+                        node = SnapshotNode.of(items[index].to_dict())
+                        if node.digest != old_nodes[index].digest:
+                            updated[index] = node
+                            self._compare_fields(f"{field}.{index}", old_nodes[index].data, node.data, changes)
+                    nodes = tuple(updated)
+            lists[field] = nodes
+        
+        values = {}
+        for field in VALUE_SECTIONS:
+            node = getattr(previous, field)
+            if field in dirty:
+                node = SnapshotNode.of(deepcopy(getattr(state, field)))
+                if node.digest != getattr(previous, field).digest:
+                    changes.append(StateChange(field, getattr(previous, field).data, node.data, "modified"))
+                else:
+                    node = getattr(previous, field)
+            values[field] = node
+        
+        snapshot = StateSnapshot.build(self._next_token(), turn_state, lists['civilizations'],
+                                       lists['advisors'], values['global_events'], values['metadata'],
+                                       previous=previous)
+        return snapshot, changes
     
-    def _update_state_tracking(self, checksum: str, state: GameState):
+    def _update_state_tracking(self, snapshot: StateSnapshot, state: GameState):
         """Update internal state tracking."""
-        self.current_state = deepcopy(state)
-        self.current_checksum = checksum
+        self.current_snapshot = snapshot
+        self.current_checksum = snapshot.checksum
         
-        # Add to history
-        self.state_history.append((checksum, deepcopy(state)))
+        # Add to history; unchanged nodes are shared with earlier entries
+        self.state_history.append((snapshot.checksum, snapshot))
         
-        # Trim history if too long
-        if len(self.state_history) > self.max_history:
-            self.state_history = self.state_history[-self.max_history:]
+        # Later changes to the state are recorded relative to this snapshot
+        state.clear_changes(snapshot.token)
     
-    def _detect_changes(self, old_state: GameState, new_state: GameState) -> List[StateChange]:
-        """Detect changes between two game states."""
+    def _detect_changes(self, old_snapshot: StateSnapshot, new_snapshot: StateSnapshot) -> List[StateChange]:
+        """Detect changes between two snapshots, skipping nodes with equal digests."""
         changes = []
         
         try:
-            old_dict = old_state.to_dict()
-            new_dict = new_state.to_dict()
+            if old_snapshot.turn_state.digest != new_snapshot.turn_state.digest:
+                self._compare_fields('turn_state', old_snapshot.turn_state.data,
+                                     new_snapshot.turn_state.data, changes)
+            
+            for field in LIST_SECTIONS:
+                self._compare_sections(field, getattr(old_snapshot, field), getattr(new_snapshot, field), changes)
             
-            # Compare dictionaries recursively
-            self._compare_dicts(old_dict, new_dict, "", changes)
+            for field in VALUE_SECTIONS:
+                old_node, new_node = getattr(old_snapshot, field), getattr(new_snapshot, field)
+                if old_node.digest != new_node.digest:
+                    changes.append(StateChange(field, old_node.data, new_node.data, "modified"))
             
         except Exception as e:
             self.logger.error(f"Failed to detect changes: {e}")
         
         return changes
     
-    def _compare_dicts(self, old_dict: Dict, new_dict: Dict, path: str, changes: List[StateChange]):
-        """Recursively compare dictionaries and record changes."""
+    def _compare_sections(self, field: str, old_nodes: Tuple[SnapshotNode, ...],
+                          new_nodes: Tuple[SnapshotNode, ...], changes: List[StateChange]):
+        """Compare two lists of nodes index by index, or as a whole when their lengths differ."""
+        if old_nodes is new_nodes:
+            return
+        if len(old_nodes) != len(new_nodes):
+            changes.append(StateChange(
+                path=field,
+                old_value=[node.data for node in old_nodes],
+                new_value=[node.data for node in new_nodes],
+                change_type="modified"
+            ))
+            return
+        for index, (old_node, new_node) in enumerate(zip(old_nodes, new_nodes)):
+            if old_node is not new_node and old_node.digest != new_node.digest:
+                self._compare_fields(f"{field}.{index}", old_node.data, new_node.data, changes)
+    
+    def _compare_fields(self, path: str, old_dict: Dict, new_dict: Dict, changes: List[StateChange]):
+        """Compare the top-level fields of two serialized objects and record changes."""
         # Check for removed keys
         for key in old_dict:
-            key_path = f"{path}.{key}" if path else key
             if key not in new_dict:
                 changes.append(StateChange(
-                    path=key_path,
+                    path=f"{path}.{key}",
                     old_value=old_dict[key],
                     new_value=None,
                     change_type="removed"
@@ -494,25 +702,20 @@ class GameStateSerializer:
         
         # Check for added or modified keys
         for key in new_dict:
-            key_path = f"{path}.{key}" if path else key
             if key not in old_dict:
                 changes.append(StateChange(
-                    path=key_path,
+                    path=f"{path}.{key}",
                     old_value=None,
                     new_value=new_dict[key],
                     change_type="added"
                 ))
             elif old_dict[key] != new_dict[key]:
-                if isinstance(old_dict[key], dict) and isinstance(new_dict[key], dict):
-                    # Recursively compare nested dictionaries
-                    self._compare_dicts(old_dict[key], new_dict[key], key_path, changes)
-                else:
-                    changes.append(StateChange(
-                        path=key_path,
-                        old_value=old_dict[key],
-                        new_value=new_dict[key],
-                        change_type="modified"
-                    ))
+                changes.append(StateChange(
+                    path=f"{path}.{key}",
+                    old_value=old_dict[key],
+                    new_value=new_dict[key],
+                    change_type="modified"
+                ))
     
     def _apply_change(self, data_dict: Dict, change: StateChange):
         """Apply a single change to a dictionary."""
@@ -533,11 +736,12 @@ class GameStateSerializer:
             if final_key in current:
                 del current[final_key]
         elif change.change_type in ["added", "modified"]:
+            # Copy so the result does not share containers with the snapshot
             if final_key.isdigit():
                 # Array index
-                current[int(final_key)] = change.new_value
+                current[int(final_key)] = deepcopy(change.new_value)
             else:
-                current[final_key] = change.new_value
+                current[final_key] = deepcopy(change.new_value)
     
     def _is_base64(self, data: str) -> bool:
         """Check if string is base64 encoded."""
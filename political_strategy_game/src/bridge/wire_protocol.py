@@ -0,0 +1,475 @@
+"""
+Binary Wire Protocol
+
+Compact framing for bridge messages, negotiated per connection during the
+handshake. JSON text frames remain the default and stay available to
+debugging clients; a client that asks for ``binary`` receives
+length-prefixed binary frames instead.
+
+Each frame body is a tagged value encoding of the message header and
+payload:
+
+- dicts whose keys match a known schema (``GameState``, ``PoliticalEvent``,
+  ``MessageHeader`` ...) are written as a schema id followed by the field
+  values, without keys;
+- dict keys, ids and enum values go through a per-connection string table,
+  so a repeated string costs one or two bytes after its first use;
+- floats with at most four decimals are written as scaled varints;
+- frame bodies can be deflated through one compression stream per
+  connection, primed with a preset dictionary of common strings.
+
+The string table and compression stream carry state from frame to frame, so
+each direction of a connection needs its own ``WireCodec`` and frames must
+be decoded in the order they were encoded.
+"""
+
+import struct
+import zlib
+from dataclasses import dataclass, asdict, fields
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+
+from . import (
+    BridgeMessage, MessageHeader, MessageType, EventPriority,
+    TurnState, AdvisorState, CivilizationState, GameState, PoliticalEvent, PlayerCommand
+)
+
+
+WIRE_FORMAT_JSON = "json"
+WIRE_FORMAT_BINARY = "binary"
+COMPRESSION_NONE = "none"
+COMPRESSION_DEFLATE = "deflate-dict"
+SCHEMA_VERSION = 1
+
+FRAME_HEADER = struct.Struct(">IB")  # Body length, flags
+FLAG_COMPRESSED = 0x01
+MAX_FRAME_SIZE = 1024 * 1024  # Matches the server's websocket message limit
+MIN_COMPRESS_SIZE = 96  # Smaller bodies do not shrink enough to pay for deflate
+MAX_INTERNED_LENGTH = 64
+MAX_STRING_TABLE = 4096
+DECIMAL_SCALE = 10000
+
+_SYNC_FLUSH_TAIL = b'\x00\x00\xff\xff'
+# Deflate grows incompressible input by well under 1/64, so smaller bodies always fit a frame
+_SAFE_DEFLATE_SIZE = MAX_FRAME_SIZE - MAX_FRAME_SIZE // 64
+_FLOAT = struct.Struct(">d")
+_EPOCH = datetime(1970, 1, 1)
+
+# Value tags
+_NONE, _TRUE, _FALSE, _INT, _FLOAT_TAG, _DECIMAL = range(6)
+_STR, _STR_NEW, _STR_REF, _LIST, _DICT, _SCHEMA, _DATETIME = range(6, 13)
+
+
+class WireProtocolError(ValueError):
+    """Raised for frames that cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class Schema:
+    """Positional layout for dicts with a fixed key order."""
+    schema_id: int
+    fields: Tuple[str, ...]
+    interned: FrozenSet[str] = frozenset()  # String fields worth a string table entry
+    timestamps: FrozenSet[str] = frozenset()  # ISO timestamp fields
+
+
+def _schema(schema_id: int, cls: type, interned: Tuple[str, ...] = (),
+            timestamps: Tuple[str, ...] = ()) -> Schema:
+    return Schema(schema_id, tuple(field.name for field in fields(cls)),
+                  frozenset(interned), frozenset(timestamps))
+
+
+# Ids are part of the wire format: append new schemas and bump
+# SCHEMA_VERSION when a layout changes
+SCHEMAS = (
+    _schema(1, MessageHeader, ('message_type', 'sender', 'recipient', 'priority', 'api_version'),
+            ('timestamp',)),
+    _schema(2, TurnState, ('civilization_id', 'phase')),
+    _schema(3, AdvisorState, ('advisor_id', 'name', 'role', 'current_mood', 'current_activity', 'location')),
+    _schema(4, CivilizationState, ('civilization_id', 'name', 'leader_name', 'active_crises',
+                                   'active_conspiracies')),
+    _schema(5, GameState),
+    _schema(6, PoliticalEvent, ('event_id', 'event_type', 'civilization_id', 'severity', 'participants'),
+            ('timestamp',)),
+    _schema(7, PlayerCommand, ('command_type', 'civilization_id'), ('timestamp',)),
+)
+_SCHEMAS_BY_KEYS = {schema.fields: schema for schema in SCHEMAS}
+_SCHEMAS_BY_ID = {schema.schema_id: schema for schema in SCHEMAS}
+
+
+def _preset_dictionary() -> bytes:
+    """
+    Deflate dictionary of strings most connections send early on, laid out
+    as they appear on the wire. zlib favours the end of the dictionary, so
+    the most common strings come last.
+    """
+    strings = [
+        "resolution", "execution", "planning", "minor", "moderate", "major", "critical",
+        "game_state", "sync_timestamp", "event", "status", "alive", "system_metrics",
+        "cpu_usage", "memory_usage", "active_connections", "error_code", "error_message",
+        "recovery_suggestions", "capabilities", "sender_info", "type", "version", "update",
+        *(priority.value for priority in EventPriority),
+        *(message_type.value for message_type in MessageType),
+        "bridge", "game_engine", "political_engine", "1.0",
+    ]
+    out = bytearray()
+    for value in strings:
+        encoded = value.encode('utf-8')
+        out.append(_STR_NEW)
+        _write_varint(out, len(encoded))
+        out += encoded
+    return bytes(out)
+
+
+def _write_varint(out: bytearray, value: int):
+    while value > 0x7f:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+PRESET_DICTIONARY = _preset_dictionary()
+DICTIONARY_ID = zlib.adler32(PRESET_DICTIONARY)
+
+
+@dataclass(frozen=True)
+class WireOptions:
+    """Encoding settings agreed for one connection."""
+    wire_format: str = WIRE_FORMAT_JSON
+    compression: str = COMPRESSION_NONE
+    state_deltas: bool = False  # Client applies incremental state updates
+
+    @property
+    def binary(self) -> bool:
+        return self.wire_format == WIRE_FORMAT_BINARY
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Handshake fields announcing these options."""
+        data = asdict(self)
+        data['schema_version'] = SCHEMA_VERSION
+        data['dictionary_id'] = DICTIONARY_ID
+        return data
+
+    @staticmethod
+    def offer() -> Dict[str, Any]:
+        """Handshake fields advertising what this end supports."""
+        return {
+            'wire_formats': [WIRE_FORMAT_BINARY, WIRE_FORMAT_JSON],
+            'compression': [COMPRESSION_DEFLATE, COMPRESSION_NONE],
+            'schema_version': SCHEMA_VERSION,
+            'dictionary_id': DICTIONARY_ID
+        }
+
+    @classmethod
+    def negotiate(cls, request: Dict[str, Any]) -> 'WireOptions':
+        """
+        Options for a peer's handshake payload. Anything not understood
+        falls back to JSON, or to no compression when only the dictionary
+        differs.
+        """
+        if request.get('wire_format') != WIRE_FORMAT_BINARY or request.get('schema_version') != SCHEMA_VERSION:
+            return cls()
+        compression = request.get('compression', COMPRESSION_NONE)
+        if compression != COMPRESSION_DEFLATE or request.get('dictionary_id') != DICTIONARY_ID:
+            compression = COMPRESSION_NONE
+        return cls(WIRE_FORMAT_BINARY, compression, bool(request.get('state_deltas', False)))
+
+
+class _Encoder:
+    """Tagged value writer sharing a string table across frames."""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+
+    def mark(self) -> int:
+        return len(self.strings)
+
+    def rollback(self, mark: int):
+        """Forget strings interned since ``mark``, for a frame that was never sent."""
+        while len(self.strings) > mark:
+            self.strings.popitem()
+
+    def value(self, out: bytearray, value: Any, intern: bool = False):
+        if value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, str):
+            self.string(out, value, intern)
+        elif isinstance(value, int):
+            out.append(_INT)
+            _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            scaled = round(value * DECIMAL_SCALE) if abs(value) < 2 ** 48 else None
+            if scaled is not None and scaled / DECIMAL_SCALE == value:
+                out.append(_DECIMAL)
+                _write_varint(out, scaled * 2 if scaled >= 0 else -scaled * 2 - 1)
+            else:
+                out.append(_FLOAT_TAG)
+                out += _FLOAT.pack(value)
+        elif isinstance(value, dict):
+            schema = _SCHEMAS_BY_KEYS.get(tuple(value))
+            if schema is not None:
+                out.append(_SCHEMA)
+                _write_varint(out, schema.schema_id)
+                for name in schema.fields:
+                    field_value = value[name]
+                    if name in schema.timestamps and isinstance(field_value, str):
+                        self.timestamp(out, field_value)
+                    else:
+                        self.value(out, field_value, name in schema.interned)
+            else:
+                out.append(_DICT)
+                _write_varint(out, len(value))
+                for key, item in value.items():
+                    if not isinstance(key, str):
+                        raise WireProtocolError(f"Dict keys must be strings, got {type(key).__name__}")
+                    self.string(out, key, True)
+                    self.value(out, item, intern)
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                self.value(out, item, intern)
+        elif isinstance(value, Enum):
+            self.value(out, value.value, True)
+        else:
+            raise WireProtocolError(f"Cannot encode {type(value).__name__}")
+
+    def string(self, out: bytearray, value: str, intern: bool):
+        index = self.strings.get(value)
+        if index is not None:
+            out.append(_STR_REF)
+            _write_varint(out, index)
+            return
+        encoded = value.encode('utf-8')
+        if intern and len(encoded) <= MAX_INTERNED_LENGTH and len(self.strings) < MAX_STRING_TABLE:
+            self.strings[value] = len(self.strings)
+            out.append(_STR_NEW)
+        else:
+            out.append(_STR)
+        _write_varint(out, len(encoded))
+        out += encoded
+
+    def timestamp(self, out: bytearray, value: str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            parsed = None
+        # Only naive timestamps whose text round-trips are packed
+        if parsed is None or parsed.tzinfo is not None or parsed.isoformat() != value:
+            self.string(out, value, False)
+            return
+        out.append(_DATETIME)
+        micros = (parsed - _EPOCH) // timedelta(microseconds=1)
+        _write_varint(out, micros * 2 if micros >= 0 else -micros * 2 - 1)
+
+
+class _Decoder:
+    """Reader for ``_Encoder`` output, mirroring its string table."""
+
+    def __init__(self):
+        self.strings: List[str] = []
+        self.data = b''
+        self.pos = 0
+
+    def read(self, data: bytes) -> Tuple[Any, Any]:
+        """Decode the header and payload values of one frame body."""
+        self.data, self.pos = data, 0
+        header = self.value()
+        payload = self.value()
+        if self.pos != len(data):
+            raise WireProtocolError(f"{len(data) - self.pos} trailing bytes in frame")
+        return header, payload
+
+    def varint(self) -> int:
+        result = shift = 0
+        data = self.data
+        while True:
+            if self.pos >= len(data):
+                raise WireProtocolError("Truncated varint")
+            byte = data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def signed(self) -> int:
+        value = self.varint()
+        return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+    def raw(self, length: int) -> bytes:
+        end = self.pos + length
+        if end > len(self.data):
+            raise WireProtocolError("Truncated value")
+        chunk = self.data[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def value(self) -> Any:
+        if self.pos >= len(self.data):
+            raise WireProtocolError("Truncated value")
+        tag = self.data[self.pos]
+        self.pos += 1
+        reader = _READERS.get(tag)
+        if reader is None:
+            raise WireProtocolError(f"Unknown value tag {tag}")
+        return reader(self)
+
+    def _string(self) -> str:
+        return self.raw(self.varint()).decode('utf-8')
+
+    def _new_string(self) -> str:
+        value = self._string()
+        if len(self.strings) >= MAX_STRING_TABLE:
+            raise WireProtocolError("String table overflow")
+        self.strings.append(value)
+        return value
+
+    def _string_ref(self) -> str:
+        index = self.varint()
+        if index >= len(self.strings):
+            raise WireProtocolError(f"Unknown string reference {index}")
+        return self.strings[index]
+
+    def _list(self) -> List[Any]:
+        return [self.value() for _ in range(self.varint())]
+
+    def _dict(self) -> Dict[str, Any]:
+        result = {}
+        for _ in range(self.varint()):
+            key = self.value()
+            if not isinstance(key, str):
+                raise WireProtocolError("Dict key is not a string")
+            result[key] = self.value()
+        return result
+
+    def _schema(self) -> Dict[str, Any]:
+        schema = _SCHEMAS_BY_ID.get(self.varint())
+        if schema is None:
+            raise WireProtocolError("Unknown schema id")
+        return {name: self.value() for name in schema.fields}
+
+    def _float(self) -> float:
+        return _FLOAT.unpack(self.raw(_FLOAT.size))[0]
+
+    def _datetime(self) -> str:
+        return (_EPOCH + timedelta(microseconds=self.signed())).isoformat()
+
+
+_READERS: Dict[int, Callable[[_Decoder], Any]] = {
+    _NONE: lambda decoder: None,
+    _TRUE: lambda decoder: True,
+    _FALSE: lambda decoder: False,
+    _INT: _Decoder.signed,
+    _FLOAT_TAG: _Decoder._float,
+    _DECIMAL: lambda decoder: decoder.signed() / DECIMAL_SCALE,
+    _STR: _Decoder._string,
+    _STR_NEW: _Decoder._new_string,
+    _STR_REF: _Decoder._string_ref,
+    _LIST: _Decoder._list,
+    _DICT: _Decoder._dict,
+    _SCHEMA: _Decoder._schema,
+    _DATETIME: _Decoder._datetime,
+}
+
+
+class WireCodec:
+    """
+    Per-connection binary codec.
+
+    ``encode`` writes outbound frames and ``decode`` reads inbound ones; the
+    two directions keep separate string tables and compression streams.
+    """
+
+    def __init__(self, options: WireOptions):
+        self.options = options
+        self._encoder = _Encoder()
+        self._decoder = _Decoder()
+        self._compressor = None
+        self._decompressor = None
+        if options.compression == COMPRESSION_DEFLATE:
+            self._compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=PRESET_DICTIONARY)
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=PRESET_DICTIONARY)
+        self.stats = {"frames_encoded": 0, "frames_decoded": 0, "bytes_encoded": 0, "bytes_decoded": 0}
+
+    def encode(self, message: BridgeMessage) -> bytes:
+        """
+        Encode one message as a length-prefixed frame.
+
+        Encoding is transactional: when a message is rejected, the string
+        table and compression stream are left as they were, so the peer's
+        decoder stays in step for the next frame.
+        """
+        mark = self._encoder.mark()
+        try:
+            body = bytearray()
+            self._encoder.value(body, message.header.to_dict())
+            self._encoder.value(body, message.payload)
+            if len(body) > MAX_FRAME_SIZE:
+                raise WireProtocolError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_SIZE}")
+
+            flags = 0
+            if self._compressor is not None and len(body) >= MIN_COMPRESS_SIZE:
+                # Bodies that might not fit once deflated go through a copy of the stream
+                compressor = self._compressor if len(body) <= _SAFE_DEFLATE_SIZE else self._compressor.copy()
+                compressed = compressor.compress(bytes(body)) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                # Like permessage-deflate, drop the empty block every sync flush ends with
+                body = compressed[:-len(_SYNC_FLUSH_TAIL)]
+                if len(body) > MAX_FRAME_SIZE:
+                    raise WireProtocolError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_SIZE}")
+                self._compressor = compressor
+                flags |= FLAG_COMPRESSED
+        except Exception:
+            self._encoder.rollback(mark)
+            raise
+
+        frame = FRAME_HEADER.pack(len(body), flags) + body
+        self.stats["frames_encoded"] += 1
+        self.stats["bytes_encoded"] += len(frame)
+        return frame
+
+    def encode_batch(self, messages: List[BridgeMessage]) -> bytes:
+        """Concatenate frames so several messages share one websocket message."""
+        return b''.join(self.encode(message) for message in messages)
+
+    def decode(self, data: bytes) -> List[BridgeMessage]:
+        """Decode every frame in ``data``, in order."""
+        messages = []
+        view = memoryview(data)
+        offset = 0
+        while offset < len(view):
+            if len(view) - offset < FRAME_HEADER.size:
+                raise WireProtocolError("Truncated frame header")
+            length, flags = FRAME_HEADER.unpack_from(view, offset)
+            offset += FRAME_HEADER.size
+            if length > MAX_FRAME_SIZE or offset + length > len(view):
+                raise WireProtocolError(f"Frame length {length} exceeds available data")
+            body = bytes(view[offset:offset + length])
+            offset += length
+
+            if flags & FLAG_COMPRESSED:
+                body = self._inflate(body)
+            header, payload = self._decoder.read(body)
+            if not isinstance(header, dict) or not isinstance(payload, dict):
+                raise WireProtocolError("Frame does not hold a header and payload")
+            messages.append(BridgeMessage.from_dict({'header': header, 'payload': payload}))
+
+        self.stats["frames_decoded"] += len(messages)
+        self.stats["bytes_decoded"] += len(data)
+        return messages
+
+    def _inflate(self, body: bytes) -> bytes:
+        if self._decompressor is None:
+            raise WireProtocolError("Compressed frame on a connection without compression")
+        try:
+            inflated = self._decompressor.decompress(body + _SYNC_FLUSH_TAIL, MAX_FRAME_SIZE)
+        except zlib.error as e:
+            raise WireProtocolError(f"Corrupt compressed frame: {e}")
+        if self._decompressor.unconsumed_tail:
+            raise WireProtocolError(f"Decompressed frame exceeds {MAX_FRAME_SIZE} bytes")
+        return inflated
@@ -19,6 +19,7 @@ from .civilization import Civilization
 from .technology_tree import TechnologyEra
 from .events import EventManager, PoliticalEvent
 from .resources import ResourceManager
+from .turn_scheduler import TurnScheduler
 
 # Import bridge components - make optional for now
 try:
@@ -142,9 +143,12 @@ class GameState(BaseModel):
 class GameStateManager:
     """Central manager for coordinating all game systems."""
     
-    def __init__(self, event_broadcaster: Optional[Any] = None):
+    def __init__(self, event_broadcaster: Optional[Any] = None,
+                 turn_scheduler: Optional[TurnScheduler] = None):
         self.state = GameState()
         self.event_broadcaster = event_broadcaster or (EventBroadcaster() if EventBroadcaster else None)
+        # Turn-driven systems (crisis escalation, conspiracy scans) subscribe here
+        self.turn_scheduler = turn_scheduler if turn_scheduler is not None else TurnScheduler()
         self.system_managers: Dict[str, Any] = {}
         self.era_config = self._load_era_configurations()
         
@@ -221,6 +225,9 @@ class GameStateManager:
         # Broadcast turn completion
         self._broadcast_event('turn_completed', turn_results)
         
+        # Fire turn timers and subscribed monitors
+        self.turn_scheduler.notify_turn(self.state.current_turn)
+        
         return turn_results
         
     def check_era_transition_readiness(self, civilization_id: str) -> EraTransitionMetrics:
@@ -323,6 +330,10 @@ class GameStateManager:
         """Register a system manager for coordination."""
         self.system_managers[system_name] = manager
         
+        # Turn-driven managers run on this game's scheduler
+        if hasattr(manager, 'attach_scheduler'):
+            manager.attach_scheduler(self.turn_scheduler)
+        
         # Notify manager of current game state
         if hasattr(manager, 'on_game_state_update'):
             manager.on_game_state_update(self.state)
@@ -0,0 +1,230 @@
+"""
+Turn-based scheduling for game systems.
+
+Monitors such as crisis escalation and conspiracy detection run on game
+turns rather than wall-clock polling. The scheduler keeps a heap of timers
+keyed on turn numbers and game-time deadlines, and fires them along with
+per-turn subscribers whenever the game state manager advances a turn. The
+clock is injectable so headless runs can use a simulated clock and fast
+forward through many turns instantly.
+"""
+
+from typing import Any, Callable, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+
+
+class WallClock:
+    """Clock backed by the system time."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def advance(self, delta: timedelta) -> None:
+        """Wall time advances on its own; turns do not move it."""
+
+
+class SimulatedClock:
+    """Manually advanced clock for headless simulation and tests."""
+
+    def __init__(self, start: Optional[datetime] = None):
+        self.current = start or datetime.now()
+
+    def now(self) -> datetime:
+        return self.current
+
+    def advance(self, delta: timedelta) -> None:
+        self.current += delta
+
+
+@dataclass
+class ScheduledTimer:
+    """Handle for a pending timer; cancel() prevents it from firing."""
+    callback: Callable
+    args: Tuple[Any, ...] = ()
+    turn: Optional[int] = None
+    deadline: Optional[datetime] = None
+    cancelled: bool = field(default=False, compare=False)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TurnScheduler:
+    """
+    Heap-based timer and turn event dispatcher.
+
+    Turn timers and clock deadlines live in separate heaps and become due once
+    the current turn or the clock reaches them. Each ``advance_turn`` moves the
+    clock forward by ``turn_duration`` of game time, fires due turn timers and
+    then due deadlines in order, and finally calls turn subscribers with the
+    new turn number. Callbacks may be plain functions or coroutines.
+    """
+
+    def __init__(self, clock: Optional[Any] = None, turn_duration: timedelta = timedelta(hours=1)):
+        self.clock = clock or WallClock()
+        self.turn_duration = turn_duration
+        self.current_turn = 0
+        self._turn_timers: List[Tuple[int, int, ScheduledTimer]] = []
+        self._clock_timers: List[Tuple[float, int, ScheduledTimer]] = []
+        self._sequence = itertools.count()
+        self._subscribers: List[Callable] = []
+        self._pending_tasks: Set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._sync_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._running = False
+        self.logger = logging.getLogger(__name__)
+
+    def __len__(self) -> int:
+        return sum(1 for heap in (self._turn_timers, self._clock_timers)
+                   for *_, timer in heap if not timer.cancelled)
+
+    def subscribe(self, callback: Callable) -> None:
+        """Call ``callback(turn)`` after every turn advance."""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def call_at_turn(self, turn: int, callback: Callable, *args: Any) -> ScheduledTimer:
+        """Fire ``callback(*args)`` once the game reaches ``turn``."""
+        timer = ScheduledTimer(callback, args, turn=turn)
+        heapq.heappush(self._turn_timers, (turn, next(self._sequence), timer))
+        return timer
+
+    def call_after_turns(self, turns: int, callback: Callable, *args: Any) -> ScheduledTimer:
+        return self.call_at_turn(self.current_turn + max(0, turns), callback, *args)
+
+    def call_at(self, deadline: datetime, callback: Callable, *args: Any) -> ScheduledTimer:
+        """Fire ``callback(*args)`` once the clock reaches ``deadline``."""
+        timer = ScheduledTimer(callback, args, deadline=deadline)
+        earliest = self.next_deadline()
+        heapq.heappush(self._clock_timers, (deadline.timestamp(), next(self._sequence), timer))
+        if self._wakeup is not None and (earliest is None or deadline < earliest):
+            self._wakeup.set()
+        return timer
+
+    def next_deadline(self) -> Optional[datetime]:
+        """Earliest pending clock deadline, if any."""
+        while self._clock_timers and self._clock_timers[0][-1].cancelled:
+            heapq.heappop(self._clock_timers)
+        return self._clock_timers[0][-1].deadline if self._clock_timers else None
+
+    async def advance_turn(self, turn: Optional[int] = None) -> int:
+        """Advance to ``turn`` (default: the next turn) and dispatch due work."""
+        current_turn = self._begin_turn(turn)
+        for timer in self._pop_due():
+            await self._invoke(timer.callback, *timer.args)
+        for callback in list(self._subscribers):
+            await self._invoke(callback, current_turn)
+        return current_turn
+
+    async def fast_forward(self, turns: int) -> int:
+        """Advance through ``turns`` turns back to back."""
+        for _ in range(turns):
+            await self.advance_turn()
+        return self.current_turn
+
+    async def run_due(self) -> int:
+        """Fire timers that are due without advancing the turn."""
+        due = self._pop_due()
+        for timer in due:
+            await self._invoke(timer.callback, *timer.args)
+        return len(due)
+
+    def notify_turn(self, turn: Optional[int] = None) -> Optional[asyncio.Task]:
+        """
+        Synchronous entry point for turn advances.
+
+        Inside a running event loop the dispatch is scheduled as a task.
+        Otherwise callbacks are called directly before returning, and only
+        coroutine callbacks are driven, on one loop reused across turns.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_turn = self._begin_turn(turn)
+            for timer in self._pop_due():
+                self._invoke_sync(timer.callback, *timer.args)
+            for callback in list(self._subscribers):
+                self._invoke_sync(callback, current_turn)
+            return None
+        task = loop.create_task(self.advance_turn(turn))
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
+    async def run(self) -> None:
+        """
+        Fire clock deadlines as they come due under a wall clock.
+
+        Sleeps until the earliest deadline instead of polling, waking early
+        when an earlier timer is scheduled.
+        """
+        self._running = True
+        self._wakeup = asyncio.Event()
+        try:
+            while self._running:
+                await self.run_due()
+                deadline = self.next_deadline()
+                timeout = None
+                if deadline is not None:
+                    timeout = max(0.0, (deadline - self.clock.now()).total_seconds())
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+
+    def stop(self) -> None:
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def close(self) -> None:
+        """Release the loop used for synchronous dispatch."""
+        if self._sync_loop is not None:
+            self._sync_loop.close()
+            self._sync_loop = None
+
+    def _begin_turn(self, turn: Optional[int]) -> int:
+        self.current_turn = self.current_turn + 1 if turn is None else turn
+        self.clock.advance(self.turn_duration)
+        return self.current_turn
+
+    def _pop_due(self) -> List[ScheduledTimer]:
+        due = []
+        now = self.clock.now().timestamp()
+        for heap, limit in ((self._turn_timers, self.current_turn), (self._clock_timers, now)):
+            while heap and heap[0][0] <= limit:
+                timer = heapq.heappop(heap)[-1]
+                if not timer.cancelled:
+                    due.append(timer)
+        return due
+
+    def _invoke_sync(self, callback: Callable, *args: Any) -> None:
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                if self._sync_loop is None:
+                    self._sync_loop = asyncio.new_event_loop()
+                self._sync_loop.run_until_complete(result)
+        except Exception as e:
+            self.logger.error(f"Scheduled callback {getattr(callback, '__name__', callback)} failed: {e}")
+
+    async def _invoke(self, callback: Callable, *args: Any) -> None:
+        try:
+            result = callback(*args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            self.logger.error(f"Scheduled callback {getattr(callback, '__name__', callback)} failed: {e}")
@@ -8,6 +8,7 @@ political conspiracies with AI advisor assistance.
 
 import asyncio
 import json
+import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable, Set
 from dataclasses import dataclass, field
@@ -17,6 +18,7 @@ from ..llm.conspiracy import ConspiracyGenerator, ConspiracyPlot, ConspiracyType
 from ..llm.dialogue import MultiAdvisorDialogue, DialogueContext, DialogueType
 from ..llm.advisors import AdvisorCouncil, AdvisorRole
 from ..llm.llm_providers import LLMManager
+from ..core.turn_scheduler import TurnScheduler, ScheduledTimer
 
 
 class ThreatLevel(Enum):
@@ -123,7 +125,8 @@ class InteractiveConspiracyManager:
     """Interactive conspiracy detection and management system with AI advisor integration."""
     
     def __init__(self, llm_manager: LLMManager, advisor_council: AdvisorCouncil,
-                 dialogue_system: MultiAdvisorDialogue, conspiracy_generator: ConspiracyGenerator):
+                 dialogue_system: MultiAdvisorDialogue, conspiracy_generator: ConspiracyGenerator,
+                 scheduler: Optional[TurnScheduler] = None):
         self.llm_manager = llm_manager
         self.advisor_council = advisor_council
         self.dialogue_system = dialogue_system
@@ -148,9 +151,36 @@ class InteractiveConspiracyManager:
             "counter_intelligence": 0.5
         }
         
-        # Alert monitoring
+        # Alert monitoring runs on the game's turn scheduler, whose clock is game time.
+        # Without one, a private scheduler is used until GameStateManager attaches its own.
+        self.scheduler = scheduler if scheduler is not None else TurnScheduler()
+        self.scheduler_attached = scheduler is not None
+        self.clock = self.scheduler.clock
+        self.scan_interval_turns = 1
         self.alert_monitoring_active = False
-        self.last_conspiracy_scan = datetime.now()
+        self.last_conspiracy_scan = self.clock.now()
+        self._expiry_timers: Dict[str, ScheduledTimer] = {}
+        self.logger = logging.getLogger(__name__)
+        
+    def attach_scheduler(self, scheduler: TurnScheduler):
+        """Move alert monitoring and alert expiry onto the game's turn scheduler."""
+        self.scheduler_attached = True
+        if scheduler is self.scheduler:
+            return
+        if self.alert_monitoring_active:
+            self.scheduler.unsubscribe(self._on_turn_advanced)
+        for timer in self._expiry_timers.values():
+            timer.cancel()
+        self._expiry_timers.clear()
+        
+        self.scheduler = scheduler
+        self.clock = scheduler.clock
+        for alert in self.pending_alerts.values():
+            if alert.expires_at:
+                self._expiry_timers[alert.alert_id] = scheduler.call_at(
+                    alert.expires_at, self._expire_alert, alert.alert_id)
+        if self.alert_monitoring_active:
+            scheduler.subscribe(self._on_turn_advanced)
         
     def register_alert_callback(self, callback: Callable):
         """Register callback for new conspiracy alerts."""
@@ -165,39 +195,47 @@ class InteractiveConspiracyManager:
         self.evidence_callbacks.append(callback)
         
     async def start_alert_monitoring(self):
-        """Start continuous monitoring for conspiracy threats."""
+        """Start scanning for conspiracy threats on each game turn."""
+        if not self.scheduler_attached:
+            self.logger.warning("Conspiracy alert monitoring started without a game turn scheduler; "
+                                "register the manager with GameStateManager to receive turns")
         self.alert_monitoring_active = True
-        asyncio.create_task(self._monitor_conspiracy_threats())
+        self.scheduler.subscribe(self._on_turn_advanced)
         
     async def stop_alert_monitoring(self):
         """Stop conspiracy threat monitoring."""
         self.alert_monitoring_active = False
-        
-    async def _monitor_conspiracy_threats(self):
-        """Background task to monitor for new conspiracy threats."""
-        while self.alert_monitoring_active:
-            try:
-                # Scan for new threats every 30 seconds (configurable)
-                await asyncio.sleep(30)
-                
-                # Get recent activities (mock for testing)
-                recent_activities = self._get_recent_suspicious_activities()
-                
-                # Check for new conspiracy threats
-                new_threats = await self._detect_conspiracies_from_activities(recent_activities)
+        self.scheduler.unsubscribe(self._on_turn_advanced)
+        
+    async def _on_turn_advanced(self, turn: int):
+        """Scan for new conspiracy threats every ``scan_interval_turns`` turns."""
+        if not self.alert_monitoring_active or turn % max(1, self.scan_interval_turns):
+            return
+        
+        # Get recent activities (mock for testing)
+        recent_activities = self._get_recent_suspicious_activities()
+        
+        # Check for new conspiracy threats
+        new_threats = await self._detect_conspiracies_from_activities(recent_activities)
+        
+        # Process new threats into alerts
+        for threat in new_threats:
+            if threat.threat_id not in self.active_investigations:
+                alert = await self._create_conspiracy_alert(threat)
+                self.pending_alerts[alert.alert_id] = alert
+                if alert.expires_at:
+                    self._expiry_timers[alert.alert_id] = self.scheduler.call_at(
+                        alert.expires_at, self._expire_alert, alert.alert_id)
+                await self._notify_alert_callbacks(alert)
                 
-                # Process new threats into alerts
-                for threat in new_threats:
-                    if threat.threat_id not in self.active_investigations:
-                        alert = await self._create_conspiracy_alert(threat)
-                        self.pending_alerts[alert.alert_id] = alert
-                        await self._notify_alert_callbacks(alert)
-                        
-                self.last_conspiracy_scan = datetime.now()
-                
-            except Exception as e:
-                print(f"Error in conspiracy monitoring: {e}")
-                await asyncio.sleep(60)  # Wait longer on error
+        self.last_conspiracy_scan = self.clock.now()
+    
+    def _expire_alert(self, alert_id: str):
+        """Drop a time-sensitive alert the player never acknowledged."""
+        self._expiry_timers.pop(alert_id, None)
+        alert = self.pending_alerts.get(alert_id)
+        if alert and not alert.acknowledged:
+            del self.pending_alerts[alert_id]
                 
     def _get_recent_suspicious_activities(self) -> List[SuspiciousActivity]:
         """Get recent suspicious activities for monitoring (mock implementation)."""
@@ -224,7 +262,7 @@ class InteractiveConspiracyManager:
                 threat_level = ThreatLevel.HIGH if activity.suspicion_level > 0.8 else ThreatLevel.MEDIUM
                 
                 threat = ConspiracyThreat(
-                    threat_id=f"threat_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    threat_id=f"threat_{self.clock.now().strftime('%Y%m%d_%H%M%S')}",
                     conspiracy_type=activity.activity_type,
                     threat_level=threat_level,
                     participants=activity.participants,
@@ -238,7 +276,7 @@ class InteractiveConspiracyManager:
         
     async def _create_conspiracy_alert(self, threat: ConspiracyThreat) -> ConspiracyAlert:
         """Create a player-facing alert from a conspiracy threat."""
-        alert_id = f"alert_{threat.threat_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        alert_id = f"alert_{threat.threat_id}_{self.clock.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Determine urgency and recommended actions based on threat level
         urgency_map = {
@@ -263,7 +301,7 @@ class InteractiveConspiracyManager:
             
         # Check if time-sensitive
         time_sensitive = threat.threat_level in [ThreatLevel.HIGH, ThreatLevel.CRITICAL]
-        expires_at = datetime.now() + timedelta(hours=24) if time_sensitive else None
+        expires_at = self.clock.now() + timedelta(hours=24) if time_sensitive else None
         
         alert = ConspiracyAlert(
             alert_id=alert_id,
@@ -274,7 +312,8 @@ class InteractiveConspiracyManager:
             urgency_score=urgency_map[threat.threat_level],
             recommended_actions=recommended_actions,
             time_sensitive=time_sensitive,
-            expires_at=expires_at
+            expires_at=expires_at,
+            timestamp=self.clock.now()
         )
         
         return alert
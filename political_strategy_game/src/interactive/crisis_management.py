@@ -5,8 +5,8 @@ Provides AI-generated political crisis scenarios with real-time management,
 escalation dynamics, and interactive response coordination with advisor consultation.
 """
 
-import asyncio
 import json
+import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Callable, Set
 from dataclasses import dataclass, field
@@ -18,6 +18,7 @@ from llm.advisors import AdvisorCouncil, AdvisorRole
 from llm.llm_providers import LLMManager
 from llm.emergent_storytelling import EmergentStorytellingManager, NarrativeThread, NarrativeType
 from llm.information_warfare import InformationWarfareManager
+from core.turn_scheduler import TurnScheduler, ScheduledTimer
 
 
 class CrisisType(Enum):
@@ -148,7 +149,8 @@ class DynamicCrisisManager:
     
     def __init__(self, llm_manager: LLMManager, advisor_council: AdvisorCouncil,
                  dialogue_system: MultiAdvisorDialogue, storytelling_manager: EmergentStorytellingManager,
-                 information_warfare: InformationWarfareManager):
+                 information_warfare: InformationWarfareManager,
+                 scheduler: Optional[TurnScheduler] = None):
         self.llm_manager = llm_manager
         self.advisor_council = advisor_council
         self.dialogue_system = dialogue_system
@@ -170,9 +172,33 @@ class DynamicCrisisManager:
         self.escalation_rate = 0.05    # How quickly crises escalate
         self.max_concurrent_crises = 3
         
-        # Monitoring state
+        # Monitoring runs on the game's turn scheduler, whose clock is game time.
+        # Without one, a private scheduler is used until GameStateManager attaches its own.
+        self.scheduler = scheduler if scheduler is not None else TurnScheduler()
+        self.scheduler_attached = scheduler is not None
+        self.clock = self.scheduler.clock
         self.monitoring_active = False
-        self.last_crisis_check = datetime.now()
+        self.last_crisis_check = self.clock.now()
+        self._deadline_timers: Dict[str, List[ScheduledTimer]] = {}
+        self.logger = logging.getLogger(__name__)
+        
+    def attach_scheduler(self, scheduler: TurnScheduler):
+        """Move turn monitoring and crisis deadlines onto the game's turn scheduler."""
+        self.scheduler_attached = True
+        if scheduler is self.scheduler:
+            return
+        if self.monitoring_active:
+            self.scheduler.unsubscribe(self._on_turn_advanced)
+        for timers in self._deadline_timers.values():
+            for timer in timers:
+                timer.cancel()
+        
+        self.scheduler = scheduler
+        self.clock = scheduler.clock
+        for crisis in list(self.active_crises.values()):
+            self._track_crisis(crisis)
+        if self.monitoring_active:
+            scheduler.subscribe(self._on_turn_advanced)
         
     def register_crisis_callback(self, callback: Callable):
         """Register callback for new crisis events."""
@@ -187,49 +213,64 @@ class DynamicCrisisManager:
         self.decision_callbacks.append(callback)
         
     async def start_crisis_monitoring(self):
-        """Start continuous monitoring and generation of crisis events."""
+        """Start monitoring and generating crisis events on each game turn."""
+        if not self.scheduler_attached:
+            self.logger.warning("Crisis monitoring started without a game turn scheduler; "
+                                "register the manager with GameStateManager to receive turns")
         self.monitoring_active = True
-        asyncio.create_task(self._monitor_and_generate_crises())
+        self.scheduler.subscribe(self._on_turn_advanced)
         
     async def stop_crisis_monitoring(self):
         """Stop crisis monitoring and generation."""
         self.monitoring_active = False
+        self.scheduler.unsubscribe(self._on_turn_advanced)
         
-    async def _monitor_and_generate_crises(self):
-        """Background task to monitor existing crises and generate new ones."""
-        while self.monitoring_active:
-            try:
-                # Monitor existing crises for escalation
-                await self._update_existing_crises()
-                
-                # Check for new crisis generation
-                if len(self.active_crises) < self.max_concurrent_crises:
-                    await self._check_for_new_crisis()
-                
-                # Wait before next check (every 30 seconds for testing, could be longer)
-                await asyncio.sleep(30)
-                
-            except Exception as e:
-                print(f"Error in crisis monitoring: {e}")
-                await asyncio.sleep(60)
+    async def _on_turn_advanced(self, turn: int):
+        """Monitor existing crises and possibly generate a new one for this turn."""
+        if not self.monitoring_active:
+            return
+        
+        # Monitor existing crises for escalation
+        await self._update_existing_crises()
+        
+        # Check for new crisis generation
+        if len(self.active_crises) < self.max_concurrent_crises:
+            await self._check_for_new_crisis()
                 
     async def _update_existing_crises(self):
         """Update and potentially escalate existing crises."""
         for crisis_id, crisis in list(self.active_crises.items()):
-            if crisis.status in [CrisisStatus.ACTIVE, CrisisStatus.ESCALATING]:
+            if crisis.status == CrisisStatus.EMERGING:
+                # A crisis becomes active on the first turn after it emerges
+                crisis.status = CrisisStatus.ACTIVE
+            elif crisis.status in [CrisisStatus.ACTIVE, CrisisStatus.ESCALATING]:
                 # Check for escalation
                 escalation_occurred = await self._check_crisis_escalation(crisis)
                 
                 if escalation_occurred:
                     await self._notify_escalation_callbacks(crisis)
-                
-                # Check for resolution deadline
-                if crisis.resolution_deadline and datetime.now() > crisis.resolution_deadline:
-                    await self._resolve_crisis_by_timeout(crisis)
+    
+    def _track_crisis(self, crisis: CrisisEvent):
+        """Register an active crisis and schedule its resolution deadlines."""
+        self.active_crises[crisis.crisis_id] = crisis
+        timers = []
+        if crisis.resolution_deadline:
+            timers.append(self.scheduler.call_at(
+                crisis.resolution_deadline, self._on_crisis_deadline, crisis.crisis_id))
+        if crisis.turns_remaining is not None:
+            timers.append(self.scheduler.call_after_turns(
+                crisis.turns_remaining, self._on_crisis_deadline, crisis.crisis_id))
+        self._deadline_timers[crisis.crisis_id] = timers
+    
+    async def _on_crisis_deadline(self, crisis_id: str):
+        """Fail a crisis that reaches its deadline without being resolved."""
+        crisis = self.active_crises.get(crisis_id)
+        if crisis and crisis.status in [CrisisStatus.EMERGING, CrisisStatus.ACTIVE, CrisisStatus.ESCALATING]:
+            await self._resolve_crisis_by_timeout(crisis)
                     
     async def _check_crisis_escalation(self, crisis: CrisisEvent) -> bool:
         """Check if a crisis should escalate."""
-        time_since_update = (datetime.now() - crisis.last_update).total_seconds() / 3600
+        time_since_update = (self.clock.now() - crisis.last_update).total_seconds() / 3600
         
         # Calculate escalation probability
         base_escalation = self.escalation_rate * time_since_update
@@ -240,7 +281,7 @@ class DynamicCrisisManager:
         
         if random.random() < escalation_chance and crisis.escalation_level < 1.0:  # nosec B311 - Using random for game mechanics, not security
             crisis.escalation_level = min(1.0, crisis.escalation_level + random.uniform(0.1, 0.3))  # nosec B311 - Using random for game mechanics, not security
-            crisis.last_update = datetime.now()
+            crisis.last_update = self.clock.now()
             
             # Increase effects with escalation
             crisis.current_effects.political_stability -= 0.1
@@ -257,16 +298,16 @@ class DynamicCrisisManager:
         
     async def _check_for_new_crisis(self):
         """Check if a new crisis should be generated."""
-        time_since_last = (datetime.now() - self.last_crisis_check).total_seconds() / 3600
+        time_since_last = (self.clock.now() - self.last_crisis_check).total_seconds() / 3600
         crisis_chance = self.crisis_probability * time_since_last
         
         if random.random() < crisis_chance:  # nosec B311 - Using random for game mechanics, not security
             new_crisis = await self._generate_new_crisis()
             if new_crisis:
-                self.active_crises[new_crisis.crisis_id] = new_crisis
+                self._track_crisis(new_crisis)
                 await self._notify_crisis_callbacks(new_crisis)
                 
-        self.last_crisis_check = datetime.now()
+        self.last_crisis_check = self.clock.now()
         
     async def _generate_new_crisis(self) -> Optional[CrisisEvent]:
         """Generate a new dynamic crisis using AI."""
@@ -277,7 +318,8 @@ class DynamicCrisisManager:
         if not crisis_details:
             return None
             
-        crisis_id = f"crisis_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{crisis_type.value}"
+        now = self.clock.now()
+        crisis_id = f"crisis_{now.strftime('%Y%m%d_%H%M%S')}_{crisis_type.value}"
         
         # Determine urgency based on crisis type
         urgency_map = {
@@ -294,7 +336,7 @@ class DynamicCrisisManager:
         
         # Set resolution deadline based on urgency
         deadline_hours = {"critical": 2, "high": 12, "medium": 48, "low": 168}[urgency.value]
-        resolution_deadline = datetime.now() + timedelta(hours=deadline_hours)
+        resolution_deadline = now + timedelta(hours=deadline_hours)
         
         crisis = CrisisEvent(
             crisis_id=crisis_id,
@@ -307,6 +349,8 @@ class DynamicCrisisManager:
             affected_regions=crisis_details.get("regions", []),
             key_actors=crisis_details.get("actors", []),
             resolution_deadline=resolution_deadline,
+            start_time=now,
+            last_update=now,
             media_attention=random.uniform(0.3, 0.8)  # nosec B311 - Using random for game mechanics, not security
         )
         
@@ -628,10 +672,10 @@ class DynamicCrisisManager:
         crisis.response_history.append({
             "response": response_option.title,
             "success": response_succeeded,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self.clock.now().isoformat(),
             "effects": effects
         })
-        crisis.last_update = datetime.now()
+        crisis.last_update = self.clock.now()
         
         # Check if crisis is resolved
         if effects.get("crisis_resolved", False):
@@ -728,6 +772,8 @@ class DynamicCrisisManager:
         # Move to completed crises
         self.completed_crises.append(crisis)
         del self.active_crises[crisis.crisis_id]
+        for timer in self._deadline_timers.pop(crisis.crisis_id, []):
+            timer.cancel()
         
         # Generate final narrative if applicable
         if crisis.narrative_threads:
@@ -805,25 +851,28 @@ class DynamicCrisisManager:
             # Generate specific crisis type
             crisis_details = await self._ai_generate_crisis_details(crisis_type)
             if crisis_details:
-                crisis_id = f"forced_crisis_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                now = self.clock.now()
+                crisis_id = f"forced_crisis_{now.strftime('%Y%m%d_%H%M%S')}"
                 crisis = CrisisEvent(
                     crisis_id=crisis_id,
                     crisis_type=crisis_type,
                     title=crisis_details["title"],
                     description=crisis_details["description"],
                     urgency=CrisisUrgency.HIGH,
-                    status=CrisisStatus.EMERGING
+                    status=CrisisStatus.EMERGING,
+                    start_time=now,
+                    last_update=now
                 )
                 
                 crisis.available_responses = await self._generate_response_options(crisis)
-                self.active_crises[crisis_id] = crisis
+                self._track_crisis(crisis)
                 await self._notify_crisis_callbacks(crisis)
                 return crisis_id
         else:
             # Generate random crisis
             new_crisis = await self._generate_new_crisis()
             if new_crisis:
-                self.active_crises[new_crisis.crisis_id] = new_crisis
+                self._track_crisis(new_crisis)
                 await self._notify_crisis_callbacks(new_crisis)
                 return new_crisis.crisis_id
                 
@@ -6,17 +6,22 @@ and creates adaptive consequences based on player behavior patterns and choices.
 """
 
 import asyncio
+import gzip
+import heapq
+import itertools
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable, Set, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple, Deque, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 import statistics
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, deque
 
 from llm.dialogue import MultiAdvisorDialogue
 from llm.advisors import AdvisorCouncil
 from llm.llm_providers import LLMManager
+from core.turn_scheduler import WallClock
 
 
 class DecisionDomain(Enum):
@@ -133,6 +138,36 @@ class PlayerReputation:
             if dimension not in self.dimensions:
                 self.dimensions[dimension] = 0.0  # -1.0 to 1.0 scale
                 self.confidence_levels[dimension] = 0.0  # 0.0 to 1.0 scale
+    
+    # Stored scores are exact as of ``last_updated``; decay since then is linear
+    # toward neutral at ``rate`` per day and is computed on read in closed form.
+    
+    def _decay_amount(self, rate: float, now: datetime) -> float:
+        return rate * max(0.0, (now - self.last_updated).total_seconds() / 86400)
+    
+    def score(self, dimension: ReputationDimension, rate: float, now: datetime) -> float:
+        """Score for ``dimension`` with decay up to ``now`` applied."""
+        value = self.dimensions[dimension]
+        amount = self._decay_amount(rate, now)
+        return max(0.0, value - amount) if value > 0 else min(0.0, value + amount)
+    
+    def confidence(self, dimension: ReputationDimension, rate: float, now: datetime) -> float:
+        """Confidence for ``dimension``; it decays at half the score rate."""
+        return max(0.0, self.confidence_levels[dimension] - self._decay_amount(rate, now) * 0.5)
+    
+    def materialize(self, rate: float, now: datetime):
+        """Fold decay up to ``now`` into the stored values."""
+        for dimension in ReputationDimension:
+            self.dimensions[dimension] = self.score(dimension, rate, now)
+            self.confidence_levels[dimension] = self.confidence(dimension, rate, now)
+        self.last_updated = now
+    
+    def adjust(self, dimension: ReputationDimension, delta: float, rate: float, now: datetime,
+               confidence_delta: float = 0.0):
+        """Apply a reputation change on top of the decayed current value."""
+        self.materialize(rate, now)
+        self.dimensions[dimension] = max(-1.0, min(1.0, self.dimensions[dimension] + delta))
+        self.confidence_levels[dimension] = min(1.0, self.confidence_levels[dimension] + confidence_delta)
 
 
 @dataclass
@@ -161,20 +196,210 @@ class AdvisorRelationship:
     relationship_trend: str = "stable"  # "improving", "declining", "stable"
 
 
+@dataclass
+class ExponentialStatistic:
+    """Exponentially weighted mean and variance of a stream of observations."""
+    alpha: float = 0.1
+    count: int = 0
+    mean: float = 0.0
+    variance: float = 0.0
+    
+    def update(self, value: float):
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+            return
+        delta = value - self.mean
+        increment = self.alpha * delta
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + delta * increment)
+    
+    def to_dict(self) -> Dict[str, float]:
+        return {"count": self.count, "mean": self.mean, "variance": self.variance}
+
+
+class DecisionAggregates:
+    """
+    Streaming aggregates over every tracked decision.
+    
+    Pattern analysis and trends read these running counts, per-category and
+    per-advisor exponentially weighted statistics, and a short window of recent
+    decisions, so their cost does not grow with the length of the campaign.
+    """
+    
+    URGENT_PRESSURE = 0.7
+    HIGH_COMPLEXITY = 0.7
+    
+    def __init__(self, alpha: float = 0.1, recent_window: int = 20):
+        self.alpha = alpha
+        self.total = 0
+        self.consulted = 0
+        self.urgent = 0
+        self.high_risk = 0
+        self.outcomes = 0
+        self.successes = 0
+        self.by_domain: Counter = Counter()
+        self.by_type: Counter = Counter()
+        self.recent: Deque[PlayerDecision] = deque(maxlen=recent_window)
+        self.last_decision_id = ""
+        
+        # Decision types chosen per (domain, urgency) context, for consistency patterns
+        self.context_types: Dict[str, Counter] = defaultdict(Counter)
+        self.context_last_decision: Dict[str, str] = {}
+        
+        self.category_statistics: Dict[str, Dict[str, ExponentialStatistic]] = defaultdict(self._statistics)
+        self.advisor_statistics: Dict[str, Dict[str, ExponentialStatistic]] = defaultdict(self._statistics)
+    
+    def _statistics(self) -> Dict[str, ExponentialStatistic]:
+        return defaultdict(lambda: ExponentialStatistic(self.alpha))
+    
+    @staticmethod
+    def context_key(decision: PlayerDecision) -> str:
+        return f"{decision.domain.value}_{decision.context.time_pressure:.1f}"
+    
+    def add(self, decision: PlayerDecision):
+        self.total += 1
+        self.consulted += decision.advisor_consultation
+        self.urgent += decision.context.time_pressure > self.URGENT_PRESSURE
+        self.high_risk += decision.complexity_score > self.HIGH_COMPLEXITY
+        self.by_domain[decision.domain] += 1
+        self.by_type[decision.decision_type] += 1
+        self.recent.append(decision)
+        self.last_decision_id = decision.decision_id
+        
+        context_key = self.context_key(decision)
+        self.context_types[context_key][decision.decision_type] += 1
+        self.context_last_decision[context_key] = decision.decision_id
+        
+        for category in (f"domain:{decision.domain.value}", f"type:{decision.decision_type.value}"):
+            stats = self.category_statistics[category]
+            stats["complexity"].update(decision.complexity_score)
+            stats["time_pressure"].update(decision.context.time_pressure)
+            stats["consultation"].update(float(decision.advisor_consultation))
+    
+    def record_outcome(self, decision: PlayerDecision, outcome: DecisionOutcome):
+        self.outcomes += 1
+        self.successes += outcome.success
+        for category in (f"domain:{decision.domain.value}", f"type:{decision.decision_type.value}"):
+            self.category_statistics[category]["success"].update(float(outcome.success))
+    
+    def observe_advisor(self, advisor_name: str, metric: str, value: float):
+        self.advisor_statistics[advisor_name][metric].update(value)
+    
+    def ratio(self, count: int) -> float:
+        return count / self.total if self.total else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "consultation_rate": self.ratio(self.consulted),
+            "urgent_rate": self.ratio(self.urgent),
+            "high_risk_rate": self.ratio(self.high_risk),
+            "success_rate": self.successes / self.outcomes if self.outcomes else None,
+            "categories": {
+                category: {metric: stat.to_dict() for metric, stat in stats.items()}
+                for category, stats in self.category_statistics.items()
+            },
+            "advisors": {
+                advisor: {metric: stat.to_dict() for metric, stat in stats.items()}
+                for advisor, stats in self.advisor_statistics.items()
+            }
+        }
+
+
+class DecisionArchive:
+    """
+    Append-only store of compact records for decisions evicted from memory.
+    
+    With a ``path`` records go to a gzip-compressed JSON lines file; without
+    one only the newest ``max_records`` are kept in memory and older ones are
+    counted in ``dropped``.
+    """
+    
+    def __init__(self, path: Optional[str] = None, max_records: int = 10000):
+        self.path = Path(path) if path else None
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=max(0, max_records))
+        self.count = sum(1 for _ in self) if self.path is not None and self.path.exists() else 0
+    
+    @property
+    def dropped(self) -> int:
+        """Archived decisions whose records were discarded by the in-memory cap."""
+        return 0 if self.path is not None else self.count - len(self.records)
+    
+    @staticmethod
+    def compact(decision: PlayerDecision) -> Dict[str, Any]:
+        """Reduce a decision to the fields kept after archival."""
+        return {
+            "id": decision.decision_id,
+            "domain": decision.domain.value,
+            "type": decision.decision_type.value,
+            "title": decision.title,
+            "turn": decision.context.game_turn,
+            "timestamp": decision.timestamp.isoformat(),
+            "consulted": decision.advisor_consultation,
+            "complexity": decision.complexity_score,
+            "time_pressure": decision.context.time_pressure,
+            "outcome_success": decision.outcome.success if decision.outcome else None
+        }
+    
+    def append(self, decisions: List[PlayerDecision]):
+        if not decisions:
+            return
+        if self.path is None:
+            self.records.extend(self.compact(d) for d in decisions)
+            self.count += len(decisions)
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lines = "".join(json.dumps(self.compact(d), separators=(",", ":")) + "\n" for d in decisions)
+        # Each append adds a gzip member; readers see one continuous stream
+        with gzip.open(self.path, "at", encoding="utf-8") as handle:
+            handle.write(lines)
+        self.count += len(decisions)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self.path is None:
+            yield from self.records
+            return
+        if not self.path.exists():
+            return
+        with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
 class PlayerDecisionTracker:
-    """Comprehensive system for tracking player decisions and building adaptive responses."""
+    """
+    Comprehensive system for tracking player decisions and building adaptive responses.
+    
+    Only the most recent ``max_resident_decisions`` decisions stay in memory;
+    older ones are moved to the archive in batches. Analysis runs on streaming
+    aggregates, so per-decision latency stays flat over a long campaign.
+    
+    With ``archive_path`` the archive is a compressed file on disk and exports
+    cover the full history. Without it, evicted decisions are kept in memory
+    as compact summary records (``DecisionArchive.compact``), capped at
+    ``max_archived_records``; exports report how many were dropped.
+    """
     
     def __init__(self, llm_manager: LLMManager, advisor_council: AdvisorCouncil,
-                 dialogue_system: MultiAdvisorDialogue):
+                 dialogue_system: MultiAdvisorDialogue, archive_path: Optional[str] = None,
+                 max_resident_decisions: int = 1000, clock: Optional[Any] = None,
+                 max_archived_records: int = 10000):
         self.llm_manager = llm_manager
         self.advisor_council = advisor_council
         self.dialogue_system = dialogue_system
+        self.clock = clock if clock is not None else WallClock()
         
         # Decision tracking
         self.decisions: List[PlayerDecision] = []
         self.decision_lookup: Dict[str, PlayerDecision] = {}
-        self.decisions_by_domain: Dict[DecisionDomain, List[str]] = defaultdict(list)
-        self.decisions_by_type: Dict[DecisionType, List[str]] = defaultdict(list)
+        self.decisions_by_domain: Dict[DecisionDomain, Deque[str]] = defaultdict(deque)
+        self.decisions_by_type: Dict[DecisionType, Deque[str]] = defaultdict(deque)
+        self.aggregates = DecisionAggregates()
+        self.archive = DecisionArchive(archive_path, max_archived_records)
+        self.max_resident_decisions = max(1, max_resident_decisions)
+        self.archive_batch_size = max(1, self.max_resident_decisions // 10)
         
         # Player profile
         self.player_reputation: PlayerReputation = PlayerReputation()
@@ -183,6 +408,8 @@ class PlayerDecisionTracker:
         
         # Impact tracking
         self.pending_impacts: Dict[str, List[Dict[str, Any]]] = defaultdict(list)  # decision_id -> future impacts
+        self._impact_queue: List[Tuple[datetime, int, str, Dict[str, Any]]] = []  # Ordered by scheduled time
+        self._impact_sequence = itertools.count()
         self.cumulative_effects: Dict[str, float] = defaultdict(float)  # metric -> cumulative change
         
         # Analysis state
@@ -194,6 +421,7 @@ class PlayerDecisionTracker:
         self.reputation_decay_rate = 0.02  # How much reputation fades over time
         self.pattern_confidence_threshold = 0.7
         self.min_decisions_for_pattern = 3
+        self.max_supporting_decisions = 50  # Decision IDs kept per behavior pattern
         
         # Initialize advisor relationships
         self._initialize_advisor_relationships()
@@ -213,13 +441,15 @@ class PlayerDecisionTracker:
         """Track a new player decision and begin impact monitoring."""
         # Assign decision ID if not provided
         if not decision.decision_id:
-            decision.decision_id = f"decision_{len(self.decisions) + 1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            decision.decision_id = f"decision_{self.aggregates.total + 1}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Store decision
         self.decisions.append(decision)
         self.decision_lookup[decision.decision_id] = decision
         self.decisions_by_domain[decision.domain].append(decision.decision_id)
         self.decisions_by_type[decision.decision_type].append(decision.decision_id)
+        self.aggregates.add(decision)
+        self._evict_old_decisions()
         
         # Update advisor relationships
         await self._update_advisor_relationships(decision)
@@ -248,17 +478,15 @@ class PlayerDecisionTracker:
         decision = self.decision_lookup[decision_id]
         decision.outcome = outcome
         
+        self.aggregates.record_outcome(decision, outcome)
+        
         # Update cumulative effects
         for metric, change in outcome.immediate_effects.items():
             self.cumulative_effects[metric] += change
             
-        # Update reputation based on outcome
+        # Update reputation based on outcome, increasing confidence in each dimension
         for dimension, change in outcome.reputation_changes.items():
-            current = self.player_reputation.dimensions[dimension]
-            self.player_reputation.dimensions[dimension] = max(-1.0, min(1.0, current + change))
-            # Increase confidence in this dimension
-            confidence = self.player_reputation.confidence_levels[dimension]
-            self.player_reputation.confidence_levels[dimension] = min(1.0, confidence + 0.1)
+            self._adjust_reputation(dimension, change, confidence_delta=0.1)
             
         # Update advisor relationships based on their reactions
         await self._update_advisor_relationships_from_outcome(decision, outcome)
@@ -308,6 +536,7 @@ class PlayerDecisionTracker:
                 relationship = self.advisor_relationships[advisor_name]
                 # Simple heuristic: if decision aligns with recommendation, increase influence
                 alignment_score = self._calculate_decision_alignment(decision, recommendation)
+                self.aggregates.observe_advisor(advisor_name, "alignment", alignment_score)
                 influence_change = alignment_score * 0.02
                 relationship.influence_level = max(0.0, min(1.0, relationship.influence_level + influence_change))
                 
@@ -318,10 +547,14 @@ class PlayerDecisionTracker:
                 relationship = self.advisor_relationships[advisor_name]
                 
                 # Analyze reaction sentiment (simplified)
+                sentiment = 0.0
                 if "pleased" in reaction.lower() or "good" in reaction.lower():
                     relationship.trust_level = min(1.0, relationship.trust_level + 0.03)
+                    sentiment = 1.0
                 elif "concerned" in reaction.lower() or "disagree" in reaction.lower():
                     relationship.trust_level = max(-1.0, relationship.trust_level - 0.03)
+                    sentiment = -1.0
+                self.aggregates.observe_advisor(advisor_name, "reaction", sentiment)
                     
     def _extract_target_advisor(self, decision: PlayerDecision, action_type: str) -> Optional[str]:
         """Extract which advisor was targeted by a support/challenge action."""
@@ -381,8 +614,11 @@ class PlayerDecisionTracker:
         # Schedule these impacts
         for impact in future_impacts:
             impact["decision_id"] = decision.decision_id
+            impact["decision_title"] = decision.title
             impact["scheduled_time"] = decision.timestamp + timedelta(hours=impact["delay_hours"])
             self.pending_impacts[decision.decision_id].append(impact)
+            heapq.heappush(self._impact_queue, (impact["scheduled_time"], next(self._impact_sequence),
+                                                decision.decision_id, impact))
             
     async def _update_reputation_from_decision(self, decision: PlayerDecision):
         """Update player reputation based on a new decision."""
@@ -390,40 +626,73 @@ class PlayerDecisionTracker:
         
         # Decisiveness: Quick decisions under pressure increase this
         if context.time_pressure > 0.7:
-            current = self.player_reputation.dimensions[ReputationDimension.DECISIVENESS]
-            self.player_reputation.dimensions[ReputationDimension.DECISIVENESS] = min(1.0, current + 0.05)
+            self._adjust_reputation(ReputationDimension.DECISIVENESS, 0.05)
             
         # Collaboration: Consulting advisors increases this
         if decision.advisor_consultation:
-            current = self.player_reputation.dimensions[ReputationDimension.COLLABORATION]
-            self.player_reputation.dimensions[ReputationDimension.COLLABORATION] = min(1.0, current + 0.03)
+            self._adjust_reputation(ReputationDimension.COLLABORATION, 0.03)
             
         # Risk tolerance: High-risk decisions increase this
         complexity_threshold = 0.7
         if decision.complexity_score > complexity_threshold:
-            current = self.player_reputation.dimensions[ReputationDimension.RISK_TOLERANCE]
-            self.player_reputation.dimensions[ReputationDimension.RISK_TOLERANCE] = min(1.0, current + 0.04)
+            self._adjust_reputation(ReputationDimension.RISK_TOLERANCE, 0.04)
             
         # Domain-specific reputation updates
         if decision.domain == DecisionDomain.MILITARY:
             if "peaceful" in decision.chosen_option.lower() or "diplomatic" in decision.chosen_option.lower():
-                current = self.player_reputation.dimensions[ReputationDimension.AGGRESSION]
-                self.player_reputation.dimensions[ReputationDimension.AGGRESSION] = max(-1.0, current - 0.02)
+                self._adjust_reputation(ReputationDimension.AGGRESSION, -0.02)
             else:
-                current = self.player_reputation.dimensions[ReputationDimension.AGGRESSION]
-                self.player_reputation.dimensions[ReputationDimension.AGGRESSION] = min(1.0, current + 0.02)
-                
-        self.player_reputation.last_updated = datetime.now()
+                self._adjust_reputation(ReputationDimension.AGGRESSION, 0.02)
+    
+    def _adjust_reputation(self, dimension: ReputationDimension, delta: float,
+                           confidence_delta: float = 0.0):
+        self.player_reputation.adjust(dimension, delta, self.reputation_decay_rate,
+                                      self.clock.now(), confidence_delta)
+    
+    def _reputation_scores(self) -> Dict[ReputationDimension, float]:
+        now = self.clock.now()
+        return {dimension: self.player_reputation.score(dimension, self.reputation_decay_rate, now)
+                for dimension in ReputationDimension}
+    
+    def _reputation_confidence(self) -> Dict[ReputationDimension, float]:
+        now = self.clock.now()
+        return {dimension: self.player_reputation.confidence(dimension, self.reputation_decay_rate, now)
+                for dimension in ReputationDimension}
+    
+    def _evict_old_decisions(self):
+        """Archive the oldest resident decisions once the resident limit is exceeded."""
+        if len(self.decisions) <= self.max_resident_decisions + self.archive_batch_size:
+            return
+        
+        overflow = len(self.decisions) - self.max_resident_decisions
+        evicted = self.decisions[:overflow]
+        del self.decisions[:overflow]
+        self.archive.append(evicted)
+        
+        for decision in evicted:
+            self.decision_lookup.pop(decision.decision_id, None)
+            for index, key in ((self.decisions_by_domain, decision.domain),
+                               (self.decisions_by_type, decision.decision_type)):
+                ids = index[key]
+                # Eviction is oldest-first, so the ID is normally at the front
+                if ids and ids[0] == decision.decision_id:
+                    ids.popleft()
+                elif decision.decision_id in ids:
+                    ids.remove(decision.decision_id)
+    
+    def iter_archived_decisions(self) -> Iterator[Dict[str, Any]]:
+        """Stream compacted records of decisions that were moved to the archive."""
+        yield from self.archive
         
     async def _check_for_new_patterns(self, decision: PlayerDecision):
         """Check if new behavioral patterns emerge from this decision."""
         # Only analyze if we have enough decisions
-        if len(self.decisions) < self.min_decisions_for_pattern:
+        if self.aggregates.total < self.min_decisions_for_pattern:
             return
             
         # Check for domain preference patterns
         domain_counts = Counter()
-        recent_decisions = self.decisions[-10:]  # Look at last 10 decisions
+        recent_decisions = list(self.aggregates.recent)[-10:]  # Look at last 10 decisions
         
         for recent_decision in recent_decisions:
             domain_counts[recent_decision.domain] += 1
@@ -442,7 +711,7 @@ class PlayerDecisionTracker:
                 if existing_pattern:
                     existing_pattern.strength = min(1.0, existing_pattern.strength + 0.1)
                     existing_pattern.last_reinforced = datetime.now()
-                    existing_pattern.decisions_supporting.append(decision.decision_id)
+                    self._add_supporting_decision(existing_pattern, decision.decision_id)
                 else:
                     # Create new pattern
                     new_pattern = BehaviorPattern(
@@ -485,7 +754,7 @@ class PlayerDecisionTracker:
             existing_pattern.confidence = min(1.0, (existing_pattern.confidence + confidence) / 2)
             existing_pattern.strength = min(1.0, existing_pattern.strength + 0.05)
             existing_pattern.last_reinforced = datetime.now()
-            existing_pattern.decisions_supporting.append(decision_id)
+            self._add_supporting_decision(existing_pattern, decision_id)
         else:
             new_pattern = BehaviorPattern(
                 pattern_id=pattern_id,
@@ -499,6 +768,12 @@ class PlayerDecisionTracker:
             )
             self.behavior_patterns.append(new_pattern)
             
+    def _add_supporting_decision(self, pattern: BehaviorPattern, decision_id: str):
+        """Record a supporting decision, keeping only the most recent IDs."""
+        pattern.decisions_supporting.append(decision_id)
+        if len(pattern.decisions_supporting) > self.max_supporting_decisions:
+            del pattern.decisions_supporting[:-self.max_supporting_decisions]
+            
     async def _analyze_patterns_if_needed(self):
         """Perform pattern analysis if enough time has passed."""
         time_since_last = (datetime.now() - self.last_pattern_analysis).total_seconds()
@@ -509,7 +784,7 @@ class PlayerDecisionTracker:
             
     async def _comprehensive_pattern_analysis(self):
         """Perform comprehensive analysis of all decision patterns."""
-        if len(self.decisions) < 5:
+        if self.aggregates.total < 5:
             return
             
         # Analyze decision timing patterns
@@ -526,49 +801,39 @@ class PlayerDecisionTracker:
         
     async def _analyze_timing_patterns(self):
         """Analyze patterns in decision timing and urgency response."""
-        urgent_decisions = [d for d in self.decisions if d.context.time_pressure > 0.7]
-        total_decisions = len(self.decisions)
+        urgent_ratio = self.aggregates.ratio(self.aggregates.urgent)
         
-        if len(urgent_decisions) / total_decisions > 0.6:
+        if urgent_ratio > 0.6:
             self._update_or_create_pattern(
                 "crisis_oriented",
                 "timing_preference",
                 "Player tends to make more decisions under high pressure",
-                len(urgent_decisions) / total_decisions,
-                self.decisions[-1].decision_id if self.decisions else ""
+                urgent_ratio,
+                self.aggregates.last_decision_id
             )
             
     async def _analyze_risk_patterns(self):
         """Analyze patterns in risk-taking behavior."""
-        high_risk_decisions = [d for d in self.decisions if d.complexity_score > 0.7]
-        total_decisions = len(self.decisions)
+        high_risk_ratio = self.aggregates.ratio(self.aggregates.high_risk)
         
-        if len(high_risk_decisions) / total_decisions > 0.5:
+        if high_risk_ratio > 0.5:
             self._update_or_create_pattern(
                 "high_risk_taker",
                 "risk_behavior",
                 "Player frequently chooses complex, high-risk options",
-                len(high_risk_decisions) / total_decisions,
-                self.decisions[-1].decision_id if self.decisions else ""
+                high_risk_ratio,
+                self.aggregates.last_decision_id
             )
             
     async def _analyze_consistency_patterns(self):
         """Analyze consistency in decision-making across similar situations."""
-        # Group decisions by similar contexts
-        similar_contexts = defaultdict(list)
-        
-        for decision in self.decisions:
-            # Create a simple context key based on domain and urgency
-            context_key = f"{decision.domain.value}_{decision.context.time_pressure:.1f}"
-            similar_contexts[context_key].append(decision)
-            
-        # Look for consistent patterns within similar contexts
-        for context_key, context_decisions in similar_contexts.items():
-            if len(context_decisions) >= 3:
+        # Decisions are grouped by domain and urgency as they are tracked
+        for context_key, type_counts in self.aggregates.context_types.items():
+            context_total = sum(type_counts.values())
+            if context_total >= 3:
                 # Check if player consistently chooses similar types of responses
-                decision_types = [d.decision_type for d in context_decisions]
-                most_common_type = Counter(decision_types).most_common(1)[0]
-                consistency_ratio = most_common_type[1] / len(context_decisions)
+                most_common_type = type_counts.most_common(1)[0]
+                consistency_ratio = most_common_type[1] / context_total
                 
                 if consistency_ratio > 0.7:
                     self._update_or_create_pattern(
@@ -576,7 +841,7 @@ class PlayerDecisionTracker:
                         "consistency",
                         f"Player consistently chooses {most_common_type[0].value} in {context_key} situations",
                         consistency_ratio,
-                        context_decisions[-1].decision_id
+                        self.aggregates.context_last_decision[context_key]
                     )
                     
     def _clean_weak_patterns(self):
@@ -588,24 +853,24 @@ class PlayerDecisionTracker:
         
     async def process_pending_impacts(self):
         """Process any pending impact checks that are due."""
-        current_time = datetime.now()
-        completed_impacts = []
-        
-        for decision_id, impacts in self.pending_impacts.items():
-            for impact in impacts:
-                if current_time >= impact["scheduled_time"]:
-                    await self._process_impact_check(decision_id, impact)
-                    completed_impacts.append((decision_id, impact))
-                    
-        # Remove completed impacts
-        for decision_id, impact in completed_impacts:
-            self.pending_impacts[decision_id].remove(impact)
-            if not self.pending_impacts[decision_id]:
+        current_time = self.clock.now()
+        
+        while self._impact_queue and self._impact_queue[0][0] <= current_time:
+            _, _, decision_id, impact = heapq.heappop(self._impact_queue)
+            impacts = self.pending_impacts.get(decision_id, [])
+            position = next((i for i, pending in enumerate(impacts) if pending is impact), None)
+            if position is None:
+                continue
+            await self._process_impact_check(decision_id, impact)
+            
+            # Remove completed impact
+            del impacts[position]
+            if not impacts:
                 del self.pending_impacts[decision_id]
                 
     async def _process_impact_check(self, decision_id: str, impact: Dict[str, Any]):
         """Process a specific impact check for a decision."""
-        decision = self.decision_lookup[decision_id]
+        decision = self.decision_lookup.get(decision_id)
         impact_type = impact["impact_type"]
         
         # Simulate impact assessment (in real implementation, this would check actual game state)
@@ -613,12 +878,12 @@ class PlayerDecisionTracker:
             "decision_id": decision_id,
             "impact_type": impact_type,
             "severity": 0.5,  # Would be calculated based on actual effects
-            "description": f"{impact_type} effects from {decision.title}",
-            "timestamp": datetime.now()
+            "description": f"{impact_type} effects from {impact.get('decision_title', decision.title if decision else decision_id)}",
+            "timestamp": self.clock.now()
         }
         
-        # Store long-term impact
-        if not decision.long_term_tracked:
+        # Store long-term impact (archived decisions are no longer resident)
+        if decision is not None and not decision.long_term_tracked:
             decision.long_term_tracked = True
             
         # Notify callbacks about long-term impact
@@ -626,14 +891,12 @@ class PlayerDecisionTracker:
         
     async def get_player_profile(self) -> Dict[str, Any]:
         """Get comprehensive player profile based on tracked decisions."""
-        # Decay reputation over time
-        await self._apply_reputation_decay()
-        
+        # Reputation decay is applied on read
         profile = {
-            "total_decisions": len(self.decisions),
-            "decisions_by_domain": {domain.value: len(decisions) for domain, decisions in self.decisions_by_domain.items()},
-            "reputation": {dim.value: score for dim, score in self.player_reputation.dimensions.items()},
-            "reputation_confidence": {dim.value: conf for dim, conf in self.player_reputation.confidence_levels.items()},
+            "total_decisions": self.aggregates.total,
+            "decisions_by_domain": {domain.value: count for domain, count in self.aggregates.by_domain.items()},
+            "reputation": {dim.value: score for dim, score in self._reputation_scores().items()},
+            "reputation_confidence": {dim.value: conf for dim, conf in self._reputation_confidence().items()},
             "behavior_patterns": [
                 {
                     "type": pattern.pattern_type,
@@ -655,39 +918,29 @@ class PlayerDecisionTracker:
                 for name, rel in self.advisor_relationships.items()
             },
             "decision_trends": await self._calculate_decision_trends(),
+            "decision_statistics": self.aggregates.to_dict(),
             "cumulative_effects": dict(self.cumulative_effects)
         }
         
         return profile
         
     async def _apply_reputation_decay(self):
-        """Apply gradual decay to reputation scores over time."""
-        time_since_update = (datetime.now() - self.player_reputation.last_updated).total_seconds() / 86400  # days
+        """
+        Fold elapsed reputation decay into the stored scores.
         
-        if time_since_update > 1.0:  # Apply decay if more than a day has passed
-            decay_factor = self.reputation_decay_rate * time_since_update
-            
-            for dimension in ReputationDimension:
-                current_score = self.player_reputation.dimensions[dimension]
-                # Decay towards neutral (0.0)
-                if current_score > 0:
-                    self.player_reputation.dimensions[dimension] = max(0.0, current_score - decay_factor)
-                elif current_score < 0:
-                    self.player_reputation.dimensions[dimension] = min(0.0, current_score + decay_factor)
-                    
-                # Also decay confidence
-                current_confidence = self.player_reputation.confidence_levels[dimension]
-                self.player_reputation.confidence_levels[dimension] = max(0.0, current_confidence - decay_factor * 0.5)
-                
-            self.player_reputation.last_updated = datetime.now()
+        Reads already decay scores in closed form from ``last_updated``, so this
+        only matters before accessing ``player_reputation.dimensions`` directly.
+        """
+        self.player_reputation.materialize(self.reputation_decay_rate, self.clock.now())
             
     async def _calculate_decision_trends(self) -> Dict[str, Any]:
         """Calculate trends in decision-making over time."""
-        if len(self.decisions) < 3:
+        if self.aggregates.total < 3:
             return {"insufficient_data": True}
             
-        recent_decisions = self.decisions[-10:]  # Last 10 decisions
-        older_decisions = self.decisions[-20:-10] if len(self.decisions) >= 20 else []
+        window = list(self.aggregates.recent)
+        recent_decisions = window[-10:]  # Last 10 decisions
+        older_decisions = window[-20:-10] if len(window) >= 20 else []
         
         trends = {}
         
@@ -760,7 +1013,7 @@ class PlayerDecisionTracker:
             recommendations["risk_assessment"] = "Your careful approach has served you well - maintain prudent decision-making"
             
         # Consultation recommendation
-        consultation_rate = sum(1 for d in self.decisions if d.advisor_consultation) / max(1, len(self.decisions))
+        consultation_rate = self.aggregates.ratio(self.aggregates.consulted)
         if consultation_rate > 0.7:
             recommendations["consultation_recommendation"] = "You consistently seek input - advisors expect to be consulted"
         elif consultation_rate < 0.3:
@@ -786,12 +1039,12 @@ class PlayerDecisionTracker:
                 
     def get_decision_history(self, domain: Optional[DecisionDomain] = None, 
                            limit: Optional[int] = None) -> List[PlayerDecision]:
-        """Get decision history, optionally filtered by domain."""
+        """Get resident decision history, optionally filtered by domain."""
         decisions = self.decisions
         
         if domain:
             decision_ids = self.decisions_by_domain.get(domain, [])
-            decisions = [self.decision_lookup[did] for did in decision_ids]
+            decisions = [self.decision_lookup[did] for did in decision_ids if did in self.decision_lookup]
             
         if limit:
             decisions = decisions[-limit:]
@@ -801,9 +1054,10 @@ class PlayerDecisionTracker:
     def get_reputation_summary(self) -> Dict[str, str]:
         """Get human-readable reputation summary."""
         summary = {}
+        confidence_levels = self._reputation_confidence()
         
-        for dimension, score in self.player_reputation.dimensions.items():
-            confidence = self.player_reputation.confidence_levels[dimension]
+        for dimension, score in self._reputation_scores().items():
+            confidence = confidence_levels[dimension]
             
             if confidence < 0.3:
                 summary[dimension.value] = "Unknown - insufficient data"
@@ -818,8 +1072,12 @@ class PlayerDecisionTracker:
         
     async def export_player_data(self) -> Dict[str, Any]:
         """Export all player data for persistence or analysis."""
+        archived = [
+            {key: record[key] for key in ("id", "domain", "type", "title", "timestamp", "outcome_success")}
+            for record in self.iter_archived_decisions()
+        ]
         return {
-            "decisions": [
+            "decisions": archived + [
                 {
                     "id": d.decision_id,
                     "domain": d.domain.value,
@@ -830,9 +1088,10 @@ class PlayerDecisionTracker:
                 }
                 for d in self.decisions
             ],
+            "archived_decisions_dropped": self.archive.dropped,
             "reputation": {
-                "dimensions": {k.value: v for k, v in self.player_reputation.dimensions.items()},
-                "confidence": {k.value: v for k, v in self.player_reputation.confidence_levels.items()}
+                "dimensions": {k.value: v for k, v in self._reputation_scores().items()},
+                "confidence": {k.value: v for k, v in self._reputation_confidence().items()}
             },
             "patterns": [
                 {
@@ -6,6 +6,7 @@ player intervention capabilities, and dynamic agreement terms with relationship
 """
 
 import asyncio
+import contextvars
 import time
 import random
 from datetime import datetime, timedelta
@@ -30,6 +31,9 @@ except ImportError:
     class LLMManager:
         pass
 
+# Stage name that LLM calls are attributed to in headless runs
+_current_stage: contextvars.ContextVar = contextvars.ContextVar("negotiation_stage", default="unstaged")
+
 class NegotiationType(Enum):
     """Types of diplomatic negotiations."""
     TRADE_AGREEMENT = "trade_agreement"
@@ -191,6 +195,7 @@ class RealTimeDiplomaticNegotiations:
         self.intervention_cooldown = 30  # Seconds between player interventions
         self.auto_progression_interval = 45  # Seconds between automatic events
         self.maximum_session_duration = 3600  # 1 hour maximum
+        self.verbose = True  # Print progress for a human watcher
         
         # Analytics
         self.negotiation_analytics = {
@@ -204,9 +209,17 @@ class RealTimeDiplomaticNegotiations:
     async def initiate_negotiation(self, negotiation_type: NegotiationType, 
                                    parties: List[NegotiationParty],
                                    issues: Dict[str, Dict[str, Any]],
-                                   context: Dict[str, Any] = None) -> str:
-        """Start a new diplomatic negotiation session."""
+                                   context: Dict[str, Any] = None,
+                                   auto_progress: bool = True) -> str:
+        """
+        Start a new diplomatic negotiation session.
+        
+        With ``auto_progress`` disabled the session is not paced in real time and
+        the caller drives it through ``_progress_negotiation_stage``.
+        """
         negotiation_id = f"negotiation_{int(time.time())}_{random.randint(1000, 9999)}"  # nosec B311 - Using random for game mechanics, not security
+        while negotiation_id in self.active_negotiations:
+            negotiation_id = f"negotiation_{int(time.time())}_{random.randint(1000, 99999)}"  # nosec B311 - Using random for game mechanics, not security
         session = {
             "id": negotiation_id,
             "type": negotiation_type,
@@ -247,11 +260,17 @@ class RealTimeDiplomaticNegotiations:
         session["events"].append(initial_event)
         
         # Start automatic progression
-        asyncio.create_task(self._auto_progress_negotiation(negotiation_id))
+        if auto_progress:
+            asyncio.create_task(self._auto_progress_negotiation(negotiation_id))
         
-        print(f"🤝 Initiated {negotiation_type.value} negotiations: {negotiation_id}")
+        self._announce(f"🤝 Initiated {negotiation_type.value} negotiations: {negotiation_id}")
         return negotiation_id
     
+    def _announce(self, message: str):
+        """Print a progress message unless running headless."""
+        if self.verbose:
+            print(message)
+    
     async def _initialize_party_positions(self, session: Dict[str, Any], 
                                           issues: Dict[str, Dict[str, Any]]):
         """Initialize negotiation positions for all parties."""
@@ -368,7 +387,7 @@ class RealTimeDiplomaticNegotiations:
             # Update progress score
             session["progress_score"] = min(1.0, session["progress_score"] + 0.15)
             
-            print(f"📈 Negotiation {negotiation_id} progressed to: {next_stage.value}")
+            self._announce(f"📈 Negotiation {negotiation_id} progressed to: {next_stage.value}")
         elif current_stage == NegotiationStage.SIGNING:
             await self._conclude_negotiation(negotiation_id, "agreement")
     
@@ -393,32 +412,12 @@ class RealTimeDiplomaticNegotiations:
         session = self.active_negotiations[negotiation_id]
         parties = session["parties"]
         
-        for party_id, party in parties.items():
-            # Generate AI-driven opening statement
-            statement_prompt = f"""
-            Generate an opening statement for {party.name} ({party.negotiator_name}) 
-            in {session['type'].value} negotiations.
-            
-            Party characteristics:
-            - Power level: {party.power_level:.2f}
-            - Diplomatic skill: {party.diplomatic_skill:.2f}
-            - Cooperation tendency: {party.cooperation_tendency:.2f}
-            - Role: {party.role.value}
-            
-            Keep the statement diplomatic, specific to the negotiation type,
-            and reflective of their position strength.
-            """
-            
-            try:
-                response = await self.llm_manager.generate(
-                    [{"role": "user", "content": statement_prompt}],
-                    max_tokens=150,
-                    temperature=0.7
-                )
-                statement = response.content.strip()
-            except:
-                statement = f"We look forward to productive negotiations that serve our mutual interests."
-            
+        # Statements are independent, so request them concurrently
+        statements = await asyncio.gather(*(
+            self._generate_opening_statement(session, party) for party in parties.values()
+        ))
+        
+        for (party_id, party), statement in zip(parties.items(), statements):
             # Create opening statement event
             opening_event = NegotiationEvent(
                 timestamp=datetime.now(),
@@ -430,6 +429,33 @@ class RealTimeDiplomaticNegotiations:
             )
             session["events"].append(opening_event)
     
+    async def _generate_opening_statement(self, session: Dict[str, Any],
+                                          party: NegotiationParty) -> str:
+        """Generate an AI-driven opening statement for one party."""
+        statement_prompt = f"""
+        Generate an opening statement for {party.name} ({party.negotiator_name}) 
+        in {session['type'].value} negotiations.
+        
+        Party characteristics:
+        - Power level: {party.power_level:.2f}
+        - Diplomatic skill: {party.diplomatic_skill:.2f}
+        - Cooperation tendency: {party.cooperation_tendency:.2f}
+        - Role: {party.role.value}
+        
+        Keep the statement diplomatic, specific to the negotiation type,
+        and reflective of their position strength.
+        """
+        
+        try:
+            response = await self.llm_manager.generate(
+                [{"role": "user", "content": statement_prompt}],
+                max_tokens=150,
+                temperature=0.7
+            )
+            return response.content.strip()
+        except:
+            return f"We look forward to productive negotiations that serve our mutual interests."
+    
     async def _generate_proposal_exchanges(self, negotiation_id: str):
         """Generate proposal exchanges between parties."""
         session = self.active_negotiations[negotiation_id]
@@ -667,7 +693,7 @@ class RealTimeDiplomaticNegotiations:
             session["current_proposals"]["package_deal"] = package_proposal
             session["momentum"] = min(1.0, session["momentum"] + 0.15)
             
-            print(f"📦 Package deal proposed in {negotiation_id}")
+            self._announce(f"📦 Package deal proposed in {negotiation_id}")
         else:
             # Package deal rejected
             rejection_event = NegotiationEvent(
@@ -749,7 +775,7 @@ class RealTimeDiplomaticNegotiations:
         }
         self.player_interventions.append(intervention_record)
         
-        print(f"🎯 Player intervention in {negotiation_id}: {intervention_type}")
+        self._announce(f"🎯 Player intervention in {negotiation_id}: {intervention_type}")
         return result
     
     async def _process_player_intervention(self, negotiation_id: str, intervention_type: str,
@@ -1080,9 +1106,9 @@ class RealTimeDiplomaticNegotiations:
         # Update analytics
         await self._update_negotiation_analytics(session, outcome)
         
-        print(f"🏁 Negotiation {negotiation_id} concluded: {conclusion_type}")
-        print(f"   Agreement reached: {outcome.agreement_reached}")
-        print(f"   Duration: {outcome.duration}")
+        self._announce(f"🏁 Negotiation {negotiation_id} concluded: {conclusion_type}")
+        self._announce(f"   Agreement reached: {outcome.agreement_reached}")
+        self._announce(f"   Duration: {outcome.duration}")
         
         return outcome
     
@@ -1407,3 +1433,214 @@ class RealTimeDiplomaticNegotiations:
                 "events_count": len(session["events"])
             }
         }
+
+
+@dataclass
+class StageMetrics:
+    """Latency and token counters for one negotiation stage in headless runs."""
+    runs: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    llm_calls: int = 0
+    llm_seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    
+    def record(self, seconds: float):
+        self.runs += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "average_ms": self.total_seconds / self.runs * 1000 if self.runs else 0.0,
+            "max_ms": self.max_seconds * 1000,
+            "llm_calls": self.llm_calls,
+            "llm_ms": self.llm_seconds * 1000,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens
+        }
+
+@dataclass
+class NegotiationRequest:
+    """A negotiation to run headless."""
+    negotiation_type: NegotiationType
+    parties: List[NegotiationParty]
+    issues: Dict[str, Dict[str, Any]]
+    context: Dict[str, Any] = field(default_factory=dict)
+
+class ThrottledLLMManager:
+    """
+    LLM manager wrapper enforcing a shared concurrency cap.
+    
+    Every call is attributed to the negotiation stage active in the calling
+    task, recording latency and token usage. Providers that do not report usage
+    are estimated at roughly four characters per token.
+    """
+    
+    def __init__(self, llm_manager: LLMManager, max_concurrent: int = 4,
+                 stage_metrics: Optional[Dict[str, StageMetrics]] = None):
+        self.llm_manager = llm_manager
+        self.max_concurrent = max(1, max_concurrent)
+        self.stage_metrics = stage_metrics if stage_metrics is not None else defaultdict(StageMetrics)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+    
+    async def generate(self, messages: List[Any], **kwargs) -> Any:
+        metrics = self.stage_metrics[_current_stage.get()]
+        async with self._semaphore:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            start = time.perf_counter()
+            try:
+                response = await self.llm_manager.generate(messages, **kwargs)
+            finally:
+                self.in_flight -= 1
+                metrics.llm_calls += 1
+                metrics.llm_seconds += time.perf_counter() - start
+        
+        usage = getattr(response, "usage", None) or {}
+        prompt_tokens = usage.get("prompt_tokens")
+        if prompt_tokens is None:
+            prompt_tokens = sum(len(self._message_content(message)) for message in messages) // 4
+        completion_tokens = usage.get("completion_tokens")
+        if completion_tokens is None:
+            completion_tokens = len(getattr(response, "content", "") or "") // 4
+        metrics.prompt_tokens += prompt_tokens
+        metrics.completion_tokens += completion_tokens
+        return response
+    
+    @staticmethod
+    def _message_content(message: Any) -> str:
+        if isinstance(message, dict):
+            return message.get("content", "")
+        return getattr(message, "content", "")
+
+class HeadlessNegotiationRunner:
+    """
+    Batch runner for AI-vs-AI negotiations without real-time pacing.
+    
+    Sessions run concurrently and are driven straight through their stages
+    with no presentation delays, while all LLM traffic shares one concurrency
+    cap. Negotiations whose stakes fall at or below ``low_stakes_threshold``
+    are settled by a rule-based fast path that never calls the LLM.
+    """
+    
+    FAST_PATH_STAGE = "fast_path"
+    
+    def __init__(self, llm_manager: LLMManager, advisor_council: AdvisorCouncil = None,
+                 dialogue_system: MultiAdvisorDialogue = None, max_concurrent_llm_calls: int = 4,
+                 low_stakes_threshold: float = 0.3):
+        self.stage_metrics: Dict[str, StageMetrics] = defaultdict(StageMetrics)
+        self.llm_manager = ThrottledLLMManager(llm_manager, max_concurrent_llm_calls, self.stage_metrics)
+        self.negotiations = RealTimeDiplomaticNegotiations(self.llm_manager, advisor_council, dialogue_system)
+        self.negotiations.verbose = False
+        self.low_stakes_threshold = low_stakes_threshold
+        self.fast_path_sessions = 0
+        self.full_sessions = 0
+    
+    def assess_stakes(self, issues: Dict[str, Dict[str, Any]], context: Dict[str, Any]) -> float:
+        """Stakes from the context, else the highest issue stakes or complexity."""
+        if "stakes" in context:
+            return float(context["stakes"])
+        return max(
+            (float(config.get("stakes", config.get("complexity", 1.0))) for config in issues.values()),
+            default=0.0
+        )
+    
+    async def run_batch(self, requests: List[NegotiationRequest]) -> List[NegotiationOutcome]:
+        """Run all negotiations concurrently, returning outcomes in request order."""
+        return list(await asyncio.gather(*(
+            self.run_session(request.negotiation_type, request.parties, request.issues, request.context)
+            for request in requests
+        )))
+    
+    async def run_session(self, negotiation_type: NegotiationType, parties: List[NegotiationParty],
+                          issues: Dict[str, Dict[str, Any]],
+                          context: Dict[str, Any] = None) -> NegotiationOutcome:
+        """Run one negotiation to its conclusion."""
+        context = context or {}
+        negotiation_id = await self.negotiations.initiate_negotiation(
+            negotiation_type, parties, issues, context, auto_progress=False
+        )
+        session = self.negotiations.active_negotiations[negotiation_id]
+        
+        if self.assess_stakes(issues, context) <= self.low_stakes_threshold:
+            self.fast_path_sessions += 1
+            start = time.perf_counter()
+            await self._resolve_by_rules(negotiation_id)
+            self.stage_metrics[self.FAST_PATH_STAGE].record(time.perf_counter() - start)
+            return session["outcome"]
+        
+        self.full_sessions += 1
+        for _ in range(len(NegotiationStage)):
+            if negotiation_id not in self.negotiations.active_negotiations:
+                break
+            stage = session["stage"].value
+            token = _current_stage.set(stage)
+            start = time.perf_counter()
+            try:
+                await self.negotiations._progress_negotiation_stage(negotiation_id)
+            finally:
+                _current_stage.reset(token)
+            self.stage_metrics[stage].record(time.perf_counter() - start)
+        
+        if negotiation_id in self.negotiations.active_negotiations:
+            await self.negotiations._conclude_negotiation(negotiation_id, "timeout")
+        return session["outcome"]
+    
+    async def _resolve_by_rules(self, negotiation_id: str):
+        """Settle each issue at the middle of the zone all parties can accept."""
+        session = self.negotiations.active_negotiations[negotiation_id]
+        parties = session["parties"]
+        
+        terms = {}
+        for issue in session["issues"]:
+            positions = [party.positions[issue] for party in parties.values() if issue in party.positions]
+            if not positions:
+                continue
+            floor = max(position.minimum_acceptable for position in positions)
+            ceiling = min(1.0, min(position.ideal_outcome + position.flexibility for position in positions))
+            if floor > ceiling:
+                terms = None
+                break
+            terms[issue] = (floor + ceiling) / 2
+        
+        if terms is None:
+            await self.negotiations._conclude_negotiation(negotiation_id, "breakdown")
+            return
+        
+        for party in parties.values():
+            for issue, value in terms.items():
+                party.adjust_position(issue, value, "Rule-based settlement")
+        session["stage"] = NegotiationStage.SIGNING
+        session["events"].append(NegotiationEvent(
+            timestamp=datetime.now(),
+            stage=NegotiationStage.SIGNING,
+            event_type="rule_based_settlement",
+            description="Low-stakes negotiation settled within the overlapping acceptable zone",
+            parties_involved=list(parties.keys()),
+            impact_score=0.1,
+            consequences={"terms": terms}
+        ))
+        await self.negotiations._conclude_negotiation(negotiation_id, "agreement")
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-stage latency and token metrics plus session and concurrency counters."""
+        stages = {name: metrics.to_dict() for name, metrics in self.stage_metrics.items()}
+        return {
+            "sessions": {
+                "fast_path": self.fast_path_sessions,
+                "full": self.full_sessions
+            },
+            "llm": {
+                "max_concurrent": self.llm_manager.max_concurrent,
+                "peak_in_flight": self.llm_manager.peak_in_flight,
+                "calls": sum(stage["llm_calls"] for stage in stages.values()),
+                "prompt_tokens": sum(stage["prompt_tokens"] for stage in stages.values()),
+                "completion_tokens": sum(stage["completion_tokens"] for stage in stages.values())
+            },
+            "stages": stages
+        }
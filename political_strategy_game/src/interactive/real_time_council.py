@@ -52,6 +52,18 @@ class MeetingState:
     urgency_level: float = 0.5  # 0.0 = calm, 1.0 = crisis
 
 
+@dataclass
+class TurnPipeline:
+    """Speculative generation and pacing state for one council meeting."""
+    epoch: int = 0  # Bumped whenever pending generation is invalidated
+    generation_task: Optional[asyncio.Task] = None
+    generation_speaker: Optional[str] = None
+    generation_epoch: int = -1
+    acknowledged: asyncio.Event = field(default_factory=asyncio.Event)
+    speculative_hits: int = 0
+    discarded_generations: int = 0
+
+
 class RealTimeCouncilInterface:
     """Interactive council meeting interface with live advisor debates and player intervention."""
     
@@ -63,11 +75,13 @@ class RealTimeCouncilInterface:
         
         self.active_sessions: Dict[str, DialogueSession] = {}
         self.meeting_states: Dict[str, MeetingState] = {}
+        self.turn_pipelines: Dict[str, TurnPipeline] = {}
         self.intervention_callbacks: List[Callable] = []
         self.update_callbacks: List[Callable] = []
         
         # Real-time configuration
-        self.turn_delay_seconds = 5.0  # Delay between advisor responses
+        self.turn_delay_seconds = 5.0  # Longest wait for a client to acknowledge a turn
+        self.wait_for_acknowledgement = True  # Pace turns on acknowledge_turn() when clients are watching
         self.max_turns_before_intervention = 3  # Force intervention opportunities
         
     def register_intervention_callback(self, callback: Callable):
@@ -102,6 +116,7 @@ class RealTimeCouncilInterface:
                 meeting_state.emotional_climate[advisor_name] = emotional_model.current_emotion
         
         self.meeting_states[meeting_id] = meeting_state
+        self.turn_pipelines[meeting_id] = TurnPipeline()
         
         # Create dialogue context
         context = DialogueContext(
@@ -130,32 +145,42 @@ class RealTimeCouncilInterface:
         return meeting_id
     
     async def _run_interactive_dialogue(self, meeting_id: str):
-        """Run the main interactive dialogue loop."""
+        """
+        Run the main interactive dialogue loop.
+        
+        Turns are pipelined: as soon as a turn is recorded, the next speaker's
+        response is generated speculatively while the current turn is shown.
+        The loop then waits for a client acknowledgement (or for slow update
+        callbacks to return) rather than sleeping a fixed delay. Player
+        interventions invalidate the speculative response so it is regenerated
+        with the new context.
+        """
         session = self.active_sessions[meeting_id]
         meeting_state = self.meeting_states[meeting_id]
+        pipeline = self.turn_pipelines[meeting_id]
         
         current_speaker_idx = 0
         turns_since_intervention = 0
         
-        while meeting_state.is_active and len(session.turns) < session.context.max_turns:
-            # Check if meeting should continue
-            if not meeting_state.is_active:
-                break
-            
-            # Determine current speaker
-            current_speaker = meeting_state.participants[current_speaker_idx]
-            meeting_state.current_speaker = current_speaker
-            
-            # Notify about current speaker
-            await self._notify_update_callbacks(meeting_id, "speaker_change", {
-                "current_speaker": current_speaker,
-                "emotional_state": meeting_state.emotional_climate.get(current_speaker, EmotionalState.CALM).value
-            })
-            
-            # Generate advisor response
-            response = await self._generate_real_time_response(session, current_speaker)
-            
-            if response:
+        try:
+            while meeting_state.is_active and len(session.turns) < session.context.max_turns:
+                # Determine current speaker
+                current_speaker = meeting_state.participants[current_speaker_idx]
+                meeting_state.current_speaker = current_speaker
+                
+                # Notify about current speaker
+                await self._notify_update_callbacks(meeting_id, "speaker_change", {
+                    "current_speaker": current_speaker,
+                    "emotional_state": meeting_state.emotional_climate.get(current_speaker, EmotionalState.CALM).value
+                })
+                
+                # Use the speculative response if it is still valid, otherwise generate now
+                response = await self._take_response(meeting_id, current_speaker)
+                
+                # If no response (or the meeting ended meanwhile), end meeting
+                if not response or not meeting_state.is_active:
+                    break
+                
                 # Create dialogue turn
                 emotional_tone = self.dialogue_system._analyze_emotional_tone(response)
                 turn = DialogueTurn(
@@ -174,7 +199,13 @@ class RealTimeCouncilInterface:
                 # Update emotional climate
                 await self._update_emotional_climate(meeting_id)
                 
+                # Start generating the next speaker's response while this turn is displayed
+                current_speaker_idx = self._select_next_speaker(session, current_speaker_idx)
+                if len(session.turns) < session.context.max_turns:
+                    self._start_generation(meeting_id, meeting_state.participants[current_speaker_idx])
+                
                 # Notify callbacks about new turn
+                pipeline.acknowledged.clear()
                 await self._notify_update_callbacks(meeting_id, "new_turn", {
                     "speaker": current_speaker,
                     "content": response,
@@ -190,19 +221,85 @@ class RealTimeCouncilInterface:
                     await self._offer_intervention_opportunity(meeting_id)
                     turns_since_intervention = 0
                 
-                # Move to next speaker
-                current_speaker_idx = self._select_next_speaker(session, current_speaker_idx)
-                
-                # Wait before next turn (simulates natural conversation pace)
-                await asyncio.sleep(self.turn_delay_seconds)
-            
+                # Wait until watching clients have caught up with this turn
+                await self._await_turn_acknowledgement(meeting_id)
+        finally:
+            self._cancel_generation(pipeline)
+        
+        # Process meeting conclusion unless the meeting was ended externally
+        if meeting_state.is_active:
+            await self._conclude_meeting(meeting_id)
+    
+    def _start_generation(self, meeting_id: str, speaker_name: str) -> asyncio.Task:
+        """Begin generating ``speaker_name``'s response in the background."""
+        pipeline = self.turn_pipelines[meeting_id]
+        self._cancel_generation(pipeline)
+        pipeline.generation_task = asyncio.create_task(
+            self._generate_real_time_response(self.active_sessions[meeting_id], speaker_name)
+        )
+        pipeline.generation_speaker = speaker_name
+        pipeline.generation_epoch = pipeline.epoch
+        return pipeline.generation_task
+    
+    def _cancel_generation(self, pipeline: TurnPipeline):
+        if pipeline.generation_task is not None and not pipeline.generation_task.done():
+            pipeline.generation_task.cancel()
+            pipeline.discarded_generations += 1
+        pipeline.generation_task = None
+        pipeline.generation_speaker = None
+    
+    async def _take_response(self, meeting_id: str, speaker_name: str) -> Optional[str]:
+        """Wait for a response for ``speaker_name`` that no intervention has invalidated."""
+        pipeline = self.turn_pipelines[meeting_id]
+        meeting_state = self.meeting_states[meeting_id]
+        
+        while meeting_state.is_active:
+            task = pipeline.generation_task
+            if (task is not None and pipeline.generation_speaker == speaker_name
+                    and pipeline.generation_epoch == pipeline.epoch):
+                pipeline.speculative_hits += 1
             else:
-                # If no response, end meeting
-                meeting_state.is_active = False
-                break
+                task = self._start_generation(meeting_id, speaker_name)
+            epoch = pipeline.epoch
+            
+            # asyncio.wait does not raise if the generation task is cancelled
+            await asyncio.wait({task})
+            if not task.cancelled() and pipeline.epoch == epoch:
+                pipeline.generation_task = None
+                pipeline.generation_speaker = None
+                return task.result()
+            if pipeline.generation_task is task:
+                pipeline.generation_task = None
+        
+        return None
+    
+    async def _await_turn_acknowledgement(self, meeting_id: str):
+        """Pause until a client acknowledges the latest turn or the timeout elapses."""
+        if not self.wait_for_acknowledgement or not self.update_callbacks:
+            return  # Nobody is watching, so there is nothing to pace against
         
-        # Process meeting conclusion
-        await self._conclude_meeting(meeting_id)
+        pipeline = self.turn_pipelines[meeting_id]
+        try:
+            await asyncio.wait_for(pipeline.acknowledged.wait(), self.turn_delay_seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    def acknowledge_turn(self, meeting_id: str) -> bool:
+        """Signal that a client has finished presenting the latest turn."""
+        pipeline = self.turn_pipelines.get(meeting_id)
+        if pipeline is None:
+            return False
+        pipeline.acknowledged.set()
+        return True
+    
+    def _invalidate_speculation(self, meeting_id: str):
+        """Discard pending generation after the discussion context changed."""
+        pipeline = self.turn_pipelines.get(meeting_id)
+        if pipeline is None:
+            return
+        pipeline.epoch += 1
+        self._cancel_generation(pipeline)
+        pipeline.acknowledged.set()
     
     async def _generate_real_time_response(self, session: DialogueSession, speaker_name: str) -> Optional[str]:
         """Generate a response for real-time council meeting."""
@@ -248,7 +345,7 @@ class RealTimeCouncilInterface:
         for turn in recent_turns:
             conversation_context += f"{turn.speaker}: {turn.content}\n"
         
-        prompt = f"""You are {personality.name}, {advisor.role.value.title()} Advisor in a LIVE council meeting.
+        prompt = f"""You are {personality.name}, {personality.role.value.title()} Advisor in a LIVE council meeting.
 
 PERSONALITY & ROLE:
 - Background: {personality.background}
@@ -263,7 +360,7 @@ MEETING CONTEXT:
 - Topic: {meeting_state.topic}
 - Current Focus: {meeting_state.discussion_focus}
 - Urgency Level: {meeting_state.urgency_level:.1f}/1.0 {"(HIGH URGENCY)" if meeting_state.urgency_level > 0.7 else ""}
-- Other Participants: {', '.join([p for p in meeting_state.participants if p != speaker_name])}
+- Other Participants: {', '.join([getattr(p, 'value', str(p)) for p in meeting_state.participants if p != speaker_name])}
 
 RECENT DISCUSSION:
 {conversation_context or "Meeting just started."}
@@ -276,7 +373,7 @@ INSTRUCTIONS:
 2. React to the most recent statements and the overall discussion
 3. Consider the urgency level - {"speak decisively and urgently" if meeting_state.urgency_level > 0.7 else "maintain measured discussion"}
 4. Keep response concise (1-2 sentences) for natural dialogue flow
-5. Show your expertise in {advisor.role.value} matters
+5. Show your expertise in {personality.role.value} matters
 6. Your emotional state affects how you express your ideas
 
 Your response as {personality.name}:"""
@@ -373,6 +470,9 @@ Your response as {personality.name}:"""
         if intervention.intervention_type == InterventionType.REDIRECT_DISCUSSION:
             meeting_state.discussion_focus = intervention.content
         
+        # Any speculative response was generated without this intervention
+        self._invalidate_speculation(meeting_id)
+        
         # Notify callbacks about intervention
         await self._notify_update_callbacks(meeting_id, "player_intervention", {
             "intervention_type": intervention.intervention_type.value,
@@ -464,7 +564,7 @@ Your response as {personality.name}:"""
         # Simple summary for now - could be enhanced with LLM summarization
         summary_parts = [
             f"Council Meeting: {meeting_state.topic}",
-            f"Participants: {', '.join(meeting_state.participants)}",
+            f"Participants: {', '.join(getattr(p, 'value', str(p)) for p in meeting_state.participants)}",
             f"Total Discussion Turns: {len(session.turns)}",
             f"Final Emotional Climate: {dict(meeting_state.emotional_climate)}"
         ]
@@ -486,6 +586,7 @@ Your response as {personality.name}:"""
         """Manually end a council meeting."""
         if meeting_id in self.meeting_states:
             self.meeting_states[meeting_id].is_active = False
+            self._invalidate_speculation(meeting_id)
             await self._conclude_meeting(meeting_id)
             return True
         return False
@@ -7,17 +7,19 @@ decision-making and consistency in the political strategy game.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple, FrozenSet, Iterable
 from enum import Enum
 from datetime import datetime, timedelta
 import json
 import asyncio
 import logging
-from collections import defaultdict, Counter
+from collections import defaultdict, Counter, OrderedDict
 import hashlib
 
 from .llm_providers import LLMManager, LLMMessage, LLMResponse
 from .advisors import AdvisorRole, AdvisorAI
+from .memory_retrieval import MemoryRetrievalIndex, time_decay_score
+from .semantic_memory import SemanticMemoryIndex, SemanticPatternCache, create_embedder
 
 
 class MemoryType(Enum):
@@ -41,6 +43,15 @@ class MemoryImportance(Enum):
     MINIMAL = "minimal"
 
 
+IMPORTANCE_WEIGHTS = {
+    MemoryImportance.CRITICAL: 1.0,
+    MemoryImportance.HIGH: 0.8,
+    MemoryImportance.MEDIUM: 0.6,
+    MemoryImportance.LOW: 0.4,
+    MemoryImportance.MINIMAL: 0.2
+}
+
+
 class ContextRelevance(Enum):
     """Relevance levels for context retrieval."""
     ESSENTIAL = "essential"
@@ -70,29 +81,23 @@ class MemoryEntry:
     
     def calculate_relevance_score(self, query_keywords: Set[str], 
                                 current_advisors: List[str],
-                                time_weight: float = 0.3) -> float:
+                                time_weight: float = 0.3,
+                                now: Optional[datetime] = None) -> float:
         """Calculate relevance score for this memory entry."""
         # Keyword similarity
         keyword_overlap = len(self.context_keywords.intersection(query_keywords))
         keyword_score = keyword_overlap / max(len(query_keywords), 1) if query_keywords else 0.0
         
         # Advisor relevance
-        advisor_overlap = len(set(self.associated_advisors).intersection(set(current_advisors)))
+        advisor_overlap = sum(1 for advisor in set(self.associated_advisors) if advisor in current_advisors)
         advisor_score = advisor_overlap / max(len(current_advisors), 1) if current_advisors else 0.0
         
-        # Temporal relevance (more recent = higher score)
-        time_delta = datetime.now() - self.timestamp
-        time_score = max(0.1, 1.0 - (time_delta.days / 30.0))  # Decay over 30 days
+        # Temporal relevance (more recent = higher score, decays over 30 days)
+        time_delta = (now or datetime.now()) - self.timestamp
+        time_score = time_decay_score(time_delta.days)
         
         # Importance and access patterns
-        importance_weights = {
-            MemoryImportance.CRITICAL: 1.0,
-            MemoryImportance.HIGH: 0.8,
-            MemoryImportance.MEDIUM: 0.6,
-            MemoryImportance.LOW: 0.4,
-            MemoryImportance.MINIMAL: 0.2
-        }
-        importance_score = importance_weights.get(self.importance, 0.5)
+        importance_score = IMPORTANCE_WEIGHTS.get(self.importance, 0.5)
         
         # Access frequency (but with diminishing returns)
         access_score = min(1.0, self.access_count / 10.0)
@@ -189,10 +194,210 @@ class ContextPackage:
         return full_context
 
 
+ContextCacheKey = Tuple[str, FrozenSet[str], str]
+
+
+@dataclass
+class CachedContext:
+    """A cached context package with the store generations it was built from."""
+    package: ContextPackage
+    created_at: datetime
+    keyword_generations: Dict[str, int]
+    advisor_generations: Dict[str, int]
+    memory_ids: FrozenSet[str]
+
+
+class ContextCache:
+    """Bounded LRU cache of context packages with precise invalidation.
+    
+    Entries are keyed on (query fingerprint, advisor set, context type) and
+    record the generation counter of every keyword and advisor they touched.
+    When a memory is added or removed, the generations of its keywords and
+    advisors are bumped and only the entries that depend on them are dropped.
+    Memories found purely by semantic similarity are covered by the TTL and
+    by the memory-id dependency on removal.
+    """
+    
+    def __init__(self, max_entries: int = 512, ttl: timedelta = timedelta(hours=1)):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries: "OrderedDict[ContextCacheKey, CachedContext]" = OrderedDict()
+        
+        # Memory-store generation counters
+        self.keyword_generations: Dict[str, int] = defaultdict(int)
+        self.advisor_generations: Dict[str, int] = defaultdict(int)
+        
+        # Reverse dependencies for eager invalidation
+        self._keyword_dependents: Dict[str, Set[ContextCacheKey]] = defaultdict(set)
+        self._advisor_dependents: Dict[str, Set[ContextCacheKey]] = defaultdict(set)
+        self._memory_dependents: Dict[str, Set[ContextCacheKey]] = defaultdict(set)
+        
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    @staticmethod
+    def make_key(query: str, current_advisors: Iterable[str], context_type: str) -> ContextCacheKey:
+        """Build a cache key from a whitespace/case-normalized query fingerprint."""
+        normalized_query = " ".join(query.lower().split())
+        fingerprint = hashlib.md5(normalized_query.encode(), usedforsecurity=False).hexdigest()  # nosec B324 - MD5 used for cache key, not security
+        return (fingerprint, frozenset(current_advisors), context_type)
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def __contains__(self, key: ContextCacheKey) -> bool:
+        return key in self.entries
+    
+    def get(self, key: ContextCacheKey, now: Optional[datetime] = None) -> Optional[ContextPackage]:
+        """Return a valid cached package and mark it most recently used."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        if (now or datetime.now()) - entry.created_at >= self.ttl:
+            self._drop(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        
+        if not self._is_current(entry):
+            self._drop(key)
+            self.invalidations += 1
+            self.misses += 1
+            return None
+        
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry.package
+    
+    def snapshot(self, keywords: Iterable[str],
+                 advisors: Iterable[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Capture current generations before building a package.
+        
+        Taking the snapshot up front means memories added while the package
+        is being built (e.g. during LLM calls) make the entry stale at once.
+        """
+        return (
+            {keyword.lower(): self.keyword_generations.get(keyword.lower(), 0) for keyword in keywords},
+            {advisor: self.advisor_generations.get(advisor, 0) for advisor in advisors}
+        )
+    
+    def put(self, key: ContextCacheKey, package: ContextPackage,
+            generations: Tuple[Dict[str, int], Dict[str, int]]):
+        """Cache a package with the generation snapshot it was built from."""
+        if key in self.entries:
+            self._drop(key)
+        
+        keyword_generations, advisor_generations = generations
+        entry = CachedContext(
+            package=package,
+            created_at=datetime.now(),
+            keyword_generations=dict(keyword_generations),
+            advisor_generations=dict(advisor_generations),
+            memory_ids=frozenset(memory.memory_id for memory in package.relevant_memories)
+        )
+        
+        if not self._is_current(entry):
+            return
+        
+        self.entries[key] = entry
+        for keyword in entry.keyword_generations:
+            self._keyword_dependents[keyword].add(key)
+        for advisor in entry.advisor_generations:
+            self._advisor_dependents[advisor].add(key)
+        for memory_id in entry.memory_ids:
+            self._memory_dependents[memory_id].add(key)
+        
+        while len(self.entries) > self.max_entries:
+            oldest_key = next(iter(self.entries))
+            self._drop(oldest_key)
+            self.evictions += 1
+    
+    def record_change(self, keywords: Iterable[str], advisors: Iterable[str],
+                      memory_id: Optional[str] = None) -> int:
+        """Bump generations for a changed memory and drop dependent entries.
+        
+        Returns the number of invalidated entries.
+        """
+        affected: Set[ContextCacheKey] = set()
+        for keyword in {keyword.lower() for keyword in keywords}:
+            self.keyword_generations[keyword] += 1
+            affected |= self._keyword_dependents.get(keyword, set())
+        for advisor in set(advisors):
+            self.advisor_generations[advisor] += 1
+            affected |= self._advisor_dependents.get(advisor, set())
+        if memory_id is not None:
+            affected |= self._memory_dependents.get(memory_id, set())
+        
+        for key in affected:
+            self._drop(key)
+        self.invalidations += len(affected)
+        return len(affected)
+    
+    def expire(self, now: Optional[datetime] = None) -> int:
+        """Drop all entries older than the TTL and return how many were dropped."""
+        now = now or datetime.now()
+        expired = [key for key, entry in self.entries.items() if now - entry.created_at >= self.ttl]
+        for key in expired:
+            self._drop(key)
+        self.expirations += len(expired)
+        return len(expired)
+    
+    def clear(self):
+        for key in list(self.entries):
+            self._drop(key)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+    
+    def _is_current(self, entry: CachedContext) -> bool:
+        return (
+            all(self.keyword_generations.get(keyword, 0) == generation
+                for keyword, generation in entry.keyword_generations.items()) and
+            all(self.advisor_generations.get(advisor, 0) == generation
+                for advisor, generation in entry.advisor_generations.items())
+        )
+    
+    def _drop(self, key: ContextCacheKey):
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        for keyword in entry.keyword_generations:
+            self._discard_dependent(self._keyword_dependents, keyword, key)
+        for advisor in entry.advisor_generations:
+            self._discard_dependent(self._advisor_dependents, advisor, key)
+        for memory_id in entry.memory_ids:
+            self._discard_dependent(self._memory_dependents, memory_id, key)
+    
+    @staticmethod
+    def _discard_dependent(dependents: Dict[str, Set[ContextCacheKey]], name: str, key: ContextCacheKey):
+        keys = dependents.get(name)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del dependents[name]
+
+
 class AdvancedMemoryManager:
     """Advanced memory management system for enhanced LLM context."""
     
-    def __init__(self, llm_manager: LLMManager, max_memory_entries: int = 10000):
+    def __init__(self, llm_manager: LLMManager, max_memory_entries: int = 10000,
+                 semantic_index: Optional[SemanticMemoryIndex] = None,
+                 max_cached_contexts: int = 512):
         self.llm_manager = llm_manager
         self.max_memory_entries = max_memory_entries
         self.logger = logging.getLogger("memory_manager")
@@ -202,14 +407,21 @@ class AdvancedMemoryManager:
         self.memory_index: Dict[str, Set[str]] = defaultdict(set)  # keyword -> memory_ids
         self.advisor_memories: Dict[str, Set[str]] = defaultdict(set)  # advisor -> memory_ids
         self.temporal_index: Dict[str, Set[str]] = defaultdict(set)  # date -> memory_ids
+        self.retrieval_index = MemoryRetrievalIndex()  # BM25 postings + advisor/day bitmaps
+        
+        # Optional embedding index for hybrid keyword + vector retrieval
+        self.semantic_index = semantic_index
+        self.semantic_candidates = 50
+        self.semantic_min_similarity = 0.2
+        self.pattern_cache = SemanticPatternCache() if semantic_index is not None else None
         
         # Pattern recognition
         self.identified_patterns: List[str] = []
         self.pattern_confidence: Dict[str, float] = {}
         
         # Context optimization
-        self.context_cache: Dict[str, ContextPackage] = {}
         self.cache_timeout = timedelta(hours=1)
+        self.context_cache = ContextCache(max_entries=max_cached_contexts, ttl=self.cache_timeout)
         
         # Memory maintenance
         self.last_cleanup = datetime.now()
@@ -219,19 +431,23 @@ class AdvancedMemoryManager:
     
     def add_memory(self, content: str, memory_type: MemoryType, 
                   importance: MemoryImportance, associated_advisors: List[str] = None,
-                  tags: Set[str] = None, emotional_context: Dict[str, float] = None) -> str:
-        """Add a new memory entry."""
+                  tags: Set[str] = None, emotional_context: Dict[str, float] = None,
+                  timestamp: Optional[datetime] = None) -> str:
+        """Add a new memory entry (timestamp defaults to now)."""
         memory_id = self._generate_memory_id(content)
+        if memory_id in self.memories:
+            self._remove_memory(memory_id)
         
-        # Extract keywords from content
-        keywords = self._extract_keywords(content)
+        # Extract keywords and term frequencies from content
+        term_frequencies = self._extract_term_frequencies(content)
+        keywords = set(term_frequencies)
         
         memory = MemoryEntry(
             memory_id=memory_id,
             content=content,
             memory_type=memory_type,
             importance=importance,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             associated_advisors=associated_advisors or [],
             tags=tags or set(),
             context_keywords=keywords,
@@ -251,6 +467,15 @@ class AdvancedMemoryManager:
         date_key = memory.timestamp.strftime("%Y-%m-%d")
         self.temporal_index[date_key].add(memory_id)
         
+        self.retrieval_index.add(
+            memory_id, memory, term_frequencies, memory.associated_advisors,
+            memory.timestamp, IMPORTANCE_WEIGHTS.get(importance, 0.5)
+        )
+        if self.semantic_index is not None:
+            self.semantic_index.add(memory_id, content)
+        
+        self.context_cache.record_change(keywords, memory.associated_advisors)
+        
         # Trigger cleanup if needed
         if len(self.memories) > self.max_memory_entries:
             self._cleanup_old_memories()
@@ -263,23 +488,33 @@ class AdvancedMemoryManager:
                                  max_context_tokens: int = 1500) -> ContextPackage:
         """Get enhanced context for LLM query."""
         # Check cache first
-        cache_key = hashlib.md5(f"{query}_{context_type}_{','.join(sorted(current_advisors))}".encode(), usedforsecurity=False).hexdigest()  # nosec B324 - MD5 used for cache key, not security
-        
-        if cache_key in self.context_cache:
-            cached_context = self.context_cache[cache_key]
-            if datetime.now() - cached_context.relevant_memories[0].timestamp < self.cache_timeout:
-                return cached_context
+        cache_key = ContextCache.make_key(query, current_advisors, context_type)
+        cached_context = self.context_cache.get(cache_key)
+        if cached_context is not None:
+            return cached_context
         
         # Extract query keywords
         query_keywords = self._extract_keywords(query)
+        cache_generations = self.context_cache.snapshot(query_keywords, current_advisors)
+        
+        # Semantic candidates (hybrid keyword + vector ranking)
+        query_vector = None
+        semantic_scores = None
+        if self.semantic_index is not None:
+            query_vector = self.semantic_index.embed_query(query)
+            semantic_scores = dict(self.semantic_index.search(
+                query_vector, limit=self.semantic_candidates,
+                min_similarity=self.semantic_min_similarity
+            ))
         
         # Find relevant memories
-        relevant_memories = self._find_relevant_memories(
-            query_keywords, current_advisors, limit=10
+        ranked_memories = self._rank_relevant_memories(
+            query_keywords, current_advisors, limit=10, semantic_scores=semantic_scores
         )
+        relevant_memories = [memory for memory, score in ranked_memories]
         
         # Get historical patterns
-        patterns = await self._identify_contextual_patterns(query, relevant_memories)
+        patterns = await self._identify_contextual_patterns(query, relevant_memories, query_vector)
         
         # Get advisor-specific insights
         advisor_insights = await self._get_advisor_insights(
@@ -289,11 +524,8 @@ class AdvancedMemoryManager:
         # Find decision precedents
         precedents = self._find_decision_precedents(query_keywords, relevant_memories)
         
-        # Calculate relevance scores
-        relevance_scores = {
-            memory.memory_id: memory.calculate_relevance_score(query_keywords, current_advisors)
-            for memory in relevant_memories
-        }
+        # Relevance scores come from the retrieval index ranking
+        relevance_scores = {memory.memory_id: score for memory, score in ranked_memories}
         
         # Estimate token usage
         estimated_tokens = self._estimate_context_tokens(
@@ -312,7 +544,7 @@ class AdvancedMemoryManager:
         )
         
         # Cache result
-        self.context_cache[cache_key] = context_package
+        self.context_cache.put(cache_key, context_package, cache_generations)
         
         # Update memory access tracking
         for memory in relevant_memories:
@@ -328,8 +560,13 @@ class AdvancedMemoryManager:
     
     def _extract_keywords(self, content: str) -> Set[str]:
         """Extract important keywords from content."""
+        return set(self._extract_term_frequencies(content))
+    
+    def _extract_term_frequencies(self, content: str) -> Counter:
+        """Extract keywords from content together with their term frequencies."""
         # Simple keyword extraction - could be enhanced with NLP
-        words = content.lower().split()
+        lowered = content.lower()
+        words = lowered.split()
         
         # Filter out common words
         stop_words = {
@@ -340,11 +577,11 @@ class AdvancedMemoryManager:
         }
         
         # Extract meaningful words (3+ characters, not stop words)
-        keywords = {
+        keywords = Counter(
             word.strip('.,!?;:"()[]{}')
             for word in words
             if len(word) >= 3 and word not in stop_words
-        }
+        )
         
         # Add common political/strategy terms that might be important
         important_terms = {
@@ -353,41 +590,50 @@ class AdvancedMemoryManager:
             'faction', 'advisor', 'council', 'stability', 'legitimacy', 'resources'
         }
         
-        keywords.update(word for word in important_terms if word in content.lower())
+        for term in important_terms:
+            if term in lowered and term not in keywords:
+                keywords[term] = 1
         
         return keywords
     
     def _find_relevant_memories(self, query_keywords: Set[str], 
                               current_advisors: List[str], limit: int = 10) -> List[MemoryEntry]:
         """Find memories relevant to the query."""
-        candidate_memory_ids = set()
-        
-        # Find memories by keyword overlap
-        for keyword in query_keywords:
-            candidate_memory_ids.update(self.memory_index.get(keyword.lower(), set()))
-        
-        # Find memories by advisor association
-        for advisor in current_advisors:
-            candidate_memory_ids.update(self.advisor_memories.get(advisor, set()))
-        
-        # Score and rank memories
-        scored_memories = []
-        for memory_id in candidate_memory_ids:
-            if memory_id in self.memories:
-                memory = self.memories[memory_id]
-                score = memory.calculate_relevance_score(query_keywords, current_advisors)
-                scored_memories.append((score, memory))
-        
-        # Sort by relevance and return top results
-        scored_memories.sort(key=lambda x: x[0], reverse=True)
-        return [memory for score, memory in scored_memories[:limit]]
+        return [
+            memory for memory, score in
+            self._rank_relevant_memories(query_keywords, current_advisors, limit)
+        ]
+    
+    def _rank_relevant_memories(self, query_keywords: Set[str], current_advisors: List[str],
+                              limit: int = 10,
+                              semantic_scores: Optional[Dict[str, float]] = None
+                              ) -> List[Tuple[MemoryEntry, float]]:
+        """Rank memories matching any query keyword, current advisor or semantic hit, best first.
+        
+        Semantic similarities (memory_id -> cosine) compete with the BM25
+        keyword score, so paraphrased memories are ranked like keyword matches.
+        """
+        return self.retrieval_index.search(
+            query_keywords, current_advisors, limit=limit, extra_scores=semantic_scores
+        )
     
     async def _identify_contextual_patterns(self, query: str, 
-                                          relevant_memories: List[MemoryEntry]) -> List[str]:
-        """Use LLM to identify patterns in relevant memories."""
+                                          relevant_memories: List[MemoryEntry],
+                                          query_vector: Optional[Any] = None) -> List[str]:
+        """Use LLM to identify patterns in relevant memories.
+        
+        With a semantic index, analyses are reused for semantically equivalent
+        queries over largely the same memories instead of calling the LLM again.
+        """
         if not relevant_memories:
             return []
         
+        memory_ids = {memory.memory_id for memory in relevant_memories}
+        if self.pattern_cache is not None and query_vector is not None:
+            cached_patterns = self.pattern_cache.lookup(query_vector, memory_ids)
+            if cached_patterns is not None:
+                return cached_patterns
+        
         # Prepare memory content for analysis
         memory_contents = [memory.content for memory in relevant_memories[:5]]
         
@@ -416,9 +662,12 @@ Return each pattern as a concise statement (one sentence each)."""
                     line.strip().lstrip('123456789.- ')
                     for line in response.content.split('\n')
                     if line.strip() and len(line.strip()) > 10
-                ]
+                ][:3]  # Limit to 3 patterns
+                
+                if self.pattern_cache is not None and query_vector is not None:
+                    self.pattern_cache.store(query_vector, memory_ids, patterns)
                 
-                return patterns[:3]  # Limit to 3 patterns
+                return patterns
                 
         except Exception as e:
             self.logger.error(f"Failed to identify patterns: {e}")
@@ -532,6 +781,15 @@ Provide one concise insight (1-2 sentences) that {advisor} would find relevant b
             "average_access_count": avg_access_count,
             "unique_keywords": len(self.memory_index),
             "cached_contexts": len(self.context_cache),
+            "context_cache": self.context_cache.get_metrics(),
+            "retrieval_index": self.retrieval_index.statistics.to_dict(),
+            "semantic_index": (
+                self.semantic_index.statistics.to_dict() if self.semantic_index is not None else None
+            ),
+            "pattern_cache": (
+                {"hits": self.pattern_cache.hits, "misses": self.pattern_cache.misses}
+                if self.pattern_cache is not None else None
+            ),
             "last_cleanup": self.last_cleanup.isoformat()
         }
     
@@ -570,15 +828,8 @@ Provide one concise insight (1-2 sentences) that {advisor} would find relevant b
         for memory_id in memories_to_remove[:len(memories_to_remove)//2]:  # Remove only half at a time
             self._remove_memory(memory_id)
         
-        # Clear old cache entries
-        current_time = datetime.now()
-        old_cache_keys = [
-            key for key, context in self.context_cache.items()
-            if current_time - context.relevant_memories[0].timestamp > self.cache_timeout
-        ]
-        
-        for key in old_cache_keys:
-            del self.context_cache[key]
+        # Clear expired cache entries
+        self.context_cache.expire()
         
         self.last_cleanup = datetime.now()
         self.logger.info(f"Memory cleanup completed. Removed {len(memories_to_remove)//2} memories")
@@ -589,6 +840,7 @@ Provide one concise insight (1-2 sentences) that {advisor} would find relevant b
             return
         
         memory = self.memories[memory_id]
+        self.context_cache.record_change(memory.context_keywords, memory.associated_advisors, memory_id)
         
         # Remove from keyword index
         for keyword in memory.context_keywords:
@@ -602,6 +854,11 @@ Provide one concise insight (1-2 sentences) that {advisor} would find relevant b
             if not self.advisor_memories[advisor]:
                 del self.advisor_memories[advisor]
         
+        self.retrieval_index.remove(memory_id)
+        if self.semantic_index is not None:
+            self.semantic_index.remove(memory_id)
+            self.pattern_cache.discard_memory(memory_id)
+        
         # Remove from temporal index
         date_key = memory.timestamp.strftime("%Y-%m-%d")
         self.temporal_index[date_key].discard(memory_id)
@@ -613,9 +870,23 @@ Provide one concise insight (1-2 sentences) that {advisor} would find relevant b
 
 
 # Integration helper functions
-def create_memory_manager(llm_manager: LLMManager) -> AdvancedMemoryManager:
-    """Create and configure a memory manager."""
-    return AdvancedMemoryManager(llm_manager, max_memory_entries=10000)
+def create_memory_manager(llm_manager: LLMManager, enable_semantic_index: bool = False,
+                          embedding_model: Optional[str] = None,
+                          vector_storage_path: Optional[str] = None) -> AdvancedMemoryManager:
+    """Create and configure a memory manager.
+    
+    With ``enable_semantic_index`` the manager also ranks memories by
+    embedding similarity, using ``embedding_model`` (a local
+    sentence-transformers model) when available and a hashing embedder
+    otherwise. ``vector_storage_path`` memory-maps the vectors to disk.
+    """
+    semantic_index = None
+    if enable_semantic_index:
+        semantic_index = SemanticMemoryIndex(
+            embedder=create_embedder(embedding_model),
+            storage_path=vector_storage_path
+        )
+    return AdvancedMemoryManager(llm_manager, max_memory_entries=10000, semantic_index=semantic_index)
 
 
 def add_decision_memory(memory_manager: AdvancedMemoryManager, 
@@ -16,6 +16,7 @@ import json
 from datetime import datetime
 
 from .llm_providers import LLMManager, LLMMessage, LLMResponse, LLMProvider
+from .structured_batch import StructuredQuery, StructuredQueryBatcher, clamp_unit_fields, scoped_key
 from .advisors import AdvisorRole, AdvisorPersonality, AdvisorAI
 from .dialogue import MultiAdvisorDialogue, EmotionalState, DialogueType
 
@@ -98,9 +99,15 @@ class ConspiracyGenerator:
     based on current political tensions, advisor relationships, and game state.
     """
     
-    def __init__(self, llm_manager: LLMManager, dialogue_system: MultiAdvisorDialogue):
+    CONDITION_FIELDS = ("economic_crisis", "external_pressure", "corruption_exposure", "military_dissatisfaction")
+    RECRUITMENT_FIELDS = ("relationship_quality", "ideological_alignment", "risk_tolerance")
+    
+    def __init__(self, llm_manager: LLMManager, dialogue_system: MultiAdvisorDialogue,
+                 query_batcher: Optional[StructuredQueryBatcher] = None):
         self.llm_manager = llm_manager
         self.dialogue_system = dialogue_system
+        # Shared with other political systems so their per-turn analyses coalesce
+        self.query_batcher = query_batcher or StructuredQueryBatcher(llm_manager)
         self.active_conspiracies: Dict[str, ConspiracyPlot] = {}
         self.conspiracy_history: List[ConspiracyPlot] = []
         self.relationship_tensions: Dict[Tuple[str, str], float] = {}
@@ -212,15 +219,15 @@ Respond in JSON format:
     "military_dissatisfaction": 0.0-1.0
 }}"""
 
-            response = await self.llm_manager.generate([LLMMessage("user", prompt)])
-            
-            # Parse JSON response
-            try:
-                additional_conditions = json.loads(response.content)
-                return {k: min(max(float(v), 0.0), 1.0) for k, v in additional_conditions.items()}
-            except (json.JSONDecodeError, ValueError):
+            additional_conditions = await self.query_batcher.submit(StructuredQuery(
+                key=scoped_key("conspiracy_conditions", self, game_state),
+                prompt=prompt,
+                validator=clamp_unit_fields(self.CONDITION_FIELDS)
+            ))
+            if additional_conditions is None:
                 self.logger.warning("Failed to parse LLM conspiracy analysis response")
                 return {}
+            return additional_conditions
                 
         except Exception as e:
             self.logger.error(f"Error in LLM conspiracy analysis: {e}")
@@ -397,18 +404,28 @@ Respond in JSON format:
             self.logger.error(f"Error generating conspiracy plot: {e}")
             return None
     
-    async def evaluate_recruitment_targets(self, conspiracy: ConspiracyPlot) -> List[Tuple[str, float]]:
-        """Evaluate potential recruitment targets for a conspiracy."""
+    async def evaluate_recruitment_targets(self, conspiracy: ConspiracyPlot,
+                                           llm_factors: Optional[Dict[str, Dict[str, float]]] = None
+                                           ) -> List[Tuple[str, float]]:
+        """
+        Evaluate potential recruitment targets for a conspiracy.
+        
+        ``llm_factors`` maps target names to pre-fetched LLM assessments; when
+        omitted every target is assessed in a single batched request.
+        """
         targets = []
         initiator = conspiracy.participants[0].advisor_name
+        candidates = [name for name in self.dialogue_system.advisor_council.advisors if name != initiator]
         
-        for advisor_name, advisor in self.dialogue_system.advisor_council.advisors.items():
-            if advisor_name == initiator:
-                continue
-            
+        if llm_factors is None:
+            assessments = await self._llm_assess_recruitment_factors_batch([(conspiracy, candidates)])
+            llm_factors = assessments[0]
+        
+        for advisor_name in candidates:
             # Calculate recruitment suitability
             suitability = await self._calculate_recruitment_suitability(
-                conspiracy, initiator, advisor_name
+                conspiracy, initiator, advisor_name,
+                llm_factors=llm_factors.get(advisor_name, self._default_recruitment_factors())
             )
             
             if suitability > 0.3:  # Minimum threshold for consideration
@@ -418,7 +435,8 @@ Respond in JSON format:
         return sorted(targets, key=lambda x: x[1], reverse=True)
     
     async def _calculate_recruitment_suitability(self, conspiracy: ConspiracyPlot, 
-                                               initiator: str, target: str) -> float:
+                                               initiator: str, target: str,
+                                               llm_factors: Optional[Dict[str, float]] = None) -> float:
         """Calculate how suitable a target is for recruitment."""
         target_emotional = self.dialogue_system.get_advisor_emotional_state(target)
         target_advisor = self.dialogue_system.advisor_council.advisors[target]
@@ -449,7 +467,9 @@ Respond in JSON format:
                 factors["role_compatibility"] = 0.8
         
         # Use LLM to assess relationship and ideological alignment
-        factors.update(await self._llm_assess_recruitment_factors(conspiracy, initiator, target))
+        if llm_factors is None:
+            llm_factors = await self._llm_assess_recruitment_factors(conspiracy, initiator, target)
+        factors.update(llm_factors)
         
         # Calculate weighted suitability score
         weights = {
@@ -466,16 +486,61 @@ Respond in JSON format:
                                            initiator: str, target: str) -> Dict[str, float]:
         """Use LLM to assess recruitment factors."""
         try:
-            initiator_advisor = self.dialogue_system.advisor_council.advisors[initiator]
-            target_advisor = self.dialogue_system.advisor_council.advisors[target]
-            
-            # Get recent dialogue history between these advisors
-            dialogue_history = ""
-            for dialogue in self.dialogue_system.active_dialogues.values():
-                if initiator in dialogue.context.participants and target in dialogue.context.participants:
-                    dialogue_history += dialogue.get_conversation_history() + "\n"
+            query = self._recruitment_factors_query(conspiracy, initiator, target, key=target)
+            results = await self.query_batcher.run([query])
+            return results.get(target, self._default_recruitment_factors())
             
-            prompt = f"""Assess recruitment potential for conspiracy involvement.
+        except Exception as e:
+            self.logger.error(f"Error in LLM recruitment assessment: {e}")
+            return self._default_recruitment_factors()
+    
+    async def _llm_assess_recruitment_factors_batch(
+            self, requests: List[Tuple[ConspiracyPlot, List[str]]]) -> List[Dict[str, Dict[str, float]]]:
+        """
+        Assess recruitment factors for several conspiracies and their targets at once.
+        
+        Returns, for each (conspiracy, targets) request, a mapping of target name to
+        assessed factors. Targets the LLM could not assess are left out.
+        """
+        queries = []
+        for index, (conspiracy, targets) in enumerate(requests):
+            initiator = conspiracy.participants[0].advisor_name
+            for target in targets:
+                try:
+                    queries.append(self._recruitment_factors_query(
+                        conspiracy, initiator, target, key=f"{index}:{target}"
+                    ))
+                except Exception as e:
+                    self.logger.error(f"Error preparing recruitment assessment for {target}: {e}")
+        
+        try:
+            results = await self.query_batcher.run(queries)
+        except Exception as e:
+            self.logger.error(f"Error in batched LLM recruitment assessment: {e}")
+            results = {}
+        
+        assessments: List[Dict[str, Dict[str, float]]] = [{} for _ in requests]
+        for key, factors in results.items():
+            index, target = key.split(":", 1)
+            assessments[int(index)][target] = factors
+        return assessments
+    
+    def _default_recruitment_factors(self) -> Dict[str, float]:
+        return {"relationship_quality": 0.5, "ideological_alignment": 0.5, "risk_tolerance": 0.5}
+    
+    def _recruitment_factors_query(self, conspiracy: ConspiracyPlot, initiator: str,
+                                   target: str, key: str) -> StructuredQuery:
+        """Build the structured recruitment assessment query for one target."""
+        initiator_advisor = self.dialogue_system.advisor_council.advisors[initiator]
+        target_advisor = self.dialogue_system.advisor_council.advisors[target]
+        
+        # Get recent dialogue history between these advisors
+        dialogue_history = ""
+        for dialogue in self.dialogue_system.active_dialogues.values():
+            if initiator in dialogue.context.participants and target in dialogue.context.participants:
+                dialogue_history += dialogue.get_conversation_history() + "\n"
+        
+        prompt = f"""Assess recruitment potential for conspiracy involvement.
 
 CONSPIRACY DETAILS:
 - Type: {conspiracy.conspiracy_type.value}
@@ -505,15 +570,12 @@ Respond in JSON format:
     "risk_tolerance": 0.0-1.0
 }}"""
 
-            response = await self.llm_manager.generate([LLMMessage("user", prompt)])
-            return json.loads(response.content)
-            
-        except Exception as e:
-            self.logger.error(f"Error in LLM recruitment assessment: {e}")
-            return {"relationship_quality": 0.5, "ideological_alignment": 0.5, "risk_tolerance": 0.5}
+        return StructuredQuery(key=key, prompt=prompt, validator=clamp_unit_fields(self.RECRUITMENT_FIELDS))
     
     async def process_conspiracy_turn(self, conspiracy: ConspiracyPlot, 
-                                    game_state: Any) -> Dict[str, Any]:
+                                    game_state: Any,
+                                    recruitment_factors: Optional[Dict[str, Dict[str, float]]] = None
+                                    ) -> Dict[str, Any]:
         """Process a turn for an active conspiracy."""
         results = {
             "status_change": False,
@@ -525,7 +587,12 @@ Respond in JSON format:
         
         if conspiracy.status == ConspiracyStatus.PLANNING:
             # Attempt recruitment
-            recruitment_targets = await self.evaluate_recruitment_targets(conspiracy)
+            if recruitment_factors is None:
+                recruitment_targets = await self.evaluate_recruitment_targets(conspiracy)
+            else:
+                recruitment_targets = await self.evaluate_recruitment_targets(
+                    conspiracy, llm_factors=recruitment_factors
+                )
             if recruitment_targets:
                 target_name, suitability = recruitment_targets[0]
                 if random.random() < suitability * 0.5:  # nosec B311 - Using random for game mechanics, not security
@@ -743,6 +810,19 @@ Respond in JSON format:
             "completed_conspiracies": []
         }
         
+        # Assess every planning conspiracy's recruitment targets in one batched request
+        planning = [plot_id for plot_id, conspiracy in self.active_conspiracies.items()
+                    if conspiracy.status == ConspiracyStatus.PLANNING]
+        recruitment_requests = []
+        for plot_id in planning:
+            conspiracy = self.active_conspiracies[plot_id]
+            initiator = conspiracy.participants[0].advisor_name
+            recruitment_requests.append((conspiracy, [
+                name for name in self.dialogue_system.advisor_council.advisors if name != initiator
+            ]))
+        assessments = await self._llm_assess_recruitment_factors_batch(recruitment_requests)
+        recruitment_factors = dict(zip(planning, assessments))
+        
         # Process each active conspiracy
         conspiracies_to_remove = []
         
@@ -751,7 +831,9 @@ Respond in JSON format:
                                    ConspiracyStatus.FAILED]:
                 continue
             
-            turn_results = await self.process_conspiracy_turn(conspiracy, game_state)
+            turn_results = await self.process_conspiracy_turn(
+                conspiracy, game_state, recruitment_factors=recruitment_factors.get(plot_id)
+            )
             
             if turn_results["events"]:
                 results["conspiracy_events"].extend(turn_results["events"])
@@ -21,6 +21,7 @@ from .faction_dynamics import FactionDynamicsManager, PoliticalFaction
 from .information_warfare import InformationWarfareManager, PropagandaCampaign
 from .advisors import AdvisorRole, AdvisorCouncil, AdvisorAI, AdvisorPersonality
 from .llm_providers import LLMManager, LLMMessage, LLMResponse
+from .structured_batch import StructuredQuery, StructuredQueryBatcher, clamp_unit_fields, scoped_key
 
 
 class NarrativeType(Enum):
@@ -172,11 +173,17 @@ class GeneratedNarrative:
 class EmergentStorytellingManager:
     """Manages AI-driven dynamic narrative generation from game events."""
     
+    OPPORTUNITY_FIELDS = ("cultural_evolution", "historical_significance", "heroic_moments",
+                          "tragic_elements", "redemption_arcs")
+    
     def __init__(self, llm_manager: LLMManager, dialogue_system: MultiAdvisorDialogue,
                  faction_manager: Optional[FactionDynamicsManager] = None,
-                 information_manager: Optional[InformationWarfareManager] = None):
+                 information_manager: Optional[InformationWarfareManager] = None,
+                 query_batcher: Optional[StructuredQueryBatcher] = None):
         self.llm_manager = llm_manager
         self.dialogue_system = dialogue_system
+        # Shared with other political systems so their per-turn analyses coalesce
+        self.query_batcher = query_batcher or StructuredQueryBatcher(llm_manager)
         self.faction_manager = faction_manager
         self.information_manager = information_manager
         
@@ -278,24 +285,15 @@ Analyze additional storytelling opportunities and return JSON with values 0.0-1.
 
 Consider: What stories are emerging? What character arcs are developing? What historical moments are being created?"""
         
-        try:
-            response = await self.llm_manager.generate([
-                LLMMessage(role="system", content="You are a narrative analysis specialist and storytelling expert."),
-                LLMMessage(role="user", content=prompt)
-            ])
-            
-            opportunities_data = json.loads(response.content)
-            
-            # Validate and clamp values
-            additional_opportunities = {}
-            for key, value in opportunities_data.items():
-                if isinstance(value, (int, float)):
-                    additional_opportunities[key] = max(0.0, min(1.0, float(value)))
-            
-            return additional_opportunities
-            
-        except (json.JSONDecodeError, Exception) as e:
-            self.logger.warning(f"Failed to parse LLM narrative analysis: {e}")
+        additional_opportunities = await self.query_batcher.submit(StructuredQuery(
+            key=scoped_key("narrative_opportunities", self, game_state),
+            prompt=prompt,
+            validator=clamp_unit_fields(self.OPPORTUNITY_FIELDS),
+            system="You are a narrative analysis specialist and storytelling expert."
+        ))
+        
+        if additional_opportunities is None:
+            self.logger.warning("Failed to parse LLM narrative analysis")
             return {
                 "cultural_evolution": random.uniform(0.1, 0.4),  # nosec B311 - Using random for game mechanics, not security
                 "historical_significance": random.uniform(0.2, 0.6),  # nosec B311 - Using random for game mechanics, not security
@@ -303,6 +301,8 @@ Consider: What stories are emerging? What character arcs are developing? What hi
                 "tragic_elements": random.uniform(0.0, 0.4),  # nosec B311 - Using random for game mechanics, not security
                 "redemption_arcs": random.uniform(0.1, 0.3)  # nosec B311 - Using random for game mechanics, not security
             }
+        
+        return additional_opportunities
     
     async def create_narrative_event(self, title: str, description: str, 
                                    involved_characters: List[str],
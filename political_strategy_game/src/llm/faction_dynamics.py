@@ -20,6 +20,7 @@ from .dialogue import MultiAdvisorDialogue, EmotionalState
 from .conspiracy import ConspiracyGenerator, ConspiracyType
 from .advisors import AdvisorRole, AdvisorCouncil, AdvisorAI, AdvisorPersonality
 from .llm_providers import LLMManager, LLMMessage, LLMResponse
+from .structured_batch import StructuredQuery, StructuredQueryBatcher, clamp_unit_fields, scoped_key
 
 
 class IdeologyType(Enum):
@@ -187,9 +188,14 @@ class PoliticalFaction:
 class FactionDynamicsManager:
     """Manages AI-driven faction formation, evolution, and alliance dynamics."""
     
-    def __init__(self, llm_manager: LLMManager, dialogue_system: MultiAdvisorDialogue):
+    CONDITION_FIELDS = ("resource_competition", "external_pressure", "succession_uncertainty", "policy_disagreements")
+    
+    def __init__(self, llm_manager: LLMManager, dialogue_system: MultiAdvisorDialogue,
+                 query_batcher: Optional[StructuredQueryBatcher] = None):
         self.llm_manager = llm_manager
         self.dialogue_system = dialogue_system
+        # Shared with other political systems so their per-turn analyses coalesce
+        self.query_batcher = query_batcher or StructuredQueryBatcher(llm_manager)
         self.active_factions: Dict[str, PoliticalFaction] = {}
         self.faction_alliances: Dict[Tuple[str, str], FactionAlliance] = {}
         self.ideology_trends: Dict[IdeologyType, float] = defaultdict(float)
@@ -253,31 +259,23 @@ Please analyze additional faction formation factors and return a JSON object wit
 
 Consider economic pressures, diplomatic tensions, military threats, and policy conflicts."""
         
-        try:
-            response = await self.llm_manager.generate([
-                LLMMessage(role="system", content="You are a political analyst specializing in faction dynamics."),
-                LLMMessage(role="user", content=prompt)
-            ])
-            
-            # Parse LLM response
-            conditions_data = json.loads(response.content)
-            
-            # Validate and clamp values
-            additional_conditions = {}
-            for key, value in conditions_data.items():
-                if isinstance(value, (int, float)):
-                    additional_conditions[key] = max(0.0, min(1.0, float(value)))
-            
-            return additional_conditions
-            
-        except (json.JSONDecodeError, Exception) as e:
-            self.logger.warning(f"Failed to parse LLM faction analysis: {e}")
+        additional_conditions = await self.query_batcher.submit(StructuredQuery(
+            key=scoped_key("faction_conditions", self, game_state),
+            prompt=prompt,
+            validator=clamp_unit_fields(self.CONDITION_FIELDS),
+            system="You are a political analyst specializing in faction dynamics."
+        ))
+        
+        if additional_conditions is None:
+            self.logger.warning("Failed to parse LLM faction analysis")
             return {
                 "resource_competition": random.uniform(0.2, 0.6),  # nosec B311 - Using random for game mechanics, not security
                 "external_pressure": random.uniform(0.1, 0.4),  # nosec B311 - Using random for game mechanics, not security
                 "succession_uncertainty": random.uniform(0.0, 0.5),  # nosec B311 - Using random for game mechanics, not security
                 "policy_disagreements": random.uniform(0.3, 0.7)  # nosec B311 - Using random for game mechanics, not security
             }
+        
+        return additional_conditions
     
     async def generate_faction_ideology(self, founding_advisor: str, conditions: Dict[str, float]) -> FactionIdeology:
         """Generate a faction ideology based on founding advisor and conditions."""
@@ -483,13 +481,15 @@ Style: Political, inspiring, addressing key concerns of the time."""
         opportunities.sort(key=lambda x: x[1], reverse=True)
         return opportunities[:3]  # Return top 3 opportunities
     
-    async def attempt_faction_alliance(self, faction_a_id: str, faction_b_id: str) -> Optional[FactionAlliance]:
-        """Attempt to form an alliance between two factions."""
+    async def attempt_faction_alliance(self, faction_a_id: str, faction_b_id: str,
+                                       alliance_terms: Optional[Dict[str, Any]] = None) -> Optional[FactionAlliance]:
+        """Attempt to form an alliance between two factions, optionally with pre-negotiated terms."""
         faction_a = self.active_factions[faction_a_id]
         faction_b = self.active_factions[faction_b_id]
         
         # Use LLM to determine alliance terms and likelihood
-        alliance_terms = await self._negotiate_alliance_terms(faction_a, faction_b)
+        if alliance_terms is None:
+            alliance_terms = await self._negotiate_alliance_terms(faction_a, faction_b)
         
         if alliance_terms.get("success", False):
             alliance_key = (min(faction_a_id, faction_b_id), max(faction_a_id, faction_b_id))
@@ -515,6 +515,33 @@ Style: Political, inspiring, addressing key concerns of the time."""
     
     async def _negotiate_alliance_terms(self, faction_a: PoliticalFaction, faction_b: PoliticalFaction) -> Dict[str, Any]:
         """Use LLM to negotiate alliance terms between factions."""
+        negotiated = await self._negotiate_alliance_terms_batch([(faction_a, faction_b)])
+        return negotiated[(faction_a.faction_id, faction_b.faction_id)]
+    
+    async def _negotiate_alliance_terms_batch(
+            self, pairs: List[Tuple[PoliticalFaction, PoliticalFaction]]) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Negotiate terms for several faction pairs in one batched LLM request."""
+        queries = {
+            (faction_a.faction_id, faction_b.faction_id): self._alliance_terms_query(faction_a, faction_b)
+            for faction_a, faction_b in pairs
+        }
+        try:
+            results = await self.query_batcher.run(list(queries.values()))
+        except Exception as e:
+            self.logger.warning(f"Failed to negotiate alliance terms: {e}")
+            results = {}
+        
+        negotiated = {}
+        for faction_a, faction_b in pairs:
+            pair = (faction_a.faction_id, faction_b.faction_id)
+            terms = results.get(queries[pair].key)
+            if terms is None:
+                self.logger.warning(f"Failed to negotiate alliance terms between {faction_a.name} and {faction_b.name}")
+                terms = self._fallback_alliance_terms(faction_a, faction_b)
+            negotiated[pair] = terms
+        return negotiated
+    
+    def _alliance_terms_query(self, faction_a: PoliticalFaction, faction_b: PoliticalFaction) -> StructuredQuery:
         prompt = f"""Negotiate alliance terms between two political factions:
 
 FACTION A: {faction_a.name}
@@ -540,28 +567,37 @@ Return JSON format:
     "reasoning": "Brief explanation of outcome"
 }}"""
         
-        try:
-            response = await self.llm_manager.generate([
-                LLMMessage(role="system", content="You are a political negotiation specialist."),
-                LLMMessage(role="user", content=prompt)
-            ])
-            
-            return json.loads(response.content)
-            
-        except (json.JSONDecodeError, Exception) as e:
-            self.logger.warning(f"Failed to negotiate alliance terms: {e}")
-            
-            # Simple fallback based on ideological compatibility
-            ideological_distance = faction_a.ideology.calculate_ideological_distance(faction_b.ideology)
-            success = ideological_distance < 0.6
-            
-            return {
-                "success": success,
-                "strength": 0.7 if success else 0.2,
-                "alliance_type": "temporary_cooperation" if success else "rivalry",
-                "terms": ["Mutual support", "Shared resources"] if success else [],
-                "reasoning": "Ideological compatibility analysis"
-            }
+        return StructuredQuery(
+            key=f"{faction_a.faction_id}|{faction_b.faction_id}",
+            prompt=prompt,
+            validator=self._validate_alliance_terms,
+            system="You are a political negotiation specialist."
+        )
+    
+    @staticmethod
+    def _validate_alliance_terms(data: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(data["success"], bool):
+            raise TypeError("Alliance success must be a boolean")
+        terms = data.get("terms", [])
+        if not isinstance(terms, list):
+            raise TypeError("Alliance terms must be a list")
+        validated = dict(data)
+        validated["strength"] = max(0.0, min(1.0, float(data.get("strength", 0.6))))
+        validated["terms"] = [str(term) for term in terms]
+        return validated
+    
+    def _fallback_alliance_terms(self, faction_a: PoliticalFaction, faction_b: PoliticalFaction) -> Dict[str, Any]:
+        # Simple fallback based on ideological compatibility
+        ideological_distance = faction_a.ideology.calculate_ideological_distance(faction_b.ideology)
+        success = ideological_distance < 0.6
+        
+        return {
+            "success": success,
+            "strength": 0.7 if success else 0.2,
+            "alliance_type": "temporary_cooperation" if success else "rivalry",
+            "terms": ["Mutual support", "Shared resources"] if success else [],
+            "reasoning": "Ideological compatibility analysis"
+        }
     
     async def process_faction_dynamics_turn(self, game_state: Any) -> Dict[str, Any]:
         """Process faction dynamics for one game turn."""
@@ -598,7 +634,9 @@ Return JSON format:
                 new_faction = await self.create_political_faction(founder, conditions)
                 results["new_factions"].append(new_faction.faction_id)
         
-        # Process existing factions
+        # Process existing factions, collecting alliance candidates first
+        candidate_pairs = []
+        seen_pairs = set()
         for faction in list(self.active_factions.values()):
             # Evaluate alliance opportunities
             if faction.status == FactionStatus.ACTIVE and random.random() < 0.3:  # nosec B311 - Using random for game mechanics, not security
@@ -606,14 +644,25 @@ Return JSON format:
                 
                 if opportunities:
                     target_faction_id, compatibility = opportunities[0]
-                    if compatibility > 0.6:  # High compatibility threshold
-                        alliance = await self.attempt_faction_alliance(faction.faction_id, target_faction_id)
-                        if alliance:
-                            results["new_alliances"].append({
-                                "factions": [faction.faction_id, target_faction_id],
-                                "type": alliance.alliance_type.value,
-                                "strength": alliance.strength
-                            })
+                    pair_key = tuple(sorted((faction.faction_id, target_faction_id)))
+                    if compatibility > 0.6 and pair_key not in seen_pairs:  # High compatibility threshold
+                        seen_pairs.add(pair_key)
+                        candidate_pairs.append((faction, self.active_factions[target_faction_id]))
+        
+        # Negotiate every candidate alliance in one batched request
+        if candidate_pairs:
+            negotiated = await self._negotiate_alliance_terms_batch(candidate_pairs)
+            for faction, target_faction in candidate_pairs:
+                alliance = await self.attempt_faction_alliance(
+                    faction.faction_id, target_faction.faction_id,
+                    alliance_terms=negotiated[(faction.faction_id, target_faction.faction_id)]
+                )
+                if alliance:
+                    results["new_alliances"].append({
+                        "factions": [faction.faction_id, target_faction.faction_id],
+                        "type": alliance.alliance_type.value,
+                        "strength": alliance.strength
+                    })
         
         return results
     
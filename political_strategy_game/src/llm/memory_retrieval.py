@@ -0,0 +1,403 @@
+"""
+Memory Retrieval Engine for Advanced Memory Integration
+
+This module provides the ranked retrieval index used by the
+AdvancedMemoryManager. Memories are stored in postings lists with term
+frequencies and scored with BM25, advisor filtering is done with packed
+bitmaps, time relevance comes from precomputed decay buckets, and the
+top results are selected with a bounded heap that stops scanning once the
+remaining candidates can no longer beat the current top-k.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Iterable, Set, Tuple
+from datetime import datetime
+import heapq
+import math
+
+import numpy as np
+
+
+SECONDS_PER_DAY = 86400.0
+
+# Memories lose temporal relevance linearly over 30 days, floored at 0.1
+TIME_DECAY_DAYS = 30
+TIME_DECAY_BUCKETS: Tuple[float, ...] = tuple(
+    max(0.1, 1.0 - (day / float(TIME_DECAY_DAYS))) for day in range(TIME_DECAY_DAYS + 1)
+)
+
+# Weights of the individual relevance components (see MemoryEntry.calculate_relevance_score)
+KEYWORD_WEIGHT = 0.3
+ADVISOR_WEIGHT = 0.2
+IMPORTANCE_WEIGHT = 0.2
+ACCESS_WEIGHT = 0.1
+
+
+def time_decay_score(days_old: int) -> float:
+    """Look up the temporal relevance for a memory of the given age in days."""
+    if days_old <= 0:
+        return TIME_DECAY_BUCKETS[0]
+    return TIME_DECAY_BUCKETS[min(days_old, TIME_DECAY_DAYS)]
+
+
+class Bitmap:
+    """Growable packed bitmap over integer document ids.
+
+    Only the byte range between the lowest and highest set document id is
+    stored, so bitmaps for clustered ids (such as a single creation day)
+    stay small regardless of the total number of documents.
+    """
+
+    __slots__ = ("bits", "offset", "count")
+
+    def __init__(self):
+        self.bits = bytearray()
+        self.offset = 0
+        self.count = 0
+
+    def add(self, doc_id: int):
+        byte_index = doc_id >> 3
+        if not self.bits:
+            self.offset = byte_index
+            self.bits.append(0)
+        elif byte_index < self.offset:
+            self.bits[0:0] = bytes(self.offset - byte_index)
+            self.offset = byte_index
+        elif byte_index - self.offset >= len(self.bits):
+            self.bits.extend(bytes(byte_index - self.offset - len(self.bits) + 1))
+
+        local_index = byte_index - self.offset
+        mask = 1 << (doc_id & 7)
+        if not self.bits[local_index] & mask:
+            self.bits[local_index] |= mask
+            self.count += 1
+
+    def discard(self, doc_id: int):
+        local_index = (doc_id >> 3) - self.offset
+        if 0 <= local_index < len(self.bits):
+            mask = 1 << (doc_id & 7)
+            if self.bits[local_index] & mask:
+                self.bits[local_index] &= ~mask & 0xFF
+                self.count -= 1
+
+    def __contains__(self, doc_id: int) -> bool:
+        local_index = (doc_id >> 3) - self.offset
+        return 0 <= local_index < len(self.bits) and bool(self.bits[local_index] & (1 << (doc_id & 7)))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def window(self) -> Tuple[int, np.ndarray]:
+        """Return (byte offset, uint8 view) of the stored byte range."""
+        return self.offset, np.frombuffer(self.bits, dtype=np.uint8)
+
+    def as_array(self, num_bytes: int) -> np.ndarray:
+        """Return the bitmap as a uint8 array covering bytes [0, num_bytes)."""
+        array = np.zeros(num_bytes, dtype=np.uint8)
+        end = min(num_bytes, self.offset + len(self.bits))
+        if end > self.offset:
+            array[self.offset:end] = np.frombuffer(self.bits, dtype=np.uint8, count=end - self.offset)
+        return array
+
+
+def iter_set_bits(packed: np.ndarray, byte_offset: int = 0) -> np.ndarray:
+    """Return the document ids set in a packed uint8 bitmap array."""
+    return np.flatnonzero(np.unpackbits(packed, bitorder="little")) + (byte_offset << 3)
+
+
+@dataclass
+class RetrievalStatistics:
+    """Counters describing the work done by the retrieval index."""
+    queries: int = 0
+    keyword_candidates: int = 0
+    advisor_candidates: int = 0
+    scored_documents: int = 0
+    buckets_scanned: int = 0
+    buckets_skipped: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queries": self.queries,
+            "keyword_candidates": self.keyword_candidates,
+            "advisor_candidates": self.advisor_candidates,
+            "scored_documents": self.scored_documents,
+            "buckets_scanned": self.buckets_scanned,
+            "buckets_skipped": self.buckets_skipped,
+        }
+
+
+@dataclass
+class _IndexedDocument:
+    """Per-document data kept by the retrieval index."""
+    memory: Any
+    term_frequencies: Dict[str, int]
+    length: int
+    timestamp: float
+    bucket: Tuple[int, float]
+    importance_score: float
+    advisors: Tuple[str, ...] = field(default_factory=tuple)
+
+
+class MemoryRetrievalIndex:
+    """BM25 inverted index with advisor bitmaps and time-bucketed top-k search.
+
+    Documents are the memory entries of an AdvancedMemoryManager. The entry
+    object itself is kept so that mutable fields such as ``access_count`` and
+    ``decay_factor`` are read at query time.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, time_weight: float = 0.3):
+        self.k1 = k1
+        self.b = b
+        self.time_weight = time_weight
+
+        # Document storage (doc ids are reused after removal)
+        self._documents: List[Optional[_IndexedDocument]] = []
+        self._doc_ids: Dict[str, int] = {}
+        self._free_doc_ids: List[int] = []
+        self._total_length = 0
+
+        # Postings: term -> {doc_id: term frequency}
+        self.postings: Dict[str, Dict[int, int]] = {}
+
+        # Bitmaps: advisor -> docs, (creation day, importance score) -> docs
+        self.advisor_bitmaps: Dict[str, Bitmap] = {}
+        self.bucket_bitmaps: Dict[Tuple[int, float], Bitmap] = {}
+        self._max_advisors_per_document = 0
+
+        self.statistics = RetrievalStatistics()
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._doc_ids
+
+    @property
+    def average_document_length(self) -> float:
+        return self._total_length / len(self._doc_ids) if self._doc_ids else 0.0
+
+    def add(self, memory_id: str, memory: Any, term_frequencies: Dict[str, int],
+            advisors: Iterable[str], timestamp: datetime, importance_score: float):
+        """Index a memory entry."""
+        if memory_id in self._doc_ids:
+            self.remove(memory_id)
+
+        if self._free_doc_ids:
+            doc_id = self._free_doc_ids.pop()
+        else:
+            doc_id = len(self._documents)
+            self._documents.append(None)
+
+        unique_advisors = tuple(dict.fromkeys(advisors))
+        length = sum(term_frequencies.values())
+        document = _IndexedDocument(
+            memory=memory,
+            term_frequencies=dict(term_frequencies),
+            length=length,
+            timestamp=timestamp.timestamp(),
+            bucket=(timestamp.toordinal(), importance_score),
+            importance_score=importance_score,
+            advisors=unique_advisors
+        )
+
+        self._documents[doc_id] = document
+        self._doc_ids[memory_id] = doc_id
+        self._total_length += length
+
+        for term, frequency in document.term_frequencies.items():
+            self.postings.setdefault(term, {})[doc_id] = frequency
+
+        for advisor in unique_advisors:
+            self.advisor_bitmaps.setdefault(advisor, Bitmap()).add(doc_id)
+
+        self.bucket_bitmaps.setdefault(document.bucket, Bitmap()).add(doc_id)
+        self._max_advisors_per_document = max(self._max_advisors_per_document, len(unique_advisors))
+
+    def remove(self, memory_id: str):
+        """Remove a memory entry from the index."""
+        doc_id = self._doc_ids.pop(memory_id, None)
+        if doc_id is None:
+            return
+
+        document = self._documents[doc_id]
+        self._documents[doc_id] = None
+        self._free_doc_ids.append(doc_id)
+        self._total_length -= document.length
+
+        for term in document.term_frequencies:
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[term]
+
+        for advisor in document.advisors:
+            bitmap = self.advisor_bitmaps.get(advisor)
+            if bitmap is not None:
+                bitmap.discard(doc_id)
+                if not bitmap:
+                    del self.advisor_bitmaps[advisor]
+
+        bitmap = self.bucket_bitmaps.get(document.bucket)
+        if bitmap is not None:
+            bitmap.discard(doc_id)
+            if not bitmap:
+                del self.bucket_bitmaps[document.bucket]
+
+    def inverse_document_frequency(self, term: str) -> float:
+        """BM25 inverse document frequency (always positive)."""
+        document_frequency = len(self.postings.get(term, ()))
+        total = len(self._doc_ids)
+        return math.log(1.0 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def keyword_scores(self, query_terms: Set[str]) -> Dict[int, float]:
+        """Accumulate normalized BM25 scores (0-1) for documents matching any query term."""
+        if not query_terms or not self._doc_ids:
+            return {}
+
+        k1 = self.k1
+        b = self.b
+        average_length = self.average_document_length or 1.0
+        documents = self._documents
+
+        accumulators: Dict[int, float] = {}
+        max_possible = 0.0
+
+        for term in query_terms:
+            idf = self.inverse_document_frequency(term)
+            max_possible += idf * (k1 + 1.0)
+
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+
+            for doc_id, frequency in postings.items():
+                length_norm = k1 * (1.0 - b + b * documents[doc_id].length / average_length)
+                contribution = idf * frequency * (k1 + 1.0) / (frequency + length_norm)
+                accumulators[doc_id] = accumulators.get(doc_id, 0.0) + contribution
+
+        if max_possible <= 0.0:
+            return {}
+
+        return {doc_id: min(1.0, score / max_possible) for doc_id, score in accumulators.items()}
+
+    def search(self, query_terms: Set[str], current_advisors: List[str], limit: int = 10,
+               now: Optional[datetime] = None,
+               extra_scores: Optional[Dict[str, float]] = None) -> List[Tuple[Any, float]]:
+        """Return the top ``limit`` (memory, score) pairs, best first.
+
+        Candidates are memories matching a query term or associated with one
+        of the current advisors, mirroring the original union semantics.
+        Keyword matches are scored exhaustively; advisor-only matches are
+        scanned one (creation day, importance) bucket at a time in order of
+        their score upper bound, and the scan stops as soon as no remaining
+        bucket can beat the weakest entry in the top-k heap. The bound
+        assumes decay factors never exceed 1.0.
+
+        ``extra_scores`` maps memory ids to an additional keyword-like score
+        (0-1); the larger of it and the BM25 score is used.
+        """
+        self.statistics.queries += 1
+        if limit <= 0 or not self._doc_ids:
+            return []
+
+        now_ts = (now or datetime.now()).timestamp()
+        today = datetime.fromtimestamp(now_ts).toordinal()
+        advisors = tuple(dict.fromkeys(current_advisors or ()))
+        advisor_bitmaps = [self.advisor_bitmaps[a] for a in advisors if a in self.advisor_bitmaps]
+        advisor_divisor = float(max(len(advisors), 1))
+
+        keyword_scores = self.keyword_scores({term.lower() for term in query_terms})
+        if extra_scores:
+            for memory_id, score in extra_scores.items():
+                doc_id = self._doc_ids.get(memory_id)
+                if doc_id is not None and score > keyword_scores.get(doc_id, 0.0):
+                    keyword_scores[doc_id] = min(1.0, score)
+
+        heap: List[Tuple[float, int]] = []
+        documents = self._documents
+        time_weight = self.time_weight
+
+        def score_document(doc_id: int, keyword_score: float) -> float:
+            document = documents[doc_id]
+            memory = document.memory
+            advisor_overlap = 0
+            for bitmap in advisor_bitmaps:
+                if doc_id in bitmap:
+                    advisor_overlap += 1
+            days_old = int((now_ts - document.timestamp) // SECONDS_PER_DAY)
+            access_score = min(1.0, memory.access_count / 10.0)
+            total = (
+                keyword_score * KEYWORD_WEIGHT +
+                (advisor_overlap / advisor_divisor) * ADVISOR_WEIGHT +
+                time_decay_score(days_old) * time_weight +
+                document.importance_score * IMPORTANCE_WEIGHT +
+                access_score * ACCESS_WEIGHT
+            ) * memory.decay_factor
+            return min(1.0, total)
+
+        def offer(doc_id: int, score: float):
+            # Ties favour the more recently indexed document id
+            entry = (score, doc_id)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        # Exhaustive pass over keyword matches
+        self.statistics.keyword_candidates += len(keyword_scores)
+        for doc_id, keyword_score in keyword_scores.items():
+            offer(doc_id, score_document(doc_id, keyword_score))
+        self.statistics.scored_documents += len(keyword_scores)
+
+        if not advisor_bitmaps:
+            return self._heap_results(heap)
+
+        # Advisor-only matches, newest bucket first with early termination
+        num_bytes = (len(documents) + 7) >> 3
+        advisor_mask = np.zeros(num_bytes, dtype=np.uint8)
+        for bitmap in advisor_bitmaps:
+            np.bitwise_or(advisor_mask, bitmap.as_array(num_bytes), out=advisor_mask)
+
+        if keyword_scores:
+            keyword_bitmap = Bitmap()
+            for doc_id in keyword_scores:
+                keyword_bitmap.add(doc_id)
+            np.bitwise_and(advisor_mask, np.invert(keyword_bitmap.as_array(num_bytes)), out=advisor_mask)
+
+        # Upper bound on the non-temporal part of any advisor-only score
+        max_overlap = min(len(advisor_bitmaps), self._max_advisors_per_document)
+        static_bound = (max_overlap / advisor_divisor) * ADVISOR_WEIGHT + ACCESS_WEIGHT
+
+        # A memory created on day d is at least (today - d - 1) days old
+        buckets = sorted(
+            (
+                min(1.0, static_bound +
+                    time_decay_score(today - day - 1) * time_weight +
+                    importance_score * IMPORTANCE_WEIGHT),
+                (day, importance_score)
+            )
+            for day, importance_score in self.bucket_bitmaps
+        )
+        buckets.reverse()
+
+        for position, (bound, bucket) in enumerate(buckets):
+            if len(heap) >= limit and heap[0][0] >= bound:
+                self.statistics.buckets_skipped += len(buckets) - position
+                break
+
+            self.statistics.buckets_scanned += 1
+            offset, bucket_bits = self.bucket_bitmaps[bucket].window()
+            bucket_mask = np.bitwise_and(bucket_bits, advisor_mask[offset:offset + len(bucket_bits)])
+            candidates = iter_set_bits(bucket_mask, offset)
+            self.statistics.advisor_candidates += len(candidates)
+            self.statistics.scored_documents += len(candidates)
+            for doc_id in candidates.tolist():
+                offer(doc_id, score_document(doc_id, 0.0))
+
+        return self._heap_results(heap)
+
+    def _heap_results(self, heap: List[Tuple[float, int]]) -> List[Tuple[Any, float]]:
+        ranked = sorted(heap, reverse=True)
+        return [(self._documents[doc_id].memory, score) for score, doc_id in ranked]
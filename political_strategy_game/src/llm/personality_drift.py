@@ -19,6 +19,7 @@ from collections import defaultdict, deque
 from .dialogue import MultiAdvisorDialogue, EmotionalState
 from .advisors import AdvisorRole, AdvisorCouncil, AdvisorAI, AdvisorPersonality
 from .llm_providers import LLMManager, LLMMessage, LLMResponse
+from .semantic_memory import HashingEmbedder
 
 
 class PersonalityAspect(Enum):
@@ -139,6 +140,322 @@ class PersonalityProfile:
             self.expected_responses["recent_patterns"] = new_snapshot.recent_responses[-5:]
 
 
+@dataclass
+class DriftScreeningResult:
+    """Cheap, LLM-free drift estimate for one advisor."""
+    advisor_name: str
+    drift_score: float
+    escalated: bool
+    baseline_responses: List[str] = field(default_factory=list)
+    recent_responses: List[str] = field(default_factory=list)
+
+
+def response_drift_score(embedder: HashingEmbedder, baseline_responses: List[str],
+                         recent_responses: List[str]) -> float:
+    """Embedding distance (0-1) between baseline and recent responses.
+    
+    Both sets are embedded and averaged; the score is one minus the cosine
+    similarity of the two centroids, clamped to [0, 1].
+    """
+    if not baseline_responses or not recent_responses:
+        return 0.0
+    
+    vectors = embedder.embed(list(baseline_responses) + list(recent_responses))
+    baseline_centroid = vectors[:len(baseline_responses)].mean(axis=0)
+    recent_centroid = vectors[len(baseline_responses):].mean(axis=0)
+    
+    norm = float((baseline_centroid @ baseline_centroid) * (recent_centroid @ recent_centroid)) ** 0.5
+    if norm == 0.0:
+        return 0.0
+    similarity = float(baseline_centroid @ recent_centroid) / norm
+    return max(0.0, min(1.0, 1.0 - similarity))
+
+
+class PersonalityMonitoringPipeline:
+    """Turn-based drift monitoring that keeps LLM analysis off the critical path.
+    
+    Each turn every advisor is screened with a local embedding distance
+    between baseline and recent responses. Only advisors past the
+    escalation threshold are analysed by the LLM, all of them together in
+    one structured request that runs as a background task. The task only
+    gathers the LLM's analyses; they are applied to the detector's history
+    and drift list at the start of the next turn (or by ``drain``).
+    
+    Advisors are only screened on responses they actually gave: until a
+    snapshot or calibrated baseline exists, the first real responses passed
+    to ``screen`` become the baseline and screening starts on the next turn.
+    Advisors without responses this turn are not screened.
+    """
+    
+    def __init__(self, detector: "PersonalityDriftDetector", escalation_threshold: float = 0.35,
+                 embedder: Optional[HashingEmbedder] = None):
+        self.detector = detector
+        self.escalation_threshold = escalation_threshold
+        self.embedder = embedder or HashingEmbedder()
+        self.logger = logging.getLogger(__name__)
+        
+        self.latest_screening: Dict[str, DriftScreeningResult] = {}
+        self.response_baselines: Dict[str, List[str]] = {}
+        self._pending_task: Optional[asyncio.Task] = None
+        self._deferred: Dict[str, DriftScreeningResult] = {}
+        
+        self.metrics = {
+            "advisors_screened": 0,
+            "advisors_escalated": 0,
+            "llm_batches": 0,
+            "llm_calls": 0,
+            "individual_retries": 0,
+            "analyses_applied": 0
+        }
+    
+    @property
+    def analysis_pending(self) -> bool:
+        return self._pending_task is not None or bool(self._deferred)
+    
+    def screen(self, advisor_names: List[str],
+               recent_responses: Optional[Dict[str, List[str]]] = None) -> List[DriftScreeningResult]:
+        """Score drift locally for each advisor and return the screening results."""
+        results = []
+        for advisor_name in advisor_names:
+            observed = recent_responses.get(advisor_name) if recent_responses else None
+            if not observed:
+                continue
+            baseline = self._baseline_responses(advisor_name)
+            if not baseline:
+                self.response_baselines[advisor_name] = list(observed)[-5:]
+                continue
+            
+            recent = list(observed)[-10:]
+            score = response_drift_score(self.embedder, baseline, recent)
+            result = DriftScreeningResult(
+                advisor_name=advisor_name,
+                drift_score=score,
+                escalated=score >= self.escalation_threshold,
+                baseline_responses=baseline,
+                recent_responses=recent
+            )
+            self.latest_screening[advisor_name] = result
+            results.append(result)
+        
+        self.metrics["advisors_screened"] += len(results)
+        return results
+    
+    def _baseline_responses(self, advisor_name: str) -> List[str]:
+        # Role and trait keywords are not responses; scoring text against them reads as drift
+        history = self.detector.personality_history.get(advisor_name)
+        if history and history[0].recent_responses:
+            return list(history[0].recent_responses)
+        
+        profile = self.detector.personality_profiles.get(advisor_name)
+        if profile is not None and profile.expected_responses.get("recent_patterns"):
+            return list(profile.expected_responses["recent_patterns"])
+        return list(self.response_baselines.get(advisor_name, []))
+    
+    def schedule_analysis(self, screening: List[DriftScreeningResult]) -> bool:
+        """Queue escalated advisors and start the batched LLM analysis if possible.
+        
+        Returns True when a background analysis task was started.
+        """
+        for result in screening:
+            if result.escalated:
+                self._deferred[result.advisor_name] = result
+                self.metrics["advisors_escalated"] += 1
+        
+        if self._pending_task is not None or not self._deferred:
+            return False
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False  # No event loop: analysis waits for drain() or a later turn
+        
+        batch = list(self._deferred.values())
+        self._deferred.clear()
+        self._pending_task = loop.create_task(self.analyze_batch(batch))
+        return True
+    
+    def apply_completed_analysis(self) -> List[PersonalityDrift]:
+        """Apply the results of a finished background analysis, if any."""
+        task = self._pending_task
+        if task is None or not task.done():
+            return []
+        
+        self._pending_task = None
+        if task.cancelled():
+            return []
+        if task.exception() is not None:
+            self.logger.error(f"Personality drift analysis failed: {task.exception()}")
+            return []
+        return self.apply_analyses(task.result())
+    
+    async def drain(self) -> List[PersonalityDrift]:
+        """Finish and apply pending and deferred analyses now (e.g. before saving or shutdown)."""
+        drifts: List[PersonalityDrift] = []
+        if self._pending_task is not None:
+            await asyncio.wait([self._pending_task])
+            drifts.extend(self.apply_completed_analysis())
+        if self._deferred:
+            batch = list(self._deferred.values())
+            self._deferred.clear()
+            drifts.extend(self.apply_analyses(await self.analyze_batch(batch)))
+        return drifts
+    
+    async def analyze_batch(self, batch: List[DriftScreeningResult]
+                            ) -> List[Tuple[DriftScreeningResult, Dict[str, Any]]]:
+        """Analyse all escalated advisors with one structured LLM request.
+        
+        Returns each advisor's screening result with its raw analysis; nothing
+        is recorded on the detector until ``apply_analyses``.
+        """
+        batch = [result for result in batch
+                 if result.advisor_name in self.detector.dialogue_system.advisor_council.advisors]
+        if not batch:
+            return []
+        
+        self.metrics["llm_batches"] += 1
+        analyses = await self._request_analyses(batch)
+        
+        completed = []
+        for result in batch:
+            analysis = analyses.get(result.advisor_name)
+            if analysis is None:
+                # Retry items the batch response did not cover individually
+                self.metrics["individual_retries"] += 1
+                analysis = (await self._request_analyses([result])).get(result.advisor_name)
+            if analysis is None:
+                self.logger.warning(f"No drift analysis returned for {result.advisor_name}")
+                continue
+            completed.append((result, analysis))
+        return completed
+    
+    def apply_analyses(self, analyses: List[Tuple[DriftScreeningResult, Dict[str, Any]]]
+                       ) -> List[PersonalityDrift]:
+        """Record analyses as snapshots and drifts on the detector."""
+        drifts: List[PersonalityDrift] = []
+        for result, analysis in analyses:
+            drifts.extend(self._apply_analysis(result, analysis))
+        if analyses:
+            self.metrics["analyses_applied"] += 1
+        return drifts
+    
+    async def _request_analyses(self, batch: List[DriftScreeningResult]) -> Dict[str, Dict[str, Any]]:
+        advisors = self.detector.dialogue_system.advisor_council.advisors
+        sections = []
+        for result in batch:
+            personality = advisors[result.advisor_name].personality
+            sections.append(f"""ADVISOR: {personality.name}
+- Role: {personality.role.value}
+- Personality Traits: {', '.join(personality.personality_traits)}
+- Communication Style: {personality.communication_style}
+- Local drift score: {result.drift_score:.2f}
+BASELINE BEHAVIOR:
+{chr(10).join(f"- {response}" for response in result.baseline_responses[:3])}
+RECENT BEHAVIOR:
+{chr(10).join(f"- {response}" for response in result.recent_responses[:5])}""")
+        
+        aspect_fields = ", ".join(f'"{aspect.value}": 0.0-1.0' for aspect in PersonalityAspect)
+        prompt = f"""Analyze personality consistency for each advisor below.
+
+{(chr(10) * 2).join(sections)}
+
+Return one JSON object keyed by advisor name:
+{{
+    "<advisor name>": {{
+        "aspect_scores": {{{aspect_fields}}},
+        "specific_changes": ["specific_change_1", "specific_change_2"],
+        "potential_causes": ["potential_cause_1", "potential_cause_2"]
+    }}
+}}
+
+Scores are consistency with the established personality (1.0 = perfectly consistent)."""
+        
+        self.metrics["llm_calls"] += 1
+        try:
+            response = await self.detector.llm_manager.generate([
+                LLMMessage(role="system", content="You are a personality psychology expert specializing in consistency analysis."),
+                LLMMessage(role="user", content=prompt)
+            ])
+            data = json.loads(response.content)
+        except (json.JSONDecodeError, Exception) as e:
+            self.logger.warning(f"Failed to parse batched drift analysis: {e}")
+            return {}
+        
+        if not isinstance(data, dict):
+            return {}
+        return {
+            name: entry for name, entry in data.items()
+            if isinstance(entry, dict) and isinstance(entry.get("aspect_scores"), dict)
+        }
+    
+    def _apply_analysis(self, result: DriftScreeningResult,
+                        analysis: Dict[str, Any]) -> List[PersonalityDrift]:
+        detector = self.detector
+        advisor_name = result.advisor_name
+        
+        aspect_scores = {}
+        for aspect in PersonalityAspect:
+            try:
+                aspect_scores[aspect] = max(0.0, min(1.0, float(analysis["aspect_scores"].get(aspect.value, 0.5))))
+            except (TypeError, ValueError):
+                aspect_scores[aspect] = 0.5
+        
+        emotional_state = detector.dialogue_system.get_advisor_emotional_state(advisor_name)
+        current_snapshot = PersonalitySnapshot(
+            timestamp=datetime.now(),
+            advisor_name=advisor_name,
+            personality_aspects=aspect_scores,
+            recent_responses=result.recent_responses,
+            emotional_baseline={
+                "current_emotion": emotional_state.get("emotion", "calm"),
+                "intensity": emotional_state.get("intensity", 0.5)
+            }
+        )
+        
+        history = detector.personality_history[advisor_name]
+        if history:
+            baseline_snapshot = history[0]
+        else:
+            # No analysed history yet: compare against the profile's expected consistency
+            profile = detector.personality_profiles.get(advisor_name)
+            baseline_traits = profile.baseline_traits if profile else {}
+            baseline_snapshot = PersonalitySnapshot(
+                timestamp=profile.last_calibration if profile else datetime.now(),
+                advisor_name=advisor_name,
+                personality_aspects={
+                    aspect: baseline_traits.get(f"{aspect.value}_consistency", 1.0)
+                    for aspect in PersonalityAspect
+                },
+                recent_responses=result.baseline_responses
+            )
+            if result.baseline_responses:
+                history.append(baseline_snapshot)
+        history.append(current_snapshot)
+        
+        specific_changes = [str(change) for change in analysis.get("specific_changes", [])][:3]
+        potential_causes = [str(cause) for cause in analysis.get("potential_causes", [])][:3]
+        
+        drifts = []
+        for aspect in PersonalityAspect:
+            drift_fraction = abs(baseline_snapshot.personality_aspects.get(aspect, 0.5) - aspect_scores[aspect])
+            severity = detector._calculate_drift_severity(drift_fraction)
+            if severity == DriftSeverity.MINIMAL:
+                continue
+            drifts.append(PersonalityDrift(
+                advisor_name=advisor_name,
+                aspect=aspect,
+                severity=severity,
+                drift_percentage=drift_fraction * 100,
+                detection_timestamp=datetime.now(),
+                baseline_snapshot=baseline_snapshot,
+                current_snapshot=current_snapshot,
+                specific_changes=specific_changes,
+                potential_causes=potential_causes
+            ))
+        
+        detector.detected_drifts.extend(drifts)
+        return drifts
+
+
 class PersonalityDriftDetector:
     """Monitors and detects personality drift in advisor AI behavior."""
     
@@ -159,6 +476,7 @@ class PersonalityDriftDetector:
         }
         
         self.logger = logging.getLogger(__name__)
+        self.monitoring_pipeline = PersonalityMonitoringPipeline(self)
     
     def initialize_personality_profiles(self, advisor_council: AdvisorCouncil):
         """Initialize personality profiles for all advisors."""
@@ -613,8 +931,15 @@ Focus on the specific aspect that has drifted: {drift.aspect.value}"""
         improvement = max(0, (original_distance - corrected_distance) / original_distance)
         return improvement
     
-    def process_personality_monitoring_turn(self, advisor_names: List[str]) -> Dict[str, Any]:
-        """Process personality monitoring for one turn."""
+    def process_personality_monitoring_turn(self, advisor_names: List[str],
+                                           recent_responses: Optional[Dict[str, List[str]]] = None
+                                           ) -> Dict[str, Any]:
+        """Process personality monitoring for one turn.
+        
+        Applies LLM analyses finished since the previous turn, screens every
+        advisor locally and schedules one batched LLM analysis for escalated
+        advisors in the background (when called inside a running event loop).
+        """
         results = {
             "snapshots_captured": [],
             "drifts_detected": [],
@@ -622,10 +947,21 @@ Focus on the specific aspect that has drifted: {drift.aspect.value}"""
             "monitoring_summary": {}
         }
         
+        pipeline = self.monitoring_pipeline
+        applied_drifts = pipeline.apply_completed_analysis()
+        screening = pipeline.screen(advisor_names, recent_responses)
+        analysis_started = pipeline.schedule_analysis(screening)
+        
+        results["monitoring_summary"] = {
+            "screening_scores": {result.advisor_name: result.drift_score for result in screening},
+            "escalated_advisors": [result.advisor_name for result in screening if result.escalated],
+            "analysis_started": analysis_started,
+            "analysis_pending": pipeline.analysis_pending,
+            "drifts_applied": len(applied_drifts)
+        }
+        
         for advisor_name in advisor_names:
             try:
-                # This would be called asynchronously in real implementation
-                # For now, just track that monitoring occurred
                 results["snapshots_captured"].append(advisor_name)
                 
                 # Check for severe drifts needing immediate attention
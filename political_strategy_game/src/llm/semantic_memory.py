@@ -0,0 +1,400 @@
+"""
+Semantic Memory Retrieval for Advanced Memory Integration
+
+This module provides an optional embedding-based index for the
+AdvancedMemoryManager. Memory content is embedded on the CPU, either with a
+small local sentence-transformers model when one is installed or with a
+hashing-trick embedding otherwise. Vectors live in a float32 matrix that can
+be memory-mapped to disk and are searched with an inverted-file (IVF)
+approximate nearest neighbour index written in pure NumPy.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Sequence, Set, Tuple
+from collections import deque
+from pathlib import Path
+import logging
+import re
+import zlib
+
+import numpy as np
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class HashingEmbedder:
+    """Dependency-free embedding using the hashing trick.
+
+    Word unigrams, word bigrams and character trigrams are hashed into a
+    fixed number of signed buckets. Character trigrams let related word
+    forms ("negotiate", "negotiations") land close together.
+    """
+
+    def __init__(self, dimension: int = 256):
+        self.dimension = dimension
+        self.name = f"hashing-{dimension}"
+
+    def _features(self, text: str) -> List[Tuple[str, float]]:
+        words = _TOKEN_PATTERN.findall(text.lower())
+        features: List[Tuple[str, float]] = []
+        for word in words:
+            features.append((f"w:{word}", 1.0))
+            padded = f"#{word}#"
+            for i in range(len(padded) - 2):
+                features.append((f"c:{padded[i:i + 3]}", 0.5))
+        for first, second in zip(words, words[1:]):
+            features.append((f"b:{first}_{second}", 0.5))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed a batch of texts into L2-normalized float32 vectors."""
+        vectors = np.zeros((len(texts), self.dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                digest = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if digest & 0x80000000 else -1.0
+                vectors[row, digest % self.dimension] += sign * weight
+        return normalize_rows(vectors)
+
+
+class SentenceTransformerEmbedder:
+    """Small local sentence-transformers model running on the CPU."""
+
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", batch_size: int = 64):
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError("sentence-transformers is not installed. Run: pip install sentence-transformers")
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.batch_size = batch_size
+        self.name = model_name
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed a batch of texts into L2-normalized float32 vectors."""
+        vectors = self.model.encode(
+            list(texts), batch_size=self.batch_size, convert_to_numpy=True, show_progress_bar=False
+        )
+        return normalize_rows(np.asarray(vectors, dtype=np.float32))
+
+
+def create_embedder(model_name: Optional[str] = None, dimension: int = 256):
+    """Create the local model embedder if requested and available, else a hashing embedder."""
+    if model_name and SENTENCE_TRANSFORMERS_AVAILABLE:
+        try:
+            return SentenceTransformerEmbedder(model_name)
+        except Exception as e:
+            logging.getLogger("semantic_memory").warning(
+                f"Failed to load embedding model {model_name}, using hashing embedder: {e}"
+            )
+    return HashingEmbedder(dimension)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize each row, leaving all-zero rows untouched."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+class VectorStore:
+    """Growable float32 vector matrix, memory-mapped when a path is given."""
+
+    def __init__(self, dimension: int, storage_path: Optional[Path] = None,
+                 initial_capacity: int = 1024):
+        self.dimension = dimension
+        self.storage_path = Path(storage_path) if storage_path else None
+        self.capacity = max(1, initial_capacity)
+        self.size = 0  # rows ever allocated (rows are reused after removal)
+        self.matrix = self._allocate(self.capacity, mode="w+")
+
+    def _allocate(self, capacity: int, mode: str = "r+") -> np.ndarray:
+        if self.storage_path is None:
+            matrix = np.zeros((capacity, self.dimension), dtype=np.float32)
+            if self.size:
+                matrix[:self.size] = self.matrix[:self.size]
+            return matrix
+
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        # numpy extends the backing file when an r+ map is larger than it
+        return np.memmap(self.storage_path, dtype=np.float32, mode=mode,
+                         shape=(capacity, self.dimension))
+
+    def allocate_rows(self, count: int) -> np.ndarray:
+        """Reserve ``count`` new rows and return their indices."""
+        needed = self.size + count
+        if needed > self.capacity:
+            new_capacity = self.capacity
+            while new_capacity < needed:
+                new_capacity *= 2
+            if isinstance(self.matrix, np.memmap):
+                self.matrix.flush()
+            self.matrix = self._allocate(new_capacity)
+            self.capacity = new_capacity
+        rows = np.arange(self.size, needed)
+        self.size = needed
+        return rows
+
+    def flush(self):
+        if isinstance(self.matrix, np.memmap):
+            self.matrix.flush()
+
+
+class IVFIndex:
+    """Inverted-file approximate nearest neighbour index over a VectorStore.
+
+    Rows are partitioned by their nearest centroid (spherical k-means on
+    normalized vectors). Queries probe the ``nprobe`` closest partitions.
+    Until the index is trained, or while it is small, search is exact.
+    """
+
+    def __init__(self, store: VectorStore, nprobe: int = 8, train_threshold: int = 2048,
+                 max_lists: int = 256, training_sample: int = 50000, seed: int = 7):
+        self.store = store
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.max_lists = max_lists
+        self.training_sample = training_sample
+        self.rng = np.random.default_rng(seed)
+
+        self.centroids: Optional[np.ndarray] = None
+        self.lists: List[Set[int]] = []
+        self.row_list: Dict[int, int] = {}
+        self.trained_size = 0
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def needs_training(self, active_rows: int) -> bool:
+        if active_rows < self.train_threshold:
+            return False
+        return not self.is_trained or active_rows >= self.trained_size * 4
+
+    def train(self, rows: np.ndarray, iterations: int = 8):
+        """Cluster the given rows and rebuild the inverted lists."""
+        list_count = int(min(self.max_lists, max(8, np.sqrt(len(rows)))))
+
+        sample_rows = rows
+        if len(rows) > self.training_sample:
+            sample_rows = np.sort(self.rng.choice(rows, self.training_sample, replace=False))
+        sample = np.asarray(self.store.matrix[sample_rows])
+
+        centroids = sample[self.rng.choice(len(sample), list_count, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(list_count):
+                members = sample[assignment == cluster]
+                if len(members):
+                    centroids[cluster] = members.mean(axis=0)
+            centroids = normalize_rows(centroids)
+
+        self.centroids = centroids
+        self.lists = [set() for _ in range(list_count)]
+        self.row_list = {}
+        self.trained_size = len(rows)
+        self.assign(rows)
+
+    def assign(self, rows: np.ndarray, chunk_size: int = 65536):
+        """Add rows to the inverted list of their nearest centroid."""
+        if not self.is_trained:
+            return
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            nearest = np.argmax(self.store.matrix[chunk] @ self.centroids.T, axis=1)
+            for row, cluster in zip(chunk.tolist(), nearest.tolist()):
+                self.lists[cluster].add(row)
+                self.row_list[row] = cluster
+
+    def discard(self, row: int):
+        cluster = self.row_list.pop(row, None)
+        if cluster is not None:
+            self.lists[cluster].discard(row)
+
+    def candidate_rows(self, query: np.ndarray) -> Optional[np.ndarray]:
+        """Rows in the probed partitions, or None when search should be exact."""
+        if not self.is_trained:
+            return None
+        probes = min(self.nprobe, len(self.lists))
+        closest = np.argpartition(-(self.centroids @ query), probes - 1)[:probes]
+        rows: List[int] = []
+        for cluster in closest.tolist():
+            rows.extend(self.lists[cluster])
+        return np.fromiter(rows, dtype=np.int64, count=len(rows))
+
+
+@dataclass
+class SemanticSearchStatistics:
+    """Counters describing semantic index activity."""
+    embedded_memories: int = 0
+    embedding_batches: int = 0
+    queries: int = 0
+    exact_searches: int = 0
+    approximate_searches: int = 0
+    trainings: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "embedded_memories": self.embedded_memories,
+            "embedding_batches": self.embedding_batches,
+            "queries": self.queries,
+            "exact_searches": self.exact_searches,
+            "approximate_searches": self.approximate_searches,
+            "trainings": self.trainings,
+        }
+
+
+class SemanticMemoryIndex:
+    """Embedding index over memory content with batched insertion and IVF search."""
+
+    def __init__(self, embedder: Any = None, storage_path: Optional[Path] = None,
+                 batch_size: int = 64, nprobe: int = 16, train_threshold: int = 2048):
+        self.embedder = embedder or HashingEmbedder()
+        self.batch_size = batch_size
+        self.store = VectorStore(self.embedder.dimension, storage_path)
+        self.ivf = IVFIndex(self.store, nprobe=nprobe, train_threshold=train_threshold)
+        self.logger = logging.getLogger("semantic_memory")
+
+        self.row_ids: Dict[int, str] = {}
+        self.memory_rows: Dict[str, int] = {}
+        self.free_rows: List[int] = []
+        self.pending: Dict[str, str] = {}
+
+        self.statistics = SemanticSearchStatistics()
+
+    def __len__(self) -> int:
+        return len(self.memory_rows) + len(self.pending)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self.memory_rows or memory_id in self.pending
+
+    def add(self, memory_id: str, content: str):
+        """Queue a memory for embedding; batches are embedded when full or before a search."""
+        self.remove(memory_id)
+        self.pending[memory_id] = content
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def remove(self, memory_id: str):
+        if self.pending.pop(memory_id, None) is not None:
+            return
+        row = self.memory_rows.pop(memory_id, None)
+        if row is None:
+            return
+        del self.row_ids[row]
+        self.ivf.discard(row)
+        self.store.matrix[row] = 0.0
+        self.free_rows.append(row)
+
+    def flush(self):
+        """Embed all pending memories in one batch."""
+        if not self.pending:
+            return
+
+        memory_ids = list(self.pending.keys())
+        vectors = self.embedder.embed(list(self.pending.values()))
+        self.pending.clear()
+
+        reused = [self.free_rows.pop() for _ in range(min(len(self.free_rows), len(memory_ids)))]
+        rows = np.concatenate([
+            np.asarray(reused, dtype=np.int64),
+            self.store.allocate_rows(len(memory_ids) - len(reused)).astype(np.int64)
+        ])
+
+        self.store.matrix[rows] = vectors
+        for memory_id, row in zip(memory_ids, rows.tolist()):
+            self.memory_rows[memory_id] = row
+            self.row_ids[row] = memory_id
+
+        self.statistics.embedded_memories += len(memory_ids)
+        self.statistics.embedding_batches += 1
+
+        if self.ivf.needs_training(len(self.memory_rows)):
+            self.ivf.train(self._active_rows())
+            self.statistics.trainings += 1
+        else:
+            self.ivf.assign(rows)
+
+    def _active_rows(self) -> np.ndarray:
+        return np.fromiter(self.row_ids.keys(), dtype=np.int64, count=len(self.row_ids))
+
+    def embed_query(self, text: str) -> np.ndarray:
+        return self.embedder.embed([text])[0]
+
+    def search(self, query: Any, limit: int = 10,
+               min_similarity: float = 0.0) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` (memory_id, cosine similarity) pairs, best first.
+
+        ``query`` may be text or a vector returned by ``embed_query``.
+        """
+        self.flush()
+        self.statistics.queries += 1
+        if not self.memory_rows or limit <= 0:
+            return []
+
+        vector = self.embed_query(query) if isinstance(query, str) else query
+
+        rows = self.ivf.candidate_rows(vector)
+        if rows is None:
+            rows = self._active_rows()
+            self.statistics.exact_searches += 1
+        else:
+            self.statistics.approximate_searches += 1
+        if len(rows) == 0:
+            return []
+
+        similarities = self.store.matrix[rows] @ vector
+        if len(rows) > limit:
+            top = np.argpartition(-similarities, limit - 1)[:limit]
+        else:
+            top = np.arange(len(rows))
+        top = top[np.argsort(-similarities[top])]
+
+        return [
+            (self.row_ids[row], float(similarities[i]))
+            for i, row in zip(top.tolist(), rows[top].tolist())
+            if similarities[i] > min_similarity
+        ]
+
+
+class SemanticPatternCache:
+    """Reuses LLM pattern analyses for semantically equivalent context requests.
+
+    An entry is reused when the new query embedding is close to a cached
+    query and the retrieved memories largely overlap with the cached set.
+    """
+
+    def __init__(self, max_entries: int = 256, similarity_threshold: float = 0.9,
+                 overlap_threshold: float = 0.6):
+        self.entries: deque = deque(maxlen=max_entries)
+        self.similarity_threshold = similarity_threshold
+        self.overlap_threshold = overlap_threshold
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, query_vector: np.ndarray, memory_ids: Set[str]) -> Optional[List[str]]:
+        for cached_vector, cached_ids, patterns in reversed(self.entries):
+            if float(cached_vector @ query_vector) < self.similarity_threshold:
+                continue
+            union = cached_ids | memory_ids
+            overlap = len(cached_ids & memory_ids) / len(union) if union else 1.0
+            if overlap >= self.overlap_threshold:
+                self.hits += 1
+                return list(patterns)
+        self.misses += 1
+        return None
+
+    def store(self, query_vector: np.ndarray, memory_ids: Set[str], patterns: List[str]):
+        if patterns:
+            self.entries.append((query_vector, frozenset(memory_ids), list(patterns)))
+
+    def discard_memory(self, memory_id: str):
+        """Drop cached analyses that were derived from a removed memory."""
+        kept = [entry for entry in self.entries if memory_id not in entry[1]]
+        if len(kept) != len(self.entries):
+            self.entries = deque(kept, maxlen=self.entries.maxlen)
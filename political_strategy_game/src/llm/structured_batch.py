@@ -0,0 +1,226 @@
+"""
+Structured Batch Queries for LLM Analysis Calls
+
+Several political systems (conspiracies, factions, emergent storytelling) ask
+the LLM many small questions per turn, each expecting a tiny JSON object back.
+This module packs those questions into a single request keyed by query id,
+validates each keyed answer independently, and retries only the items that
+came back missing or malformed. Callers that run their analyses concurrently
+through a shared ``StructuredQueryBatcher`` are coalesced into one round trip.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import asyncio
+import json
+import logging
+
+from .llm_providers import LLMManager, LLMMessage
+
+
+Validator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def clamp_unit_fields(fields: Sequence[str]) -> Validator:
+    """Build a validator requiring numeric ``fields`` and clamping them to 0.0-1.0."""
+    def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for name in fields:
+            value = data[name]
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(f"Field '{name}' is not numeric")
+            result[name] = max(0.0, min(1.0, float(value)))
+        return result
+    return validate
+
+
+def extract_json_object(content: str) -> Dict[str, Any]:
+    """Parse the outermost JSON object in an LLM response, tolerating code fences."""
+    start = content.find("{")
+    end = content.rfind("}")
+    if start == -1 or end < start:
+        raise ValueError("No JSON object in response")
+    data = json.loads(content[start:end + 1])
+    if not isinstance(data, dict):
+        raise ValueError("Response is not a JSON object")
+    return data
+
+
+def scoped_key(name: str, *owners: Any) -> str:
+    """
+    Build a query key unique to the objects asking it.
+
+    Keys are deduplicated within a batch, so fixed per-system keys would let two
+    instances sharing a batcher receive each other's answers.
+    """
+    return ":".join([name, *(f"{id(owner):x}" for owner in owners)])
+
+
+@dataclass
+class StructuredQuery:
+    """A single JSON-returning analysis request."""
+    key: str
+    prompt: str  # Standalone prompt asking for one bare JSON object
+    validator: Validator
+    system: Optional[str] = None
+
+
+@dataclass
+class BatchQueryStatistics:
+    """Counters describing how queries were resolved."""
+    queries: int = 0
+    batched_requests: int = 0
+    individual_requests: int = 0
+    retried_queries: int = 0
+    failed_queries: int = 0
+
+    @property
+    def round_trips(self) -> int:
+        return self.batched_requests + self.individual_requests
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queries": self.queries,
+            "batched_requests": self.batched_requests,
+            "individual_requests": self.individual_requests,
+            "retried_queries": self.retried_queries,
+            "failed_queries": self.failed_queries,
+            "round_trips": self.round_trips
+        }
+
+
+class StructuredQueryBatcher:
+    """Packs structured LLM queries into keyed batch requests with per-item retry."""
+
+    BATCH_SYSTEM_PROMPT = "You are a political analysis engine. Answer every request precisely and only in JSON."
+
+    def __init__(self, llm_manager: LLMManager, max_batch_size: int = 16):
+        self.llm_manager = llm_manager
+        self.max_batch_size = max(1, max_batch_size)
+        self.statistics = BatchQueryStatistics()
+        self._pending: List[tuple] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger(__name__)
+
+    async def run(self, queries: Sequence[StructuredQuery]) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve queries, returning validated results keyed by query key.
+
+        Queries that still fail after an individual retry are omitted so callers
+        can apply their own fallback.
+        """
+        unique: Dict[str, StructuredQuery] = {}
+        for query in queries:
+            unique.setdefault(query.key, query)
+        if not unique:
+            return {}
+
+        self.statistics.queries += len(unique)
+        pending = list(unique.values())
+        chunks = [pending[start:start + self.max_batch_size]
+                  for start in range(0, len(pending), self.max_batch_size)]
+
+        # Chunks go out concurrently so large sets still take one round trip
+        results: Dict[str, Dict[str, Any]] = {}
+        for answered in await asyncio.gather(*(self._resolve_chunk(chunk) for chunk in chunks)):
+            results.update(answered)
+        return results
+
+    async def _resolve_chunk(self, chunk: List[StructuredQuery]) -> Dict[str, Dict[str, Any]]:
+        if len(chunk) == 1:
+            results = {}
+            failed = chunk
+        else:
+            results = await self._request_batch(chunk)
+            failed = [query for query in chunk if query.key not in results]
+            self.statistics.retried_queries += len(failed)
+
+        # Retry items the batch response did not cover individually
+        retried = await asyncio.gather(*(self._request_single(query) for query in failed))
+        for query, result in zip(failed, retried):
+            if result is None:
+                self.statistics.failed_queries += 1
+            else:
+                results[query.key] = result
+        return results
+
+    async def submit(self, query: StructuredQuery) -> Optional[Dict[str, Any]]:
+        """
+        Queue a query to be resolved with any others submitted in the same loop tick.
+
+        Returns the validated result, or None when the query could not be answered.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((query, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_pending())
+        return await future
+
+    async def _flush_pending(self):
+        # Keep draining: queries submitted while a batch is in flight go in the next one
+        while self._pending:
+            # Yield once so concurrently started callers can enqueue their queries
+            await asyncio.sleep(0)
+            pending, self._pending = self._pending, []
+            try:
+                results = await self.run([query for query, _ in pending])
+            except Exception as e:
+                self.logger.error(f"Structured batch flush failed: {e}")
+                results = {}
+            for query, future in pending:
+                if not future.done():
+                    future.set_result(results.get(query.key))
+
+    async def _request_batch(self, chunk: List[StructuredQuery]) -> Dict[str, Dict[str, Any]]:
+        sections = [f"REQUEST ID: {query.key}\n{query.prompt}" for query in chunk]
+        prompt = f"""Answer each of the {len(chunk)} analysis requests below.
+
+{(chr(10) * 2 + '---' + chr(10) * 2).join(sections)}
+
+Return one JSON object keyed by request id, where each value is the JSON object that request asks for:
+{{
+    "<request id>": {{...}}
+}}"""
+
+        self.statistics.batched_requests += 1
+        try:
+            response = await self.llm_manager.generate([
+                LLMMessage(role="system", content=self.BATCH_SYSTEM_PROMPT),
+                LLMMessage(role="user", content=prompt)
+            ])
+            data = extract_json_object(response.content)
+        except Exception as e:
+            self.logger.warning(f"Failed to parse batched analysis response: {e}")
+            return {}
+
+        results = {}
+        for query in chunk:
+            entry = data.get(query.key)
+            if not isinstance(entry, dict):
+                continue
+            validated = self._validate(query, entry)
+            if validated is not None:
+                results[query.key] = validated
+        return results
+
+    async def _request_single(self, query: StructuredQuery) -> Optional[Dict[str, Any]]:
+        messages = []
+        if query.system:
+            messages.append(LLMMessage(role="system", content=query.system))
+        messages.append(LLMMessage(role="user", content=query.prompt))
+
+        self.statistics.individual_requests += 1
+        try:
+            response = await self.llm_manager.generate(messages)
+            data = extract_json_object(response.content)
+        except Exception as e:
+            self.logger.warning(f"Failed to parse analysis response for {query.key}: {e}")
+            return None
+        return self._validate(query, data)
+
+    def _validate(self, query: StructuredQuery, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            return query.validator(data)
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.debug(f"Invalid analysis result for {query.key}: {e}")
+            return None
@@ -9,6 +9,7 @@ for the political strategy game, implementing Task 7.1 performance optimization
 import asyncio
 import json
 import logging
+import math
 import time
 import statistics
 from dataclasses import dataclass, field
@@ -17,6 +18,7 @@ from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
 import tempfile
 import sqlite3
+import random
 import psutil
 
 from src.core.civilization import Civilization
@@ -25,7 +27,10 @@ from src.core.advisor import Advisor, AdvisorRole, PersonalityProfile
 from src.core.memory import MemoryManager, Memory, MemoryType
 from src.llm.llm_providers import LLMManager, LLMMessage, LLMResponse, LLMProvider
 from src.llm.advanced_memory import AdvancedMemoryManager, MemoryImportance
+from src.llm.advanced_memory import MemoryType as AdvancedMemoryType
 from src.performance.optimization_manager import PerformanceOptimizationManager
+from src.visualization.layout_engine import ForceLayoutEngine
+from src.visualization.network_graph import NetworkLayout
 
 
 @dataclass
@@ -118,7 +123,17 @@ class PerformanceBenchmarkSuite:
             "civilization_count": 4,
             "advisor_count_per_civ": 5,
             "turns_to_simulate": 3,
-            "concurrent_operations": 10
+            "concurrent_operations": 10,
+            "retrieval_index_entries": 10000,
+            "retrieval_queries_count": 20,
+            "layout_nodes": 1000,
+            "layout_iterations": 20,
+            "save_format_civilizations": 50,
+            "wire_civilizations": 20,
+            "wire_turns": 10,
+            "routing_subscriptions": 10000,
+            "routing_events": 100000,
+            "routing_linear_sample": 500
         }
         
         # Results storage
@@ -416,6 +431,568 @@ class PerformanceBenchmarkSuite:
             }
         )
     
+    async def _benchmark_memory_retrieval(self) -> BenchmarkResult:
+        """Benchmark indexed memory retrieval against the legacy linear scan."""
+        return self._measure_memory_retrieval(
+            self.benchmark_config["retrieval_index_entries"],
+            self.benchmark_config["retrieval_queries_count"]
+        )
+    
+    def run_memory_retrieval_benchmark(self, entry_counts: List[int] = None,
+                                       query_count: int = 20) -> List[BenchmarkResult]:
+        """Benchmark memory retrieval at increasing memory bank sizes (10k-1M by default).
+        
+        Each size runs with ``max_memory_entries`` set to the entry count so
+        the manager holds the full bank without triggering cleanup.
+        """
+        entry_counts = entry_counts or [10_000, 100_000, 1_000_000]
+        return [self._measure_memory_retrieval(count, query_count) for count in entry_counts]
+    
+    def _measure_memory_retrieval(self, entry_count: int, query_count: int) -> BenchmarkResult:
+        """Populate a memory manager with entry_count memories and time top-10 retrieval."""
+        rng = random.Random(entry_count)
+        vocabulary = [f"topic{i}" for i in range(2000)] + [
+            "military", "alliance", "trade", "rebellion", "harvest", "treaty", "border"
+        ]
+        advisors = [f"advisor_{i}" for i in range(5)]
+        importance_levels = list(MemoryImportance)
+        now = datetime.now()
+        
+        memory_manager = AdvancedMemoryManager(MockLLMManager(response_delay_ms=0),
+                                               max_memory_entries=entry_count)
+        
+        build_start = time.time()
+        for i in range(entry_count):
+            memory_manager.add_memory(
+                content=f"Memory {i} " + " ".join(rng.sample(vocabulary, 8)),
+                memory_type=AdvancedMemoryType.EVENT,
+                importance=rng.choice(importance_levels),
+                associated_advisors=[advisors[i % len(advisors)]],
+                timestamp=now - timedelta(days=rng.randint(0, 90), seconds=i)
+            )
+        build_ms = (time.time() - build_start) * 1000
+        
+        queries = [
+            ({"military", "alliance", f"topic{q}"}, advisors[q % 3:q % 3 + 2])
+            for q in range(query_count)
+        ]
+        
+        index_start = time.time()
+        for keywords, query_advisors in queries:
+            memory_manager._find_relevant_memories(keywords, query_advisors, limit=10)
+        index_ms = (time.time() - index_start) * 1000
+        
+        # Legacy path: union candidates, score each memory, full sort
+        # (sampled on very large banks where each legacy query takes seconds)
+        legacy_queries = queries if entry_count <= 100_000 else queries[:3]
+        legacy_start = time.time()
+        for keywords, query_advisors in legacy_queries:
+            candidate_ids = set()
+            for keyword in keywords:
+                candidate_ids.update(memory_manager.memory_index.get(keyword, set()))
+            for advisor in query_advisors:
+                candidate_ids.update(memory_manager.advisor_memories.get(advisor, set()))
+            scored = [
+                (memory_manager.memories[memory_id].calculate_relevance_score(keywords, query_advisors),
+                 memory_id)
+                for memory_id in candidate_ids
+            ]
+            scored.sort(reverse=True)
+        legacy_ms = (time.time() - legacy_start) * 1000
+        
+        index_query_ms = index_ms / max(query_count, 1)
+        legacy_query_ms = legacy_ms / max(len(legacy_queries), 1)
+        
+        return BenchmarkResult(
+            test_name=f"memory_retrieval_index_{entry_count}",
+            duration_ms=build_ms + index_ms + legacy_ms,
+            memory_usage_mb=0.0,
+            cpu_usage_percent=0.0,
+            operations_per_second=query_count / (index_ms / 1000) if index_ms > 0 else 0.0,
+            success=len(memory_manager.memories) == entry_count,
+            metadata={
+                "entries": entry_count,
+                "max_memory_entries": memory_manager.max_memory_entries,
+                "build_ms": build_ms,
+                "index_query_ms": index_query_ms,
+                "legacy_query_ms": legacy_query_ms,
+                "speedup": legacy_query_ms / index_query_ms if index_query_ms > 0 else 0.0,
+                "retrieval_statistics": memory_manager.retrieval_index.statistics.to_dict()
+            }
+        )
+    
+    async def _benchmark_network_layout(self) -> BenchmarkResult:
+        """Benchmark the vectorized force-directed layout against the legacy pairwise loop."""
+        return self._measure_network_layout(
+            self.benchmark_config["layout_nodes"],
+            self.benchmark_config["layout_iterations"]
+        )
+    
+    def run_network_layout_benchmark(self, node_counts: List[int] = None,
+                                     iterations: int = 20) -> List[BenchmarkResult]:
+        """Benchmark network layouts at increasing graph sizes (100, 1k and 10k nodes by default)."""
+        node_counts = node_counts or [100, 1_000, 10_000]
+        return [self._measure_network_layout(count, iterations) for count in node_counts]
+    
+    def _measure_network_layout(self, node_count: int, iterations: int) -> BenchmarkResult:
+        """Time force-directed (cold and warm-started), hierarchical and circular layouts."""
+        rng = random.Random(node_count)
+        roles = ['leader', 'military', 'economic', 'diplomatic', 'intelligence', 'cultural', 'advisor']
+        nodes = [
+            {'id': f"node_{i}", 'role': rng.choice(roles), 'influence': rng.random()}
+            for i in range(node_count)
+        ]
+        links = [
+            {'source': f"node_{rng.randrange(node_count)}", 'target': f"node_{rng.randrange(node_count)}",
+             'strength': rng.random()}
+            for _ in range(node_count * 2)
+        ]
+        width = height = max(800, int(60 * node_count ** 0.5))
+        engine = ForceLayoutEngine()
+        
+        cold_start = time.time()
+        positions = NetworkLayout.force_directed_layout(
+            nodes, links, width, height, iterations=iterations, engine=engine
+        )
+        cold_ms = (time.time() - cold_start) * 1000
+        cold_statistics = engine.statistics.to_dict()
+        
+        # Incremental update: one new node joins an already laid-out graph
+        nodes.append({'id': "node_new", 'role': 'advisor', 'influence': 0.5})
+        links.append({'source': "node_new", 'target': "node_0", 'strength': 0.8})
+        warm_start = time.time()
+        NetworkLayout.force_directed_layout(
+            nodes, links, width, height, iterations=iterations,
+            initial_positions=positions, engine=engine
+        )
+        warm_ms = (time.time() - warm_start) * 1000
+        warm_statistics = engine.statistics.to_dict()
+        
+        hierarchical_start = time.time()
+        NetworkLayout.hierarchical_layout(nodes, links, width, height)
+        hierarchical_ms = (time.time() - hierarchical_start) * 1000
+        
+        circular_start = time.time()
+        NetworkLayout.circular_layout(nodes, width, height)
+        circular_ms = (time.time() - circular_start) * 1000
+        
+        # Legacy path: one iteration of the pure-Python pairwise repulsion loop
+        # (skipped on graphs where a single iteration takes tens of seconds)
+        legacy_iteration_ms = None
+        if node_count <= 1_000:
+            legacy_positions = {node_id: dict(position) for node_id, position in positions.items()}
+            forces = {node_id: {'x': 0.0, 'y': 0.0} for node_id in legacy_positions}
+            legacy_start = time.time()
+            for id1, pos1 in legacy_positions.items():
+                for id2, pos2 in legacy_positions.items():
+                    if id1 != id2:
+                        dx = pos1['x'] - pos2['x']
+                        dy = pos1['y'] - pos2['y']
+                        distance = max(math.sqrt(dx * dx + dy * dy), engine.min_distance)
+                        force = engine.repulsion_strength / (distance * distance)
+                        forces[id1]['x'] += force * dx / distance
+                        forces[id1]['y'] += force * dy / distance
+            legacy_iteration_ms = (time.time() - legacy_start) * 1000
+        
+        iteration_ms = cold_ms / max(cold_statistics["iterations"], 1)
+        
+        return BenchmarkResult(
+            test_name=f"network_layout_{node_count}",
+            duration_ms=cold_ms + warm_ms + hierarchical_ms + circular_ms + (legacy_iteration_ms or 0.0),
+            memory_usage_mb=0.0,
+            cpu_usage_percent=0.0,
+            operations_per_second=cold_statistics["iterations"] / (cold_ms / 1000) if cold_ms > 0 else 0.0,
+            success=len(positions) == node_count and warm_statistics["warm_started"] == node_count,
+            metadata={
+                "nodes": node_count,
+                "links": len(links),
+                "force_directed_ms": cold_ms,
+                "force_directed_iteration_ms": iteration_ms,
+                "warm_start_ms": warm_ms,
+                "warm_start_iterations": warm_statistics["iterations"],
+                "hierarchical_ms": hierarchical_ms,
+                "circular_ms": circular_ms,
+                "legacy_iteration_ms": legacy_iteration_ms,
+                "speedup": legacy_iteration_ms / iteration_ms if legacy_iteration_ms and iteration_ms > 0 else None,
+                "layout_statistics": cold_statistics
+            }
+        )
+    
+    async def _benchmark_save_formats(self) -> BenchmarkResult:
+        """Benchmark the packed save format against the JSON, gzip and pickle paths."""
+        return self._measure_save_formats(self.benchmark_config["save_format_civilizations"])
+    
+    def run_save_format_benchmark(self, civilization_counts: List[int] = None) -> List[BenchmarkResult]:
+        """Benchmark save formats at increasing world sizes (10, 100 and 500 civilizations by default)."""
+        civilization_counts = civilization_counts or [10, 100, 500]
+        return [self._measure_save_formats(count) for count in civilization_counts]
+    
+    def _measure_save_formats(self, civilization_count: int) -> BenchmarkResult:
+        """Time write, full load and single-civilization load for each save format."""
+        from src.persistence.save_game_manager import (
+            SaveGameManager, SaveGameData, SaveGameMetadata, SaveFileFormat, SaveFileVersion
+        )
+        
+        rng = random.Random(civilization_count)
+        civ_ids = [f"civ_{i}" for i in range(civilization_count)]
+        civilizations = {
+            civ_id: {
+                'name': f"Civilization {civ_id}",
+                'resources': {resource: rng.uniform(0, 1000) for resource in
+                              ('food', 'gold', 'iron', 'wood', 'stone', 'influence')},
+                'relationships': [rng.uniform(-1, 1) for _ in civ_ids],
+                'citizens': [
+                    {'id': n, 'age': rng.randint(16, 80), 'loyalty': rng.random(),
+                     'wealth': rng.random() * 100, 'faction': f"faction_{n % 5}"}
+                    for n in range(200)
+                ]
+            }
+            for civ_id in civ_ids
+        }
+        memory_banks = {
+            civ_id: {'civilization_id': civ_id, 'advisor_memories': {},
+                     'shared_memories': [f"Turn {t}: event in {civ_id}" for t in range(20)]}
+            for civ_id in civ_ids
+        }
+        game_state = {
+            'turn_state': {'turn_number': 100},
+            'civilizations': [{'civilization_id': civ_id} for civ_id in civ_ids],
+            'advisors': [],
+            'global_events': [],
+            'metadata': {}
+        }
+        
+        save_dir = Path(tempfile.mkdtemp(dir=self.data_dir))
+        manager = SaveGameManager(save_dir)
+        formats = [SaveFileFormat.JSON, SaveFileFormat.JSON_COMPRESSED,
+                   SaveFileFormat.BINARY_COMPRESSED, SaveFileFormat.PACKED]
+        target = civ_ids[len(civ_ids) // 2]
+        timings = {}
+        round_trips_ok = True
+        
+        for save_format in formats:
+            metadata = SaveGameMetadata(
+                save_id=f"benchmark_{save_format.value}", game_name="Save format benchmark",
+                timestamp=datetime.now(), version=SaveFileVersion.CURRENT, format=save_format,
+                compression_level=manager.compression_level, game_turn=100,
+                civilization_count=civilization_count, advisor_count=0, memory_count=0,
+                file_size=0, checksum=""
+            )
+            save_data = SaveGameData(metadata=metadata, game_state=game_state,
+                                     memory_banks=memory_banks, civilizations=civilizations)
+            save_path = save_dir / f"benchmark.{save_format.value}"
+            
+            write_start = time.time()
+            manager._write_save_file(save_data, save_path, save_format)
+            write_ms = (time.time() - write_start) * 1000
+            
+            load_start = time.time()
+            loaded = manager._read_save_file_dict(save_path)
+            load_ms = (time.time() - load_start) * 1000
+            
+            single_start = time.time()
+            single = manager._read_partial_save_dict(save_path, {target})
+            single_ms = (time.time() - single_start) * 1000
+            
+            round_trips_ok = (round_trips_ok and loaded['civilizations'][target] == civilizations[target]
+                              and list(single['civilizations']) == [target])
+            timings[save_format.value] = {
+                'file_size': save_path.stat().st_size,
+                'write_ms': write_ms,
+                'load_ms': load_ms,
+                'single_civilization_ms': single_ms
+            }
+        
+        packed = timings[SaveFileFormat.PACKED.value]
+        total_ms = sum(sum(v for k, v in timing.items() if k.endswith('_ms')) for timing in timings.values())
+        
+        return BenchmarkResult(
+            test_name=f"save_formats_{civilization_count}",
+            duration_ms=total_ms,
+            memory_usage_mb=0.0,
+            cpu_usage_percent=0.0,
+            operations_per_second=len(formats) * 3 / (total_ms / 1000) if total_ms > 0 else 0.0,
+            success=round_trips_ok,
+            metadata={
+                "civilizations": civilization_count,
+                "formats": timings,
+                "packed_size_vs_json": packed['file_size'] / timings[SaveFileFormat.JSON.value]['file_size'],
+                "packed_size_vs_gzip": packed['file_size'] / timings[SaveFileFormat.JSON_COMPRESSED.value]['file_size'],
+                "single_civilization_speedup": (
+                    timings[SaveFileFormat.JSON_COMPRESSED.value]['single_civilization_ms'] / packed['single_civilization_ms']
+                    if packed['single_civilization_ms'] > 0 else None
+                )
+            }
+        )
+    
+    async def _benchmark_bridge_wire_protocol(self) -> BenchmarkResult:
+        """Benchmark bridge wire formats by bytes per turn and per-message encode/decode time."""
+        return self._measure_bridge_wire(
+            self.benchmark_config["wire_civilizations"],
+            self.benchmark_config["wire_turns"]
+        )
+    
+    def run_bridge_wire_benchmark(self, civilization_counts: List[int] = None,
+                                  turns: int = 10) -> List[BenchmarkResult]:
+        """Benchmark wire formats at increasing world sizes (5, 20 and 100 civilizations by default)."""
+        civilization_counts = civilization_counts or [5, 20, 100]
+        return [self._measure_bridge_wire(count, turns) for count in civilization_counts]
+    
+    def _measure_bridge_wire(self, civilization_count: int, turns: int) -> BenchmarkResult:
+        """
+        Replay a game's bridge traffic (state sync, political events and a
+        heartbeat per turn) through each wire format.
+        """
+        from src.bridge import (
+            MessageFactory, GameState, TurnState, CivilizationState, AdvisorState, PoliticalEvent
+        )
+        from src.bridge.state_serializer import GameStateSerializer
+        from src.bridge.wire_protocol import (
+            WireCodec, WireOptions, WIRE_FORMAT_BINARY, COMPRESSION_DEFLATE, COMPRESSION_NONE
+        )
+        
+        rng = random.Random(civilization_count)
+        civ_ids = [f"civ_{i}" for i in range(civilization_count)]
+        moods = ['calm', 'confident', 'stressed', 'anxious', 'focused']
+        roles = ['military', 'economic', 'diplomatic', 'intelligence', 'cultural']
+        advisors = [
+            AdvisorState(
+                advisor_id=f"{civ_id}_advisor_{n}", name=f"Advisor {n} of {civ_id}", role=roles[n],
+                loyalty=round(rng.random(), 3), influence=round(rng.random(), 3),
+                stress_level=round(rng.random(), 3), current_mood=rng.choice(moods),
+                personality_traits={trait: round(rng.random(), 2)
+                                    for trait in ('aggressive', 'cautious', 'ambitious', 'loyal')},
+                relationships={f"{civ_id}_advisor_{m}": round(rng.uniform(-1, 1), 2) for m in range(5) if m != n}
+            )
+            for civ_id in civ_ids for n in range(5)
+        ]
+        civilizations = [
+            CivilizationState(
+                civilization_id=civ_id, name=f"Civilization {civ_id}", leader_name=f"Leader of {civ_id}",
+                political_stability=round(rng.random(), 3), economic_strength=round(rng.random(), 3),
+                military_power=round(rng.random(), 3),
+                diplomatic_relations={other: round(rng.uniform(-1, 1), 2) for other in civ_ids if other != civ_id},
+                active_crises=[], active_conspiracies=[], recent_events=[]
+            )
+            for civ_id in civ_ids
+        ]
+        game_state = GameState(TurnState(1, civ_ids[0], "planning"), civilizations, advisors, [], {"seed": civilization_count})
+        serializer = GameStateSerializer()
+        
+        # Build each turn's traffic: a state update, a few events and a heartbeat
+        traffic = []
+        for turn in range(1, turns + 1):
+            if turn == 1:
+                serializer.serialize_full_state(game_state)
+                update = None
+            else:
+                game_state.turn_state.turn_number = turn
+                for advisor in rng.sample(advisors, max(1, len(advisors) // 10)):
+                    advisor.loyalty = round(rng.random(), 3)
+                    advisor.current_mood = rng.choice(moods)
+                for civilization in rng.sample(civilizations, max(1, len(civilizations) // 5)):
+                    civilization.political_stability = round(rng.random(), 3)
+                update = serializer.create_incremental_update(game_state)
+            full_sync = MessageFactory.create_game_state_sync("political_engine", game_state)
+            delta = (MessageFactory.create_incremental_update("political_engine", update.to_dict())
+                     if update is not None else full_sync)
+            events = [
+                MessageFactory.create_political_event("political_engine", PoliticalEvent(
+                    event_id=f"event_{turn}_{n}", event_type="advisor_loyalty_change",
+                    civilization_id=rng.choice(civ_ids), title="Advisor Loyalty Changed",
+                    description="An advisor's loyalty has shifted due to recent events", severity="moderate",
+                    participants=[rng.choice(advisors).advisor_id], consequences={"loyalty_change": -0.1},
+                    timestamp=datetime.now()
+                ))
+                for n in range(3)
+            ]
+            heartbeat = MessageFactory.create_heartbeat("political_engine")
+            traffic.append(([full_sync, *events, heartbeat], [delta, *events, heartbeat]))
+        
+        message_count = sum(len(full) for full, _ in traffic)
+        formats = {}
+        round_trips_ok = True
+        
+        # JSON text frames, as sent to debugging clients
+        encode_start = time.perf_counter()
+        encoded = [[message.to_json() for message in full] for full, _ in traffic]
+        encode_ms = (time.perf_counter() - encode_start) * 1000
+        decode_start = time.perf_counter()
+        decoded = [[type(message).from_json(text) for message, text in zip(full, texts)]
+                   for (full, _), texts in zip(traffic, encoded)]
+        decode_ms = (time.perf_counter() - decode_start) * 1000
+        round_trips_ok = round_trips_ok and all(
+            message.payload == copy.payload for (full, _), copies in zip(traffic, decoded) for message, copy in zip(full, copies)
+        )
+        formats["json"] = {
+            'bytes_per_turn': sum(len(text.encode('utf-8')) for texts in encoded for text in texts) / turns,
+            'encode_ms_per_message': encode_ms / message_count,
+            'decode_ms_per_message': decode_ms / message_count
+        }
+        
+        # The serializer's compressed JSON state (gzip + base64) for comparison
+        gzip_bytes = len(serializer.serialize_full_state_json(game_state))
+        formats["json_gzip_base64_state"] = {'bytes_per_turn': gzip_bytes}
+        
+        variants = [
+            ("binary", COMPRESSION_NONE, False),
+            ("binary_deflate", COMPRESSION_DEFLATE, False),
+            ("binary_deflate_deltas", COMPRESSION_DEFLATE, True),
+        ]
+        for name, compression, deltas in variants:
+            options = WireOptions(WIRE_FORMAT_BINARY, compression, deltas)
+            sender, receiver = WireCodec(options), WireCodec(options)
+            total_bytes = 0
+            encode_ms = decode_ms = 0.0
+            for full, delta in traffic:
+                messages = delta if deltas else full
+                for message in messages:
+                    encode_start = time.perf_counter()
+                    frame = sender.encode(message)
+                    encode_ms += (time.perf_counter() - encode_start) * 1000
+                    decode_start = time.perf_counter()
+                    copy = receiver.decode(frame)[0]
+                    decode_ms += (time.perf_counter() - decode_start) * 1000
+                    total_bytes += len(frame)
+                    round_trips_ok = round_trips_ok and copy.payload == message.payload
+            formats[name] = {
+                'bytes_per_turn': total_bytes / turns,
+                'encode_ms_per_message': encode_ms / message_count,
+                'decode_ms_per_message': decode_ms / message_count
+            }
+        
+        total_ms = sum(timing.get('encode_ms_per_message', 0) + timing.get('decode_ms_per_message', 0)
+                       for timing in formats.values()) * message_count
+        json_bytes = formats["json"]['bytes_per_turn']
+        
+        return BenchmarkResult(
+            test_name=f"bridge_wire_{civilization_count}",
+            duration_ms=total_ms,
+            memory_usage_mb=0.0,
+            cpu_usage_percent=0.0,
+            operations_per_second=message_count * (len(variants) + 1) / (total_ms / 1000) if total_ms > 0 else 0.0,
+            success=round_trips_ok,
+            metadata={
+                "civilizations": civilization_count,
+                "advisors": len(advisors),
+                "turns": turns,
+                "messages_per_turn": message_count / turns,
+                "formats": formats,
+                "binary_size_vs_json": formats["binary"]['bytes_per_turn'] / json_bytes,
+                "deflate_size_vs_json": formats["binary_deflate"]['bytes_per_turn'] / json_bytes,
+                "delta_size_vs_json": formats["binary_deflate_deltas"]['bytes_per_turn'] / json_bytes
+            }
+        )
+    
+    async def _benchmark_event_routing(self) -> BenchmarkResult:
+        """Benchmark indexed event routing against a linear scan of every subscription."""
+        return self._measure_event_routing(
+            self.benchmark_config["routing_subscriptions"],
+            self.benchmark_config["routing_events"],
+            self.benchmark_config["routing_linear_sample"]
+        )
+    
+    def run_event_routing_benchmark(self, subscription_counts: List[int] = None, event_count: int = 100000,
+                                    linear_sample: int = 500) -> List[BenchmarkResult]:
+        """Benchmark event routing at increasing subscription counts (100, 1k and 10k by default)."""
+        subscription_counts = subscription_counts or [100, 1000, 10000]
+        return [self._measure_event_routing(count, event_count, linear_sample) for count in subscription_counts]
+    
+    def _measure_event_routing(self, subscription_count: int, event_count: int,
+                               linear_sample: int) -> BenchmarkResult:
+        """
+        Route political events to a mix of per-civilization, per-category,
+        per-advisor and unfiltered subscriptions. The linear scan runs on a
+        sample of the events, and its results are checked against the index.
+        """
+        from src.bridge import PoliticalEvent
+        from src.bridge.event_broadcaster import (
+            SubscriptionFilter, SubscriptionIndex, EventSubscription, EventCategory, EventPriority
+        )
+        
+        rng = random.Random(subscription_count)
+        civ_ids = [f"civ_{i}" for i in range(100)]
+        advisor_ids = [f"{civ_id}_advisor_{n}" for civ_id in civ_ids for n in range(5)]
+        severities = ["minor", "moderate", "major", "critical"]
+        priorities = list(EventPriority)
+        event_types = ["advisor_loyalty_change", "crisis_emergency", "conspiracy_detected", "diplomatic_incident",
+                       "trade_agreement", "war_declared", "public_unrest", "season_change"]
+        
+        subscriptions = []
+        for i in range(subscription_count):
+            kind = rng.random()
+            if kind < 0.6:
+                filter = SubscriptionFilter(civilizations=rng.sample(civ_ids, rng.randint(1, 3)),
+                                            categories=rng.sample(list(EventCategory), rng.randint(0, 2)))
+            elif kind < 0.8:
+                filter = SubscriptionFilter(categories=[rng.choice(list(EventCategory))],
+                                            severities=rng.sample(severities, 2))
+            elif kind < 0.95:
+                filter = SubscriptionFilter(participants=rng.sample(advisor_ids, rng.randint(1, 5)))
+            else:
+                filter = SubscriptionFilter(keywords=["war"] if rng.random() < 0.5 else None)
+            filter.min_priority = rng.choice([None, None, *priorities])
+            if rng.random() < 0.05:
+                filter.predicate = lambda event: len(event.participants) > 1
+            subscriptions.append(EventSubscription(
+                subscription_id=f"sub_{i}", connection_id=f"client_{i % 50}",
+                filter=filter, created_at=datetime.now()
+            ))
+        
+        index_start = time.perf_counter()
+        index = SubscriptionIndex()
+        for subscription in subscriptions:
+            index.add(subscription)
+        index_ms = (time.perf_counter() - index_start) * 1000
+        
+        events = []
+        for i in range(event_count):
+            civ_id = rng.choice(civ_ids)
+            event_type = rng.choice(event_types)
+            events.append((PoliticalEvent(
+                event_id=f"event_{i}", event_type=event_type, civilization_id=civ_id,
+                title=event_type.replace("_", " ").title(), description="", severity=rng.choice(severities),
+                participants=[f"{civ_id}_advisor_{n}" for n in rng.sample(range(5), rng.randint(0, 2))],
+                consequences={}, timestamp=datetime.now()
+            ), rng.choice(priorities)))
+        
+        deliveries = 0
+        route_start = time.perf_counter()
+        for event, priority in events:
+            deliveries += len(index.match(event, priority))
+        route_ms = (time.perf_counter() - route_start) * 1000
+        
+        sample = events[:linear_sample]
+        routes_match = True
+        linear_start = time.perf_counter()
+        linear_results = [[subscription for subscription in subscriptions if subscription.filter.matches(event, priority)]
+                          for event, priority in sample]
+        linear_ms = (time.perf_counter() - linear_start) * 1000
+        for (event, priority), expected in zip(sample, linear_results):
+            routes_match = routes_match and index.match(event, priority) == expected
+        
+        indexed_ms_per_event = route_ms / event_count
+        linear_ms_per_event = linear_ms / len(sample) if sample else 0.0
+        
+        return BenchmarkResult(
+            test_name=f"event_routing_{subscription_count}",
+            duration_ms=index_ms + route_ms,
+            memory_usage_mb=0.0,
+            cpu_usage_percent=0.0,
+            operations_per_second=event_count / (route_ms / 1000) if route_ms > 0 else 0.0,
+            success=routes_match,
+            metadata={
+                "subscriptions": subscription_count,
+                "events": event_count,
+                "index_build_ms": index_ms,
+                "indexed_ms_per_event": indexed_ms_per_event,
+                "linear_ms_per_event": linear_ms_per_event,
+                "speedup": linear_ms_per_event / indexed_ms_per_event if indexed_ms_per_event > 0 else 0.0,
+                "deliveries_per_event": deliveries / event_count,
+                "linear_sample": len(sample)
+            }
+        )
+    
     async def _benchmark_civilization_processing(self) -> BenchmarkResult:
         """Benchmark single civilization processing."""
         start_time = time.time()
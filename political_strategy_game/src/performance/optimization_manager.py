@@ -534,15 +534,7 @@ class PerformanceOptimizationManager:
         for memory_manager in self.managed_memory_managers:
             if hasattr(memory_manager, 'context_cache'):
                 # Clean expired context cache entries
-                current_time = datetime.now()
-                expired_keys = [
-                    key for key, context in memory_manager.context_cache.items()
-                    if (current_time - context.relevant_memories[0].timestamp if context.relevant_memories 
-                        else timedelta(hours=2)) > memory_manager.cache_timeout
-                ]
-                
-                for key in expired_keys:
-                    memory_manager.context_cache.pop(key, None)
+                memory_manager.context_cache.expire()
     
     def _cleanup_memory_pools(self) -> None:
         """Clean up memory pools."""
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Chunked Parallel Compression
+
+Large payloads are split into fixed-size chunks, and each chunk is
+compressed on a thread pool as an independent gzip member. zlib releases the
+GIL while it works, so the threads run in parallel. Concatenated members
+still form a valid gzip stream that ``gzip.decompress`` reads unchanged.
+
+Like BGZF, every member's header carries an extra field with its compressed
+and uncompressed sizes. A reader can therefore walk the member headers
+without inflating anything, then decompress frames in parallel or inflate
+only the frames covering a byte range.
+
+Compression levels are picked from a sampled prefix once per content profile
+(JSON, pickle, ...) and then remembered.
+"""
+
+import gzip
+import os
+import struct
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_PENDING_BYTES = 1 << 20  # Uncompressed bytes in flight per stream
+LEVEL_SAMPLE_SIZE = 256 * 1024
+CANDIDATE_LEVELS = (1, 3, 6, 9)
+LEVEL_SIZE_TOLERANCE = 0.02  # Accept a level whose output is within 2% of the smallest
+
+# gzip member header with FEXTRA set, followed by one "PG" subfield holding
+# the member's total size and its uncompressed size
+_MEMBER_HEADER = struct.Struct("<BBBBIBBHBBHII")
+_MEMBER_TRAILER = struct.Struct("<II")
+_SUBFIELD_ID = (ord('P'), ord('G'))
+_SUBFIELD_LENGTH = 8
+
+_executor_lock = threading.Lock()
+_shared_executor: Optional[ThreadPoolExecutor] = None
+
+
+def shared_executor() -> ThreadPoolExecutor:
+    """Process-wide compression pool, created on first use."""
+    global _shared_executor
+    with _executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                                  thread_name_prefix="save-compression")
+        return _shared_executor
+
+
+@dataclass(frozen=True)
+class Frame:
+    """One independently compressed gzip member."""
+    offset: int  # Position of the member in the compressed stream
+    length: int
+    raw_offset: int  # Position of its content in the uncompressed data
+    raw_length: int
+
+
+def compress_frame(chunk: bytes, level: int) -> bytes:
+    """Compress ``chunk`` into a single self-describing gzip member."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    body = compressor.compress(chunk) + compressor.flush()
+    member_size = _MEMBER_HEADER.size + len(body) + _MEMBER_TRAILER.size
+    header = _MEMBER_HEADER.pack(
+        0x1f, 0x8b, 8, 4,  # Magic, deflate, FEXTRA
+        0, 0, 255,  # mtime, extra flags, unknown OS
+        4 + _SUBFIELD_LENGTH, _SUBFIELD_ID[0], _SUBFIELD_ID[1], _SUBFIELD_LENGTH,
+        member_size, len(chunk)
+    )
+    return header + body + _MEMBER_TRAILER.pack(zlib.crc32(chunk), len(chunk) & 0xffffffff)
+
+
+def frame_index(data: bytes) -> Optional[List[Frame]]:
+    """
+    Locate the frames of a chunked stream by walking member headers.
+
+    Returns None for streams that were not written by this module, such as
+    a plain single-member gzip file.
+    """
+    frames = []
+    offset = raw_offset = 0
+    while offset < len(data):
+        if len(data) - offset < _MEMBER_HEADER.size:
+            return None
+        fields = _MEMBER_HEADER.unpack_from(data, offset)
+        if (fields[0], fields[1], fields[3]) != (0x1f, 0x8b, 4) or (fields[8], fields[9]) != _SUBFIELD_ID:
+            return None
+        member_size, raw_size = fields[11], fields[12]
+        if member_size < _MEMBER_HEADER.size + _MEMBER_TRAILER.size or offset + member_size > len(data):
+            return None
+        frames.append(Frame(offset, member_size, raw_offset, raw_size))
+        offset += member_size
+        raw_offset += raw_size
+    return frames
+
+
+def _decompress_frame(data: bytes, frame: Frame) -> bytes:
+    # wbits=31 parses the gzip header and verifies the member's CRC
+    return zlib.decompress(data[frame.offset:frame.offset + frame.length], 31)
+
+
+class ChunkedStreamCompressor:
+    """
+    Incremental chunked compressor for streaming writers.
+
+    Has the ``compress``/``flush`` interface of a zlib compress object. Full
+    chunks are submitted to the executor as they accumulate, and completed
+    frames are returned in order. At most ``max_pending`` chunks are in
+    flight (by default one per worker, within ``MAX_PENDING_BYTES``), which
+    bounds memory.
+    """
+
+    def __init__(self, level: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 executor: Optional[Executor] = None, max_pending: Optional[int] = None):
+        self.level = level
+        self.chunk_size = chunk_size
+        self.executor = executor or shared_executor()
+        workers = getattr(self.executor, '_max_workers', None) or 4
+        self.max_pending = max_pending or max(1, min(workers, MAX_PENDING_BYTES // chunk_size))
+        self.frames: List[Frame] = []
+        self._buffer = bytearray()
+        self._pending: Deque[Tuple[Future, int]] = deque()
+        self._offset = 0
+        self._raw_offset = 0
+
+    def compress(self, data: bytes) -> bytes:
+        self._buffer += data
+        while len(self._buffer) >= self.chunk_size:
+            self._submit(self._buffer[:self.chunk_size])
+            del self._buffer[:self.chunk_size]
+        return self._drain(wait=False)
+
+    def flush(self) -> bytes:
+        if self._buffer or not self.frames and not self._pending:
+            self._submit(self._buffer[:])
+            self._buffer.clear()
+        return self._drain(wait=True)
+
+    def _submit(self, chunk: bytes) -> None:
+        self._pending.append((self.executor.submit(compress_frame, chunk, self.level), len(chunk)))
+
+    def _drain(self, wait: bool) -> bytes:
+        out = bytearray()
+        while self._pending and (wait or self._pending[0][0].done() or len(self._pending) > self.max_pending):
+            future, raw_length = self._pending.popleft()
+            member = future.result()
+            self.frames.append(Frame(self._offset, len(member), self._raw_offset, raw_length))
+            self._offset += len(member)
+            self._raw_offset += raw_length
+            out += member
+        return bytes(out)
+
+
+class ChunkedCompressor:
+    """
+    Parallel chunked gzip compression with adaptive level selection.
+
+    ``select_level`` compresses a sampled prefix at a few candidate levels
+    and picks the fastest level whose output is within
+    ``LEVEL_SIZE_TOLERANCE`` of the smallest. The choice is cached per
+    content profile, so later payloads of the same kind skip the trial.
+    """
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE, executor: Optional[Executor] = None):
+        self.chunk_size = chunk_size
+        self._executor = executor
+        self.level_cache: Dict[str, int] = {}
+
+    @property
+    def executor(self) -> Executor:
+        return self._executor or shared_executor()
+
+    def compress(self, data: bytes, level: int = 6) -> bytes:
+        stream = self.stream(level)
+        return stream.compress(data) + stream.flush()
+
+    def stream(self, level: int) -> ChunkedStreamCompressor:
+        return ChunkedStreamCompressor(level, self.chunk_size, self.executor)
+
+    def decompress(self, data: bytes) -> bytes:
+        """Decompress chunked streams in parallel and any other gzip data serially."""
+        frames = frame_index(data)
+        if frames is None:
+            return gzip.decompress(data)
+        if len(frames) == 1:
+            return _decompress_frame(data, frames[0])
+        return b''.join(self.executor.map(lambda frame: _decompress_frame(data, frame), frames))
+
+    def decompress_range(self, data: bytes, start: int, end: int) -> bytes:
+        """
+        Uncompressed bytes ``[start, end)``, inflating only the frames that
+        overlap the range.
+        """
+        frames = frame_index(data)
+        if frames is None:
+            return gzip.decompress(data)[start:end]
+        wanted = [frame for frame in frames
+                  if frame.raw_offset < end and frame.raw_offset + frame.raw_length > start]
+        if not wanted:
+            return b''
+        content = b''.join(self.executor.map(lambda frame: _decompress_frame(data, frame), wanted))
+        base = wanted[0].raw_offset
+        return content[start - base:end - base]
+
+    def select_level(self, data: bytes, profile: Optional[str] = None) -> int:
+        """Pick a level for ``data``, trialling a sampled prefix once per profile."""
+        profile = profile or content_profile(data)
+        level = self.level_cache.get(profile)
+        if level is None:
+            level = self.level_cache[profile] = self._trial_levels(data[:LEVEL_SAMPLE_SIZE])
+        return level
+
+    def _trial_levels(self, sample: bytes) -> int:
+        if not sample:
+            return 6
+        sizes = {}
+        for level in CANDIDATE_LEVELS:
+            sizes[level] = len(zlib.compress(sample, level))
+        smallest = min(sizes.values())
+        return min(level for level, size in sizes.items() if size <= smallest * (1 + LEVEL_SIZE_TOLERANCE))
+
+
+def content_profile(data: bytes) -> str:
+    """Coarse content type used to share level choices between payloads."""
+    head = data[:16].lstrip()
+    if head[:1] in (b'{', b'['):
+        return "json"
+    if head[:1] == b'\x80':
+        return "pickle"
+    if head[:8] == b"PSGPACK1":
+        return "packed"
+    return "binary"
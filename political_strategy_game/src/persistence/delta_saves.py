@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Incremental Delta Saves
+
+Autosaves taken every turn mostly repeat the previous save: few civilizations
+and memory banks change between turns. A delta save hashes every section and
+writes only those whose content changed since the previous save in its chain.
+Unchanged sections are recorded as references to the file that physically
+holds them. A chain starts with a keyframe that holds every section, and a new
+keyframe is written every N saves.
+
+Each save carries a full manifest mapping section paths to their hash and the
+file holding them. Reconstructing any save in a chain is therefore one read
+of each referenced file, with no replay of the saves in between.
+"""
+
+import hashlib
+import json
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.persistence.save_stream import SaveIntegrityError
+
+
+DELTA_SECTION = "delta"
+MAPPING_SECTIONS = ('memory_banks', 'civilizations')
+
+
+def section_hash(value: Any) -> str:
+    """Content hash of a section that is independent of key order."""
+    encoded = json.dumps(value, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class SectionRef:
+    """Where a section's content lives."""
+    digest: str
+    file: str
+
+
+@dataclass
+class DeltaChain:
+    """In-memory state of one game's delta chain, as of its latest save."""
+    game_name: str
+    chain_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    keyframe: Optional[str] = None
+    latest: Optional[str] = None
+    sequence: int = 0  # Saves since the keyframe; the keyframe itself is 0
+    sections: Dict[str, SectionRef] = field(default_factory=dict)
+
+    def referenced_files(self) -> List[str]:
+        return sorted({ref.file for ref in self.sections.values()})
+
+    def advance(self, encoder: 'DeltaEncoder') -> None:
+        """Adopt the sections of a save that was written successfully."""
+        if encoder.keyframe:
+            self.chain_id = encoder.chain_id
+            self.keyframe = encoder.filename
+        self.latest = encoder.filename
+        self.sequence = encoder.sequence
+        self.sections = encoder.sections
+
+
+class DeltaEncoder:
+    """
+    Decides, section by section, what a save must write.
+
+    ``changed`` is called with each serialized section as it streams past. It
+    returns False when the previous save in the chain already holds identical
+    content, in which case the section is referenced instead of written.
+    """
+
+    def __init__(self, chain: DeltaChain, filename: str, keyframe: bool, chain_id: Optional[str] = None):
+        self.filename = filename
+        self.keyframe = keyframe
+        self.chain_id = chain_id or (uuid.uuid4().hex if keyframe else chain.chain_id)
+        self.sequence = 0 if keyframe else chain.sequence + 1
+        self.previous = {} if keyframe else chain.sections
+        self.sections: Dict[str, SectionRef] = {}
+        self.written = 0
+        self.referenced = 0
+
+    def changed(self, path: str, value: Any) -> bool:
+        digest = section_hash(value)
+        previous = self.previous.get(path)
+        if previous is not None and previous.digest == digest:
+            self.sections[path] = previous
+            self.referenced += 1
+            return False
+        self.sections[path] = SectionRef(digest, self.filename)
+        self.written += 1
+        return True
+
+    def references(self) -> List[str]:
+        """Other save files this save depends on."""
+        return sorted({ref.file for ref in self.sections.values() if ref.file != self.filename})
+
+    def manifest(self) -> Dict[str, Any]:
+        return {
+            'chain_id': self.chain_id,
+            'sequence': self.sequence,
+            'keyframe': self.keyframe,
+            'sections': {path: [ref.digest, ref.file] for path, ref in self.sections.items()}
+        }
+
+
+def resolve_delta_save(save_dict: Dict[str, Any], save_path: Path,
+                       read_save: Callable[[Path], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fill the referenced sections of a delta save in place.
+
+    Each referenced file is read once with ``read_save``. Resolved content is
+    checked against the manifest hashes, and a ``SaveIntegrityError`` is raised
+    when a referenced save is missing or no longer matches.
+    """
+    delta = save_dict.pop(DELTA_SECTION)
+    save_path = Path(save_path)
+    wanted: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+    for path, (digest, filename) in delta['sections'].items():
+        if filename != save_path.name:
+            wanted[filename].append((path, digest))
+
+    for filename, paths in wanted.items():
+        source_path = save_path.parent / filename
+        if not source_path.exists():
+            raise SaveIntegrityError(f"Delta save {save_path.name} references missing save {filename}")
+        source = read_save(source_path)
+        for path, digest in paths:
+            try:
+                value = _get_section(source, path)
+            except KeyError:
+                raise SaveIntegrityError(f"Save {filename} does not hold section {path}")
+            if section_hash(value) != digest:
+                raise SaveIntegrityError(f"Section {path} in {filename} does not match its hash")
+            _set_section(save_dict, path, value)
+
+    metadata = save_dict.get('metadata')
+    if isinstance(metadata, dict):
+        metadata['delta_chain'] = delta['chain_id']
+        metadata['delta_sequence'] = delta['sequence']
+        metadata['delta_references'] = sorted(wanted)
+    return save_dict
+
+
+def chain_from_manifest(game_name: str, save_path: Path, delta: Dict[str, Any]) -> DeltaChain:
+    """Rebuild chain state from the manifest of its latest save."""
+    sections = {path: SectionRef(digest, filename) for path, (digest, filename) in delta['sections'].items()}
+    return DeltaChain(game_name=game_name, chain_id=delta['chain_id'],
+                      keyframe=save_path.name if delta['keyframe'] else None,
+                      latest=save_path.name, sequence=delta['sequence'], sections=sections)
+
+
+def _get_section(save_dict: Dict[str, Any], path: str) -> Any:
+    mapping, _, key = path.partition('/')
+    if mapping in MAPPING_SECTIONS and key:
+        return save_dict[mapping][key]
+    return save_dict[path]
+
+
+def _set_section(save_dict: Dict[str, Any], path: str, value: Any) -> None:
+    mapping, _, key = path.partition('/')
+    if mapping in MAPPING_SECTIONS and key:
+        save_dict.setdefault(mapping, {})[key] = value
+    else:
+        save_dict[path] = value
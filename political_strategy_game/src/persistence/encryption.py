@@ -7,13 +7,21 @@ This module provides secure encryption and decryption for save files:
 - Secure key management and rotation
 - Encrypted save file integrity verification
 - Backward compatibility with unencrypted saves
+
+Saves are encrypted as a stream of independently authenticated AES-256-GCM
+chunks, so encryption can run chunk by chunk behind the compressor instead of
+over one in-memory buffer. Saves written with the older AES-CBC plus HMAC
+scheme still decrypt.
 """
 
 import os
 import hashlib
 import hmac
 import secrets
-from typing import Dict, Optional, Tuple, Union, Any, List
+import struct
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union, Any, List
 from enum import Enum
 from dataclasses import dataclass
 from pathlib import Path
@@ -21,18 +29,37 @@ import json
 import logging
 from datetime import datetime
 
+from src.persistence.save_stream import HashingFileSink
+
 try:
     from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
     from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
     from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
     from cryptography.hazmat.primitives import hashes, serialization
     from cryptography.hazmat.primitives.asymmetric import rsa, padding
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
     from cryptography.hazmat.backends import default_backend
+    from cryptography.exceptions import InvalidTag
     CRYPTO_AVAILABLE = True
 except ImportError:
     CRYPTO_AVAILABLE = False
 
 
+# Cipher schemes recorded in EncryptedSaveMetadata
+LEGACY_CIPHER = "aes256_cbc_hmac"
+STREAM_CIPHER = "aes256_gcm_stream"
+
+ENCRYPTED_SAVE_MAGIC = b"PSGENC02"
+DEFAULT_ENCRYPTION_CHUNK_SIZE = 64 * 1024
+TAG_SIZE = 16
+KEY_CHECK_SIZE = 16
+
+# Magic followed by the big-endian length of the JSON metadata header
+_FILE_HEADER = struct.Struct(">8sI")
+_STREAM_KEY_LABEL = b"psg-save-stream-key"
+_KEY_CHECK_LABEL = b"psg-save-key-check"
+
+
 class EncryptionMethod(str, Enum):
     """Supported encryption methods."""
     NONE = "none"
@@ -59,6 +86,7 @@ class EncryptionConfig:
     salt_size: int = 32
     iv_size: int = 16
     key_size: int = 32        # 256 bits
+    chunk_size: int = DEFAULT_ENCRYPTION_CHUNK_SIZE  # Plaintext bytes per authenticated chunk
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -71,7 +99,8 @@ class EncryptionConfig:
             'scrypt_p': self.scrypt_p,
             'salt_size': self.salt_size,
             'iv_size': self.iv_size,
-            'key_size': self.key_size
+            'key_size': self.key_size,
+            'chunk_size': self.chunk_size
         }
     
     @classmethod
@@ -86,7 +115,8 @@ class EncryptionConfig:
             scrypt_p=data.get('scrypt_p', 1),
             salt_size=data.get('salt_size', 32),
             iv_size=data.get('iv_size', 16),
-            key_size=data.get('key_size', 32)
+            key_size=data.get('key_size', 32),
+            chunk_size=data.get('chunk_size', DEFAULT_ENCRYPTION_CHUNK_SIZE)
         )
 
 
@@ -99,6 +129,9 @@ class EncryptedSaveMetadata:
     hmac_digest: bytes
     timestamp: datetime
     key_hint: Optional[str] = None  # Optional hint for password
+    cipher: str = LEGACY_CIPHER
+    key_check: bytes = b''  # Verifies a password or key without decrypting anything
+    wrapped_key: bytes = b''  # RSA-encrypted data key for hybrid stream saves
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -108,7 +141,10 @@ class EncryptedSaveMetadata:
             'iv': self.iv.hex(),
             'hmac_digest': self.hmac_digest.hex(),
             'timestamp': self.timestamp.isoformat(),
-            'key_hint': self.key_hint
+            'key_hint': self.key_hint,
+            'cipher': self.cipher,
+            'key_check': self.key_check.hex(),
+            'wrapped_key': self.wrapped_key.hex()
         }
     
     @classmethod
@@ -120,15 +156,200 @@ class EncryptedSaveMetadata:
             iv=bytes.fromhex(data['iv']),
             hmac_digest=bytes.fromhex(data['hmac_digest']),
             timestamp=datetime.fromisoformat(data['timestamp']),
-            key_hint=data.get('key_hint')
+            key_hint=data.get('key_hint'),
+            cipher=data.get('cipher', LEGACY_CIPHER),
+            key_check=bytes.fromhex(data.get('key_check', '')),
+            wrapped_key=bytes.fromhex(data.get('wrapped_key', ''))
         )
 
 
+def zeroize(buffer: bytearray) -> None:
+    """Overwrite key material in place."""
+    buffer[:] = bytes(len(buffer))
+
+
+def _subkey(master_key: bytes, label: bytes, context: bytes = b'') -> bytes:
+    """HMAC-SHA256 based key separation, so one master key serves several purposes."""
+    return hmac.new(master_key, label + context, hashlib.sha256).digest()
+
+
+def key_check_tag(master_key: bytes, salt: bytes) -> bytes:
+    """Tag stored in the header to verify a password or key in constant time."""
+    return _subkey(master_key, _KEY_CHECK_LABEL, salt)[:KEY_CHECK_SIZE]
+
+
+def _chunk_nonce(counter: int, final: bool) -> bytes:
+    # 11-byte chunk counter plus a final-chunk flag: reordered, dropped or
+    # truncated chunks fail authentication
+    return counter.to_bytes(11, 'big') + (b'\x01' if final else b'\x00')
+
+
+class StreamingEncryptor:
+    """
+    Chunked AES-256-GCM encryption.
+    
+    Every ``chunk_size`` bytes of plaintext become a ciphertext chunk with its
+    own 16-byte tag. ``update``/``finalize`` mirror a zlib compress object's
+    ``compress``/``flush``, so compressor output can be fed straight in.
+    """
+    
+    def __init__(self, key: bytes, chunk_size: int = DEFAULT_ENCRYPTION_CHUNK_SIZE):
+        self._aead = AESGCM(key)
+        self.chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._counter = 0
+    
+    def update(self, data: bytes) -> bytes:
+        self._buffer += data
+        out = bytearray()
+        # Hold back at least one byte so the final chunk is sealed by finalize
+        while len(self._buffer) > self.chunk_size:
+            out += self._seal(self._buffer[:self.chunk_size], final=False)
+            del self._buffer[:self.chunk_size]
+        return bytes(out)
+    
+    def finalize(self) -> bytes:
+        out = self._seal(self._buffer, final=True)
+        zeroize(self._buffer)
+        self._buffer.clear()
+        return out
+    
+    def _seal(self, chunk: bytes, final: bool) -> bytes:
+        sealed = self._aead.encrypt(_chunk_nonce(self._counter, final), bytes(chunk), None)
+        self._counter += 1
+        return sealed
+
+
+class StreamingDecryptor:
+    """
+    Counterpart of ``StreamingEncryptor``. Each chunk is authenticated before
+    its plaintext is returned; ``finalize`` fails if the stream was truncated.
+    """
+    
+    def __init__(self, key: bytes, chunk_size: int = DEFAULT_ENCRYPTION_CHUNK_SIZE):
+        self._aead = AESGCM(key)
+        self.sealed_size = chunk_size + TAG_SIZE
+        self._buffer = bytearray()
+        self._counter = 0
+    
+    def update(self, data: bytes) -> bytes:
+        self._buffer += data
+        out = bytearray()
+        while len(self._buffer) > self.sealed_size:
+            out += self._open(self._buffer[:self.sealed_size], final=False)
+            del self._buffer[:self.sealed_size]
+        return bytes(out)
+    
+    def finalize(self) -> bytes:
+        out = self._open(self._buffer, final=True)
+        self._buffer.clear()
+        return out
+    
+    def _open(self, chunk: bytes, final: bool) -> bytes:
+        try:
+            plain = self._aead.decrypt(_chunk_nonce(self._counter, final), bytes(chunk), None)
+        except InvalidTag:
+            raise ValueError(f"Chunk {self._counter} failed authentication - data may be "
+                             f"corrupted, truncated or tampered with")
+        self._counter += 1
+        return plain
+
+
+class DerivedKeyCache:
+    """
+    Session cache of password-derived keys.
+    
+    PBKDF2 and Scrypt are slow on purpose, so a session derives each
+    password's key once and reuses that salt for later saves (every file still
+    gets its own data key from a random file nonce). Entries are found by an
+    HMAC of the password under a random per-cache secret, so passwords are not
+    kept. Keys live in bytearrays that ``clear`` and eviction overwrite.
+    Copies handed to the cipher library are outside its reach, so this limits
+    exposure rather than guaranteeing none.
+    """
+    
+    def __init__(self, max_entries: int = 8):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._secret = bytearray(secrets.token_bytes(32))
+        self._keys: "OrderedDict[Tuple[bytes, bytes, str], bytearray]" = OrderedDict()
+        self._session_salts: Dict[Tuple[bytes, str], bytes] = {}
+        self._lock = threading.Lock()
+    
+    def _identity(self, password: str, config: EncryptionConfig) -> Tuple[bytes, str]:
+        params = json.dumps([config.key_derivation.value if config.key_derivation else None,
+                             config.iterations, config.scrypt_n, config.scrypt_r, config.scrypt_p,
+                             config.key_size])
+        return hmac.new(bytes(self._secret), password.encode('utf-8'), hashlib.sha256).digest(), params
+    
+    def get(self, password: str, salt: bytes, config: EncryptionConfig) -> Optional[bytes]:
+        identity, params = self._identity(password, config)
+        with self._lock:
+            key = self._keys.get((identity, salt, params))
+            if key is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return bytes(key)
+    
+    def put(self, password: str, salt: bytes, config: EncryptionConfig, key: bytes) -> None:
+        identity, params = self._identity(password, config)
+        with self._lock:
+            self._keys[(identity, salt, params)] = bytearray(key)
+            self._session_salts[(identity, params)] = salt
+            while len(self._keys) > self.max_entries:
+                _, evicted = self._keys.popitem(last=False)
+                zeroize(evicted)
+    
+    def session_salt(self, password: str, config: EncryptionConfig) -> Optional[bytes]:
+        """Salt whose key is already cached for this password, if any."""
+        identity, params = self._identity(password, config)
+        with self._lock:
+            salt = self._session_salts.get((identity, params))
+            return salt if salt is not None and (identity, salt, params) in self._keys else None
+    
+    def clear(self) -> None:
+        """Zeroize and forget every cached key."""
+        with self._lock:
+            for key in self._keys.values():
+                zeroize(key)
+            self._keys.clear()
+            self._session_salts.clear()
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def encode_encrypted_header(metadata: EncryptedSaveMetadata) -> bytes:
+    encoded = json.dumps(metadata.to_dict()).encode('utf-8')
+    return _FILE_HEADER.pack(ENCRYPTED_SAVE_MAGIC, len(encoded)) + encoded
+
+
+def read_encrypted_header(file_path: Path) -> Optional[EncryptedSaveMetadata]:
+    """
+    Read the metadata header of a stream-encrypted save without reading its
+    body. Returns None for files in any other format.
+    """
+    with open(file_path, 'rb') as f:
+        return _read_encrypted_header(f)
+
+
+def _read_encrypted_header(f) -> Optional[EncryptedSaveMetadata]:
+    # Leaves ``f`` positioned at the first encrypted chunk
+    prefix = f.read(_FILE_HEADER.size)
+    if len(prefix) < _FILE_HEADER.size or not prefix.startswith(ENCRYPTED_SAVE_MAGIC):
+        return None
+    _, length = _FILE_HEADER.unpack(prefix)
+    return EncryptedSaveMetadata.from_dict(json.loads(f.read(length).decode('utf-8')))
+
+
 class SaveFileEncryption:
     """Handles encryption and decryption of save files."""
     
-    def __init__(self):
+    def __init__(self, key_cache: Optional[DerivedKeyCache] = None):
         self.logger = logging.getLogger(__name__)
+        self.key_cache = key_cache if key_cache is not None else DerivedKeyCache()
         
         if not CRYPTO_AVAILABLE:
             self.logger.warning("Cryptography library not available. Encryption disabled.")
@@ -164,52 +385,65 @@ class SaveFileEncryption:
                 timestamp=datetime.now()
             )
         
-        # Generate salt and IV
-        salt = os.urandom(encryption_config.salt_size)
-        iv = os.urandom(encryption_config.iv_size)
+        encryptor, metadata = self.create_encryptor(encryption_config, password=password,
+                                                    key=key, public_key=public_key)
+        encrypted_data = encryptor.update(data) + encryptor.finalize()
         
-        # Derive encryption key
+        self.logger.info(f"Encrypted save data using {encryption_config.method.value}")
+        return encrypted_data, metadata
+    
+    def create_encryptor(self, encryption_config: EncryptionConfig,
+                         password: Optional[str] = None,
+                         key: Optional[bytes] = None,
+                         public_key: Optional[bytes] = None) -> Tuple[StreamingEncryptor, EncryptedSaveMetadata]:
+        """
+        Start a streaming encryption and return it with the metadata needed
+        to decrypt it. The metadata is complete before any data is written.
+        """
+        if not CRYPTO_AVAILABLE:
+            raise RuntimeError("Cryptography library not available")
+        
+        wrapped_key = b''
         if encryption_config.method == EncryptionMethod.PASSWORD_AES256:
             if not password:
                 raise ValueError("Password required for password-based encryption")
-            encryption_key = self._derive_key_from_password(password, salt, encryption_config)
+            # Reusing the session's salt lets the derived key come from the cache
+            salt = (self.key_cache.session_salt(password, encryption_config)
+                    or os.urandom(encryption_config.salt_size))
+            master_key = self._derive_key_from_password(password, salt, encryption_config)
+            self.key_cache.put(password, salt, encryption_config, master_key)
         
         elif encryption_config.method == EncryptionMethod.KEY_AES256:
             if not key or len(key) != encryption_config.key_size:
                 raise ValueError(f"Key of {encryption_config.key_size} bytes required")
-            encryption_key = key
+            salt = os.urandom(encryption_config.salt_size)
+            master_key = key
         
         elif encryption_config.method == EncryptionMethod.RSA_AES_HYBRID:
             if not public_key:
                 raise ValueError("Public key required for RSA hybrid encryption")
-            # Generate random AES key
-            encryption_key = os.urandom(encryption_config.key_size)
-            # This will be encrypted with RSA (implemented below)
+            salt = os.urandom(encryption_config.salt_size)
+            master_key = os.urandom(encryption_config.key_size)
+            wrapped_key = self._encrypt_key_with_rsa(master_key, public_key)
         
         else:
             raise ValueError(f"Unsupported encryption method: {encryption_config.method}")
         
-        # Encrypt data with AES
-        encrypted_data = self._encrypt_aes(data, encryption_key, iv)
-        
-        # Handle RSA hybrid encryption
-        if encryption_config.method == EncryptionMethod.RSA_AES_HYBRID:
-            encrypted_data = self._encrypt_key_with_rsa(encryption_key, public_key) + encrypted_data
-        
-        # Generate HMAC for integrity
-        hmac_key = hashlib.sha256(encryption_key + salt).digest()
-        hmac_digest = hmac.new(hmac_key, encrypted_data, hashlib.sha256).digest()
-        
+        # A fresh data key per file keeps chunk nonces unique across saves
+        file_nonce = os.urandom(encryption_config.iv_size)
+        encryptor = StreamingEncryptor(_subkey(master_key, _STREAM_KEY_LABEL, file_nonce),
+                                       encryption_config.chunk_size)
         metadata = EncryptedSaveMetadata(
             encryption_config=encryption_config,
             salt=salt,
-            iv=iv,
-            hmac_digest=hmac_digest,
-            timestamp=datetime.now()
+            iv=file_nonce,
+            hmac_digest=b'',
+            timestamp=datetime.now(),
+            cipher=STREAM_CIPHER,
+            key_check=key_check_tag(master_key, salt),
+            wrapped_key=wrapped_key
         )
-        
-        self.logger.info(f"Encrypted save data using {encryption_config.method.value}")
-        return encrypted_data, metadata
+        return encryptor, metadata
     
     def decrypt_save_data(self, encrypted_data: bytes,
                          metadata: EncryptedSaveMetadata,
@@ -237,18 +471,76 @@ class SaveFileEncryption:
         if config.method == EncryptionMethod.NONE:
             return encrypted_data
         
-        # Derive decryption key
+        if metadata.cipher == LEGACY_CIPHER:
+            decrypted_data = self._decrypt_legacy(encrypted_data, metadata, password, key, private_key)
+        else:
+            decryptor = self.create_decryptor(metadata, password=password, key=key, private_key=private_key)
+            decrypted_data = decryptor.update(encrypted_data) + decryptor.finalize()
+        
+        self.logger.info(f"Successfully decrypted save data using {config.method.value}")
+        return decrypted_data
+    
+    def create_decryptor(self, metadata: EncryptedSaveMetadata,
+                         password: Optional[str] = None,
+                         key: Optional[bytes] = None,
+                         private_key: Optional[bytes] = None) -> StreamingDecryptor:
+        """
+        Start a streaming decryption of a stream-cipher save. Wrong
+        credentials are rejected here, from the header's key check.
+        """
+        if not CRYPTO_AVAILABLE:
+            raise RuntimeError("Cryptography library not available")
+        if metadata.cipher != STREAM_CIPHER:
+            raise ValueError(f"Save uses {metadata.cipher}, which cannot be decrypted as a stream")
+        
+        master_key = self._master_key(metadata, password, key, private_key)
+        if not hmac.compare_digest(key_check_tag(master_key, metadata.salt), metadata.key_check):
+            raise ValueError("Incorrect password or key")
+        self._remember_password_key(metadata, password, master_key)
+        return StreamingDecryptor(_subkey(master_key, _STREAM_KEY_LABEL, metadata.iv),
+                                  metadata.encryption_config.chunk_size)
+    
+    def check_password(self, metadata: EncryptedSaveMetadata, password: str) -> Optional[bool]:
+        """
+        Check a password against the header's key check without touching the
+        encrypted data. Returns None for saves that predate key checks.
+        """
+        if not metadata.key_check:
+            return None
+        master_key = self._derive_key_from_password(password, metadata.salt, metadata.encryption_config)
+        if not hmac.compare_digest(key_check_tag(master_key, metadata.salt), metadata.key_check):
+            return False
+        self._remember_password_key(metadata, password, master_key)
+        return True
+    
+    def clear_key_cache(self) -> None:
+        """Zeroize cached password-derived keys, e.g. when a session ends."""
+        self.key_cache.clear()
+    
+    def _master_key(self, metadata: EncryptedSaveMetadata, password: Optional[str],
+                    key: Optional[bytes], private_key: Optional[bytes]) -> bytes:
+        config = metadata.encryption_config
         if config.method == EncryptionMethod.PASSWORD_AES256:
             if not password:
                 raise ValueError("Password required for decryption")
-            decryption_key = self._derive_key_from_password(password, metadata.salt, config)
-        
-        elif config.method == EncryptionMethod.KEY_AES256:
+            return self._derive_key_from_password(password, metadata.salt, config)
+        if config.method == EncryptionMethod.KEY_AES256:
             if not key or len(key) != config.key_size:
                 raise ValueError(f"Key of {config.key_size} bytes required")
-            decryption_key = key
+            return key
+        if config.method == EncryptionMethod.RSA_AES_HYBRID:
+            if not private_key:
+                raise ValueError("Private key required for RSA hybrid decryption")
+            return self._decrypt_key_with_rsa(metadata.wrapped_key, private_key)
+        raise ValueError(f"Unsupported encryption method: {config.method}")
+    
+    def _decrypt_legacy(self, encrypted_data: bytes, metadata: EncryptedSaveMetadata,
+                        password: Optional[str], key: Optional[bytes],
+                        private_key: Optional[bytes]) -> bytes:
+        """Decrypt a save written with AES-CBC and a separate HMAC."""
+        config = metadata.encryption_config
         
-        elif config.method == EncryptionMethod.RSA_AES_HYBRID:
+        if config.method == EncryptionMethod.RSA_AES_HYBRID:
             if not private_key:
                 raise ValueError("Private key required for RSA hybrid decryption")
             # Extract encrypted AES key and decrypt it
@@ -256,9 +548,8 @@ class SaveFileEncryption:
             encrypted_aes_key = encrypted_data[:rsa_key_size]
             encrypted_data = encrypted_data[rsa_key_size:]
             decryption_key = self._decrypt_key_with_rsa(encrypted_aes_key, private_key)
-        
         else:
-            raise ValueError(f"Unsupported encryption method: {config.method}")
+            decryption_key = self._master_key(metadata, password, key, private_key)
         
         # Verify HMAC integrity
         hmac_key = hashlib.sha256(decryption_key + metadata.salt).digest()
@@ -266,16 +557,30 @@ class SaveFileEncryption:
         
         if not hmac.compare_digest(expected_hmac, metadata.hmac_digest):
             raise ValueError("HMAC verification failed - data may be corrupted or tampered with")
+        self._remember_password_key(metadata, password, decryption_key)
         
-        # Decrypt data
-        decrypted_data = self._decrypt_aes(encrypted_data, decryption_key, metadata.iv)
-        
-        self.logger.info(f"Successfully decrypted save data using {config.method.value}")
-        return decrypted_data
+        return self._decrypt_aes(encrypted_data, decryption_key, metadata.iv)
     
     def _derive_key_from_password(self, password: str, salt: bytes, 
                                  config: EncryptionConfig) -> bytes:
-        """Derive encryption key from password using specified method."""
+        """
+        Derive encryption key from password using specified method.
+        
+        Keys come from the session cache when present. Callers cache a new
+        key only once it is verified, so wrong passwords never evict the
+        right one.
+        """
+        cached = self.key_cache.get(password, salt, config)
+        if cached is not None:
+            return cached
+        return self._run_key_derivation(password, salt, config)
+    
+    def _remember_password_key(self, metadata: EncryptedSaveMetadata, password: Optional[str],
+                               master_key: bytes) -> None:
+        if metadata.encryption_config.method == EncryptionMethod.PASSWORD_AES256 and password:
+            self.key_cache.put(password, metadata.salt, metadata.encryption_config, master_key)
+    
+    def _run_key_derivation(self, password: str, salt: bytes, config: EncryptionConfig) -> bytes:
         password_bytes = password.encode('utf-8')
         
         if config.key_derivation == KeyDerivationMethod.PBKDF2:
@@ -303,20 +608,6 @@ class SaveFileEncryption:
         else:
             raise ValueError(f"Unsupported key derivation method: {config.key_derivation}")
     
-    def _encrypt_aes(self, data: bytes, key: bytes, iv: bytes) -> bytes:
-        """Encrypt data using AES-256-CBC."""
-        # Add PKCS7 padding
-        block_size = 16
-        padding_length = block_size - (len(data) % block_size)
-        padded_data = data + bytes([padding_length] * padding_length)
-        
-        # Encrypt
-        cipher = Cipher(algorithms.AES(key), modes.CBC(iv), backend=default_backend())
-        encryptor = cipher.encryptor()
-        encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
-        
-        return encrypted_data
-    
     def _decrypt_aes(self, encrypted_data: bytes, key: bytes, iv: bytes) -> bytes:
         """Decrypt data using AES-256-CBC."""
         # Decrypt
@@ -412,6 +703,9 @@ class SaveFileEncryption:
             with open(file_path, 'rb') as f:
                 # Try to read as JSON to check for encryption metadata
                 data = f.read()
+            
+            if data.startswith(ENCRYPTED_SAVE_MAGIC):
+                return True
                 
             # Check if it starts with encryption metadata marker
             if data.startswith(b'{"encryption_metadata":'):
@@ -431,6 +725,10 @@ class SaveFileEncryption:
     def extract_encryption_metadata(self, file_path: Path) -> Optional[EncryptedSaveMetadata]:
         """Extract encryption metadata from encrypted save file."""
         try:
+            metadata = read_encrypted_header(file_path)
+            if metadata is not None:
+                return metadata
+            
             with open(file_path, 'rb') as f:
                 data = f.read()
             
@@ -531,22 +829,36 @@ class EncryptedSaveManager:
         Returns:
             Path to the encrypted save file
         """
-        save_path = self.save_dir / f"{save_name}.encrypted"
+        return self.save_encrypted_stream([save_data], save_name, encryption_config,
+                                          password=password, key=key)
+    
+    def save_encrypted_stream(self, chunks: Iterable[bytes], save_name: str,
+                              encryption_config: EncryptionConfig,
+                              password: Optional[str] = None,
+                              key: Optional[bytes] = None,
+                              public_key: Optional[bytes] = None) -> Path:
+        """
+        Encrypt ``chunks`` as they are produced, e.g. by a streaming
+        compressor, without holding the whole save in memory.
         
-        # Encrypt the data
-        encrypted_data, metadata = self.encryption.encrypt_save_data(
-            save_data, encryption_config, password=password, key=key
+        The file is the metadata header followed by the authenticated chunks,
+        and replaces any previous file atomically once complete.
+        """
+        save_path = self.save_dir / f"{save_name}.encrypted"
+        encryptor, metadata = self.encryption.create_encryptor(
+            encryption_config, password=password, key=key, public_key=public_key
         )
+        header = encode_encrypted_header(metadata)
         
-        # Create save file structure
-        save_file_data = {
-            'encryption_metadata': metadata.to_dict(),
-            'encrypted_data': encrypted_data.hex()
-        }
-        
-        # Write to file
-        with open(save_path, 'w') as f:
-            json.dump(save_file_data, f, indent=2)
+        sink = HashingFileSink(save_path, header_size=len(header))
+        try:
+            for chunk in chunks:
+                sink.write(encryptor.update(chunk), hashed=False)
+            sink.write(encryptor.finalize(), hashed=False)
+            sink.commit(lambda: header)
+        except BaseException:
+            sink.abort()
+            raise
         
         self.logger.info(f"Encrypted save file written: {save_path}")
         return save_path
@@ -567,22 +879,50 @@ class EncryptedSaveManager:
         Returns:
             Decrypted save file data
         """
-        with open(save_path, 'r') as f:
-            save_file_data = json.load(f)
-        
-        # Extract metadata and encrypted data
-        metadata = EncryptedSaveMetadata.from_dict(save_file_data['encryption_metadata'])
-        encrypted_data = bytes.fromhex(save_file_data['encrypted_data'])
-        
-        # Decrypt the data
-        decrypted_data = self.encryption.decrypt_save_data(
-            encrypted_data, metadata, 
-            password=password, key=key, private_key=private_key
-        )
+        if read_encrypted_header(save_path) is not None:
+            decrypted_data = b''.join(self.iter_encrypted(save_path, password=password, key=key,
+                                                          private_key=private_key))
+        else:
+            with open(save_path, 'r') as f:
+                save_file_data = json.load(f)
+            
+            # Extract metadata and encrypted data
+            metadata = EncryptedSaveMetadata.from_dict(save_file_data['encryption_metadata'])
+            encrypted_data = bytes.fromhex(save_file_data['encrypted_data'])
+            
+            # Decrypt the data
+            decrypted_data = self.encryption.decrypt_save_data(
+                encrypted_data, metadata, 
+                password=password, key=key, private_key=private_key
+            )
         
         self.logger.info(f"Decrypted save file loaded: {save_path}")
         return decrypted_data
     
+    def iter_encrypted(self, save_path: Path,
+                       password: Optional[str] = None,
+                       key: Optional[bytes] = None,
+                       private_key: Optional[bytes] = None,
+                       read_size: int = 1 << 20) -> Iterator[bytes]:
+        """
+        Decrypt a stream-encrypted save incrementally. Only authenticated
+        plaintext is yielded, and truncation raises ``ValueError`` at the end.
+        """
+        with open(save_path, 'rb') as f:
+            metadata = _read_encrypted_header(f)
+            if metadata is None:
+                raise ValueError(f"{save_path} is not a stream-encrypted save")
+            decryptor = self.encryption.create_decryptor(metadata, password=password, key=key,
+                                                         private_key=private_key)
+            while True:
+                data = f.read(read_size)
+                if not data:
+                    break
+                plain = decryptor.update(data)
+                if plain:
+                    yield plain
+        yield decryptor.finalize()
+    
     def change_encryption(self, save_path: Path, new_config: EncryptionConfig,
                          old_password: Optional[str] = None,
                          new_password: Optional[str] = None,
@@ -618,13 +958,27 @@ class EncryptedSaveManager:
         return new_save_path
     
     def verify_password(self, save_path: Path, password: str) -> bool:
-        """Verify if a password is correct for an encrypted save file."""
+        """
+        Verify if a password is correct for an encrypted save file.
+        
+        Stream-encrypted saves are checked against their header alone; older
+        saves still need a full decryption.
+        """
         try:
+            metadata = read_encrypted_header(save_path)
+            if metadata is not None:
+                verified = self.encryption.check_password(metadata, password)
+                if verified is not None:
+                    return verified
             self.load_encrypted(save_path, password=password)
             return True
         except Exception:
             return False
     
+    def close(self) -> None:
+        """End the session, zeroizing cached keys."""
+        self.encryption.clear_key_cache()
+    
     def list_encrypted_saves(self) -> List[Tuple[Path, EncryptedSaveMetadata]]:
         """List all encrypted save files with their metadata."""
         encrypted_saves = []
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Packed Binary Save Format
+
+A binary container for saves. It replaces pretty-printed JSON and raw pickle
+and supports random access:
+
+    [PSGPACK1][section][section]...[table of contents][footer]
+
+Every section (metadata, game state, each civilization, each memory bank) is
+encoded on its own with a compact tagged encoding: zigzag varints, raw
+float64, length-prefixed strings. Homogeneous numeric lists are stored as
+packed int64/float64 arrays. Lists of records that share the same keys are
+stored column by column. Sections are zlib-compressed individually when that
+helps, so one section can be read without touching the others.
+
+The table of contents records each section's offset, length, CRC32 and the
+save version its schema was written with. The footer points at the table and
+holds the SHA-256 checksum of everything before it. Decoding only ever builds
+plain data (no pickle), so loading an untrusted save cannot run code.
+"""
+
+import hashlib
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.persistence.save_catalog import SAVE_HEADER_SIZE, has_save_header
+from src.persistence.save_stream import (
+    CHECKSUM_ALGORITHM, SaveIntegrityError, SaveStreamResult, StreamingSaveWriter
+)
+
+
+PACKED_MAGIC = b"PSGPACK1"
+PACKED_FOOTER_MAGIC = b"PSGPEND1"
+CONTAINER_VERSION = 1
+MIN_COMPRESS_SIZE = 256
+MIN_ARRAY_LENGTH = 4
+
+# Table offset, table length, SHA-256 of everything before the footer, magic
+_FOOTER = struct.Struct("<QI32s8s")
+_FLOAT = struct.Struct("<d")
+
+# Value tags
+_NONE, _TRUE, _FALSE = b'N', b'T', b'F'
+_INT, _FLOAT_TAG, _STR, _BYTES = b'i', b'd', b's', b'b'
+_LIST, _DICT, _TABLE = b'l', b'm', b't'
+_INT_ARRAY, _FLOAT_ARRAY = b'q', b'f'
+
+# Section codecs
+RAW_CODEC = "raw"
+ZLIB_CODEC = "zlib"
+MAPPING_CODEC = "map"  # Marks a keyed collection whose entries follow as "name/key"
+
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def is_packed(data: bytes) -> bool:
+    return data[:len(PACKED_MAGIC)] == PACKED_MAGIC
+
+
+# --- Value encoding -----------------------------------------------------------
+
+def encode_value(value: Any) -> bytes:
+    """
+    Encode plain data (and anything with ``model_dump``/``to_dict``) compactly.
+    
+    Dict keys must be ``str`` or ``int`` and decode to the same type; unlike
+    JSON, int keys are not turned into strings. Other keys raise TypeError.
+    """
+    out = bytearray()
+    _encode(value, out)
+    return bytes(out)
+
+
+def _write_varint(number: int, out: bytearray) -> None:
+    while number > 0x7f:
+        out.append((number & 0x7f) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _encode(value: Any, out: bytearray) -> None:
+    if value is None:
+        out += _NONE
+    elif value is True:
+        out += _TRUE
+    elif value is False:
+        out += _FALSE
+    elif isinstance(value, int):
+        out += _INT
+        _write_varint(value * 2 if value >= 0 else -value * 2 - 1, out)
+    elif isinstance(value, float):
+        out += _FLOAT_TAG
+        out += _FLOAT.pack(value)
+    elif isinstance(value, str):
+        encoded = value.encode('utf-8')
+        out += _STR
+        _write_varint(len(encoded), out)
+        out += encoded
+    elif isinstance(value, (bytes, bytearray)):
+        out += _BYTES
+        _write_varint(len(value), out)
+        out += value
+    elif isinstance(value, dict):
+        out += _DICT
+        _write_varint(len(value), out)
+        for key, item in value.items():
+            _encode_key(key, out)
+            _encode(item, out)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        _encode_sequence(list(value), out)
+    elif hasattr(value, 'model_dump'):
+        _encode(value.model_dump(), out)
+    elif hasattr(value, 'to_dict'):
+        _encode(value.to_dict(), out)
+    else:
+        # Matches the JSON writer's default=str
+        _encode(str(value), out)
+
+
+def _encode_key(key: Any, out: bytearray) -> None:
+    # Anything else would encode as a value that is unhashable or changes type on decode
+    if not isinstance(key, (str, int)):
+        raise TypeError(f"Packed dict keys must be str or int, not {type(key).__name__}")
+    _encode(key, out)
+
+
+def _encode_sequence(items: List[Any], out: bytearray) -> None:
+    if len(items) >= MIN_ARRAY_LENGTH:
+        kinds = {type(item) for item in items}
+        if kinds == {float}:
+            out += _FLOAT_ARRAY
+            _write_varint(len(items), out)
+            out += _array_bytes(array('d', items))
+            return
+        if kinds == {int} and _INT64_MIN <= min(items) and max(items) <= _INT64_MAX:
+            out += _INT_ARRAY
+            _write_varint(len(items), out)
+            out += _array_bytes(array('q', items))
+            return
+
+    if len(items) >= 2 and type(items[0]) is dict and items[0]:
+        keys = list(items[0])
+        if all(type(item) is dict and len(item) == len(keys) and list(item) == keys for item in items[1:]):
+            out += _TABLE
+            _write_varint(len(items), out)
+            _write_varint(len(keys), out)
+            for key in keys:
+                _encode_key(key, out)
+            for key in keys:
+                _encode_sequence([item[key] for item in items], out)
+            return
+
+    out += _LIST
+    _write_varint(len(items), out)
+    for item in items:
+        _encode(item, out)
+
+
+def _array_bytes(values: array) -> bytes:
+    # Arrays are stored little-endian regardless of the platform
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def decode_value(data: bytes) -> Any:
+    value, position = _decode(memoryview(data), 0)
+    if position != len(data):
+        raise SaveIntegrityError(f"Trailing bytes after packed value at {position}")
+    return value
+
+
+def _read_varint(data: memoryview, position: int) -> Tuple[int, int]:
+    number = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        number |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return number, position
+        shift += 7
+
+
+def _decode(data: memoryview, position: int) -> Tuple[Any, int]:
+    tag = bytes(data[position:position + 1])
+    position += 1
+    if tag == _STR:
+        length, position = _read_varint(data, position)
+        return str(data[position:position + length], 'utf-8'), position + length
+    if tag == _INT:
+        number, position = _read_varint(data, position)
+        return (number >> 1) if not number & 1 else -((number + 1) >> 1), position
+    if tag == _FLOAT_TAG:
+        return _FLOAT.unpack_from(data, position)[0], position + _FLOAT.size
+    if tag == _DICT:
+        count, position = _read_varint(data, position)
+        result = {}
+        for _ in range(count):
+            key, position = _decode(data, position)
+            result[key], position = _decode(data, position)
+        return result, position
+    if tag == _LIST:
+        count, position = _read_varint(data, position)
+        result = []
+        for _ in range(count):
+            item, position = _decode(data, position)
+            result.append(item)
+        return result, position
+    if tag == _NONE:
+        return None, position
+    if tag == _TRUE:
+        return True, position
+    if tag == _FALSE:
+        return False, position
+    if tag in (_INT_ARRAY, _FLOAT_ARRAY):
+        count, position = _read_varint(data, position)
+        values = array('q' if tag == _INT_ARRAY else 'd')
+        end = position + count * values.itemsize
+        values.frombytes(data[position:end])
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values.tolist(), end
+    if tag == _TABLE:
+        rows, position = _read_varint(data, position)
+        width, position = _read_varint(data, position)
+        keys = []
+        for _ in range(width):
+            key, position = _decode(data, position)
+            keys.append(key)
+        columns = []
+        for _ in range(width):
+            column, position = _decode(data, position)
+            columns.append(column)
+        return [dict(zip(keys, row)) for row in zip(*columns)] if width else [{} for _ in range(rows)], position
+    if tag == _BYTES:
+        length, position = _read_varint(data, position)
+        return bytes(data[position:position + length]), position + length
+    raise SaveIntegrityError(f"Unknown packed value tag {tag!r} at {position - 1}")
+
+
+# --- Container ----------------------------------------------------------------
+
+class PackedSaveWriter(StreamingSaveWriter):
+    """
+    ``StreamingSaveWriter`` that produces a packed container.
+
+    Sections and mapping entries are encoded and written one at a time. Each
+    is tagged with ``version``, the save version of its schema, so readers
+    can migrate individual sections.
+    """
+
+    def __init__(self, path: Path, version: str, compression_level: Optional[int] = None,
+                 header_size: int = 0):
+        super().__init__(path, binary=True, header_size=header_size)
+        self.version = version
+        self.section_compression = compression_level
+        self.toc: List[List[Any]] = []
+        self._start = self.sink.file_size
+        self.sink.write(PACKED_MAGIC)
+
+    def write_section(self, key: str, value: Any) -> None:
+        self._write_packed(key, value)
+        self.sections.append(key)
+
+    def begin_mapping(self, key: str) -> None:
+        self._mapping = key
+        self._mapping_entries = 0
+        self.toc.append([key, self.version, self.sink.file_size - self._start, 0, 0, MAPPING_CODEC, 0])
+        self.sections.append(key)
+
+    def write_entry(self, key: str, value: Any) -> None:
+        self._write_packed(f"{self._mapping}/{key}", value)
+        self._mapping_entries += 1
+
+    def end_mapping(self) -> None:
+        self._mapping = None
+
+    def finish(self, header=None) -> SaveStreamResult:
+        toc = encode_value({'container_version': CONTAINER_VERSION,
+                            'columns': ['name', 'version', 'offset', 'length', 'raw_length', 'codec', 'crc32'],
+                            'sections': self.toc})
+        toc_offset = self.sink.file_size - self._start
+        self.sink.write(toc)
+        result = SaveStreamResult(self.sink.path, self.sink.hasher.hexdigest(),
+                                  self.sink.payload_size, 0, self.sections, self.largest_section)
+        self.sink.write(_FOOTER.pack(toc_offset, len(toc), self.sink.hasher.digest(), PACKED_FOOTER_MAGIC),
+                        hashed=False)
+
+        def render_header() -> bytes:
+            result.file_size = self.sink.file_size
+            return header(result)
+
+        self.sink.commit(render_header if header is not None else None)
+        result.file_size = self.sink.file_size
+        return result
+
+    def _write_packed(self, name: str, value: Any) -> None:
+        encoded = encode_value(value)
+        stored, codec = encoded, RAW_CODEC
+        if self.section_compression is not None and len(encoded) >= MIN_COMPRESS_SIZE:
+            compressed = zlib.compress(encoded, self.section_compression)
+            if len(compressed) < len(encoded):
+                stored, codec = compressed, ZLIB_CODEC
+        self.toc.append([name, self.version, self.sink.file_size - self._start, len(stored),
+                         len(encoded), codec, zlib.crc32(stored)])
+        self.largest_section = max(self.largest_section, len(encoded))
+        self.sink.write(stored)
+
+
+def _parse_footer(footer: bytes) -> Tuple[int, int, bytes]:
+    if len(footer) != _FOOTER.size:
+        raise SaveIntegrityError("Packed save is truncated: footer missing")
+    toc_offset, toc_length, digest, magic = _FOOTER.unpack(footer)
+    if magic != PACKED_FOOTER_MAGIC:
+        raise SaveIntegrityError("Packed save is truncated: footer missing")
+    return toc_offset, toc_length, digest
+
+
+def _decode_section(name: str, stored: bytes, codec: str, crc: int) -> Any:
+    if zlib.crc32(stored) != crc:
+        raise SaveIntegrityError(f"Section {name} failed its CRC check")
+    return decode_value(zlib.decompress(stored) if codec == ZLIB_CODEC else stored)
+
+
+def _oldest_version(toc: List[List[Any]]) -> Optional[str]:
+    versions = {row[1] for row in toc}
+    return min(versions, key=lambda version: tuple(int(part) for part in version.split('.'))) if versions else None
+
+
+def decode_packed(data: bytes) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Decode a whole packed container (without the save header).
+
+    The SHA-256 checksum is verified first. Returns the save dictionary,
+    whose top-level ``version`` is the oldest section schema version, and a
+    trailer compatible with ``decode_save_payload``.
+    """
+    toc_offset, toc_length, digest = _parse_footer(data[-_FOOTER.size:])
+    payload = data[:len(data) - _FOOTER.size]
+    actual = hashlib.sha256(payload)
+    if actual.digest() != digest:
+        raise SaveIntegrityError(f"Save file checksum mismatch: expected {digest.hex()}, got {actual.hexdigest()}")
+
+    toc = decode_value(payload[toc_offset:toc_offset + toc_length])['sections']
+    save_dict: Dict[str, Any] = {}
+    for name, _, offset, length, _, codec, crc in toc:
+        if codec == MAPPING_CODEC:
+            save_dict[name] = {}
+            continue
+        value = _decode_section(name, payload[offset:offset + length], codec, crc)
+        mapping, separator, key = name.partition('/')
+        if separator and isinstance(save_dict.get(mapping), dict):
+            save_dict[mapping][key] = value
+        else:
+            save_dict[name] = value
+
+    save_dict['version'] = _oldest_version(toc)
+    trailer = {
+        'algorithm': CHECKSUM_ALGORITHM,
+        'checksum': digest.hex(),
+        'payload_size': len(payload),
+        'sections': [row[0] for row in toc if '/' not in row[0]]
+    }
+    return save_dict, trailer
+
+
+class PackedSaveReader:
+    """
+    Random-access reader for packed saves.
+
+    Opening the reader reads only the footer and table of contents. Each
+    ``read`` then seeks to one section and checks its CRC, so a single
+    civilization or the metadata can be loaded without decoding the rest.
+    ``verify`` checks the whole-file checksum.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file = open(self.path, 'rb')
+        try:
+            self.base = SAVE_HEADER_SIZE if has_save_header(self._file.read(len(PACKED_MAGIC))) else 0
+            self._file.seek(self.base)
+            if not is_packed(self._file.read(len(PACKED_MAGIC))):
+                raise ValueError(f"{self.path} is not a packed save")
+            self._file.seek(-_FOOTER.size, 2)
+            self.toc_offset, toc_length, self.digest = _parse_footer(self._file.read(_FOOTER.size))
+            self._file.seek(self.base + self.toc_offset)
+            self.toc = {row[0]: row for row in decode_value(self._file.read(toc_length))['sections']}
+        except Exception:
+            self._file.close()
+            raise
+        self.bytes_read = 0
+
+    def __enter__(self) -> 'PackedSaveReader':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.toc
+
+    def close(self) -> None:
+        self._file.close()
+
+    @property
+    def version(self) -> Optional[str]:
+        return _oldest_version(list(self.toc.values()))
+
+    def section_version(self, name: str) -> str:
+        return self.toc[name][1]
+
+    def mapping_keys(self, mapping: str) -> List[str]:
+        prefix = f"{mapping}/"
+        return [name[len(prefix):] for name in self.toc if name.startswith(prefix)]
+
+    def read(self, name: str) -> Any:
+        """Decode one section or mapping entry (``"civilizations/<id>"``)."""
+        _, _, offset, length, _, codec, crc = self.toc[name]
+        if codec == MAPPING_CODEC:
+            return {key: self.read(f"{name}/{key}") for key in self.mapping_keys(name)}
+        self._file.seek(self.base + offset)
+        stored = self._file.read(length)
+        self.bytes_read += length
+        return _decode_section(name, stored, codec, crc)
+
+    def verify(self) -> None:
+        """Check the whole-file checksum; raises ``SaveIntegrityError`` on mismatch."""
+        hasher = hashlib.sha256()
+        remaining = self._payload_size()
+        while remaining:
+            chunk = self._file.read(min(remaining, 1 << 20))
+            if not chunk:
+                break
+            hasher.update(chunk)
+            remaining -= len(chunk)
+        if hasher.digest() != self.digest:
+            raise SaveIntegrityError(f"Save file checksum mismatch in {self.path}")
+
+    def _payload_size(self) -> int:
+        self._file.seek(0, 2)
+        size = self._file.tell() - self.base - _FOOTER.size
+        self._file.seek(self.base)
+        return size
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Save Catalog
+
+Listing saves should not require opening, decompressing and parsing each one.
+Every save file now starts with a fixed-size, uncompressed header holding its
+metadata as JSON, and the save directory keeps an index of those headers keyed
+by file name. Index entries are trusted while the file's size and modification
+time still match. Otherwise the header is read again (a few kilobytes), and
+only files written before headers existed need a full read.
+"""
+
+import json
+import logging
+import os
+import struct
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+SAVE_HEADER_MAGIC = b"PSGSAVE1"
+SAVE_HEADER_SIZE = 4096
+INDEX_FILENAME = ".save_index.json"
+INDEX_VERSION = 1
+SAVE_SUFFIXES = ('.json', '.gz', '.binary', '.pack')
+
+# Magic followed by the big-endian length of the metadata JSON; 0 means the
+# metadata did not fit and readers must fall back to the file body
+_HEADER_PREFIX = struct.Struct(">8sI")
+
+
+def encode_save_header(metadata: Dict[str, Any]) -> bytes:
+    """Encode ``metadata`` into a header of exactly ``SAVE_HEADER_SIZE`` bytes."""
+    encoded = json.dumps(metadata, separators=(',', ':'), default=str).encode('utf-8')
+    capacity = SAVE_HEADER_SIZE - _HEADER_PREFIX.size
+    if len(encoded) > capacity:
+        # Long descriptions are the usual culprit; listing still works without them
+        encoded = json.dumps(dict(metadata, description=""), separators=(',', ':'),
+                             default=str).encode('utf-8')
+    if len(encoded) > capacity:
+        encoded = b''
+    header = _HEADER_PREFIX.pack(SAVE_HEADER_MAGIC, len(encoded)) + encoded
+    return header.ljust(SAVE_HEADER_SIZE, b'\0')
+
+
+def has_save_header(data: bytes) -> bool:
+    return data[:len(SAVE_HEADER_MAGIC)] == SAVE_HEADER_MAGIC
+
+
+def strip_save_header(data: bytes) -> bytes:
+    """Return the save body, dropping the metadata header if present."""
+    return data[SAVE_HEADER_SIZE:] if has_save_header(data) else data
+
+
+def read_save_header(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read the metadata header of a save file.
+
+    Returns None for files without a header, or whose metadata did not fit.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(SAVE_HEADER_SIZE)
+    if len(header) < _HEADER_PREFIX.size or not has_save_header(header):
+        return None
+    _, length = _HEADER_PREFIX.unpack_from(header)
+    if not length or _HEADER_PREFIX.size + length > len(header):
+        return None
+    return json.loads(header[_HEADER_PREFIX.size:_HEADER_PREFIX.size + length].decode('utf-8'))
+
+
+class SaveCatalog:
+    """
+    Directory-level index of save metadata.
+
+    Entries map file names to ``{'size', 'mtime_ns', 'metadata'}``. ``record``
+    and ``remove`` keep the index in step with saves and deletes made through
+    the manager. ``scan`` reconciles it with the directory, so files that were
+    copied in, replaced or deleted behind its back are picked up too. A
+    missing, corrupt or outdated index is rebuilt from the file headers.
+    """
+
+    def __init__(self, save_dir: Path, index_name: str = INDEX_FILENAME):
+        self.save_dir = Path(save_dir)
+        self.index_path = self.save_dir / index_name
+        self.entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self.statistics = {'index_hits': 0, 'header_reads': 0, 'full_reads': 0, 'rebuilds': 0}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def is_save_file(path: Path) -> bool:
+        return path.suffix in SAVE_SUFFIXES and not path.name.startswith('.')
+
+    def record(self, save_path: Path, metadata: Dict[str, Any]) -> None:
+        """Index ``metadata`` for a save file that was just written."""
+        with self._lock:
+            entries = self._load()
+            stat = Path(save_path).stat()
+            entries[Path(save_path).name] = self._entry(stat, metadata)
+            self._persist()
+
+    def remove(self, save_path: Path) -> None:
+        with self._lock:
+            entries = self._load()
+            if entries.pop(Path(save_path).name, None) is not None:
+                self._persist()
+
+    def scan(self, read_metadata: Callable[[Path], Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Return metadata for every save file in the directory, by file name.
+
+        Unchanged files are served from the index, files with a header cost
+        one small read, and ``read_metadata`` is only called for files with
+        neither. Files that cannot be read are logged and skipped.
+        """
+        with self._lock:
+            entries = self._load()
+            seen = set()
+            changed = False
+            results = {}
+
+            with os.scandir(self.save_dir) as directory:
+                for item in directory:
+                    path = Path(item.path)
+                    if not item.is_file() or not self.is_save_file(path):
+                        continue
+                    seen.add(item.name)
+                    stat = item.stat()
+                    entry = entries.get(item.name)
+                    if entry is not None and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                        self.statistics['index_hits'] += 1
+                        results[item.name] = entry['metadata']
+                        continue
+
+                    try:
+                        metadata = read_save_header(path)
+                        if metadata is not None:
+                            self.statistics['header_reads'] += 1
+                        else:
+                            metadata = read_metadata(path)
+                            self.statistics['full_reads'] += 1
+                    except Exception as e:
+                        self.logger.warning(f"Failed to read save file {path}: {e}")
+                        if entries.pop(item.name, None) is not None:
+                            changed = True
+                        continue
+
+                    entries[item.name] = self._entry(stat, metadata)
+                    results[item.name] = metadata
+                    changed = True
+
+            for name in [name for name in entries if name not in seen]:
+                del entries[name]
+                changed = True
+
+            if changed:
+                self._persist()
+            return results
+
+    def _entry(self, stat: os.stat_result, metadata: Dict[str, Any]) -> Dict[str, Any]:
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'metadata': metadata}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self.entries is not None:
+            return self.entries
+        self.entries = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') == INDEX_VERSION and isinstance(index.get('entries'), dict):
+                self.entries = index['entries']
+            else:
+                self.statistics['rebuilds'] += 1
+        except FileNotFoundError:
+            self.statistics['rebuilds'] += 1
+        except Exception as e:
+            self.logger.warning(f"Save index {self.index_path} is unreadable, rebuilding: {e}")
+            self.statistics['rebuilds'] += 1
+        return self.entries
+
+    def _persist(self) -> None:
+        temp_path = self.index_path.with_name(f".{self.index_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'entries': self.entries}, f, default=str)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            # The index is only a cache; listing rebuilds it from headers
+            self.logger.warning(f"Failed to write save index {self.index_path}: {e}")
+            try:
+                temp_path.unlink()
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+"""
+Streaming Save Diff
+
+Comparing two late-game saves by loading both and flattening them into dotted
+key dictionaries costs several times their size in memory. This module reads
+saves one section at a time (metadata, game state, each civilization and each
+memory bank) from every save format, without materialising the whole file.
+
+A diff takes three streaming passes:
+
+1. Hash every section of save A.
+2. Hash every section of save B. Sections whose hash matches are skipped
+   outright, and changed sections are spilled to a temporary file.
+3. Walk save A again and diff each changed section against its spilled
+   counterpart.
+
+List elements that carry a stable id (advisor, civilization, memory, ...) are
+matched by that id rather than by position. Differences go to a temporary
+file behind a paginated report, so memory use depends on the number of
+sections, not on the size of the saves or of the diff.
+"""
+
+import codecs
+import gzip
+import json
+import pickle
+import tempfile
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from src.persistence.delta_saves import DELTA_SECTION, MAPPING_SECTIONS, section_hash
+from src.persistence.packed_format import MAPPING_CODEC, PackedSaveReader, is_packed
+from src.persistence.save_catalog import SAVE_HEADER_SIZE, has_save_header
+from src.persistence.save_stream import (
+    ENTRY_RECORD, SECTION_RECORD, TRAILER_RECORD, SaveIntegrityError
+)
+
+
+STABLE_ID_KEYS = ('id', 'advisor_id', 'civilization_id', 'memory_id', 'event_id', 'save_id')
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_MAX_DIFFERENCES = 100_000
+MAX_VALUE_CHARS = 200
+JSON_READ_SIZE = 64 * 1024
+
+
+def iter_save_sections(save_path: Path) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield ``(path, value)`` for every section of a save, one at a time.
+
+    Mapping entries are yielded as ``"civilizations/<id>"``, each after an
+    empty placeholder for the mapping itself. Sections that a delta save
+    references are read from the files that hold them.
+    """
+    save_path = Path(save_path)
+    delta = None
+    for path, value in _iter_stored_sections(save_path):
+        if path == DELTA_SECTION:
+            delta = value
+        else:
+            yield path, value
+
+    if delta is None:
+        return
+    wanted: Dict[str, Dict[str, str]] = defaultdict(dict)
+    for path, (digest, filename) in delta['sections'].items():
+        if filename != save_path.name:
+            wanted[filename][path] = digest
+    for filename, digests in wanted.items():
+        source = save_path.parent / filename
+        if not source.exists():
+            raise SaveIntegrityError(f"Delta save {save_path.name} references missing save {filename}")
+        for path, value in _iter_stored_sections(source):
+            if path in digests:
+                if section_hash(value) != digests[path]:
+                    raise SaveIntegrityError(f"Section {path} in {filename} does not match its hash")
+                yield path, value
+
+
+def _iter_stored_sections(save_path: Path) -> Iterator[Tuple[str, Any]]:
+    """Sections physically stored in one file, including any delta manifest."""
+    with open(save_path, 'rb') as f:
+        prefix = f.read(SAVE_HEADER_SIZE + 8)
+    base = SAVE_HEADER_SIZE if has_save_header(prefix) else 0
+
+    if is_packed(prefix[base:]):
+        with PackedSaveReader(save_path) as reader:
+            for name, row in reader.toc.items():
+                yield name, {} if row[5] == MAPPING_CODEC else reader.read(name)
+        return
+
+    with open(save_path, 'rb') as raw:
+        raw.seek(base)
+        stream = gzip.GzipFile(fileobj=raw) if prefix[base:base + 2] == b'\x1f\x8b' else raw
+        if stream.peek(1)[:1] == b'{':
+            yield from _JsonSectionReader(stream).sections()
+        else:
+            yield from _iter_pickle_sections(stream)
+
+
+def _split_section(key: str, value: Any) -> Iterator[Tuple[str, Any]]:
+    if key in MAPPING_SECTIONS and isinstance(value, dict):
+        yield key, {}
+        for entry_key, entry in value.items():
+            yield f"{key}/{entry_key}", entry
+    elif key != 'trailer':
+        yield key, value
+
+
+def _iter_pickle_sections(stream: IO[bytes]) -> Iterator[Tuple[str, Any]]:
+    while True:
+        try:
+            record = pickle.load(stream)
+        except EOFError:
+            return
+        if isinstance(record, dict):
+            # Whole-document pickle from before streamed saves
+            for key, value in record.items():
+                yield from _split_section(key, value)
+            return
+        if record[0] == SECTION_RECORD:
+            yield record[1], record[2]
+        elif record[0] == ENTRY_RECORD:
+            yield f"{record[1]}/{record[2]}", record[3]
+        elif record[0] == TRAILER_RECORD:
+            return
+
+
+class _JsonSectionReader:
+    """
+    Incremental reader for a save's top-level JSON object.
+
+    Top-level members are decoded one at a time, and the members of mapping
+    sections one entry at a time. The buffer only ever holds the value being
+    decoded.
+    """
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.text = ''
+        self.position = 0
+        self.eof = False
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+
+    def sections(self) -> Iterator[Tuple[str, Any]]:
+        self._expect('{')
+        if self._peek() == '}':
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if key in MAPPING_SECTIONS and self._peek() == '{':
+                self._expect('{')
+                yield key, {}
+                if self._peek() != '}':
+                    while True:
+                        entry_key = self._value()
+                        self._expect(':')
+                        yield f"{key}/{entry_key}", self._value()
+                        if self._separator('}'):
+                            break
+                else:
+                    self._expect('}')
+            else:
+                value = self._value()
+                if key != 'trailer':
+                    yield key, value
+            if self._separator('}'):
+                return
+
+    def _fill(self, size: int) -> bool:
+        if self.eof:
+            return False
+        data = self.stream.read(size)
+        self.eof = not data
+        self.text = self.text[self.position:] + self._utf8.decode(data, final=self.eof)
+        self.position = 0
+        return not self.eof
+
+    def _peek(self) -> str:
+        while True:
+            while self.position < len(self.text) and self.text[self.position] in ' \t\r\n':
+                self.position += 1
+            if self.position < len(self.text):
+                return self.text[self.position]
+            if not self._fill(JSON_READ_SIZE):
+                raise ValueError("Unexpected end of save data")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"Expected {char!r} in save data, found {self.text[self.position]!r}")
+        self.position += 1
+
+    def _separator(self, closer: str) -> bool:
+        char = self._peek()
+        self.position += 1
+        if char == closer:
+            return True
+        if char != ',':
+            raise ValueError(f"Unexpected {char!r} in save data")
+        return False
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.position)
+                # A number at the very end of the buffer may continue in the next read
+                if end < len(self.text) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Grow reads geometrically so a large value is re-scanned O(log n) times
+            self._fill(max(JSON_READ_SIZE, len(self.text) - self.position))
+
+
+@dataclass
+class SaveDiffReport:
+    """
+    Outcome of a streaming save comparison.
+
+    ``differences`` holds the first page. Later pages are read back from a
+    temporary file with ``page``, which is discarded by ``close`` (or on
+    leaving a ``with`` block). At most ``max_differences`` are kept, though
+    all are counted.
+    """
+    file_a: Path
+    file_b: Path
+    sections_identical: int = 0
+    sections_changed: int = 0
+    sections_added: int = 0
+    sections_removed: int = 0
+    total_differences: int = 0
+    counts: Dict[str, int] = field(default_factory=dict)
+    similarity_score: float = 1.0
+    page_size: int = DEFAULT_PAGE_SIZE
+    truncated: bool = False
+    differences: List[Dict[str, Any]] = field(default_factory=list)
+    metadata_a: Optional[Dict[str, Any]] = None
+    metadata_b: Optional[Dict[str, Any]] = None
+    section_sizes_a: Dict[str, int] = field(default_factory=dict)  # Entry counts of top-level sections
+    section_sizes_b: Dict[str, int] = field(default_factory=dict)
+    _spill: Optional[IO[bytes]] = field(default=None, repr=False)
+    _page_offsets: List[int] = field(default_factory=list, repr=False)
+
+    @property
+    def page_count(self) -> int:
+        return len(self._page_offsets)
+
+    def page(self, number: int) -> List[Dict[str, Any]]:
+        """Differences on page ``number``, counting from 0."""
+        if number == 0 or self._spill is None:
+            return self.differences if number == 0 else []
+        if number >= len(self._page_offsets):
+            return []
+        self._spill.seek(self._page_offsets[number])
+        differences = []
+        for _ in range(self.page_size):
+            line = self._spill.readline()
+            if not line:
+                break
+            differences.append(json.loads(line))
+        return differences
+
+    def iter_differences(self) -> Iterator[Dict[str, Any]]:
+        for number in range(max(1, self.page_count)):
+            yield from self.page(number)
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def __enter__(self) -> 'SaveDiffReport':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'file_a': str(self.file_a),
+            'file_b': str(self.file_b),
+            'sections_identical': self.sections_identical,
+            'sections_changed': self.sections_changed,
+            'sections_added': self.sections_added,
+            'sections_removed': self.sections_removed,
+            'total_differences': self.total_differences,
+            'counts': self.counts,
+            'similarity_score': self.similarity_score,
+            'truncated': self.truncated,
+            'page_size': self.page_size,
+            'page_count': self.page_count
+        }
+
+
+class _DifferenceSink:
+    """Counts differences and pages the first ``max_differences`` to disk."""
+
+    def __init__(self, report: SaveDiffReport, max_differences: int, max_value_chars: int):
+        self.report = report
+        self.max_differences = max_differences
+        self.max_value_chars = max_value_chars
+        self.counts: Counter = Counter()
+        self.stored = 0
+
+    def emit(self, kind: str, path: str, value_a: Any, value_b: Any) -> None:
+        report = self.report
+        self.counts[kind] += 1
+        report.total_differences += 1
+        if self.stored >= self.max_differences:
+            report.truncated = True
+            return
+        difference = {'type': kind, 'path': path,
+                      'value_a': self._preview(value_a), 'value_b': self._preview(value_b)}
+        if self.stored < report.page_size:
+            report.differences.append(difference)
+        if self.stored % report.page_size == 0:
+            if report._spill is None:
+                report._spill = tempfile.TemporaryFile()
+            report._page_offsets.append(report._spill.tell())
+        report._spill.write(json.dumps(difference, default=str).encode('utf-8') + b'\n')
+        self.stored += 1
+
+    def _preview(self, value: Any) -> Any:
+        if isinstance(value, (bool, int, float)) or value is None:
+            return value
+        encoded = value if isinstance(value, str) else json.dumps(value, default=str)
+        if len(encoded) <= self.max_value_chars:
+            return value
+        return encoded[:self.max_value_chars] + '...'
+
+
+def diff_saves(file_a: Path, file_b: Path, page_size: int = DEFAULT_PAGE_SIZE,
+               max_differences: int = DEFAULT_MAX_DIFFERENCES,
+               max_value_chars: int = MAX_VALUE_CHARS) -> SaveDiffReport:
+    """Compare two saves of any format section by section; see the module docstring."""
+    report = SaveDiffReport(file_a=Path(file_a), file_b=Path(file_b), page_size=max(1, page_size))
+    sink = _DifferenceSink(report, max_differences, max_value_chars)
+
+    # Pass 1: section hashes of A
+    digests_a: Dict[str, str] = {}
+    for path, value in iter_save_sections(file_a):
+        digests_a[path] = section_hash(value)
+
+    # Pass 2: skip identical sections of B, spill changed ones, report added ones
+    spilled: Dict[str, int] = {}
+    seen_b = set()
+    section_scores = 0.0
+    with tempfile.TemporaryFile() as spill:
+        for path, value in iter_save_sections(file_b):
+            seen_b.add(path)
+            _record_section(report.section_sizes_b, path, value)
+            if path == 'metadata':
+                report.metadata_b = value
+            digest = digests_a.get(path)
+            if digest is None:
+                report.sections_added += 1
+                sink.emit('added', _dotted(path), None, value)
+            elif digest == section_hash(value):
+                report.sections_identical += 1
+                section_scores += 1.0
+            else:
+                spilled[path] = spill.tell()
+                pickle.dump(value, spill, pickle.HIGHEST_PROTOCOL)
+
+        # Pass 3: diff changed sections against their spilled counterparts
+        for path, value_a in iter_save_sections(file_a):
+            _record_section(report.section_sizes_a, path, value_a)
+            if path == 'metadata':
+                report.metadata_a = value_a
+            if path not in seen_b:
+                report.sections_removed += 1
+                sink.emit('removed', _dotted(path), value_a, None)
+            elif path in spilled:
+                spill.seek(spilled[path])
+                value_b = pickle.load(spill)
+                before = report.total_differences
+                diff_values(value_a, value_b, _dotted(path), sink.emit)
+                changed = report.total_differences - before
+                report.sections_changed += 1
+                leaves = max(_count_leaves(value_a), _count_leaves(value_b), 1)
+                section_scores += max(0.0, 1.0 - changed / leaves)
+
+    sections = len(digests_a) + report.sections_added
+    report.similarity_score = section_scores / sections if sections else 1.0
+    report.counts = dict(sink.counts)
+    return report
+
+
+def diff_values(value_a: Any, value_b: Any, path: str,
+                emit: Callable[[str, str, Any, Any], None]) -> None:
+    """
+    Emit ``(type, path, value_a, value_b)`` for each difference between two
+    decoded values. Equal subtrees are skipped without descending into them.
+    """
+    if value_a == value_b:
+        return
+    if isinstance(value_a, dict) and isinstance(value_b, dict):
+        for key, item in value_a.items():
+            if key in value_b:
+                diff_values(item, value_b[key], f"{path}.{key}", emit)
+            else:
+                emit('removed', f"{path}.{key}", item, None)
+        for key, item in value_b.items():
+            if key not in value_a:
+                emit('added', f"{path}.{key}", None, item)
+    elif isinstance(value_a, list) and isinstance(value_b, list):
+        id_key = _stable_id_key(value_a, value_b)
+        if id_key is not None:
+            by_id = {item[id_key]: item for item in value_b}
+            for item in value_a:
+                item_path = f"{path}[{id_key}={item[id_key]}]"
+                if item[id_key] in by_id:
+                    diff_values(item, by_id.pop(item[id_key]), item_path, emit)
+                else:
+                    emit('removed', item_path, item, None)
+            for item_id, item in by_id.items():
+                emit('added', f"{path}[{id_key}={item_id}]", None, item)
+        else:
+            for index, (item_a, item_b) in enumerate(zip(value_a, value_b)):
+                diff_values(item_a, item_b, f"{path}[{index}]", emit)
+            for index in range(len(value_b), len(value_a)):
+                emit('removed', f"{path}[{index}]", value_a[index], None)
+            for index in range(len(value_a), len(value_b)):
+                emit('added', f"{path}[{index}]", None, value_b[index])
+    else:
+        emit('modified', path, value_a, value_b)
+
+
+def summarize_save_sections(save_path: Path, largest: int = 5) -> Dict[str, Any]:
+    """Encoded size of each section, gathered in one streaming pass."""
+    total = 0
+    count = 0
+    sizes: List[Tuple[int, str]] = []
+    for path, value in iter_save_sections(save_path):
+        size = len(json.dumps(value, default=str))
+        total += size
+        count += 1
+        sizes = sorted(sizes + [(size, path)], reverse=True)[:largest]
+    return {
+        'payload_bytes': total,
+        'section_count': count,
+        'largest_sections': [{'section': path, 'bytes': size} for size, path in sizes]
+    }
+
+
+def _stable_id_key(items_a: List[Any], items_b: List[Any]) -> Optional[str]:
+    """The id key every element of both lists carries uniquely, if any."""
+    if not items_a or not items_b:
+        return None
+    first = items_a[0]
+    if not isinstance(first, dict):
+        return None
+    for key in STABLE_ID_KEYS:
+        if key not in first:
+            continue
+        try:
+            ids_a = [item[key] for item in items_a]
+            ids_b = [item[key] for item in items_b]
+            if len(set(ids_a)) == len(ids_a) and len(set(ids_b)) == len(ids_b):
+                return key
+        except (KeyError, TypeError):
+            continue
+    return None
+
+
+def _count_leaves(value: Any) -> int:
+    if isinstance(value, dict):
+        return sum(_count_leaves(item) for item in value.values()) or 1
+    if isinstance(value, list):
+        return sum(_count_leaves(item) for item in value) or 1
+    return 1
+
+
+def _record_section(sizes: Dict[str, int], path: str, value: Any) -> None:
+    mapping, separator, _ = path.partition('/')
+    if separator:
+        sizes[mapping] = sizes.get(mapping, 0) + 1
+    elif isinstance(value, (list, dict)):
+        sizes[path] = len(value)
+    else:
+        sizes.setdefault(path, 0)
+
+
+def _dotted(path: str) -> str:
+    return path.replace('/', '.', 1)
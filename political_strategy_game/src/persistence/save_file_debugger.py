@@ -17,7 +17,7 @@ import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import pickle
 import sys
@@ -27,6 +27,9 @@ from src.persistence.save_game_manager import (
     SaveGameManager, SaveGameData, SaveGameMetadata, 
     SaveFileFormat, SaveFileVersion, IntegrityValidator
 )
+from src.persistence.save_catalog import strip_save_header
+from src.persistence.packed_format import is_packed
+from src.persistence.save_diff import SaveDiffReport, diff_saves, summarize_save_sections
 
 
 class AnalysisLevel(str, Enum):
@@ -75,6 +78,8 @@ class SaveFileComparison:
     similarity_score: float
     metadata_changes: Dict[str, Any]
     structure_changes: Dict[str, Any]
+    total_differences: int = 0
+    report: Optional[SaveDiffReport] = field(default=None, repr=False)  # Pages beyond ``differences``
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for export."""
@@ -82,10 +87,23 @@ class SaveFileComparison:
             'file_a': str(self.file_a),
             'file_b': str(self.file_b),
             'differences': self.differences,
+            'total_differences': self.total_differences,
             'similarity_score': self.similarity_score,
             'metadata_changes': self.metadata_changes,
-            'structure_changes': self.structure_changes
+            'structure_changes': self.structure_changes,
+            'diff_summary': self.report.summary() if self.report is not None else None
         }
+    
+    def close(self) -> None:
+        """Discard the report's temporary file of later difference pages."""
+        if self.report is not None:
+            self.report.close()
+    
+    def __enter__(self) -> 'SaveFileComparison':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 class SaveFileDebugger:
@@ -100,6 +118,9 @@ class SaveFileDebugger:
         """
         Perform comprehensive analysis of a save file.
         
+        Not constant-memory: structure stats and validation need the whole
+        save loaded. Section sizes come from a separate streaming pass.
+        
         Args:
             save_path: Path to save file
             analysis_level: Depth of analysis to perform
@@ -125,6 +146,10 @@ class SaveFileDebugger:
             
             # Analyze structure
             structure_stats = self._analyze_structure(save_data, analysis_level)
+            section_summary = summarize_save_sections(save_path)
+            if analysis_level == AnalysisLevel.COMPREHENSIVE:
+                structure_stats['section_count'] = section_summary['section_count']
+                structure_stats['largest_sections'] = section_summary['largest_sections']
             
             # Validate integrity
             validation_errors = []
@@ -132,14 +157,14 @@ class SaveFileDebugger:
             
             if analysis_level in [AnalysisLevel.DETAILED, AnalysisLevel.COMPREHENSIVE]:
                 validation_errors = self.integrity_validator.validate_save_file(save_data)
-                warnings = self._detect_warnings(save_data)
+                warnings = self._detect_warnings(save_data, section_summary['payload_bytes'])
             
             # Performance metrics
             performance_metrics = {
                 'load_time_seconds': load_time,
                 'parse_time_seconds': 0.0,  # Would measure parsing time separately
                 'validation_time_seconds': 0.0,  # Would measure validation time
-                'memory_usage_mb': self._estimate_memory_usage(save_data)
+                'memory_usage_mb': section_summary['payload_bytes'] / 1024 / 1024
             }
             
             return SaveFileAnalysis(
@@ -159,13 +184,21 @@ class SaveFileDebugger:
             self.logger.error(f"Analysis failed: {e}")
             raise
     
-    def compare_save_files(self, file_a: Path, file_b: Path) -> SaveFileComparison:
+    def compare_save_files(self, file_a: Path, file_b: Path,
+                           page_size: int = 1000) -> SaveFileComparison:
         """
         Compare two save files and identify differences.
         
+        Both saves are streamed section by section, so memory stays flat
+        however large they are. ``differences`` holds the first
+        ``page_size`` differences; ``report.page(n)`` returns later ones.
+        Later pages live in a temporary file, so close the comparison when
+        done, or use it as a context manager.
+        
         Args:
             file_a: First save file
             file_b: Second save file
+            page_size: Differences per report page
             
         Returns:
             Detailed comparison results
@@ -173,33 +206,24 @@ class SaveFileDebugger:
         try:
             self.logger.info(f"Comparing save files: {file_a} vs {file_b}")
             
-            # Load both save files
-            save_data_a = self._load_save_file_raw(file_a)
-            save_data_b = self._load_save_file_raw(file_b)
-            
-            # Convert to dictionaries for comparison
-            dict_a = save_data_a.to_dict()
-            dict_b = save_data_b.to_dict()
-            
-            # Find differences
-            differences = self._find_differences(dict_a, dict_b)
-            
-            # Calculate similarity score
-            similarity_score = self._calculate_similarity(dict_a, dict_b)
+            report = diff_saves(file_a, file_b, page_size=page_size)
             
             # Analyze metadata changes
-            metadata_changes = self._compare_metadata(save_data_a.metadata, save_data_b.metadata)
-            
-            # Analyze structure changes
-            structure_changes = self._compare_structures(dict_a, dict_b)
+            metadata_changes = {}
+            if report.metadata_a is not None and report.metadata_b is not None:
+                metadata_changes = self._compare_metadata(SaveGameMetadata.from_dict(report.metadata_a),
+                                                          SaveGameMetadata.from_dict(report.metadata_b))
             
             return SaveFileComparison(
                 file_a=file_a,
                 file_b=file_b,
-                differences=differences,
-                similarity_score=similarity_score,
+                differences=report.differences,
+                similarity_score=report.similarity_score,
                 metadata_changes=metadata_changes,
-                structure_changes=structure_changes
+                structure_changes=self._compare_section_sizes(report.section_sizes_a,
+                                                              report.section_sizes_b),
+                total_differences=report.total_differences,
+                report=report
             )
             
         except Exception as e:
@@ -347,7 +371,7 @@ class SaveFileDebugger:
         try:
             # Try reading as raw JSON
             with open(save_path, 'rb') as f:
-                data = f.read()
+                data = strip_save_header(f.read())
             
             # Try decompression
             try:
@@ -373,9 +397,18 @@ class SaveFileDebugger:
             data = f.read()
         
         original_size = len(data)
+        data = strip_save_header(data)
         format_type = SaveFileFormat.BINARY
         compression_ratio = 0.0
         
+        if is_packed(data):
+            return {
+                'format': SaveFileFormat.PACKED,
+                'compression_ratio': compression_ratio,
+                'original_size': original_size,
+                'decompressed_size': len(data)
+            }
+        
         # Try to decompress
         try:
             decompressed = gzip.decompress(data)
@@ -438,7 +471,7 @@ class SaveFileDebugger:
         
         return stats
     
-    def _detect_warnings(self, save_data: SaveGameData) -> List[str]:
+    def _detect_warnings(self, save_data: SaveGameData, payload_bytes: int) -> List[str]:
         """Detect potential issues that aren't critical errors."""
         warnings = []
         
@@ -461,88 +494,11 @@ class SaveFileDebugger:
                     warnings.append(f"Advisor {advisor_id} has {len(old_memories)} very old memories")
         
         # Check file size concerns
-        estimated_size = len(json.dumps(save_data.to_dict(), default=str))
-        if estimated_size > 10 * 1024 * 1024:  # 10MB
-            warnings.append(f"Save file is very large: {estimated_size / 1024 / 1024:.1f}MB")
+        if payload_bytes > 10 * 1024 * 1024:  # 10MB
+            warnings.append(f"Save file is very large: {payload_bytes / 1024 / 1024:.1f}MB")
         
         return warnings
     
-    def _estimate_memory_usage(self, save_data: SaveGameData) -> float:
-        """Estimate memory usage of save data in MB."""
-        # Rough estimation based on JSON size
-        json_size = len(json.dumps(save_data.to_dict(), default=str))
-        return json_size / 1024 / 1024
-    
-    def _find_differences(self, dict_a: Dict, dict_b: Dict, path: str = "") -> List[Dict[str, Any]]:
-        """Find differences between two dictionaries."""
-        differences = []
-        
-        # Check for added/removed keys
-        keys_a = set(dict_a.keys()) if isinstance(dict_a, dict) else set()
-        keys_b = set(dict_b.keys()) if isinstance(dict_b, dict) else set()
-        
-        for key in keys_a - keys_b:
-            differences.append({
-                'type': 'removed',
-                'path': f"{path}.{key}" if path else key,
-                'value_a': dict_a[key],
-                'value_b': None
-            })
-        
-        for key in keys_b - keys_a:
-            differences.append({
-                'type': 'added',
-                'path': f"{path}.{key}" if path else key,
-                'value_a': None,
-                'value_b': dict_b[key]
-            })
-        
-        # Check for modified values
-        for key in keys_a & keys_b:
-            current_path = f"{path}.{key}" if path else key
-            value_a = dict_a[key]
-            value_b = dict_b[key]
-            
-            if isinstance(value_a, dict) and isinstance(value_b, dict):
-                differences.extend(self._find_differences(value_a, value_b, current_path))
-            elif value_a != value_b:
-                differences.append({
-                    'type': 'modified',
-                    'path': current_path,
-                    'value_a': value_a,
-                    'value_b': value_b
-                })
-        
-        return differences
-    
-    def _calculate_similarity(self, dict_a: Dict, dict_b: Dict) -> float:
-        """Calculate similarity score between two dictionaries."""
-        # Convert to flat key-value pairs
-        flat_a = self._flatten_dict(dict_a)
-        flat_b = self._flatten_dict(dict_b)
-        
-        all_keys = set(flat_a.keys()) | set(flat_b.keys())
-        if not all_keys:
-            return 1.0
-        
-        matching_keys = 0
-        for key in all_keys:
-            if key in flat_a and key in flat_b and flat_a[key] == flat_b[key]:
-                matching_keys += 1
-        
-        return matching_keys / len(all_keys)
-    
-    def _flatten_dict(self, d: Dict, parent_key: str = '', sep: str = '.') -> Dict:
-        """Flatten a nested dictionary."""
-        items = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep=sep).items())
-            else:
-                items.append((new_key, v))
-        return dict(items)
-    
     def _compare_metadata(self, meta_a: SaveGameMetadata, meta_b: SaveGameMetadata) -> Dict[str, Any]:
         """Compare two metadata objects."""
         changes = {}
@@ -559,24 +515,18 @@ class SaveFileDebugger:
         
         return changes
     
-    def _compare_structures(self, dict_a: Dict, dict_b: Dict) -> Dict[str, Any]:
-        """Compare the structures of two save files."""
+    def _compare_section_sizes(self, sizes_a: Dict[str, int], sizes_b: Dict[str, int]) -> Dict[str, Any]:
+        """Compare the structures of two save files from their top-level section sizes."""
         changes = {}
         
         # Compare top-level structure
-        keys_a = set(dict_a.keys())
-        keys_b = set(dict_b.keys())
-        
-        changes['added_sections'] = list(keys_b - keys_a)
-        changes['removed_sections'] = list(keys_a - keys_b)
+        changes['added_sections'] = sorted(set(sizes_b) - set(sizes_a))
+        changes['removed_sections'] = sorted(set(sizes_a) - set(sizes_b))
         
         # Compare sizes of major sections
-        for section in keys_a & keys_b:
-            if isinstance(dict_a[section], (list, dict)):
-                size_a = len(dict_a[section])
-                size_b = len(dict_b[section])
-                if size_a != size_b:
-                    changes[f'{section}_size_change'] = {'from': size_a, 'to': size_b}
+        for section in set(sizes_a) & set(sizes_b):
+            if sizes_a[section] != sizes_b[section]:
+                changes[f'{section}_size_change'] = {'from': sizes_a[section], 'to': sizes_b[section]}
         
         return changes
     
@@ -783,8 +733,8 @@ def main():
             if not args.second_file:
                 print("Error: --second-file required for comparison")
                 sys.exit(1)
-            comparison = debugger.compare_save_files(Path(args.save_file), Path(args.second_file))
-            print(json.dumps(comparison.to_dict(), indent=2, default=str))
+            with debugger.compare_save_files(Path(args.save_file), Path(args.second_file)) as comparison:
+                print(json.dumps(comparison.to_dict(), indent=2, default=str))
         
         elif args.command == "repair":
             if not args.output:
@@ -11,8 +11,8 @@ This module implements a complete save/load system with:
 """
 
 import json
-import gzip
 import hashlib
+import pickle
 import logging
 import shutil
 import threading
@@ -21,12 +21,22 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-import pickle
 import time
 import uuid
 from collections import defaultdict
 
 from src.bridge.state_serializer import GameStateSerializer, GameState, SerializationMetadata
+from src.persistence.save_stream import StreamingSaveWriter, SaveStreamResult, decode_save_payload
+from src.persistence.chunked_compression import DEFAULT_CHUNK_SIZE, ChunkedCompressor, Frame, frame_index
+from src.persistence.save_catalog import (
+    SaveCatalog, SAVE_HEADER_SIZE, encode_save_header, read_save_header, strip_save_header
+)
+from src.persistence.packed_format import (
+    PackedSaveWriter, PackedSaveReader, PACKED_MAGIC, MAPPING_CODEC, decode_packed, is_packed
+)
+from src.persistence.delta_saves import (
+    DELTA_SECTION, DeltaChain, DeltaEncoder, resolve_delta_save, chain_from_manifest
+)
 from src.core.memory import MemoryManager, MemoryBank
 from src.core.civilization import Civilization
 from src.core.advisor_enhanced import AdvisorWithMemory
@@ -38,6 +48,7 @@ class SaveFileFormat(str, Enum):
     JSON_COMPRESSED = "json.gz"
     BINARY = "binary"
     BINARY_COMPRESSED = "binary.gz"
+    PACKED = "pack"  # Sectioned binary container with random access
 
 
 class SaveFileVersion(str, Enum):
@@ -68,6 +79,9 @@ class SaveGameMetadata:
     tags: List[str] = field(default_factory=list)
     play_time_hours: float = 0.0
     screenshot_path: Optional[str] = None
+    delta_chain: Optional[str] = None  # Chain ID for incremental saves
+    delta_sequence: int = 0  # Saves since the chain's keyframe
+    delta_references: List[str] = field(default_factory=list)  # Files holding unchanged sections
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -88,7 +102,10 @@ class SaveGameMetadata:
             'description': self.description,
             'tags': self.tags,
             'play_time_hours': self.play_time_hours,
-            'screenshot_path': self.screenshot_path
+            'screenshot_path': self.screenshot_path,
+            'delta_chain': self.delta_chain,
+            'delta_sequence': self.delta_sequence,
+            'delta_references': self.delta_references
         }
         return data
     
@@ -112,7 +129,10 @@ class SaveGameMetadata:
             description=data.get('description', ''),
             tags=data.get('tags', []),
             play_time_hours=data.get('play_time_hours', 0.0),
-            screenshot_path=data.get('screenshot_path')
+            screenshot_path=data.get('screenshot_path'),
+            delta_chain=data.get('delta_chain'),
+            delta_sequence=data.get('delta_sequence', 0),
+            delta_references=data.get('delta_references', [])
         )
 
 
@@ -122,48 +142,99 @@ class SaveGameData:
     metadata: SaveGameMetadata
     game_state: GameState
     memory_banks: Dict[str, MemoryBank]
-    civilizations: Dict[str, Dict[str, Any]]  # Serialized civilization data
+    civilizations: Dict[str, Any]  # Serialized civilization data or civilization models
     custom_data: Dict[str, Any] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        # Handle game_state - could be a dict or an object with to_dict method
-        if hasattr(self.game_state, 'to_dict'):
-            game_state_dict = self.game_state.to_dict()
-        else:
-            game_state_dict = self.game_state  # Assume it's already a dict
-        
         return {
             'metadata': self.metadata.to_dict(),
-            'game_state': game_state_dict,
-            'memory_banks': {civ_id: bank.model_dump() for civ_id, bank in self.memory_banks.items()},
-            'civilizations': self.civilizations,
+            'game_state': self._game_state_dict(),
+            'memory_banks': dict(self.iter_memory_banks()),
+            'civilizations': dict(self.iter_civilizations()),
             'custom_data': self.custom_data
         }
+    
+    def iter_memory_banks(self):
+        """Yield (civilization ID, serialized memory bank) pairs one at a time."""
+        for civ_id, bank in self.memory_banks.items():
+            yield civ_id, bank.model_dump() if hasattr(bank, 'model_dump') else bank
+    
+    def iter_civilizations(self):
+        """Yield (civilization ID, serialized civilization) pairs one at a time."""
+        for civ_id, civilization in self.civilizations.items():
+            yield civ_id, civilization.model_dump() if hasattr(civilization, 'model_dump') else civilization
+    
+    def _game_state_dict(self) -> Dict[str, Any]:
+        # Handle game_state - could be a dict or an object with to_dict method
+        if hasattr(self.game_state, 'to_dict'):
+            return self.game_state.to_dict()
+        return self.game_state  # Assume it's already a dict
+    
+    def write_to(self, writer: StreamingSaveWriter, delta: Optional[DeltaEncoder] = None) -> None:
+        """
+        Stream every section into ``writer`` in document order.
+        
+        With a ``delta`` encoder, sections unchanged since the previous save
+        in the chain are skipped and listed in a trailing delta manifest.
+        """
+        keep = delta.changed if delta is not None else (lambda path, value: True)
+        writer.write_section('metadata', self.metadata.to_dict())
+        game_state = self._game_state_dict()
+        if keep('game_state', game_state):
+            writer.write_section('game_state', game_state)
+        writer.write_mapping('memory_banks', ((civ_id, bank) for civ_id, bank in self.iter_memory_banks()
+                                              if keep(f'memory_banks/{civ_id}', bank)))
+        writer.write_mapping('civilizations', ((civ_id, civ) for civ_id, civ in self.iter_civilizations()
+                                               if keep(f'civilizations/{civ_id}', civ)))
+        if keep('custom_data', self.custom_data):
+            writer.write_section('custom_data', self.custom_data)
+        if delta is not None:
+            writer.write_section(DELTA_SECTION, delta.manifest())
 
 
 class CompressionManager:
-    """Handles save file compression and optimization."""
+    """
+    Handles save file compression and optimization.
     
-    def __init__(self):
+    Data is compressed in independent chunks on a thread pool. The output
+    is still plain (multi-member) gzip, and ``frame_index`` locates its
+    chunks so they can be decompressed in parallel or one range at a time.
+    """
+    
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.logger = logging.getLogger(__name__)
+        self.chunked = ChunkedCompressor(chunk_size)
+    
+    @property
+    def level_cache(self) -> Dict[str, int]:
+        """Compression levels chosen so far, by content profile."""
+        return self.chunked.level_cache
     
     def compress_data(self, data: bytes, level: int = 6) -> bytes:
-        """Compress data using gzip."""
+        """Compress data into chunked gzip."""
         try:
-            return gzip.compress(data, compresslevel=level)
+            return self.chunked.compress(data, level)
         except Exception as e:
             self.logger.error(f"Compression failed: {e}")
             return data
     
     def decompress_data(self, compressed_data: bytes) -> bytes:
-        """Decompress gzip data."""
+        """Decompress gzip data, in parallel when it is chunked."""
         try:
-            return gzip.decompress(compressed_data)
+            return self.chunked.decompress(compressed_data)
         except Exception as e:
             self.logger.error(f"Decompression failed: {e}")
             return compressed_data
     
+    def frame_index(self, compressed_data: bytes) -> Optional[List[Frame]]:
+        """Chunk offsets of compressed data, or None if it is not chunked."""
+        return frame_index(compressed_data)
+    
+    def decompress_range(self, compressed_data: bytes, start: int, end: int) -> bytes:
+        """Decompress only the chunks holding uncompressed bytes ``[start, end)``."""
+        return self.chunked.decompress_range(compressed_data, start, end)
+    
     # Convenience methods for backward compatibility
     def compress(self, data: bytes, level: int = 6) -> bytes:
         """Alias for compress_data."""
@@ -183,20 +254,16 @@ class CompressionManager:
         """Calculate compression ratio from data."""
         return self.calculate_compression_ratio(len(original_data), len(compressed_data))
     
-    def optimize_compression_level(self, data: bytes) -> int:
-        """Find optimal compression level for data."""
-        best_level = 6
-        best_ratio = 0.0
-        
-        for level in range(1, 10):
-            compressed = self.compress_data(data, level)
-            ratio = self.calculate_compression_ratio(len(data), len(compressed))
-            
-            if ratio > best_ratio:
-                best_ratio = ratio
-                best_level = level
+    def optimize_compression_level(self, data: bytes, profile: Optional[str] = None) -> int:
+        """
+        Find the compression level for data.
         
-        return best_level
+        Candidate levels are tried on a sampled prefix only, and the fastest
+        one within a couple of percent of the best size wins. The choice is
+        remembered for the content profile (sniffed from the data unless
+        given), so data of the same kind is not sampled again.
+        """
+        return self.chunked.select_level(data, profile)
 
 
 class VersionManager:
@@ -498,7 +565,8 @@ class IntegrityValidator:
             
             required_fields = ['name', 'leader', 'advisors']
             for field in required_fields:
-                if field not in civ_data:
+                present = field in civ_data if isinstance(civ_data, dict) else hasattr(civ_data, field)
+                if not present:
                     errors.append(f"Missing required field '{field}' in civilization {civ_id}")
         
         return errors
@@ -674,16 +742,19 @@ class SaveGameManager:
     def __init__(self, 
                  save_dir: Path,
                  backup_dir: Optional[Path] = None,
-                 compression_level: int = 6,
-                 enable_encryption: bool = False):
+                 compression_level: Optional[int] = 6,
+                 enable_encryption: bool = False,
+                 keyframe_interval: int = 10):
         """
         Initialize save game manager.
         
         Args:
             save_dir: Directory for save files
             backup_dir: Directory for backups (default: save_dir/backups)
-            compression_level: Compression level (1-9)
+            compression_level: Compression level (1-9), or None to pick one
+                per save format from a sample of the first save's game state
             enable_encryption: Whether to enable save file encryption
+            keyframe_interval: Incremental saves between full keyframes
         """
         self.save_dir = Path(save_dir)
         self.save_dir.mkdir(parents=True, exist_ok=True)
@@ -691,6 +762,8 @@ class SaveGameManager:
         self.backup_dir = Path(backup_dir) if backup_dir else (self.save_dir / "backups")
         self.compression_level = compression_level
         self.enable_encryption = enable_encryption
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.delta_chains: Dict[str, DeltaChain] = {}
         
         # Initialize components
         self.state_serializer = GameStateSerializer(compress_state=True)
@@ -698,6 +771,7 @@ class SaveGameManager:
         self.version_manager = VersionManager()
         self.integrity_validator = IntegrityValidator()
         self.backup_manager = BackupManager(self.backup_dir)
+        self.catalog = SaveCatalog(self.save_dir)
         
         self.logger = logging.getLogger(__name__)
         self.logger.info("SaveGameManager initialized")
@@ -710,7 +784,8 @@ class SaveGameManager:
                   save_format: SaveFileFormat = SaveFileFormat.JSON_COMPRESSED,
                   description: str = "",
                   tags: List[str] = None,
-                  create_backup: bool = True) -> Path:
+                  create_backup: bool = True,
+                  incremental: bool = False) -> Path:
         """
         Save complete game state.
         
@@ -723,6 +798,9 @@ class SaveGameManager:
             description: Save game description
             tags: Tags for categorization
             create_backup: Whether to create backup before saving
+            incremental: Write only sections changed since the previous
+                incremental save of this game, with a full keyframe every
+                ``keyframe_interval`` saves
             
         Returns:
             Path to created save file
@@ -764,57 +842,54 @@ class SaveGameManager:
             
             metadata.memory_count = total_memories
             
-            # Serialize civilizations
-            serialized_civilizations = {}
-            for civ_id, civilization in civilizations.items():
-                serialized_civilizations[civ_id] = civilization.model_dump()
-            
-            # Create save data
+            # Civilizations are serialized one at a time while streaming
             save_data = SaveGameData(
                 metadata=metadata,
                 game_state=game_state,
                 memory_banks=memory_banks,
-                civilizations=serialized_civilizations
+                civilizations=civilizations
             )
             
-            # Calculate preliminary checksum for validation
-            temp_dict = save_data.to_dict()
-            temp_json = json.dumps(temp_dict, default=str).encode('utf-8')
-            preliminary_checksum = self.integrity_validator.calculate_checksum(temp_json)
-            save_data.metadata.checksum = preliminary_checksum
-            
-            # Validate before saving (now with checksum) - use structure validation only
+            # Only structural problems block the save
             validation_errors = []
-            try:
-                # Only validate structure, not data integrity during save
-                if not save_data.metadata:
-                    validation_errors.append("Missing metadata")
-                if not save_data.game_state:
-                    validation_errors.append("Missing game_state")
-                    
-                # Log warnings for non-critical issues but don't fail the save
-                structure_warnings = self.integrity_validator.validate_save_file(save_data)
-                if structure_warnings:
-                    self.logger.warning(f"Save validation warnings: {structure_warnings}")
-                    
-            except Exception as e:
-                self.logger.warning(f"Validation warning during save: {e}")
-            
+            if not save_data.metadata:
+                validation_errors.append("Missing metadata")
+            if not save_data.game_state:
+                validation_errors.append("Missing game_state")
             if validation_errors:
                 raise ValueError(f"Critical save validation failed: {validation_errors}")
             
             # Determine save file path
             safe_name = "".join(c for c in game_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{safe_name}_{timestamp}.{save_format.value}"
+            delta = None
+            if incremental:
+                delta = self._next_delta_encoder(game_name, safe_name, timestamp, save_format)
+                metadata.delta_chain = delta.chain_id
+                metadata.delta_sequence = delta.sequence
+                filename = delta.filename
+            else:
+                filename = f"{safe_name}_{timestamp}.{save_format.value}"
             save_path = self.save_dir / filename
             
             # Create backup if requested and file exists
             if create_backup and save_path.exists():
                 self.backup_manager.create_backup(save_path, "pre_save")
             
-            # Serialize and save
-            self._write_save_file(save_data, save_path, save_format)
+            # Serialize and save in a single streaming pass
+            self._write_save_file(save_data, save_path, save_format, delta)
+            self.catalog.record(save_path, metadata.to_dict())
+            if delta is not None:
+                self.delta_chains.setdefault(game_name, DeltaChain(game_name)).advance(delta)
+                self.logger.info(f"Delta save wrote {delta.written} sections, referenced {delta.referenced}")
+            
+            # Log warnings for non-critical issues but don't fail the save
+            try:
+                structure_warnings = self.integrity_validator.validate_save_file(save_data)
+                if structure_warnings:
+                    self.logger.warning(f"Save validation warnings: {structure_warnings}")
+            except Exception as e:
+                self.logger.warning(f"Validation warning during save: {e}")
             
             self.logger.info(f"Game saved successfully: {save_path}")
             return save_path
@@ -823,12 +898,14 @@ class SaveGameManager:
             self.logger.error(f"Save failed: {e}")
             raise
     
-    def load_game(self, save_path: Path) -> SaveGameData:
+    def load_game(self, save_path: Path, civilization_ids: Optional[List[str]] = None) -> SaveGameData:
         """
         Load complete game state from save file.
         
         Args:
             save_path: Path to save file
+            civilization_ids: Load only these civilizations and their memory
+                banks; packed saves decode just those sections
             
         Returns:
             Complete save game data
@@ -840,7 +917,14 @@ class SaveGameManager:
                 raise FileNotFoundError(f"Save file not found: {save_path}")
             
             # Read and deserialize save file as dict first
-            save_dict = self._read_save_file_dict(save_path)
+            if civilization_ids is None:
+                read_save = self._read_save_file_dict
+            else:
+                wanted = set(civilization_ids)
+                read_save = lambda path: self._read_partial_save_dict(path, wanted)
+            save_dict = read_save(save_path)
+            if DELTA_SECTION in save_dict:
+                save_dict = resolve_delta_save(save_dict, save_path, read_save)
             
             # Detect version and migrate if needed
             version = self.version_manager.detect_version(save_dict)
@@ -854,10 +938,11 @@ class SaveGameManager:
             # Convert to SaveGameData object
             save_data = self._dict_to_save_data(save_dict)
             
-            # Validate loaded data
-            validation_errors = self.integrity_validator.validate_save_file(save_data)
-            if validation_errors:
-                self.logger.warning(f"Save validation warnings: {validation_errors}")
+            # Validate loaded data; partial loads would only report missing civilizations
+            if civilization_ids is None:
+                validation_errors = self.integrity_validator.validate_save_file(save_data)
+                if validation_errors:
+                    self.logger.warning(f"Save validation warnings: {validation_errors}")
             
             self.logger.info(f"Game loaded successfully: {save_path}")
             return save_data
@@ -866,38 +951,64 @@ class SaveGameManager:
             self.logger.error(f"Load failed: {e}")
             raise
     
+    def load_save_metadata(self, save_path: Path) -> SaveGameMetadata:
+        """Load only a save's metadata, from its header when it has one."""
+        header = read_save_header(save_path)
+        if header is not None:
+            return SaveGameMetadata.from_dict(header)
+        return SaveGameMetadata.from_dict(self._read_full_metadata(save_path))
+    
     def list_save_games(self) -> List[SaveGameMetadata]:
-        """List all available save games."""
+        """
+        List all available save games.
+        
+        Metadata comes from the save catalog and file headers; only saves
+        written before headers existed are read and migrated in full.
+        """
         save_games = []
         
-        for save_file in self.save_dir.glob("*"):
-            if save_file.is_file() and save_file.suffix in ['.json', '.gz', '.binary']:
-                try:
-                    # Read as dict first, then handle migration if needed
-                    save_dict = self._read_save_file_dict(save_file)
-                    
-                    # Detect version and migrate if needed
-                    version = self.version_manager.detect_version(save_dict)
-                    if not self.version_manager.is_compatible_with_dict(save_dict):
-                        save_dict = self.version_manager.migrate_save_data(
-                            save_dict, version, SaveFileVersion.CURRENT
-                        )
-                    
-                    save_data = self._dict_to_save_data(save_dict)
-                    save_games.append(save_data.metadata)
-                except Exception as e:
-                    self.logger.warning(f"Failed to read save file {save_file}: {e}")
+        for metadata_dict in self.catalog.scan(self._read_full_metadata).values():
+            try:
+                save_games.append(SaveGameMetadata.from_dict(metadata_dict))
+            except Exception as e:
+                self.logger.warning(f"Invalid save metadata for {metadata_dict.get('game_name')}: {e}")
         
         # Sort by timestamp, newest first
         return sorted(save_games, key=lambda x: x.timestamp, reverse=True)
     
+    def _read_full_metadata(self, save_file: Path) -> Dict[str, Any]:
+        """Read metadata from a save file without a header."""
+        # Read as dict first, then handle migration if needed
+        save_dict = self._read_save_file_dict(save_file)
+        
+        # Detect version and migrate if needed
+        version = self.version_manager.detect_version(save_dict)
+        if not self.version_manager.is_compatible_with_dict(save_dict):
+            save_dict = self.version_manager.migrate_save_data(
+                save_dict, version, SaveFileVersion.CURRENT
+            )
+        
+        return self._dict_to_save_data(save_dict).metadata.to_dict()
+    
     def delete_save_game(self, save_path: Path, create_backup: bool = True) -> bool:
-        """Delete a save game file."""
+        """
+        Delete a save game file.
+        
+        Saves that later delta saves still reference are kept; compact the
+        dependent chain first.
+        """
         try:
+            dependents = [name for name, metadata in self.catalog.scan(self._read_full_metadata).items()
+                          if save_path.name in metadata.get('delta_references', [])]
+            if dependents:
+                self.logger.error(f"Cannot delete {save_path}: referenced by delta saves {dependents}")
+                return False
+            
             if create_backup:
                 self.backup_manager.create_backup(save_path, "pre_delete")
             
             save_path.unlink()
+            self.catalog.remove(save_path)
             self.logger.info(f"Deleted save game: {save_path}")
             return True
             
@@ -905,80 +1016,197 @@ class SaveGameManager:
             self.logger.error(f"Failed to delete save game: {e}")
             return False
     
-    def _write_save_file(self, save_data: SaveGameData, save_path: Path, 
-                        save_format: SaveFileFormat) -> None:
-        """Write save data to file in specified format."""
-        # Convert to dict
-        save_dict = save_data.to_dict()
-        
-        if save_format in [SaveFileFormat.JSON, SaveFileFormat.JSON_COMPRESSED]:
-            # JSON format
-            json_data = json.dumps(save_dict, indent=2, default=str)
-            data_bytes = json_data.encode('utf-8')
-            
-            if save_format == SaveFileFormat.JSON_COMPRESSED:
-                data_bytes = self.compression_manager.compress_data(data_bytes, self.compression_level)
+    def compact_delta_chain(self, save_path: Path, remove_history: bool = True) -> Path:
+        """
+        Fold a delta save and everything it references into a new keyframe.
         
-        else:
-            # Binary format
-            data_bytes = pickle.dumps(save_dict)
-            
-            if save_format == SaveFileFormat.BINARY_COMPRESSED:
-                data_bytes = self.compression_manager.compress_data(data_bytes, self.compression_level)
+        The save is rewritten in place as a self-contained keyframe of a new
+        chain, and later incremental saves of the game build on it when it
+        was the chain's latest save. With ``remove_history``, earlier saves of
+        the old chain that no remaining save references are deleted.
+        """
+        save_dict = self._read_save_file_dict(save_path)
+        if DELTA_SECTION not in save_dict:
+            return save_path
+        save_dict = resolve_delta_save(save_dict, save_path, self._read_save_file_dict)
         
-        # Calculate checksum and update metadata
-        checksum = self.integrity_validator.calculate_checksum(data_bytes)
-        save_data.metadata.checksum = checksum
-        save_data.metadata.file_size = len(data_bytes)
+        metadata = SaveGameMetadata.from_dict(save_dict['metadata'])
+        old_chain, old_sequence = metadata.delta_chain, metadata.delta_sequence
+        chain = self.delta_chains.get(metadata.game_name)
+        was_latest = chain is not None and chain.latest == save_path.name
+        
+        encoder = DeltaEncoder(DeltaChain(metadata.game_name), save_path.name, keyframe=True)
+        metadata.delta_chain = encoder.chain_id
+        metadata.delta_sequence = 0
+        metadata.delta_references = []
+        save_data = SaveGameData(
+            metadata=metadata,
+            game_state=save_dict['game_state'],
+            memory_banks=save_dict['memory_banks'],
+            civilizations=save_dict['civilizations'],
+            custom_data=save_dict.get('custom_data', {})
+        )
+        self._write_save_file(save_data, save_path, metadata.format, encoder)
+        self.catalog.record(save_path, metadata.to_dict())
+        if was_latest:
+            self.delta_chains[metadata.game_name] = chain_from_manifest(
+                metadata.game_name, save_path, encoder.manifest()
+            )
         
-        # Update dict with new metadata
-        save_dict = save_data.to_dict()
+        if remove_history:
+            catalog = self.catalog.scan(self._read_full_metadata)
+            history = {name for name, entry in catalog.items()
+                       if entry.get('delta_chain') == old_chain and entry.get('delta_sequence', 0) < old_sequence}
+            still_referenced = {reference for name, entry in catalog.items() if name not in history
+                                for reference in entry.get('delta_references', [])}
+            for name in sorted(history - still_referenced):
+                (self.save_dir / name).unlink()
+                self.catalog.remove(self.save_dir / name)
+                self.logger.info(f"Removed compacted delta save: {name}")
+        
+        self.logger.info(f"Compacted delta chain into keyframe: {save_path}")
+        return save_path
+    
+    def _next_delta_encoder(self, game_name: str, safe_name: str, timestamp: str,
+                            save_format: SaveFileFormat) -> DeltaEncoder:
+        """Continue this game's chain, or start a new keyframe when due or broken."""
+        chain = self.delta_chains.get(game_name) or DeltaChain(game_name)
+        keyframe = (
+            chain.latest is None
+            or chain.sequence + 1 >= self.keyframe_interval
+            or not all((self.save_dir / name).exists() for name in chain.referenced_files())
+        )
+        sequence = 0 if keyframe else chain.sequence + 1
+        chain_id = uuid.uuid4().hex if keyframe else chain.chain_id
+        filename = f"{safe_name}_{timestamp}_{chain_id[:8]}_{sequence:03d}.{save_format.value}"
+        return DeltaEncoder(chain, filename, keyframe, chain_id)
+    
+    def _write_save_file(self, save_data: SaveGameData, save_path: Path, 
+                        save_format: SaveFileFormat,
+                        delta: Optional[DeltaEncoder] = None) -> SaveStreamResult:
+        """
+        Stream save data to file in the specified format.
         
-        # Re-serialize with updated metadata
-        if save_format in [SaveFileFormat.JSON, SaveFileFormat.JSON_COMPRESSED]:
-            json_data = json.dumps(save_dict, indent=2, default=str)
-            data_bytes = json_data.encode('utf-8')
-            
-            if save_format == SaveFileFormat.JSON_COMPRESSED:
-                data_bytes = self.compression_manager.compress_data(data_bytes, self.compression_level)
+        Sections are encoded, hashed and compressed one at a time into a
+        temporary file that replaces ``save_path`` once complete. The payload
+        checksum goes into the file's trailer and, with the final file size,
+        into ``save_data.metadata``, which is also written to the file's
+        fixed-size header for the save catalog.
+        """
+        binary = save_format in [SaveFileFormat.BINARY, SaveFileFormat.BINARY_COMPRESSED]
+        compressed = save_format in [SaveFileFormat.JSON_COMPRESSED, SaveFileFormat.BINARY_COMPRESSED]
+        compression_level = self._compression_level_for(save_data, save_format)
+        save_data.metadata.compression_level = compression_level
+        
+        if save_format == SaveFileFormat.PACKED:
+            # Packed containers compress section by section to keep random access
+            writer = PackedSaveWriter(save_path, SaveFileVersion.CURRENT.value,
+                                      compression_level=compression_level,
+                                      header_size=SAVE_HEADER_SIZE)
         else:
-            data_bytes = pickle.dumps(save_dict)
-            
-            if save_format == SaveFileFormat.BINARY_COMPRESSED:
-                data_bytes = self.compression_manager.compress_data(data_bytes, self.compression_level)
-        
-        # Write to file
-        with open(save_path, 'wb') as f:
-            f.write(data_bytes)
+            writer = StreamingSaveWriter(save_path, binary=binary,
+                                         compression_level=compression_level if compressed else None,
+                                         indent=None if compressed else 2,
+                                         header_size=SAVE_HEADER_SIZE)
+        
+        with writer:
+            save_data.write_to(writer, delta)
+            if delta is not None:
+                save_data.metadata.delta_references = delta.references()
+            result = writer.finish(lambda result: encode_save_header(dict(
+                save_data.metadata.to_dict(), checksum=result.checksum, file_size=result.file_size
+            )))
+        
+        save_data.metadata.checksum = result.checksum
+        save_data.metadata.file_size = result.file_size
+        return result
+    
+    def _compression_level_for(self, save_data: SaveGameData, save_format: SaveFileFormat) -> int:
+        """The configured level, or the level chosen adaptively for ``save_format``."""
+        if self.compression_level is not None:
+            return self.compression_level
+        level = self.compression_manager.level_cache.get(save_format.value)
+        if level is None:
+            # The game state section is in every save and encodes like the rest
+            game_state = save_data._game_state_dict()
+            if save_format in [SaveFileFormat.BINARY, SaveFileFormat.BINARY_COMPRESSED]:
+                sample = pickle.dumps(game_state, pickle.HIGHEST_PROTOCOL)
+            else:
+                sample = json.dumps(game_state, default=str).encode('utf-8')
+            level = self.compression_manager.optimize_compression_level(sample, save_format.value)
+        return level
     
     def _read_save_file_dict(self, save_path: Path) -> Dict[str, Any]:
         """Read save data from file and return as dictionary."""
         with open(save_path, 'rb') as f:
-            data_bytes = f.read()
+            raw_bytes = f.read()
+        data_bytes = strip_save_header(raw_bytes)
         
-        # Determine format and decompress if needed
+        # Determine format and decompress if needed (packed saves compress per section)
         try:
             # Try to decompress first (handles compressed formats)
-            decompressed_data = self.compression_manager.decompress_data(data_bytes)
-            if decompressed_data != data_bytes:
-                data_bytes = decompressed_data
+            if not is_packed(data_bytes):
+                decompressed_data = self.compression_manager.decompress_data(data_bytes)
+                if decompressed_data != data_bytes:
+                    data_bytes = decompressed_data
         except:
             # Not compressed, use original data
             pass
         
-        # Try JSON first
         try:
-            json_str = data_bytes.decode('utf-8')
-            save_dict = json.loads(json_str)
-        except:
-            # Try binary
-            try:
-                save_dict = pickle.loads(data_bytes)
-            except:
-                raise ValueError("Invalid save file format")
+            if is_packed(data_bytes):
+                save_dict, trailer = decode_packed(data_bytes)
+            else:
+                save_dict, trailer = decode_save_payload(data_bytes)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise ValueError("Invalid save file format")
+        
+        # Streamed saves record their checksum in the trailer rather than the metadata
+        metadata = save_dict.get('metadata') if isinstance(save_dict, dict) else None
+        if trailer is not None and isinstance(metadata, dict):
+            if not metadata.get('checksum'):
+                metadata['checksum'] = trailer['checksum']
+            metadata['file_size'] = len(raw_bytes)
         
         return save_dict
     
+    def _read_partial_save_dict(self, save_path: Path, civilization_ids: set) -> Dict[str, Any]:
+        """
+        Read a save with only the given civilizations and memory banks.
+        
+        Packed saves seek straight to the wanted sections; other formats are
+        read in full and filtered.
+        """
+        with open(save_path, 'rb') as f:
+            prefix = f.read(SAVE_HEADER_SIZE + len(PACKED_MAGIC))
+        
+        if is_packed(strip_save_header(prefix)):
+            with PackedSaveReader(save_path) as reader:
+                save_dict = {'version': reader.version}
+                for name, entry in reader.toc.items():
+                    mapping, separator, key = name.partition('/')
+                    if entry[5] == MAPPING_CODEC:
+                        save_dict[name] = {}
+                    elif not separator:
+                        save_dict[name] = reader.read(name)
+                    elif key in civilization_ids:
+                        save_dict[mapping][key] = reader.read(name)
+                metadata = save_dict.get('metadata')
+                if isinstance(metadata, dict):
+                    metadata['checksum'] = metadata.get('checksum') or reader.digest.hex()
+                    metadata['file_size'] = save_path.stat().st_size
+        else:
+            save_dict = self._read_save_file_dict(save_path)
+            for mapping in ('memory_banks', 'civilizations'):
+                save_dict[mapping] = {key: value for key, value in save_dict.get(mapping, {}).items()
+                                      if key in civilization_ids}
+        
+        delta = save_dict.get(DELTA_SECTION)
+        if delta is not None:
+            delta['sections'] = {path: ref for path, ref in delta['sections'].items()
+                                 if '/' not in path or path.partition('/')[2] in civilization_ids}
+        return save_dict
+    
     def _dict_to_save_data(self, save_dict: Dict[str, Any]) -> SaveGameData:
         """Convert dictionary to SaveGameData object."""
         # Reconstruct metadata
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Streaming Save File Writer
+
+Save files are written section by section instead of materialising the whole
+world as one dictionary and one JSON string. Each section (metadata, game
+state, every civilization, every memory bank) is encoded on its own and pushed
+through a sink that hashes the payload, compresses it and writes it to a
+temporary file, which replaces the target only once the save is complete.
+The checksum is not known until the end, so it is stored in a trailer:
+
+- JSON saves end with a final ``"trailer"`` key, and the checksum covers every
+  payload byte before it.
+- Binary saves are a sequence of pickled records whose last record is the
+  trailer.
+"""
+
+import hashlib
+import io
+import json
+import os
+import pickle
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.persistence.chunked_compression import DEFAULT_CHUNK_SIZE, ChunkedStreamCompressor, Frame
+
+
+CHECKSUM_ALGORITHM = "sha256"
+JSON_TRAILER_PREFIX = b', "trailer": '
+
+# Binary record kinds
+SECTION_RECORD = "section"
+ENTRY_RECORD = "entry"
+TRAILER_RECORD = "trailer"
+
+
+class SaveIntegrityError(ValueError):
+    """Raised when a save file's trailer checksum does not match its payload."""
+
+
+@dataclass
+class SaveStreamResult:
+    """Outcome of a streamed save."""
+    path: Path
+    checksum: str
+    payload_size: int
+    file_size: int
+    sections: List[str] = field(default_factory=list)
+    largest_section: int = 0  # Encoded size of the biggest single section or entry
+    frames: List[Frame] = field(default_factory=list)  # Compressed frames, relative to the body start
+
+    def trailer(self) -> Dict[str, Any]:
+        return {
+            'algorithm': CHECKSUM_ALGORITHM,
+            'checksum': self.checksum,
+            'payload_size': self.payload_size,
+            'sections': self.sections
+        }
+
+
+class HashingFileSink:
+    """
+    Write-only file sink that hashes, optionally gzip-compresses and
+    atomically publishes what is written to it.
+
+    Compression is chunked: full chunks are compressed in parallel as
+    independent gzip members, whose offsets are kept in ``frames``.
+
+    Data goes to a temporary file next to ``path``; ``commit`` flushes,
+    fsyncs and renames it over ``path``, while ``abort`` removes it.
+    ``header_size`` bytes are reserved, uncompressed and unhashed, at the
+    start of the file and filled in by ``commit`` once the rest is known.
+    """
+
+    def __init__(self, path: Path, compression_level: Optional[int] = None, header_size: int = 0,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.path = Path(path)
+        self.temp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        self.hasher = hashlib.sha256()
+        self.header_size = header_size
+        self.payload_size = 0
+        self.file_size = header_size
+        self._compressor = (ChunkedStreamCompressor(compression_level, chunk_size)
+                            if compression_level is not None else None)
+        self._file = open(self.temp_path, 'wb')
+        if header_size:
+            self._file.write(bytes(header_size))
+
+    def write(self, data: bytes, hashed: bool = True) -> None:
+        if hashed:
+            self.hasher.update(data)
+            self.payload_size += len(data)
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        if data:
+            self._file.write(data)
+            self.file_size += len(data)
+
+    def commit(self, header: Optional[Callable[[], bytes]] = None) -> str:
+        """
+        Finish the file, move it into place and return the payload checksum.
+
+        ``header`` is called once the final file size is known and must
+        return exactly ``header_size`` bytes.
+        """
+        if self._compressor is not None:
+            tail = self._compressor.flush()
+            self._file.write(tail)
+            self.file_size += len(tail)
+        if self.header_size and header is not None:
+            data = header()
+            if len(data) != self.header_size:
+                raise ValueError(f"Header is {len(data)} bytes, expected {self.header_size}")
+            self._file.seek(0)
+            self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self.temp_path, self.path)
+        return self.hasher.hexdigest()
+
+    @property
+    def frames(self) -> List[Frame]:
+        return self._compressor.frames if self._compressor is not None else []
+
+    def abort(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+        try:
+            self.temp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class StreamingSaveWriter:
+    """
+    Incrementally encodes save sections into a ``HashingFileSink``.
+
+    Top-level values are written with ``write_section``; keyed collections
+    such as civilizations and memory banks are written one entry at a time
+    between ``begin_mapping`` and ``end_mapping``, so only one entry is ever
+    encoded in memory. ``finish`` appends the trailer and publishes the file.
+    """
+
+    def __init__(self, path: Path, binary: bool = False, compression_level: Optional[int] = None,
+                 indent: Optional[int] = None, header_size: int = 0,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.binary = binary
+        self.indent = indent
+        self.sink = HashingFileSink(path, compression_level, header_size, chunk_size)
+        self.sections: List[str] = []
+        self.largest_section = 0
+        self._mapping: Optional[str] = None
+        self._mapping_entries = 0
+        if not binary:
+            self.sink.write(b'{')
+
+    def __enter__(self) -> 'StreamingSaveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.sink.abort()
+
+    def write_section(self, key: str, value: Any) -> None:
+        if self.binary:
+            self._write_record((SECTION_RECORD, key, value))
+        else:
+            self._write_json_member(key, value, top_level=True)
+        self.sections.append(key)
+
+    def begin_mapping(self, key: str) -> None:
+        self._mapping = key
+        self._mapping_entries = 0
+        if self.binary:
+            self._write_record((SECTION_RECORD, key, {}))
+        else:
+            self._write_json_key(key, top_level=True)
+            self.sink.write(b'{')
+        self.sections.append(key)
+
+    def write_entry(self, key: str, value: Any) -> None:
+        if self.binary:
+            self._write_record((ENTRY_RECORD, self._mapping, key, value))
+        else:
+            self._write_json_member(key, value, top_level=False)
+        self._mapping_entries += 1
+
+    def end_mapping(self) -> None:
+        if not self.binary:
+            self.sink.write(b'}')
+        self._mapping = None
+
+    def write_mapping(self, key: str, entries: Iterable[Tuple[str, Any]]) -> None:
+        """Write a keyed collection from a lazy iterable of (key, value) pairs."""
+        self.begin_mapping(key)
+        for entry_key, value in entries:
+            self.write_entry(entry_key, value)
+        self.end_mapping()
+
+    def finish(self, header: Optional[Callable[[SaveStreamResult], bytes]] = None) -> SaveStreamResult:
+        """
+        Append the trailer and publish the file.
+
+        ``header`` renders the reserved header from the result, whose
+        ``file_size`` is final by the time it is called.
+        """
+        result = SaveStreamResult(self.sink.path, self.sink.hasher.hexdigest(),
+                                  self.sink.payload_size, 0, self.sections, self.largest_section)
+        if self.binary:
+            self.sink.write(pickle.dumps((TRAILER_RECORD, result.trailer()), pickle.HIGHEST_PROTOCOL),
+                            hashed=False)
+        else:
+            self.sink.write(JSON_TRAILER_PREFIX + json.dumps(result.trailer()).encode('utf-8') + b'}',
+                            hashed=False)
+
+        def render_header() -> bytes:
+            result.file_size = self.sink.file_size
+            return header(result)
+
+        self.sink.commit(render_header if header is not None else None)
+        result.file_size = self.sink.file_size
+        result.frames = self.sink.frames
+        return result
+
+    def _write_record(self, record: Tuple) -> None:
+        encoded = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+        self.largest_section = max(self.largest_section, len(encoded))
+        self.sink.write(encoded)
+
+    def _write_json_key(self, key: str, top_level: bool) -> None:
+        first = not self.sections if top_level else not self._mapping_entries
+        self.sink.write((b'' if first else b', ') + json.dumps(key).encode('utf-8') + b': ')
+
+    def _write_json_member(self, key: str, value: Any, top_level: bool) -> None:
+        self._write_json_key(key, top_level)
+        encoded = json.dumps(value, indent=self.indent, default=str).encode('utf-8')
+        self.largest_section = max(self.largest_section, len(encoded))
+        self.sink.write(encoded)
+
+
+def decode_save_payload(data: bytes) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """
+    Decode an uncompressed save payload into its dictionary and trailer.
+
+    Streamed saves have their trailer checksum verified and removed; legacy
+    whole-document JSON and pickle saves are returned with no trailer.
+    Raises ``SaveIntegrityError`` on a checksum mismatch and ``ValueError``
+    for data in no known format.
+    """
+    if data[:1] == b'{':
+        save_dict = json.loads(data.decode('utf-8'))
+        trailer = save_dict.pop('trailer', None) if isinstance(save_dict, dict) else None
+        if trailer is not None:
+            _verify(data[:data.rfind(JSON_TRAILER_PREFIX)], trailer)
+        return save_dict, trailer
+
+    try:
+        stream = io.BytesIO(data)
+        first = pickle.load(stream)
+    except Exception:
+        raise ValueError("Invalid save file format")
+    if isinstance(first, dict):
+        return first, None
+
+    save_dict: Dict[str, Any] = {}
+    record, offset = first, 0
+    while True:
+        kind = record[0]
+        if kind == TRAILER_RECORD:
+            trailer = record[1]
+            _verify(data[:offset], trailer)
+            return save_dict, trailer
+        if kind == SECTION_RECORD:
+            save_dict[record[1]] = record[2]
+        elif kind == ENTRY_RECORD:
+            save_dict[record[1]][record[2]] = record[3]
+        offset = stream.tell()
+        try:
+            record = pickle.load(stream)
+        except EOFError:
+            raise SaveIntegrityError("Save file is truncated: trailer missing")
+
+
+def _verify(payload: bytes, trailer: Dict[str, Any]) -> None:
+    algorithm = trailer.get('algorithm', CHECKSUM_ALGORITHM)
+    actual = hashlib.new(algorithm, payload).hexdigest()
+    if actual != trailer.get('checksum'):
+        raise SaveIntegrityError(f"Save file checksum mismatch: expected {trailer.get('checksum')}, got {actual}")
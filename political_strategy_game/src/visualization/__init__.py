@@ -20,6 +20,8 @@ from .timeline import EventTimelineVisualization
 from .dashboard import PoliticalDashboard
 from .memory_browser import MemoryBrowserVisualization
 from .integrated_manager import IntegratedVisualizationManager, create_political_visualization_system
+from .serving import VisualizationPublisher, VisualizationHTTPServer, diff_documents, apply_delta
+from .update_bus import UpdateBus
 
 
 class VisualizationType(Enum):
@@ -47,5 +49,8 @@ __all__ = [
     'PoliticalDashboard', 'MemoryBrowserVisualization',
     
     # Integrated system
-    'IntegratedVisualizationManager', 'create_political_visualization_system'
+    'IntegratedVisualizationManager', 'create_political_visualization_system', 'UpdateBus',
+    
+    # Serving
+    'VisualizationPublisher', 'VisualizationHTTPServer', 'diff_documents', 'apply_delta'
 ]
@@ -180,11 +180,13 @@ class DataFormatter:
 class RealTimeDataProvider:
     """Provides real-time data updates to visualization components."""
     
-    def __init__(self):
+    def __init__(self, batch_interval: float = 0.1):
         self.is_active = False
         self.subscribers: Dict[str, List[Callable]] = {}
         self.data_buffer: List[DataPoint] = []
         self.update_task: Optional[asyncio.Task] = None
+        self.batch_interval = batch_interval  # Minimum spacing between batched deliveries
+        self._data_ready = asyncio.Event()
     
     async def initialize(self):
         """Initialize the data provider."""
@@ -194,6 +196,7 @@ class RealTimeDataProvider:
     async def stop(self):
         """Stop the data provider."""
         self.is_active = False
+        self._data_ready.set()
         if self.update_task:
             self.update_task.cancel()
     
@@ -206,6 +209,7 @@ class RealTimeDataProvider:
     async def publish_data(self, data_point: DataPoint):
         """Publish a data point to subscribers."""
         self.data_buffer.append(data_point)
+        self._data_ready.set()
         
         # Notify subscribers immediately for real-time data
         if data_point.data_type in self.subscribers:
@@ -219,9 +223,19 @@ class RealTimeDataProvider:
                     print(f"Error notifying data subscriber: {e}")
     
     async def _update_loop(self):
-        """Background update loop for periodic data processing."""
+        """
+        Background loop delivering buffered data in batches.
+        
+        The loop sleeps until data is published instead of polling, then waits
+        out the rest of ``batch_interval`` so points published in a burst are
+        grouped into one delivery per data type.
+        """
         while self.is_active:
             try:
+                await self._data_ready.wait()
+                self._data_ready.clear()
+                await asyncio.sleep(self.batch_interval)
+                
                 # Process buffered data
                 if self.data_buffer:
                     # Group by data type and send batched updates
@@ -246,8 +260,6 @@ class RealTimeDataProvider:
                                 except Exception as e:
                                     print(f"Error in batch update: {e}")
                 
-                await asyncio.sleep(0.1)  # 100ms update cycle
-                
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -6,7 +6,7 @@ key metrics, trends, and real-time political status information.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Set, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
@@ -16,6 +16,7 @@ from .base import (
     VisualizationComponent, VisualizationConfig, VisualizationUpdate,
     DataPoint, UpdateType, DataFormatter
 )
+from .timeseries import TimeSeriesStore
 
 
 class MetricType(Enum):
@@ -86,16 +87,22 @@ class PoliticalDashboard(VisualizationComponent):
         self.grid_columns = config.layout_options.get('columns', 4)
         self.grid_rows = config.layout_options.get('rows', 6)
         self.widget_padding = config.layout_options.get('padding', 10)
+        self.column_width = config.layout_options.get('column_width', 300)  # pixels
         
         # Metrics storage
         self.metrics: Dict[MetricType, List[MetricValue]] = {}
         self.current_values: Dict[MetricType, MetricValue] = {}
-        self.historical_data: Dict[MetricType, List[Tuple[datetime, float]]] = {}
+        self.time_series = TimeSeriesStore(
+            raw_capacity=config.layout_options.get('history_raw_capacity', 4096),
+            minute_capacity=config.layout_options.get('history_minute_capacity', 1440),
+            hour_capacity=config.layout_options.get('history_hour_capacity', 24 * 7)
+        )
         
         # Widgets
         self.widgets: Dict[str, DashboardWidget] = {}
         self.auto_refresh = config.layout_options.get('auto_refresh', True)
         self.refresh_interval = config.layout_options.get('refresh_interval', 5.0)  # seconds
+        self._dirty_metrics: Set[MetricType] = set()  # Metrics stored since widgets last refreshed
         
         # Alerting
         self.alert_thresholds: Dict[MetricType, Dict[str, float]] = {}
@@ -331,7 +338,7 @@ class PoliticalDashboard(VisualizationComponent):
             # Initialize metric storage
             for metric_type in MetricType:
                 self.metrics[metric_type] = []
-                self.historical_data[metric_type] = []
+                self.time_series.ensure(metric_type)
             
             self.is_active = True
             
@@ -356,8 +363,9 @@ class PoliticalDashboard(VisualizationComponent):
             
             self.last_update = update.timestamp
             
-            # Update widgets with new data
-            await self._update_widgets()
+            # Update only the widgets whose metrics changed
+            dirty, self._dirty_metrics = self._dirty_metrics, set()
+            await self._update_widgets(dirty)
             
             # Check for alerts
             await self._check_alerts()
@@ -466,12 +474,8 @@ class PoliticalDashboard(VisualizationComponent):
         current_time = datetime.now()
         hour_ago = current_time - timedelta(hours=1)
         
-        if MetricType.CRISIS_FREQUENCY in self.historical_data:
-            recent_crises = [
-                count for timestamp, count in self.historical_data[MetricType.CRISIS_FREQUENCY]
-                if timestamp >= hour_ago
-            ]
-            crisis_count = len(recent_crises)
+        if MetricType.CRISIS_FREQUENCY in self.time_series:
+            crisis_count = self.time_series.count(MetricType.CRISIS_FREQUENCY, hour_ago)
         else:
             crisis_count = 1  # Current crisis
         
@@ -509,24 +513,20 @@ class PoliticalDashboard(VisualizationComponent):
         
         # Store current value
         self.current_values[metric_type] = metric_value
+        self._dirty_metrics.add(metric_type)
         
-        # Add to historical data
-        if metric_type not in self.historical_data:
-            self.historical_data[metric_type] = []
-        
+        # Add to historical data; ring buffers bound retention per resolution
         if isinstance(value, (int, float)):
-            self.historical_data[metric_type].append((timestamp, value))
-            
-            # Keep only recent data (last 7 days)
-            week_ago = timestamp - timedelta(days=7)
-            self.historical_data[metric_type] = [
-                (ts, val) for ts, val in self.historical_data[metric_type]
-                if ts >= week_ago
-            ]
-    
-    async def _update_widgets(self):
-        """Update all widgets with current data."""
+            self.time_series.append(metric_type, timestamp, value)
+    
+    async def _update_widgets(self, metrics: Optional[Set[MetricType]] = None,
+                              widget_types: Optional[Set[WidgetType]] = None):
+        """Update widgets with current data, optionally only for the given metrics or widget types."""
         for widget in self.widgets.values():
+            if metrics is not None and widget.metric_type not in metrics:
+                continue
+            if widget_types is not None and widget.widget_type not in widget_types:
+                continue
             await self._update_widget(widget)
     
     async def _update_widget(self, widget: DashboardWidget):
@@ -547,7 +547,8 @@ class PoliticalDashboard(VisualizationComponent):
         
         elif widget.widget_type == WidgetType.LINE_CHART:
             time_window = widget.config.get('time_window', '24h')
-            historical_data = self._get_historical_data(metric_type, time_window)
+            historical_data = self._get_historical_data(metric_type, time_window,
+                                                        self._chart_pixel_width(widget))
             widget.data = {
                 'series': [{'name': widget.title, 'data': historical_data}],
                 'current_value': current_value.value
@@ -596,9 +597,21 @@ class PoliticalDashboard(VisualizationComponent):
         
         widget.last_update = current_value.timestamp
     
-    def _get_historical_data(self, metric_type: MetricType, time_window: str) -> List[Tuple[str, float]]:
-        """Get historical data for a specific time window."""
-        if metric_type not in self.historical_data:
+    def _chart_pixel_width(self, widget: DashboardWidget) -> int:
+        """Horizontal pixels available to a chart widget."""
+        if 'pixel_width' in widget.config:
+            return max(1, int(widget.config['pixel_width']))
+        return max(1, widget.size[0] * self.column_width - 2 * self.widget_padding)
+    
+    def _get_historical_data(self, metric_type: MetricType, time_window: str,
+                             max_points: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get historical data for a specific time window.
+        
+        Points are downsampled to at most ``max_points`` min/max/mean buckets
+        and reused from cache until the metric records a new value.
+        """
+        if metric_type not in self.time_series:
             return []
         
         # Parse time window
@@ -612,14 +625,7 @@ class PoliticalDashboard(VisualizationComponent):
         else:
             start_time = now - timedelta(hours=24)  # Default to 24h
         
-        # Filter and format data
-        filtered_data = [
-            (timestamp.isoformat(), value)
-            for timestamp, value in self.historical_data[metric_type]
-            if timestamp >= start_time
-        ]
-        
-        return filtered_data
+        return self.time_series.chart_points(metric_type, start_time, now, max_points)
     
     def _format_value(self, value: Any, config: Dict[str, Any]) -> str:
         """Format a value for display."""
@@ -694,7 +700,8 @@ class PoliticalDashboard(VisualizationComponent):
         while self.is_active and self.auto_refresh:
             try:
                 await asyncio.sleep(self.refresh_interval)
-                await self._update_widgets()
+                # Data-driven widgets refresh on update; only time windows move on their own
+                await self._update_widgets(widget_types={WidgetType.LINE_CHART})
                 
                 # Notify subscribers of refresh
                 await self.notify_subscribers({
@@ -862,9 +869,9 @@ class PoliticalDashboard(VisualizationComponent):
             'historical_data': {
                 metric_type.value: [
                     {'timestamp': ts.isoformat(), 'value': val}
-                    for ts, val in data
+                    for ts, val in self.time_series.export(metric_type)
                 ]
-                for metric_type, data in self.historical_data.items()
+                for metric_type in self.time_series.series
             },
             'active_alerts': self.active_alerts
         }
@@ -18,6 +18,7 @@ from .network_graph import AdvisorNetworkVisualization
 from .timeline import EventTimelineVisualization
 from .dashboard import PoliticalDashboard
 from .memory_browser import MemoryBrowserVisualization
+from .update_bus import UpdateBus
 
 
 class IntegratedVisualizationManager:
@@ -53,6 +54,13 @@ class IntegratedVisualizationManager:
         # Integration status
         self.is_initialized = False
         self.active_components = set()
+        
+        # Bumped whenever a component may render differently; lets caches skip re-rendering
+        self.component_versions: Dict[str, int] = {}
+        
+        # Optional coalescing delivery; updates go straight to components without it
+        self.update_bus: Optional[UpdateBus] = None
+        self._update_bus_task: Optional[asyncio.Task] = None
     
     async def initialize(self, game_interface: Any = None) -> bool:
         """
@@ -130,6 +138,7 @@ class IntegratedVisualizationManager:
             if await component.initialize():
                 self.components[component_id] = component
                 self.active_components.add(component_id)
+                self.component_versions[component_id] = 1
                 
                 # Subscribe component to relevant data
                 await self._setup_component_subscriptions(component_id, component_type)
@@ -165,6 +174,9 @@ class IntegratedVisualizationManager:
             # Remove from registry
             del self.components[component_id]
             self.active_components.discard(component_id)
+            self.component_versions.pop(component_id, None)
+            if self.update_bus is not None:
+                self.update_bus.discard(component_id)
             
             # Remove data subscriptions
             for data_type, subscribers in self.data_subscriptions.items():
@@ -215,9 +227,15 @@ class IntegratedVisualizationManager:
                             source="integrated_manager"
                         )
                         
+                        if self.update_bus is not None:
+                            self.update_bus.submit(component_id, update)
+                            results[component_id] = True
+                            continue
+                        
                         try:
                             success = await component.update(update)
                             results[component_id] = success
+                            self._touch_component(component_id)
                         except Exception as e:
                             print(f"Error updating component {component_id}: {e}")
                             results[component_id] = False
@@ -250,9 +268,13 @@ class IntegratedVisualizationManager:
         )
         
         for component_id in self.active_components:
+            if self.update_bus is not None:
+                self.update_bus.submit(component_id, update)
+                continue
             component = self.components[component_id]
             try:
                 await component.update(update)
+                self._touch_component(component_id)
             except Exception as e:
                 print(f"Error broadcasting event to {component_id}: {e}")
     
@@ -276,6 +298,59 @@ class IntegratedVisualizationManager:
             print(f"Error getting state for component {component_id}: {e}")
             return None
     
+    async def enable_update_bus(self, frame_budget: float = 0.008, frame_interval: float = 1 / 30,
+                                start: bool = True) -> UpdateBus:
+        """
+        Route component updates through a coalescing, frame-budgeted update bus.
+        
+        Args:
+            frame_budget: Seconds of update work allowed per frame
+            frame_interval: Seconds between frames
+            start: Whether to start the background frame loop; without it,
+                pending updates are delivered by ``flush_updates``
+            
+        Returns:
+            The update bus
+        """
+        if self.update_bus is None:
+            self.update_bus = UpdateBus(self._deliver_update, frame_budget, frame_interval)
+        if start and self._update_bus_task is None:
+            self._update_bus_task = asyncio.create_task(self.update_bus.run())
+        return self.update_bus
+    
+    async def flush_updates(self) -> int:
+        """Deliver every pending bus update now; returns the number of frames run."""
+        if self.update_bus is None:
+            return 0
+        return await self.update_bus.flush()
+    
+    async def _deliver_update(self, component_id: str, update: VisualizationUpdate) -> bool:
+        component = self.components.get(component_id)
+        if component is None or component_id not in self.active_components:
+            return False
+        success = await component.update(update)
+        self._touch_component(component_id)
+        return success
+    
+    def get_component_version(self, component_id: str) -> Optional[int]:
+        """
+        Get the version counter of a component.
+        
+        The counter increases after every update, broadcast event and interaction
+        delivered to the component, so a render cached at one version stays valid
+        until the counter moves.
+        
+        Args:
+            component_id: ID of component to query
+            
+        Returns:
+            Current version or None if component not found
+        """
+        return self.component_versions.get(component_id)
+    
+    def _touch_component(self, component_id: str) -> None:
+        self.component_versions[component_id] = self.component_versions.get(component_id, 0) + 1
+    
     async def get_all_component_states(self) -> Dict[str, Any]:
         """
         Get current states of all active components.
@@ -310,6 +385,7 @@ class IntegratedVisualizationManager:
         try:
             component = self.components[component_id]
             result = await component.handle_interaction(interaction)
+            self._touch_component(component_id)
             
             # Check if interaction affects other components
             await self._handle_cross_component_effects(component_id, interaction, result)
@@ -603,13 +679,21 @@ class IntegratedVisualizationManager:
             'data_subscriptions': len(self.data_subscriptions),
             'shared_data_types': len(self.shared_data),
             'has_data_provider': self.data_provider is not None,
-            'has_base_manager': self.base_manager is not None
+            'has_base_manager': self.base_manager is not None,
+            'update_bus': self.update_bus.get_statistics() if self.update_bus is not None else None
         }
     
     async def shutdown(self) -> None:
         """Shutdown the visualization manager and all components."""
         print("Shutting down integrated visualization manager...")
         
+        # Stop frame delivery before components go away
+        if self.update_bus is not None:
+            self.update_bus.stop()
+        if self._update_bus_task is not None:
+            self._update_bus_task.cancel()
+            self._update_bus_task = None
+        
         # Stop all components
         for component_id in list(self.active_components):
             await self.remove_component(component_id)
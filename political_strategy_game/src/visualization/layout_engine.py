@@ -0,0 +1,289 @@
+"""
+Vectorized Force-Directed Layout Engine
+
+This module implements the force simulation behind the advisor relationship
+network. Repulsion is computed with NumPy, exactly for small graphs and with a
+Barnes-Hut quadtree approximation for large ones. Layouts can be warm-started
+from previous positions and bounded by an iteration and time budget.
+"""
+
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+
+@dataclass
+class LayoutStatistics:
+    """Summary of the most recent layout run."""
+    nodes: int = 0
+    links: int = 0
+    method: str = "exact"
+    iterations: int = 0
+    converged: bool = False
+    warm_started: int = 0
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": self.nodes,
+            "links": self.links,
+            "method": self.method,
+            "iterations": self.iterations,
+            "converged": self.converged,
+            "warm_started": self.warm_started,
+            "elapsed_ms": self.elapsed_ms
+        }
+
+
+def seed_position(node_id: str, width: float, height: float,
+                  spread: float = 100) -> Tuple[float, float]:
+    """Deterministic initial position for a node within ``spread`` of the canvas centre."""
+    digest = zlib.crc32(str(node_id).encode("utf-8"))
+    return (width * 0.5 + (0.5 - digest % 100 / 100.0) * spread,
+            height * 0.5 + (0.5 - (digest >> 8) % 79 / 79.0) * spread)
+
+
+class ForceLayoutEngine:
+    """
+    Force-directed layout with vectorized exact or Barnes-Hut repulsion.
+
+    Graphs with more than ``barnes_hut_threshold`` nodes use the quadtree
+    approximation; lower ``theta`` values are more accurate but slower. Each
+    node's step is capped by a temperature that cools every iteration; warm
+    starts begin cooler in proportion to how many nodes already had positions.
+    """
+
+    def __init__(self, repulsion_strength: float = 1000, attraction_strength: float = 0.1,
+                 damping: float = 0.9, min_distance: float = 30, margin: float = 50,
+                 theta: float = 0.7, barnes_hut_threshold: int = 500,
+                 tolerance: float = 0.5, cooling: float = 0.9):
+        self.repulsion_strength = repulsion_strength
+        self.attraction_strength = attraction_strength
+        self.damping = damping
+        self.min_distance = min_distance
+        self.margin = margin
+        self.theta = theta
+        self.barnes_hut_threshold = barnes_hut_threshold
+        self.tolerance = tolerance
+        self.cooling = cooling
+        self.statistics = LayoutStatistics()
+
+    def layout(self, nodes: List[Dict], links: List[Dict], width: int = 800, height: int = 600,
+               iterations: int = 100, time_budget: Optional[float] = None,
+               initial_positions: Optional[Dict[str, Dict[str, float]]] = None
+               ) -> Dict[str, Dict[str, float]]:
+        """
+        Run the force simulation and return node positions.
+
+        Args:
+            nodes: List of node data dictionaries
+            links: List of link/edge data dictionaries
+            width: Canvas width for positioning
+            height: Canvas height for positioning
+            iterations: Maximum number of simulation iterations
+            time_budget: Optional wall-clock budget in seconds
+            initial_positions: Previous positions to warm-start from
+
+        Returns:
+            Dictionary mapping node IDs to {x, y} positions
+        """
+        start = time.perf_counter()
+        node_ids = [node['id'] for node in nodes]
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        sources, targets, strengths = self._link_arrays(links, index)
+        positions, warm = self._initial_positions(node_ids, index, sources, targets,
+                                                  width, height, initial_positions)
+
+        use_barnes_hut = len(node_ids) > self.barnes_hut_threshold
+        self.statistics = LayoutStatistics(
+            nodes=len(node_ids), links=len(sources),
+            method="barnes_hut" if use_barnes_hut else "exact",
+            warm_started=warm
+        )
+        if not node_ids:
+            return {}
+
+        low = np.array([self.margin, self.margin], dtype=np.float64)
+        high = np.array([width - self.margin, height - self.margin], dtype=np.float64)
+        velocities = np.zeros_like(positions)
+        cold_fraction = 1.0 - warm / len(node_ids)
+        temperature = max(width, height) * 0.1 * cold_fraction + 2 * self.tolerance
+
+        for iteration in range(iterations):
+            if use_barnes_hut:
+                forces = self._barnes_hut_repulsion(positions)
+            else:
+                forces = self._exact_repulsion(positions)
+            forces += self._attraction(positions, sources, targets, strengths)
+
+            velocities = (velocities + forces) * self.damping
+            speed = np.sqrt((velocities ** 2).sum(axis=1))
+            velocities *= np.minimum(1.0, temperature / np.maximum(speed, 1e-12))[:, None]
+            temperature *= self.cooling
+            updated = np.clip(positions + velocities, low, high)
+            displacement = np.abs(updated - positions).max()
+            positions = updated
+            self.statistics.iterations = iteration + 1
+
+            if displacement < self.tolerance:
+                self.statistics.converged = True
+                break
+            if time_budget is not None and time.perf_counter() - start >= time_budget:
+                break
+
+        self.statistics.elapsed_ms = (time.perf_counter() - start) * 1000
+        return {
+            node_id: {'x': float(positions[i, 0]), 'y': float(positions[i, 1])}
+            for i, node_id in enumerate(node_ids)
+        }
+
+    def _link_arrays(self, links: List[Dict], index: Dict[str, int]
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        sources, targets, strengths = [], [], []
+        for link in links:
+            source = index.get(link['source'])
+            target = index.get(link['target'])
+            if source is not None and target is not None:
+                sources.append(source)
+                targets.append(target)
+                strengths.append(link.get('strength', 0.5))
+        return (np.array(sources, dtype=np.int64), np.array(targets, dtype=np.int64),
+                np.array(strengths, dtype=np.float64))
+
+    def _initial_positions(self, node_ids: List[str], index: Dict[str, int],
+                           sources: np.ndarray, targets: np.ndarray, width: int, height: int,
+                           initial_positions: Optional[Dict[str, Dict[str, float]]]
+                           ) -> Tuple[np.ndarray, int]:
+        positions = np.empty((len(node_ids), 2), dtype=np.float64)
+        known = np.zeros(len(node_ids), dtype=bool)
+        initial_positions = initial_positions or {}
+        # Large graphs start spread out enough that nodes are not stacked on top of each other
+        spread = min(max(100.0, self.min_distance * np.sqrt(len(node_ids)) / 2),
+                     max(min(width, height) - 2 * self.margin, 100.0))
+
+        for i, node_id in enumerate(node_ids):
+            previous = initial_positions.get(node_id)
+            if previous is not None:
+                positions[i] = (previous['x'], previous['y'])
+                known[i] = True
+            else:
+                positions[i] = seed_position(node_id, width, height, spread)
+
+        # Place new nodes next to already positioned neighbours
+        warm = int(known.sum())
+        if 0 < warm < len(node_ids) and len(sources):
+            ends = np.concatenate([sources, targets])
+            others = np.concatenate([targets, sources])
+            usable = ~known[ends] & known[others]
+            if usable.any():
+                totals = np.zeros_like(positions)
+                counts = np.bincount(ends[usable], minlength=len(node_ids))
+                np.add.at(totals, ends[usable], positions[others[usable]])
+                placed = counts > 0
+                jitter = (positions[placed] - np.array([width * 0.5, height * 0.5])) / spread
+                positions[placed] = totals[placed] / counts[placed, None] + jitter * self.min_distance
+        return positions, warm
+
+    def _attraction(self, positions: np.ndarray, sources: np.ndarray, targets: np.ndarray,
+                    strengths: np.ndarray) -> np.ndarray:
+        forces = np.zeros_like(positions)
+        if not len(sources):
+            return forces
+        # Spring force proportional to distance along the unit vector is just k * delta
+        pull = (positions[targets] - positions[sources]) * (self.attraction_strength * strengths)[:, None]
+        n = len(positions)
+        for axis in range(2):
+            forces[:, axis] += np.bincount(sources, weights=pull[:, axis], minlength=n)
+            forces[:, axis] -= np.bincount(targets, weights=pull[:, axis], minlength=n)
+        return forces
+
+    def _exact_repulsion(self, positions: np.ndarray, block_size: int = 256) -> np.ndarray:
+        forces = np.empty_like(positions)
+        for start in range(0, len(positions), block_size):
+            block = positions[start:start + block_size]
+            delta = block[:, None, :] - positions[None, :, :]
+            distance = np.maximum(np.sqrt((delta ** 2).sum(axis=2)), self.min_distance)
+            scale = self.repulsion_strength / distance ** 3
+            forces[start:start + block_size] = (delta * scale[:, :, None]).sum(axis=1)
+        return forces
+
+    def _barnes_hut_repulsion(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Approximate repulsion with a quadtree stored as a pyramid of grids.
+
+        Node/cell interaction pairs are expanded level by level: a cell far enough
+        away (size / distance < theta) acts as a single mass at its centre of mass,
+        otherwise its four children are visited at the next level.
+        """
+        n = len(positions)
+        depth = int(min(9, max(2, np.ceil(np.log(n) / np.log(4)) + 1)))
+        origin = positions.min(axis=0)
+        extent = max(float((positions.max(axis=0) - origin).max()), 1e-9) * (1 + 1e-9)
+
+        side = 1 << depth
+        cells = np.minimum(((positions - origin) / extent * side).astype(np.int64), side - 1)
+        flat = cells[:, 1] * side + cells[:, 0]
+        mass = [None] * (depth + 1)
+        moment = [None] * (depth + 1)
+        mass[depth] = np.bincount(flat, minlength=side * side).reshape(side, side).astype(np.float64)
+        moment[depth] = np.stack([
+            np.bincount(flat, weights=positions[:, axis], minlength=side * side).reshape(side, side)
+            for axis in range(2)
+        ], axis=-1)
+        for level in range(depth - 1, 0, -1):
+            size = 1 << level
+            mass[level] = mass[level + 1].reshape(size, 2, size, 2).sum(axis=(1, 3))
+            moment[level] = moment[level + 1].reshape(size, 2, size, 2, 2).sum(axis=(1, 3))
+
+        forces = np.zeros_like(positions)
+        child_x = np.array([0, 1, 0, 1])
+        child_y = np.array([0, 0, 1, 1])
+        body = np.repeat(np.arange(n), 4)
+        cell_x = np.tile(child_x, n)
+        cell_y = np.tile(child_y, n)
+
+        for level in range(1, depth + 1):
+            cell_mass = mass[level][cell_y, cell_x]
+            occupied = cell_mass > 0
+            body, cell_x, cell_y, cell_mass = body[occupied], cell_x[occupied], cell_y[occupied], cell_mass[occupied]
+            centre = moment[level][cell_y, cell_x] / cell_mass[:, None]
+
+            shift = depth - level
+            contains_self = ((cells[body, 0] >> shift) == cell_x) & ((cells[body, 1] >> shift) == cell_y)
+            if level == depth:
+                # Leaf cells holding the body itself act as the remaining mass only
+                remaining = cell_mass - contains_self
+                keep = remaining > 0
+                centre = np.where(contains_self[:, None],
+                                  (centre * cell_mass[:, None] - positions[body]) / np.maximum(remaining, 1)[:, None],
+                                  centre)
+                self._accumulate(forces, positions, body[keep], centre[keep], remaining[keep])
+                break
+
+            delta = positions[body] - centre
+            distance = np.sqrt((delta ** 2).sum(axis=1))
+            cell_size = extent / (1 << level)
+            accept = ~contains_self & (cell_size < self.theta * distance)
+            self._accumulate(forces, positions, body[accept], centre[accept], cell_mass[accept])
+
+            expand = ~accept
+            body = np.repeat(body[expand], 4)
+            cell_x = (np.repeat(cell_x[expand], 4) << 1) + np.tile(child_x, int(expand.sum()))
+            cell_y = (np.repeat(cell_y[expand], 4) << 1) + np.tile(child_y, int(expand.sum()))
+            if not len(body):
+                break
+        return forces
+
+    def _accumulate(self, forces: np.ndarray, positions: np.ndarray, body: np.ndarray,
+                    centre: np.ndarray, cell_mass: np.ndarray):
+        if not len(body):
+            return
+        delta = positions[body] - centre
+        distance = np.maximum(np.sqrt((delta ** 2).sum(axis=1)), self.min_distance)
+        push = delta * (self.repulsion_strength * cell_mass / distance ** 3)[:, None]
+        n = len(positions)
+        for axis in range(2):
+            forces[:, axis] += np.bincount(body, weights=push[:, axis], minlength=n)
@@ -6,11 +6,15 @@ decision history, and political knowledge networks.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, List, Optional, Any, Tuple, Set, Collection
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
+import base64
+import bisect
+import itertools
 import json
+import re
 
 from .base import (
     VisualizationComponent, VisualizationConfig, VisualizationUpdate,
@@ -108,6 +112,193 @@ class MemorySearchFilter:
             self.participants = set()
 
 
+class MemorySearchIndex:
+    """
+    Incremental inverted index over memories.
+    
+    Postings map text tokens, tags, advisors, participants and enum facets to
+    memory IDs, so a filter becomes a handful of set intersections instead of a
+    scan. Each memory also gets precomputed sort keys, and one presorted order
+    per sortable field lets a page be read by walking from a cursor until it is
+    full rather than sorting every match.
+    """
+    
+    IMPORTANCE_RANK = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
+    SORT_FIELDS = ('timestamp', 'importance')
+    TOKEN_PATTERN = re.compile(r"\w+")
+    
+    def __init__(self):
+        self.tokens: Dict[str, Set[str]] = {}
+        self.tags: Dict[str, Set[str]] = {}
+        self.advisors: Dict[str, Set[str]] = {}
+        self.participants: Dict[str, Set[str]] = {}
+        self.facets: Dict[Enum, Set[str]] = {}
+        self.sort_keys: Dict[str, Dict[str, Tuple]] = {field: {} for field in self.SORT_FIELDS}
+        self.orders: Dict[str, List[Tuple]] = {field: [] for field in self.SORT_FIELDS}
+        self._postings: Dict[str, List[Tuple[Dict[Any, Set[str]], Any]]] = {}
+        self._sequence = itertools.count()
+        self._substring_cache: Dict[str, Set[str]] = {}  # fragment -> vocabulary tokens containing it
+    
+    def __len__(self) -> int:
+        return len(self._postings)
+    
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._postings
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        return cls.TOKEN_PATTERN.findall(text.lower())
+    
+    @staticmethod
+    def searchable_text(memory: MemoryEntry) -> str:
+        return f"{memory.title} {memory.content} {' '.join(memory.tags)}".lower()
+    
+    def clear(self):
+        for table in (self.tokens, self.tags, self.advisors, self.participants, self.facets,
+                      self._postings, self._substring_cache):
+            table.clear()
+        for field in self.SORT_FIELDS:
+            self.sort_keys[field].clear()
+            self.orders[field].clear()
+    
+    def rebuild(self, memories: List[MemoryEntry]):
+        self.clear()
+        for memory in memories:
+            self.add(memory)
+    
+    def add(self, memory: MemoryEntry):
+        """Index a memory, replacing any previously indexed version of it."""
+        memory_id = memory.memory_id
+        self.remove(memory_id)
+        
+        postings = [(self.tokens, token) for token in set(self.tokenize(self.searchable_text(memory)))]
+        postings += [(self.tags, tag) for tag in set(memory.tags)]
+        postings += [(self.participants, participant) for participant in set(memory.participants)]
+        postings += [(self.advisors, memory.advisor_id)]
+        postings += [(self.facets, facet) for facet in (memory.memory_type, memory.importance, memory.emotional_tone)]
+        for table, term in postings:
+            if table is self.tokens and term not in self.tokens:
+                self._substring_cache.clear()
+            table.setdefault(term, set()).add(memory_id)
+        self._postings[memory_id] = postings
+        
+        sequence = next(self._sequence)
+        timestamp = memory.timestamp.timestamp()
+        keys = {
+            'timestamp': (timestamp, sequence, memory_id),
+            'importance': (self.IMPORTANCE_RANK.get(memory.importance.value, 0), timestamp, sequence, memory_id)
+        }
+        for field, key in keys.items():
+            self.sort_keys[field][memory_id] = key
+            bisect.insort(self.orders[field], key)
+    
+    def remove(self, memory_id: str):
+        postings = self._postings.pop(memory_id, None)
+        if postings is None:
+            return
+        for table, term in postings:
+            members = table.get(term)
+            if members is None:
+                continue
+            members.discard(memory_id)
+            if not members:
+                del table[term]
+                if table is self.tokens:
+                    self._substring_cache.clear()
+        for field in self.SORT_FIELDS:
+            key = self.sort_keys[field].pop(memory_id)
+            order = self.orders[field]
+            del order[bisect.bisect_left(order, key)]
+    
+    def search(self, search_filter: MemorySearchFilter, memories: Dict[str, MemoryEntry]) -> Collection[str]:
+        """Return the IDs of memories matching ``search_filter``."""
+        selections: List[Collection[str]] = []
+        
+        for table, wanted in ((self.advisors, search_filter.advisor_ids),
+                              (self.tags, search_filter.tags),
+                              (self.participants, search_filter.participants)):
+            if wanted:
+                selections.append(self._union(table, wanted))
+        for enum_type, wanted in ((MemoryType, search_filter.memory_types),
+                                  (MemoryImportance, search_filter.importance_levels),
+                                  (MemoryEmotion, search_filter.emotional_tones)):
+            if len(wanted) < len(enum_type):
+                selections.append(self._union(self.facets, wanted))
+        
+        if search_filter.date_range:
+            start_date, end_date = search_filter.date_range
+            order = self.orders['timestamp']
+            low = bisect.bisect_left(order, (start_date.timestamp(),))
+            high = bisect.bisect_right(order, (end_date.timestamp(), float('inf')))
+            selections.append({key[-1] for key in order[low:high]})
+        
+        search_text = search_filter.search_text.lower() if search_filter.search_text else ""
+        for token in set(self.tokenize(search_text)):
+            selections.append(self._containing(token))
+        
+        if not selections:
+            matches: Collection[str] = memories.keys()
+        else:
+            selections.sort(key=len)
+            matches = set(selections[0])
+            for selection in selections[1:]:
+                if not matches:
+                    break
+                matches &= selection
+        
+        if search_text and not self.TOKEN_PATTERN.fullmatch(search_text):
+            # Tokens only narrow phrase candidates; the phrase must still appear verbatim
+            matches = {
+                memory_id for memory_id in matches
+                if search_text in self.searchable_text(memories[memory_id])
+            }
+        return matches
+    
+    def page(self, matches: Collection[str], sort_by: str, descending: bool,
+             after: Optional[Tuple] = None, limit: Optional[int] = None) -> List[Tuple]:
+        """
+        Return up to ``limit`` sort keys of matching memories following ``after``.
+        
+        Broad result sets walk the presorted order and stop once the page is
+        full; small ones are sorted directly from their precomputed keys.
+        """
+        keys = self.sort_keys[sort_by]
+        order = self.orders[sort_by]
+        if len(matches) * 8 < len(order):
+            return self.walk(sorted(keys[memory_id] for memory_id in matches), descending, after, limit)
+        return self.walk(order, descending, after, limit,
+                         matches if len(matches) < len(order) else None)
+    
+    @staticmethod
+    def walk(order: List[Tuple], descending: bool, after: Optional[Tuple] = None,
+             limit: Optional[int] = None, matches: Optional[Collection[str]] = None) -> List[Tuple]:
+        """Read keys from a sorted order starting just past ``after``."""
+        if descending:
+            end = bisect.bisect_left(order, after) if after is not None else len(order)
+            candidates = (order[i] for i in range(end - 1, -1, -1))
+        else:
+            start = bisect.bisect_right(order, after) if after is not None else 0
+            candidates = (order[i] for i in range(start, len(order)))
+        if matches is not None:
+            candidates = (key for key in candidates if key[-1] in matches)
+        return list(itertools.islice(candidates, limit))
+    
+    def _union(self, table: Dict[Any, Set[str]], terms: Set[Any]) -> Set[str]:
+        postings = [table[term] for term in terms if term in table]
+        if len(postings) == 1:
+            return postings[0]
+        return set().union(*postings)
+    
+    def _containing(self, fragment: str) -> Set[str]:
+        """Memories with a token containing ``fragment``, matching substring search semantics."""
+        # The vocabulary scan is cached until a token is added or dropped
+        matching = self._substring_cache.get(fragment)
+        if matching is None:
+            matching = {token for token in self.tokens if fragment in token}
+            self._substring_cache[fragment] = matching
+        return self._union(self.tokens, matching)
+
+
 class MemoryGraph:
     """Represents relationships between memories."""
     
@@ -115,62 +306,100 @@ class MemoryGraph:
         self.nodes: Dict[str, MemoryEntry] = {}
         self.edges: List[Dict[str, Any]] = []
         self.clusters: Dict[str, List[str]] = {}
+        self.adjacency: Dict[str, List[str]] = {}
+        # Union-find over connected memories, kept current as edges are added
+        self._parent: Dict[str, str] = {}
+        self._members: Dict[str, List[str]] = {}
     
     def add_memory(self, memory: MemoryEntry):
         """Add a memory to the graph."""
         self.nodes[memory.memory_id] = memory
+        self._make_set(memory.memory_id)
         
         # Create edges to related memories
         for related_id in memory.related_memories:
             if related_id in self.nodes:
-                self.edges.append({
-                    'source': memory.memory_id,
-                    'target': related_id,
-                    'type': 'related',
-                    'strength': 0.5
-                })
-    
-    def find_memory_clusters(self) -> Dict[str, List[str]]:
-        """Find clusters of related memories."""
-        clusters = {}
-        visited = set()
-        
-        def dfs(memory_id: str, cluster_id: str):
-            if memory_id in visited:
-                return
-            
-            visited.add(memory_id)
-            if cluster_id not in clusters:
-                clusters[cluster_id] = []
-            clusters[cluster_id].append(memory_id)
-            
-            # Find connected memories
-            for edge in self.edges:
-                if edge['source'] == memory_id and edge['target'] not in visited:
-                    dfs(edge['target'], cluster_id)
-                elif edge['target'] == memory_id and edge['source'] not in visited:
-                    dfs(edge['source'], cluster_id)
-        
-        cluster_counter = 0
-        for memory_id in self.nodes:
-            if memory_id not in visited:
-                dfs(memory_id, f"cluster_{cluster_counter}")
-                cluster_counter += 1
+                self.add_edge(memory.memory_id, related_id)
+    
+    def add_edge(self, source: str, target: str, edge_type: str = 'related', strength: float = 0.5):
+        """Add an edge between two memories and merge their clusters."""
+        self.edges.append({
+            'source': source,
+            'target': target,
+            'type': edge_type,
+            'strength': strength
+        })
+        self.adjacency.setdefault(source, []).append(target)
+        self.adjacency.setdefault(target, []).append(source)
+        self._union(source, target)
+    
+    def remove_memory(self, memory_id: str):
+        """Remove a memory and its edges, splitting its cluster if needed."""
+        self.nodes.pop(memory_id, None)
+        neighbours = self.adjacency.pop(memory_id, [])
+        if neighbours:
+            self.edges = [
+                edge for edge in self.edges
+                if edge['source'] != memory_id and edge['target'] != memory_id
+            ]
+            for neighbour in set(neighbours):
+                remaining = [other for other in self.adjacency.get(neighbour, []) if other != memory_id]
+                if remaining:
+                    self.adjacency[neighbour] = remaining
+                else:
+                    self.adjacency.pop(neighbour, None)
         
+        if memory_id not in self._parent:
+            return
+        # Union-find cannot split, so only the affected cluster is rebuilt
+        members = self._members.pop(self._find(memory_id))
+        for member in members:
+            del self._parent[member]
+        for member in members:
+            if member != memory_id:
+                self._make_set(member)
+        for member in members:
+            for neighbour in self.adjacency.get(member, []):
+                self._union(member, neighbour)
+    
+    def find_memory_clusters(self, min_size: int = 1) -> Dict[str, List[str]]:
+        """Find clusters of related memories with at least ``min_size`` members."""
+        clusters = {
+            f"cluster_{counter}": list(members)
+            for counter, members in enumerate(
+                members for members in self._members.values() if len(members) >= min_size
+            )
+        }
         self.clusters = clusters
         return clusters
     
     def get_memory_connections(self, memory_id: str) -> List[str]:
         """Get all memories connected to a specific memory."""
-        connections = []
-        
-        for edge in self.edges:
-            if edge['source'] == memory_id:
-                connections.append(edge['target'])
-            elif edge['target'] == memory_id:
-                connections.append(edge['source'])
-        
-        return connections
+        return list(self.adjacency.get(memory_id, []))
+    
+    def _make_set(self, memory_id: str):
+        if memory_id not in self._parent:
+            self._parent[memory_id] = memory_id
+            self._members[memory_id] = [memory_id]
+    
+    def _find(self, memory_id: str) -> str:
+        root = memory_id
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[memory_id] != root:
+            self._parent[memory_id], memory_id = root, self._parent[memory_id]
+        return root
+    
+    def _union(self, first: str, second: str):
+        self._make_set(first)
+        self._make_set(second)
+        first, second = self._find(first), self._find(second)
+        if first == second:
+            return
+        if len(self._members[first]) < len(self._members[second]):
+            first, second = second, first
+        self._parent[second] = first
+        self._members[first].extend(self._members.pop(second))
 
 
 class MemoryBrowserVisualization(VisualizationComponent):
@@ -185,13 +414,16 @@ class MemoryBrowserVisualization(VisualizationComponent):
         
         # Search and filtering
         self.search_filter = MemorySearchFilter()
-        self.search_results: List[str] = []
+        self.search_index = MemorySearchIndex()
         self.selected_memories: Set[str] = set()
+        self._matching_ids: Collection[str] = set()
+        self._ordered_results: Optional[List[str]] = None
         
         # Display configuration
         self.view_mode = config.layout_options.get('view_mode', 'list')  # list, graph, timeline
         self.memories_per_page = config.layout_options.get('page_size', 20)
         self.current_page = 0
+        self.current_cursor: Optional[str] = None  # Opaque position; takes precedence over current_page
         self.sort_by = config.layout_options.get('sort_by', 'timestamp')  # timestamp, importance, relevance
         self.sort_order = config.layout_options.get('sort_order', 'desc')  # asc, desc
         
@@ -259,7 +491,8 @@ class MemoryBrowserVisualization(VisualizationComponent):
         # Replace all memories
         self.memories = new_memories
         
-        # Rebuild memory graph
+        # Rebuild search index and memory graph
+        self.search_index.rebuild(list(self.memories.values()))
         self.memory_graph = MemoryGraph()
         for memory in self.memories.values():
             self.memory_graph.add_memory(memory)
@@ -313,6 +546,7 @@ class MemoryBrowserVisualization(VisualizationComponent):
         """Add new memory to browser."""
         memory = self._create_memory_entry(memory_data)
         self.memories[memory.memory_id] = memory
+        self.search_index.add(memory)
         self.memory_graph.add_memory(memory)
     
     async def _update_memory(self, memory_data: Dict[str, Any]):
@@ -336,7 +570,8 @@ class MemoryBrowserVisualization(VisualizationComponent):
             if 'metadata' in memory_data:
                 memory.metadata.update(memory_data['metadata'])
             
-            # Update graph
+            # Update index and graph
+            self.search_index.add(memory)
             self.memory_graph.add_memory(memory)
     
     async def _remove_memory(self, memory_id: str):
@@ -344,15 +579,9 @@ class MemoryBrowserVisualization(VisualizationComponent):
         if memory_id in self.memories:
             del self.memories[memory_id]
             
-            # Remove from graph
-            if memory_id in self.memory_graph.nodes:
-                del self.memory_graph.nodes[memory_id]
-                
-                # Remove related edges
-                self.memory_graph.edges = [
-                    edge for edge in self.memory_graph.edges
-                    if edge['source'] != memory_id and edge['target'] != memory_id
-                ]
+            # Remove from index and graph
+            self.search_index.remove(memory_id)
+            self.memory_graph.remove_memory(memory_id)
             
             # Remove from selection
             self.selected_memories.discard(memory_id)
@@ -365,12 +594,7 @@ class MemoryBrowserVisualization(VisualizationComponent):
         strength = relationship_data.get('strength', 0.5)
         
         # Add edge to graph
-        self.memory_graph.edges.append({
-            'source': source_id,
-            'target': target_id,
-            'type': relationship_type,
-            'strength': strength
-        })
+        self.memory_graph.add_edge(source_id, target_id, relationship_type, strength)
         
         # Update related memories lists
         if source_id in self.memories and target_id not in self.memories[source_id].related_memories:
@@ -399,59 +623,50 @@ class MemoryBrowserVisualization(VisualizationComponent):
     
     async def _refresh_search_results(self):
         """Refresh search results based on current filter."""
-        self.search_results = self._apply_search_filter()
+        self._matching_ids = self.search_index.search(self.search_filter, self.memories)
+        self._ordered_results = None
+    
+    @property
+    def search_results(self) -> List[str]:
+        """All matching memory IDs in sort order, materialized on first use."""
+        if self._ordered_results is None:
+            self._ordered_results = [key[-1] for key in self._sorted_keys(self._matching_ids)]
+        return self._ordered_results
     
     def _apply_search_filter(self) -> List[str]:
         """Apply current search filter and return matching memory IDs."""
-        results = []
-        
-        for memory_id, memory in self.memories.items():
-            # Check advisor filter
-            if self.search_filter.advisor_ids and memory.advisor_id not in self.search_filter.advisor_ids:
-                continue
-            
-            # Check memory type filter
-            if memory.memory_type not in self.search_filter.memory_types:
-                continue
-            
-            # Check importance filter
-            if memory.importance not in self.search_filter.importance_levels:
-                continue
-            
-            # Check emotional tone filter
-            if memory.emotional_tone not in self.search_filter.emotional_tones:
-                continue
-            
-            # Check tags filter
-            if self.search_filter.tags:
-                if not any(tag in memory.tags for tag in self.search_filter.tags):
-                    continue
-            
-            # Check participants filter
-            if self.search_filter.participants:
-                if not any(participant in memory.participants for participant in self.search_filter.participants):
-                    continue
-            
-            # Check date range filter
-            if self.search_filter.date_range:
-                start_date, end_date = self.search_filter.date_range
-                if not (start_date <= memory.timestamp <= end_date):
-                    continue
-            
-            # Check text search
-            if self.search_filter.search_text:
-                search_text = self.search_filter.search_text.lower()
-                searchable_text = f"{memory.title} {memory.content} {' '.join(memory.tags)}".lower()
-                if search_text not in searchable_text:
-                    continue
-            
-            results.append(memory_id)
-        
-        # Sort results
-        results.sort(key=lambda mid: self._get_sort_value(self.memories[mid]), 
-                    reverse=(self.sort_order == 'desc'))
+        matches = self.search_index.search(self.search_filter, self.memories)
+        return [key[-1] for key in self._sorted_keys(matches)]
+    
+    def _sorted_keys(self, matches: Collection[str], after: Optional[Tuple] = None,
+                     limit: Optional[int] = None) -> List[Tuple]:
+        """Sort keys of matching memories in display order, starting after ``after``."""
+        descending = self.sort_order == 'desc'
+        if self.sort_by == 'relevance':
+            # Relevance depends on the search text, so it is scored per query
+            timestamps = self.search_index.sort_keys['timestamp']
+            order = sorted(
+                (self._get_sort_value(self.memories[memory_id]),) + timestamps[memory_id]
+                for memory_id in matches
+            )
+            return MemorySearchIndex.walk(order, descending, after, limit)
         
-        return results
+        sort_by = self.sort_by if self.sort_by in MemorySearchIndex.SORT_FIELDS else 'timestamp'
+        return self.search_index.page(matches, sort_by, descending, after, limit)
+    
+    def _encode_cursor(self, key: Tuple) -> str:
+        payload = json.dumps([self.sort_by, self.sort_order, list(key)])
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+    
+    def _decode_cursor(self, cursor: str) -> Optional[Tuple]:
+        """Return the sort key a cursor points at, or None if it is invalid for the current sort."""
+        try:
+            sort_by, sort_order, key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        except (ValueError, TypeError, UnicodeError):
+            return None
+        if sort_by != self.sort_by or sort_order != self.sort_order or not isinstance(key, list):
+            return None
+        return tuple(key)
     
     def _get_sort_value(self, memory: MemoryEntry) -> Any:
         """Get sort value for a memory based on current sort criteria."""
@@ -482,11 +697,15 @@ class MemoryBrowserVisualization(VisualizationComponent):
         
         return memory.timestamp
     
-    def _get_paginated_results(self) -> List[str]:
-        """Get current page of search results."""
-        start_index = self.current_page * self.memories_per_page
-        end_index = start_index + self.memories_per_page
-        return self.search_results[start_index:end_index]
+    def _get_paginated_results(self) -> Tuple[List[str], Optional[str]]:
+        """Get current page of search results and the cursor for the next page."""
+        after = self._decode_cursor(self.current_cursor) if self.current_cursor else None
+        offset = 0 if after is not None else self.current_page * self.memories_per_page
+        keys = self._sorted_keys(self._matching_ids, after, offset + self.memories_per_page + 1)[offset:]
+        
+        page = keys[:self.memories_per_page]
+        next_cursor = self._encode_cursor(page[-1]) if len(keys) > self.memories_per_page else None
+        return [key[-1] for key in page], next_cursor
     
     async def render(self) -> Dict[str, Any]:
         """Render the current memory browser state."""
@@ -501,7 +720,8 @@ class MemoryBrowserVisualization(VisualizationComponent):
     
     async def _render_list_view(self) -> Dict[str, Any]:
         """Render list view of memories."""
-        paginated_results = self._get_paginated_results()
+        paginated_results, next_cursor = self._get_paginated_results()
+        total_results = len(self._matching_ids)
         
         memories_data = []
         for memory_id in paginated_results:
@@ -518,9 +738,11 @@ class MemoryBrowserVisualization(VisualizationComponent):
                 'memories': memories_data,
                 'pagination': {
                     'current_page': self.current_page,
-                    'total_pages': (len(self.search_results) + self.memories_per_page - 1) // self.memories_per_page,
-                    'total_results': len(self.search_results),
-                    'page_size': self.memories_per_page
+                    'total_pages': (total_results + self.memories_per_page - 1) // self.memories_per_page,
+                    'total_results': total_results,
+                    'page_size': self.memories_per_page,
+                    'cursor': self.current_cursor,
+                    'next_cursor': next_cursor
                 }
             },
             'config': {
@@ -537,7 +759,7 @@ class MemoryBrowserVisualization(VisualizationComponent):
             },
             'metadata': {
                 'total_memories': len(self.memories),
-                'filtered_memories': len(self.search_results),
+                'filtered_memories': total_results,
                 'selected_memories': len(self.selected_memories)
             }
         }
@@ -545,7 +767,7 @@ class MemoryBrowserVisualization(VisualizationComponent):
     async def _render_graph_view(self) -> Dict[str, Any]:
         """Render graph view of memory relationships."""
         # Get filtered memories for graph
-        filtered_memory_ids = set(self.search_results)
+        filtered_memory_ids = self._matching_ids
         
         # Prepare nodes
         nodes = []
@@ -571,7 +793,7 @@ class MemoryBrowserVisualization(VisualizationComponent):
         # Get clusters
         clusters = {}
         if self.show_clusters:
-            all_clusters = self.memory_graph.find_memory_clusters()
+            all_clusters = self.memory_graph.find_memory_clusters(min_size=2)
             for cluster_id, cluster_memory_ids in all_clusters.items():
                 filtered_cluster = [mid for mid in cluster_memory_ids if mid in filtered_memory_ids]
                 if len(filtered_cluster) > 1:
@@ -704,11 +926,12 @@ class MemoryBrowserVisualization(VisualizationComponent):
         
         await self._refresh_search_results()
         self.current_page = 0  # Reset to first page
+        self.current_cursor = None
         
         return {
             'status': 'success',
             'search_text': search_text,
-            'results_count': len(self.search_results),
+            'results_count': len(self._matching_ids),
             'requires_refresh': True
         }
     
@@ -735,10 +958,11 @@ class MemoryBrowserVisualization(VisualizationComponent):
         
         await self._refresh_search_results()
         self.current_page = 0  # Reset to first page
+        self.current_cursor = None
         
         return {
             'status': 'success',
-            'results_count': len(self.search_results),
+            'results_count': len(self._matching_ids),
             'requires_refresh': True
         }
     
@@ -751,6 +975,7 @@ class MemoryBrowserVisualization(VisualizationComponent):
             self.sort_order = interaction['sort_order']
         
         await self._refresh_search_results()
+        self.current_cursor = None
         
         return {
             'status': 'success',
@@ -774,12 +999,23 @@ class MemoryBrowserVisualization(VisualizationComponent):
         return {'status': 'error', 'message': 'Invalid view mode'}
     
     async def _handle_page_change(self, interaction: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle page navigation."""
+        """Handle page navigation by page number or by an opaque cursor."""
+        if interaction.get('cursor'):
+            if self._decode_cursor(interaction['cursor']) is None:
+                return {'status': 'error', 'message': 'Invalid cursor'}
+            self.current_cursor = interaction['cursor']
+            return {
+                'status': 'success',
+                'cursor': self.current_cursor,
+                'requires_refresh': True
+            }
+        
         new_page = interaction.get('page', 0)
-        max_page = (len(self.search_results) + self.memories_per_page - 1) // self.memories_per_page - 1
+        max_page = (len(self._matching_ids) + self.memories_per_page - 1) // self.memories_per_page - 1
         
         if 0 <= new_page <= max_page:
             self.current_page = new_page
+            self.current_cursor = None
             return {
                 'status': 'success',
                 'current_page': new_page,
@@ -15,6 +15,7 @@ from .base import (
     VisualizationComponent, VisualizationConfig, VisualizationUpdate,
     DataPoint, UpdateType, DataFormatter
 )
+from .layout_engine import ForceLayoutEngine
 
 
 class NetworkLayout:
@@ -23,7 +24,10 @@ class NetworkLayout:
     @staticmethod
     def force_directed_layout(nodes: List[Dict], links: List[Dict], 
                             width: int = 800, height: int = 600,
-                            iterations: int = 100) -> Dict[str, Dict[str, float]]:
+                            iterations: int = 100,
+                            initial_positions: Optional[Dict[str, Dict[str, float]]] = None,
+                            time_budget: Optional[float] = None,
+                            engine: Optional[ForceLayoutEngine] = None) -> Dict[str, Dict[str, float]]:
         """
         Calculate force-directed layout positions for network nodes.
         
@@ -32,81 +36,17 @@ class NetworkLayout:
             links: List of link/edge data dictionaries
             width: Canvas width for positioning
             height: Canvas height for positioning
-            iterations: Number of simulation iterations
+            iterations: Maximum number of simulation iterations
+            initial_positions: Previous positions to warm-start from
+            time_budget: Optional wall-clock budget in seconds
+            engine: Layout engine to run (a default engine is used when omitted)
             
         Returns:
             Dictionary mapping node IDs to {x, y} positions
         """
-        positions = {}
-        velocities = {}
-        
-        # Initialize random positions
-        for node in nodes:
-            node_id = node['id']
-            positions[node_id] = {
-                'x': width * 0.5 + (0.5 - hash(node_id) % 100 / 100.0) * 100,
-                'y': height * 0.5 + (0.5 - hash(node_id) % 79 / 79.0) * 100
-            }
-            velocities[node_id] = {'x': 0, 'y': 0}
-        
-        # Force simulation parameters
-        repulsion_strength = 1000
-        attraction_strength = 0.1
-        damping = 0.9
-        min_distance = 30
-        
-        for iteration in range(iterations):
-            forces = {node_id: {'x': 0, 'y': 0} for node_id in positions}
-            
-            # Calculate repulsion forces between all nodes
-            for i, node1 in enumerate(nodes):
-                for j, node2 in enumerate(nodes):
-                    if i != j:
-                        id1, id2 = node1['id'], node2['id']
-                        pos1, pos2 = positions[id1], positions[id2]
-                        
-                        dx = pos1['x'] - pos2['x']
-                        dy = pos1['y'] - pos2['y']
-                        distance = max(math.sqrt(dx*dx + dy*dy), min_distance)
-                        
-                        force = repulsion_strength / (distance * distance)
-                        forces[id1]['x'] += force * dx / distance
-                        forces[id1]['y'] += force * dy / distance
-            
-            # Calculate attraction forces for connected nodes
-            for link in links:
-                source_id = link['source']
-                target_id = link['target']
-                
-                if source_id in positions and target_id in positions:
-                    pos1, pos2 = positions[source_id], positions[target_id]
-                    
-                    dx = pos2['x'] - pos1['x']
-                    dy = pos2['y'] - pos1['y']
-                    distance = math.sqrt(dx*dx + dy*dy)
-                    
-                    # Attraction force proportional to relationship strength
-                    strength = link.get('strength', 0.5)
-                    force = attraction_strength * strength * distance
-                    
-                    forces[source_id]['x'] += force * dx / distance
-                    forces[source_id]['y'] += force * dy / distance
-                    forces[target_id]['x'] -= force * dx / distance
-                    forces[target_id]['y'] -= force * dy / distance
-            
-            # Update positions based on forces
-            for node_id in positions:
-                velocities[node_id]['x'] = (velocities[node_id]['x'] + forces[node_id]['x']) * damping
-                velocities[node_id]['y'] = (velocities[node_id]['y'] + forces[node_id]['y']) * damping
-                
-                positions[node_id]['x'] += velocities[node_id]['x']
-                positions[node_id]['y'] += velocities[node_id]['y']
-                
-                # Keep nodes within bounds
-                positions[node_id]['x'] = max(50, min(width - 50, positions[node_id]['x']))
-                positions[node_id]['y'] = max(50, min(height - 50, positions[node_id]['y']))
-        
-        return positions
+        engine = engine or ForceLayoutEngine()
+        return engine.layout(nodes, links, width, height, iterations=iterations,
+                             time_budget=time_budget, initial_positions=initial_positions)
     
     @staticmethod
     def hierarchical_layout(nodes: List[Dict], links: List[Dict],
@@ -218,6 +158,8 @@ class AdvisorNetworkVisualization(VisualizationComponent):
         self.show_labels = config.layout_options.get('show_labels', True)
         self.highlight_factions = config.layout_options.get('highlight_factions', True)
         self.animation_enabled = config.layout_options.get('animation', True)
+        self.layout_engine = ForceLayoutEngine()
+        self.layout_time_budget = config.layout_options.get('layout_time_budget', 0.25)
         
         # Interaction state
         self.selected_nodes = set()
@@ -379,8 +321,12 @@ class AdvisorNetworkVisualization(VisualizationComponent):
         height = self.config.layout_options.get('height', 600)
         
         if self.layout_algorithm == 'force_directed':
+            # Warm-start from the current positions so incremental updates settle quickly
             self.node_positions = NetworkLayout.force_directed_layout(
-                self.network_data['nodes'], self.network_data['links'], width, height
+                self.network_data['nodes'], self.network_data['links'], width, height,
+                initial_positions=self.node_positions,
+                time_budget=self.layout_time_budget,
+                engine=self.layout_engine
             )
         elif self.layout_algorithm == 'hierarchical':
             self.node_positions = NetworkLayout.hierarchical_layout(
@@ -0,0 +1,554 @@
+"""
+Cached Visualization Serving Layer
+
+This module serves rendered visualization state to many concurrent viewers.
+A publisher renders each component at most once per version counter kept by
+the ``IntegratedVisualizationManager``, and stores the result as immutable,
+pre-serialized JSON and gzip payloads with a content ETag. Viewers either poll
+those payloads (answered with 304 when their ETag still matches) or hold an
+SSE stream that receives element-level deltas, so request volume never reaches
+component rendering or the simulation that feeds it.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Iterable, Set, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+
+# Identity fields recognised on list elements, checked in order
+ELEMENT_ID_FIELDS = ('id', 'widget_id', 'event_id', 'memory_id', 'alert_id', 'advisor_id')
+# Wrapper fields whose nested object carries the identity (timeline events, memory rows)
+ELEMENT_WRAPPERS = ('event', 'memory')
+
+
+def element_key(item: Any) -> Optional[str]:
+    """Stable identity of a list element, or None when it has none."""
+    if not isinstance(item, dict):
+        return None
+    for field in ELEMENT_ID_FIELDS:
+        if field in item:
+            return str(item[field])
+    if 'source' in item and 'target' in item:
+        link = f"{item['source']}->{item['target']}"
+        return f"{link}:{item['type']}" if 'type' in item else link
+    for wrapper in ELEMENT_WRAPPERS:
+        nested = item.get(wrapper)
+        if isinstance(nested, dict):
+            for field in ELEMENT_ID_FIELDS:
+                if field in nested:
+                    return f"{wrapper}:{nested[field]}"
+    return None
+
+
+def _element_keys(items: List[Any]) -> Optional[List[str]]:
+    keys = []
+    for item in items:
+        key = element_key(item)
+        if key is None:
+            return None
+        keys.append(key)
+    return keys if len(set(keys)) == len(keys) else None
+
+
+def diff_documents(old: Any, new: Any, path: Tuple = ()) -> List[Dict[str, Any]]:
+    """
+    Operations that turn ``old`` into ``new``.
+
+    Dictionaries are compared key by key. Lists whose elements all carry a
+    unique identity (nodes, links, widgets, events) produce ``upsert`` and
+    ``delete`` operations for just the changed elements, plus an ``order``
+    operation if the surviving elements were reordered. Anything else that
+    differs is replaced with a ``set``.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = []
+        for key, value in new.items():
+            if key not in old:
+                ops.append({'op': 'set', 'path': [*path, key], 'value': value})
+            else:
+                ops.extend(diff_documents(old[key], value, (*path, key)))
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': [*path, key]})
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        old_keys = _element_keys(old)
+        new_keys = _element_keys(new)
+        if old_keys is not None and new_keys is not None:
+            return _diff_elements(old, new, old_keys, new_keys, path)
+
+    if old == new and type(old) is type(new):
+        return []
+    return [{'op': 'set', 'path': list(path), 'value': new}]
+
+
+def _diff_elements(old: List[Any], new: List[Any], old_keys: List[str], new_keys: List[str],
+                   path: Tuple) -> List[Dict[str, Any]]:
+    old_index = dict(zip(old_keys, old))
+    new_set = set(new_keys)
+    ops = []
+
+    removed = [key for key in old_keys if key not in new_set]
+    if removed:
+        ops.append({'op': 'delete', 'path': list(path), 'keys': removed})
+
+    changed = [(key, item) for key, item in zip(new_keys, new)
+               if key not in old_index or old_index[key] != item]
+    if changed:
+        ops.append({'op': 'upsert', 'path': list(path),
+                    'keys': [key for key, _ in changed],
+                    'items': [item for _, item in changed]})
+
+    # Upserted elements are appended in order; only send the full order when that is not enough
+    expected = [key for key in old_keys if key in new_set] + [key for key in new_keys if key not in old_index]
+    if expected != new_keys:
+        ops.append({'op': 'order', 'path': list(path), 'keys': new_keys})
+    return ops
+
+
+def apply_delta(document: Any, ops: Iterable[Dict[str, Any]]) -> Any:
+    """Apply operations from ``diff_documents`` to ``document`` in place and return it."""
+    for op in ops:
+        *parents, last = op['path'] or [None]
+        if last is None:
+            if op['op'] == 'set':
+                document = op['value']
+            continue
+
+        target = document
+        for key in parents:
+            target = target[key]
+
+        if op['op'] == 'set':
+            target[last] = op['value']
+        elif op['op'] == 'remove':
+            target.pop(last, None)
+        else:
+            elements = target[last]
+            by_key = {element_key(item): item for item in elements}
+            order = [element_key(item) for item in elements]
+            if op['op'] == 'delete':
+                doomed = set(op['keys'])
+                order = [key for key in order if key not in doomed]
+            elif op['op'] == 'upsert':
+                for key, item in zip(op['keys'], op['items']):
+                    if key not in by_key:
+                        order.append(key)
+                    by_key[key] = item
+            elif op['op'] == 'order':
+                order = list(op['keys'])
+            target[last] = [by_key[key] for key in order]
+    return document
+
+
+@dataclass(frozen=True)
+class RenderedPayload:
+    """Immutable serialized state of one published channel."""
+    channel: str
+    component_id: str
+    version: int
+    body: bytes
+    gzipped: Optional[bytes]
+    etag: str
+    rendered_at: datetime
+
+    def snapshot_message(self) -> bytes:
+        """Stream message carrying the full document."""
+        return (b'{"type":"snapshot","channel":' + json.dumps(self.channel).encode() +
+                b',"etag":' + json.dumps(self.etag).encode() +
+                b',"data":' + self.body + b'}')
+
+
+@dataclass
+class PublishedChannel:
+    """A named view of one component's rendered state."""
+    name: str
+    component_id: str
+    section: Optional[str] = None  # Key of the rendered dict to publish; whole render if absent
+    rendered_version: int = -1
+    rendered_at: float = 0.0
+
+
+@dataclass
+class ServingStatistics:
+    """Counters describing render cache and delta fan-out behaviour."""
+    renders: int = 0
+    cache_hits: int = 0
+    unchanged_renders: int = 0
+    deltas_published: int = 0
+    messages_delivered: int = 0
+    resyncs: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'renders': self.renders,
+            'cache_hits': self.cache_hits,
+            'unchanged_renders': self.unchanged_renders,
+            'deltas_published': self.deltas_published,
+            'messages_delivered': self.messages_delivered,
+            'resyncs': self.resyncs
+        }
+
+
+class DeltaSubscription:
+    """Bounded queue of encoded stream messages for one viewer."""
+
+    def __init__(self, channels: Optional[Set[str]] = None, max_queue_size: int = 64):
+        self.channels = channels
+        self.queue: asyncio.Queue = asyncio.Queue(max(1, max_queue_size))
+        self.closed = False
+
+    def wants(self, channel: str) -> bool:
+        return self.channels is None or channel in self.channels
+
+    async def next_message(self, timeout: Optional[float] = None) -> Optional[Tuple[str, bytes]]:
+        """Next (event name, message) pair, or None on timeout."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class VisualizationPublisher:
+    """
+    Render cache and delta fan-out over an ``IntegratedVisualizationManager``.
+
+    ``refresh`` re-renders a channel only when its component's version counter
+    moved, or after ``max_age`` seconds for components that also change on
+    their own timers. Each render is serialized and compressed once; the
+    previous document is diffed against the new one and the resulting delta
+    is encoded once and queued for every subscriber. Subscribers that fall
+    ``max_queue_size`` messages behind are resynchronised with snapshots
+    instead of slowing the publisher down.
+    """
+
+    def __init__(self, manager: Any, refresh_interval: float = 0.5,
+                 max_age: Optional[float] = 5.0, compression_level: int = 6,
+                 gzip_min_size: int = 512, max_queue_size: int = 64):
+        self.manager = manager
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self.compression_level = compression_level
+        self.gzip_min_size = gzip_min_size
+        self.max_queue_size = max_queue_size
+
+        self.channels: Dict[str, PublishedChannel] = {}
+        self.payloads: Dict[str, RenderedPayload] = {}
+        self.subscriptions: Set[DeltaSubscription] = set()
+        self.statistics = ServingStatistics()
+        self._documents: Dict[str, Any] = {}
+        self._running = False
+
+    def publish(self, name: str, component_id: str, section: Optional[str] = None) -> PublishedChannel:
+        """Expose ``component_id`` (or one section of its render) as channel ``name``."""
+        channel = PublishedChannel(name, component_id, section)
+        self.channels[name] = channel
+        return channel
+
+    def get(self, name: str) -> Optional[RenderedPayload]:
+        return self.payloads.get(name)
+
+    def subscribe(self, channels: Optional[Iterable[str]] = None) -> DeltaSubscription:
+        """Register a viewer; it is primed with a snapshot of every current payload."""
+        subscription = DeltaSubscription(set(channels) if channels is not None else None,
+                                         self.max_queue_size)
+        self.subscriptions.add(subscription)
+        self._prime(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: DeltaSubscription) -> None:
+        subscription.closed = True
+        self.subscriptions.discard(subscription)
+
+    async def refresh(self) -> List[str]:
+        """Re-render stale channels and publish their deltas; returns the channels that changed."""
+        if not self.channels:
+            for component_id in getattr(self.manager, 'active_components', ()):
+                self.publish(component_id, component_id)
+
+        renders: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        changed = []
+        now = time.monotonic()
+        for channel in list(self.channels.values()):
+            version = self.manager.get_component_version(channel.component_id)
+            if version is None:
+                continue
+            expired = self.max_age is not None and now - channel.rendered_at >= self.max_age
+            if version == channel.rendered_version and not expired:
+                self.statistics.cache_hits += 1
+                continue
+
+            cached = renders.get(channel.component_id)
+            if cached is None or cached[0] != version:
+                state = await self.manager.get_component_state(channel.component_id)
+                if state is None:
+                    continue
+                self.statistics.renders += 1
+                cached = renders[channel.component_id] = (version, state)
+
+            state = cached[1]
+            if channel.section is not None and channel.section in state:
+                state = state[channel.section]
+            channel.rendered_version = version
+            channel.rendered_at = now
+            if self._store(channel, version, state):
+                changed.append(channel.name)
+        return changed
+
+    async def run(self) -> None:
+        """Refresh on a fixed cadence until ``stop`` is called."""
+        self._running = True
+        while self._running:
+            try:
+                await self.refresh()
+            except Exception as e:
+                print(f"Error refreshing visualization payloads: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def stop(self) -> None:
+        self._running = False
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            'channels': {
+                name: {'component_id': channel.component_id, 'version': channel.rendered_version,
+                       'etag': self.payloads[name].etag if name in self.payloads else None}
+                for name, channel in self.channels.items()
+            },
+            'subscribers': len(self.subscriptions),
+            'statistics': self.statistics.to_dict()
+        }
+
+    def _store(self, channel: PublishedChannel, version: int, state: Any) -> bool:
+        body = json.dumps(state, default=str, separators=(',', ':')).encode('utf-8')
+        etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        previous = self.payloads.get(channel.name)
+        if previous is not None and previous.etag == etag:
+            self.statistics.unchanged_renders += 1
+            return False
+
+        gzipped = None
+        if len(body) >= self.gzip_min_size:
+            gzipped = gzip.compress(body, compresslevel=self.compression_level, mtime=0)
+        payload = RenderedPayload(channel.name, channel.component_id, version, body,
+                                  gzipped, etag, datetime.now())
+        self.payloads[channel.name] = payload
+
+        # Diff against the decoded copy clients hold, not live component objects
+        document = json.loads(body)
+        old_document = self._documents.get(channel.name)
+        self._documents[channel.name] = document
+        if previous is None or old_document is None:
+            self._fan_out(channel.name, 'snapshot', payload.snapshot_message())
+            return True
+
+        ops = diff_documents(old_document, document)
+        message = json.dumps({
+            'type': 'delta',
+            'channel': channel.name,
+            'base_etag': previous.etag,
+            'etag': etag,
+            'ops': ops
+        }, default=str, separators=(',', ':')).encode('utf-8')
+        self.statistics.deltas_published += 1
+        self._fan_out(channel.name, 'delta', message)
+        return True
+
+    def _fan_out(self, channel: str, event: str, message: bytes) -> None:
+        for subscription in list(self.subscriptions):
+            if not subscription.wants(channel):
+                continue
+            try:
+                subscription.queue.put_nowait((event, message))
+                self.statistics.messages_delivered += 1
+            except asyncio.QueueFull:
+                # Deltas are only meaningful in sequence; replace the backlog with snapshots
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                self.statistics.resyncs += 1
+                self._prime(subscription)
+
+    def _prime(self, subscription: DeltaSubscription) -> None:
+        for name, payload in self.payloads.items():
+            if subscription.wants(name) and not subscription.queue.full():
+                subscription.queue.put_nowait(('snapshot', payload.snapshot_message()))
+
+
+class VisualizationHTTPServer:
+    """
+    Keep-alive asyncio HTTP server for published visualization payloads.
+
+    ``GET /api/<channel>`` returns the cached payload, honouring
+    ``If-None-Match`` and ``Accept-Encoding: gzip``; ``GET /api/stream`` is a
+    server-sent event stream of snapshots followed by deltas, optionally
+    filtered with ``?channels=a,b``. Static documents can be registered with
+    ``add_static``. Handlers only read precomputed payloads.
+    """
+
+    STREAM_PATH = '/api/stream'
+    STATUS_PATH = '/api/status'
+
+    def __init__(self, publisher: VisualizationPublisher, host: str = '127.0.0.1', port: int = 8000,
+                 keepalive_timeout: float = 30.0, heartbeat_interval: float = 15.0,
+                 max_header_size: int = 16384):
+        self.publisher = publisher
+        self.host = host
+        self.port = port
+        self.keepalive_timeout = keepalive_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.max_header_size = max_header_size
+        self.static_routes: Dict[str, Tuple[bytes, str]] = {}
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.open_streams = 0
+        self.requests_served = 0
+        self.not_modified = 0
+
+    def add_static(self, path: str, body: bytes, content_type: str = 'text/html; charset=utf-8') -> None:
+        self.static_routes[path] = (body, content_type)
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                 limit=self.max_header_size)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.keepalive_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                request = self._parse_request(head)
+                if request is None:
+                    await self._respond(writer, 400, b'Bad Request', close=True)
+                    break
+
+                method, target, headers = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self.requests_served += 1
+                url = urlsplit(target)
+
+                if method == 'OPTIONS':
+                    await self._respond(writer, 204, b'', close=not keep_alive)
+                elif method not in ('GET', 'HEAD'):
+                    await self._respond(writer, 405, b'Method Not Allowed', close=not keep_alive)
+                elif url.path == self.STREAM_PATH:
+                    await self._stream(writer, parse_qs(url.query))
+                    break
+                else:
+                    await self._serve(writer, url.path, headers, method == 'HEAD', keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    def _parse_request(self, head: bytes) -> Optional[Tuple[str, str, Dict[str, str]]]:
+        try:
+            lines = head.decode('latin-1').split('\r\n')
+            method, target, _ = lines[0].split(' ', 2)
+        except ValueError:
+            return None
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        return method.upper(), target, headers
+
+    async def _serve(self, writer: asyncio.StreamWriter, path: str, headers: Dict[str, str],
+                     head_only: bool, keep_alive: bool) -> None:
+        if path == self.STATUS_PATH:
+            status = dict(self.publisher.get_status(), status='running',
+                          connected_clients=self.open_streams, timestamp=datetime.now().isoformat())
+            body = json.dumps(status, default=str).encode('utf-8')
+            await self._respond(writer, 200, body, 'application/json',
+                                {'Cache-Control': 'no-store'}, head_only, not keep_alive)
+            return
+
+        if path in self.static_routes:
+            body, content_type = self.static_routes[path]
+            await self._respond(writer, 200, body, content_type, {}, head_only, not keep_alive)
+            return
+
+        payload = self.publisher.get(path[len('/api/'):]) if path.startswith('/api/') else None
+        if payload is None:
+            await self._respond(writer, 404, b'Not Found', close=not keep_alive)
+            return
+
+        cache_headers = {'ETag': payload.etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        candidates = [tag.strip() for tag in headers.get('if-none-match', '').split(',')]
+        if payload.etag in candidates or '*' in candidates:
+            self.not_modified += 1
+            await self._respond(writer, 304, b'', None, cache_headers, True, not keep_alive)
+            return
+
+        body = payload.body
+        if payload.gzipped is not None and 'gzip' in headers.get('accept-encoding', ''):
+            body = payload.gzipped
+            cache_headers['Content-Encoding'] = 'gzip'
+        await self._respond(writer, 200, body, 'application/json', cache_headers, head_only, not keep_alive)
+
+    async def _stream(self, writer: asyncio.StreamWriter, query: Dict[str, List[str]]) -> None:
+        channels = None
+        if 'channels' in query:
+            channels = [name for value in query['channels'] for name in value.split(',') if name]
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-cache\r\nConnection: keep-alive\r\n'
+                     b'Access-Control-Allow-Origin: *\r\n\r\n')
+        subscription = self.publisher.subscribe(channels)
+        self.open_streams += 1
+        try:
+            await writer.drain()
+            while not writer.is_closing():
+                message = await subscription.next_message(self.heartbeat_interval)
+                if message is None:
+                    writer.write(b': keepalive\n\n')
+                else:
+                    event, data = message
+                    writer.write(b'event: ' + event.encode() + b'\ndata: ' + data + b'\n\n')
+                await writer.drain()
+        finally:
+            self.open_streams -= 1
+            self.publisher.unsubscribe(subscription)
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int, body: bytes,
+                       content_type: Optional[str] = 'text/plain', headers: Optional[Dict[str, str]] = None,
+                       head_only: bool = False, close: bool = False) -> None:
+        reasons = {200: 'OK', 204: 'No Content', 304: 'Not Modified', 400: 'Bad Request',
+                   404: 'Not Found', 405: 'Method Not Allowed'}
+        lines = [f"HTTP/1.1 {status} {reasons.get(status, 'OK')}",
+                 'Access-Control-Allow-Origin: *',
+                 'Access-Control-Allow-Methods: GET, OPTIONS',
+                 'Access-Control-Allow-Headers: Content-Type, If-None-Match']
+        if content_type and status != 304:
+            lines.append(f"Content-Type: {content_type}")
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        if status not in (204, 304):
+            lines.append(f"Content-Length: {len(body)}")
+        lines.append('Connection: close' if close else 'Connection: keep-alive')
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if body and not head_only and status not in (204, 304):
+            writer.write(body)
+        await writer.drain()
@@ -6,10 +6,12 @@ political events, decision consequences, and temporal patterns in the game.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Set
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 import bisect
+import heapq
+import itertools
 
 from .base import (
     VisualizationComponent, VisualizationConfig, VisualizationUpdate,
@@ -71,6 +73,233 @@ class TimelineEvent:
         }
 
 
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_seconds(timestamp: datetime) -> float:
+    """Convert a timestamp to seconds since the epoch without local-time conversion."""
+    epoch = _AWARE_EPOCH if timestamp.tzinfo else _NAIVE_EPOCH
+    return (timestamp - epoch).total_seconds()
+
+
+class TimelineIndex:
+    """
+    Time-sorted index over timeline events.
+    
+    Events are partitioned into (category, severity band) buckets, each kept
+    sorted by timestamp, so viewport and filter queries only bisect the
+    selected buckets and touch the events they return. Lanes are assigned once
+    per insertion by a greedy sweep: an event takes the lowest lane with no
+    other event within ``lane_gap_seconds`` of it.
+    """
+    
+    SEVERITY_BANDS = 10
+    
+    def __init__(self, lane_gap_seconds: float = 3600.0, max_lanes: int = 6):
+        self.lane_gap_seconds = lane_gap_seconds
+        self.max_lanes = max(1, max_lanes)
+        self.lanes: Dict[str, int] = {}
+        self._sequence = itertools.count()
+        self._keys: Dict[str, Tuple[float, int]] = {}
+        self._bands: Dict[str, Tuple[EventCategory, int]] = {}
+        self._buckets: Dict[Tuple[EventCategory, int], Tuple[List[Tuple[float, int]], List[TimelineEvent]]] = {}
+        # Observed severity range per bucket; buckets entirely inside a filter skip per-event checks
+        self._severity_bounds: Dict[Tuple[EventCategory, int], Tuple[float, float]] = {}
+        self._lane_times: List[List[float]] = [[] for _ in range(self.max_lanes)]
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._keys
+    
+    @classmethod
+    def severity_band(cls, severity: float) -> int:
+        return min(cls.SEVERITY_BANDS - 1, max(0, int(severity * cls.SEVERITY_BANDS)))
+    
+    def clear(self):
+        self.lanes.clear()
+        self._keys.clear()
+        self._bands.clear()
+        self._buckets.clear()
+        self._severity_bounds.clear()
+        self._lane_times = [[] for _ in range(self.max_lanes)]
+    
+    def rebuild(self, events: Iterable[TimelineEvent]):
+        """Re-index all events, assigning lanes in a single sweep over time."""
+        self.clear()
+        ordered = sorted(events, key=lambda event: event.timestamp)
+        lane_last = [float('-inf')] * self.max_lanes
+        
+        for event in ordered:
+            key = (_to_seconds(event.timestamp), next(self._sequence))
+            bucket_key = (event.category, self.severity_band(event.severity))
+            keys, bucket_events = self._buckets.setdefault(bucket_key, ([], []))
+            keys.append(key)
+            bucket_events.append(event)
+            self._widen_severity_bounds(bucket_key, event.severity)
+            self._keys[event.event_id] = key
+            self._bands[event.event_id] = bucket_key
+            
+            lane = next((lane for lane, last in enumerate(lane_last)
+                         if key[0] - last >= self.lane_gap_seconds), None)
+            if lane is None:
+                lane = min(range(self.max_lanes), key=lane_last.__getitem__)
+            lane_last[lane] = key[0]
+            self._lane_times[lane].append(key[0])
+            self.lanes[event.event_id] = lane
+    
+    def add(self, event: TimelineEvent):
+        """Index a single event and allocate its lane."""
+        if event.event_id in self._keys:
+            self.remove(event)
+        key = (_to_seconds(event.timestamp), next(self._sequence))
+        self._keys[event.event_id] = key
+        self._insert_into_bucket(event, key)
+        
+        lane = self._allocate_lane(key[0])
+        bisect.insort(self._lane_times[lane], key[0])
+        self.lanes[event.event_id] = lane
+    
+    def remove(self, event: TimelineEvent):
+        """Drop an event from the index; other events keep their lanes."""
+        key = self._keys.pop(event.event_id, None)
+        if key is None:
+            return
+        self._remove_from_bucket(event.event_id, key)
+        
+        lane_times = self._lane_times[self.lanes.pop(event.event_id)]
+        position = bisect.bisect_left(lane_times, key[0])
+        if position < len(lane_times) and lane_times[position] == key[0]:
+            lane_times.pop(position)
+    
+    def reindex(self, event: TimelineEvent):
+        """Move an event whose category or severity changed to its new bucket."""
+        key = self._keys.get(event.event_id)
+        if key is None:
+            return
+        bucket_key = (event.category, self.severity_band(event.severity))
+        if self._bands[event.event_id] != bucket_key:
+            self._remove_from_bucket(event.event_id, key)
+            self._insert_into_bucket(event, key)
+        else:
+            # Same band, but the bucket's observed range must still cover the new severity
+            self._widen_severity_bounds(bucket_key, event.severity)
+    
+    def query(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+              categories: Optional[Set[EventCategory]] = None,
+              severity_range: Tuple[float, float] = (0.0, 1.0)) -> List[TimelineEvent]:
+        """Return matching events in [start, end], ordered by timestamp."""
+        slices = [
+            zip(keys[low:high], events[low:high]) if full else
+            ((key, event) for key, event in zip(keys[low:high], events[low:high])
+             if severity_range[0] <= event.severity <= severity_range[1])
+            for _, keys, events, low, high, full in self._select(start, end, categories, severity_range)
+        ]
+        return [event for _, event in heapq.merge(*slices, key=lambda item: item[0])]
+    
+    def count(self, start: Optional[datetime] = None, end: Optional[datetime] = None,
+              categories: Optional[Set[EventCategory]] = None,
+              severity_range: Tuple[float, float] = (0.0, 1.0)) -> int:
+        """Count matching events without materializing them."""
+        total = 0
+        for _, keys, events, low, high, full in self._select(start, end, categories, severity_range):
+            if full:
+                total += high - low
+            else:
+                total += sum(1 for event in events[low:high]
+                             if severity_range[0] <= event.severity <= severity_range[1])
+        return total
+    
+    def histogram(self, start: datetime, end: datetime, bucket_count: int,
+                  categories: Optional[Set[EventCategory]] = None,
+                  severity_range: Tuple[float, float] = (0.0, 1.0)) -> List[Dict[EventCategory, int]]:
+        """Per-category event counts for ``bucket_count`` equal slices of [start, end]."""
+        bins: List[Dict[EventCategory, int]] = [{} for _ in range(bucket_count)]
+        start_seconds, end_seconds = _to_seconds(start), _to_seconds(end)
+        width = (end_seconds - start_seconds) / bucket_count if bucket_count else 0
+        if width <= 0:
+            return bins
+        edges = [(start_seconds + width * i, -1) for i in range(1, bucket_count)]
+        
+        for (category, _), keys, events, low, high, full in self._select(start, end, categories, severity_range):
+            if full:
+                previous = low
+                for index, edge in enumerate(edges + [None]):
+                    boundary = high if edge is None else max(low, min(high, bisect.bisect_left(keys, edge, low, high)))
+                    if boundary > previous:
+                        bins[index][category] = bins[index].get(category, 0) + boundary - previous
+                    previous = boundary
+            else:
+                for key, event in zip(keys[low:high], events[low:high]):
+                    if severity_range[0] <= event.severity <= severity_range[1]:
+                        index = min(bucket_count - 1, int((key[0] - start_seconds) / width))
+                        bins[index][category] = bins[index].get(category, 0) + 1
+        return bins
+    
+    def _selected_buckets(self, categories: Optional[Set[EventCategory]],
+                          severity_range: Tuple[float, float]) -> List[Tuple[Tuple[EventCategory, int], bool]]:
+        low, high = severity_range
+        selected = []
+        for bucket_key, (band_low, band_high) in self._severity_bounds.items():
+            if categories is not None and bucket_key[0] not in categories:
+                continue
+            if band_high < low or band_low > high:
+                continue
+            selected.append((bucket_key, low <= band_low and band_high <= high))
+        return selected
+    
+    def _select(self, start: Optional[datetime], end: Optional[datetime],
+                categories: Optional[Set[EventCategory]], severity_range: Tuple[float, float]):
+        start_key = (_to_seconds(start), -1) if start is not None else None
+        end_key = (_to_seconds(end), float('inf')) if end is not None else None
+        for bucket_key, full in self._selected_buckets(categories, severity_range):
+            keys, events = self._buckets[bucket_key]
+            low = bisect.bisect_left(keys, start_key) if start_key else 0
+            high = bisect.bisect_right(keys, end_key) if end_key else len(keys)
+            yield bucket_key, keys, events, low, high, full
+    
+    def _insert_into_bucket(self, event: TimelineEvent, key: Tuple[float, int]):
+        bucket_key = (event.category, self.severity_band(event.severity))
+        keys, events = self._buckets.setdefault(bucket_key, ([], []))
+        position = bisect.bisect_left(keys, key)
+        keys.insert(position, key)
+        events.insert(position, event)
+        self._bands[event.event_id] = bucket_key
+        self._widen_severity_bounds(bucket_key, event.severity)
+    
+    def _widen_severity_bounds(self, bucket_key: Tuple[EventCategory, int], severity: float):
+        band_low, band_high = self._severity_bounds.get(bucket_key, (severity, severity))
+        self._severity_bounds[bucket_key] = (min(band_low, severity), max(band_high, severity))
+    
+    def _remove_from_bucket(self, event_id: str, key: Tuple[float, int]):
+        bucket_key = self._bands.pop(event_id)
+        keys, events = self._buckets[bucket_key]
+        position = bisect.bisect_left(keys, key)
+        del keys[position]
+        del events[position]
+        if not keys:
+            # Stale bounds would keep an empty bucket selected and too wide once refilled
+            del self._buckets[bucket_key]
+            del self._severity_bounds[bucket_key]
+    
+    def _allocate_lane(self, seconds: float) -> int:
+        best_lane, best_clearance = 0, -1.0
+        for lane, lane_times in enumerate(self._lane_times):
+            position = bisect.bisect_left(lane_times, seconds)
+            clearance = float('inf')
+            if position < len(lane_times):
+                clearance = lane_times[position] - seconds
+            if position > 0:
+                clearance = min(clearance, seconds - lane_times[position - 1])
+            if clearance >= self.lane_gap_seconds:
+                return lane
+            if clearance > best_clearance:
+                best_lane, best_clearance = lane, clearance
+        return best_lane
+
+
 class TimelineScale:
     """Manages temporal scaling and positioning for timeline visualization."""
     
@@ -145,6 +374,15 @@ class EventTimelineVisualization(VisualizationComponent):
         self.show_consequences = config.layout_options.get('show_consequences', True)
         self.group_by_category = config.layout_options.get('group_by_category', False)
         
+        # Time index backing viewport queries, filters and lane allocation
+        self.index = TimelineIndex(
+            lane_gap_seconds=config.layout_options.get('lane_gap_seconds', 3600.0),
+            max_lanes=max(1, self.height // self.lane_height)
+        )
+        # Above this many visible events the timeline renders bucketed counts
+        self.lod_threshold = config.layout_options.get('lod_threshold', self.width // 4)
+        self.lod_bucket_count = config.layout_options.get('lod_bucket_count', max(1, self.width // 10))
+        
         # Filtering and interaction
         self.visible_categories = set(EventCategory)
         self.severity_filter = (0.0, 1.0)
@@ -209,6 +447,7 @@ class EventTimelineVisualization(VisualizationComponent):
         # Replace all events
         self.events = sorted(new_events, key=lambda e: e.timestamp)
         self.events_by_id = {event.event_id: event for event in self.events}
+        self.index.rebuild(self.events)
     
     async def _incremental_update(self, data_points: List[DataPoint]):
         """Process incremental updates to timeline data."""
@@ -250,11 +489,14 @@ class EventTimelineVisualization(VisualizationComponent):
     async def _add_event(self, event_data: Dict[str, Any]):
         """Add new event to timeline."""
         event = self._create_timeline_event(event_data)
+        if event.event_id in self.events_by_id:
+            self._discard_event(self.events_by_id[event.event_id])
         
         # Insert event in chronological order
-        insert_index = bisect.bisect_left(self.events, event, key=lambda e: e.timestamp)
+        insert_index = bisect.bisect_right(self.events, event.timestamp, key=lambda e: e.timestamp)
         self.events.insert(insert_index, event)
         self.events_by_id[event.event_id] = event
+        self.index.add(event)
         
         # Animate if enabled
         if self.animation_enabled:
@@ -274,6 +516,7 @@ class EventTimelineVisualization(VisualizationComponent):
                 event.description = event_data['description']
             if 'severity' in event_data:
                 event.severity = event_data['severity']
+                self.index.reindex(event)
             if 'consequences' in event_data:
                 event.consequences = event_data['consequences']
             if 'metadata' in event_data:
@@ -282,13 +525,20 @@ class EventTimelineVisualization(VisualizationComponent):
     async def _remove_event(self, event_id: str):
         """Remove event from timeline."""
         if event_id in self.events_by_id:
-            event = self.events_by_id[event_id]
-            self.events.remove(event)
-            del self.events_by_id[event_id]
+            self._discard_event(self.events_by_id[event_id])
             
             # Remove from selection if selected
             self.selected_events.discard(event_id)
     
+    def _discard_event(self, event: TimelineEvent):
+        """Drop an event from the sorted event list, id map and index."""
+        position = bisect.bisect_left(self.events, event.timestamp, key=lambda e: e.timestamp)
+        while self.events[position] is not event:
+            position += 1
+        del self.events[position]
+        del self.events_by_id[event.event_id]
+        self.index.remove(event)
+    
     async def _add_consequence(self, consequence_data: Dict[str, Any]):
         """Add consequence to existing event."""
         event_id = consequence_data['event_id']
@@ -308,8 +558,8 @@ class EventTimelineVisualization(VisualizationComponent):
         if self.time_range_filter:
             start_time, end_time = self.time_range_filter
         else:
-            start_time = min(event.timestamp for event in self.events)
-            end_time = max(event.timestamp for event in self.events)
+            start_time = self.events[0].timestamp
+            end_time = self.events[-1].timestamp
             
             # Add some padding
             time_span = end_time - start_time
@@ -334,26 +584,7 @@ class EventTimelineVisualization(VisualizationComponent):
                 EventCategory.CONSEQUENCE: 7
             }
             return category_lanes.get(event.category, 0)
-        else:
-            # Simple collision detection
-            if not self.timeline_scale:
-                return 0
-                
-            event_position = self.timeline_scale.time_to_position(event.timestamp)
-            lane_assignments = {}
-            
-            # Check for conflicts with other events
-            for other_event in self.events:
-                if other_event.event_id == event.event_id:
-                    continue
-                    
-                other_position = self.timeline_scale.time_to_position(other_event.timestamp)
-                if abs(event_position - other_position) < 50:  # Collision threshold
-                    other_lane = lane_assignments.get(other_event.event_id, 0)
-                    lane_assignments[event.event_id] = other_lane + 1
-                    break
-            
-            return lane_assignments.get(event.event_id, 0)
+        return self.index.lanes.get(event.event_id, 0)
     
     async def _animate_new_event(self, event_data: Dict[str, Any]):
         """Animate the appearance of a new event."""
@@ -379,20 +610,27 @@ class EventTimelineVisualization(VisualizationComponent):
         if not self.timeline_scale:
             await self._update_timeline_scale()
         
-        # Apply filters and prepare events for rendering
-        filtered_events = self._apply_filters()
+        # Apply filters and prepare events for rendering; zoomed-out views are
+        # aggregated into bucketed counts instead of individual events
+        visible_count = self._count_visible()
         rendered_events = []
+        aggregates = []
+        level_of_detail = 'events'
         
-        for event in filtered_events:
-            position = self.timeline_scale.time_to_position(event.timestamp)
-            lane = self._get_event_lane(event)
-            
-            rendered_events.append({
-                'event': event.to_dict(),
-                'position': position,
-                'lane': lane,
-                'y_position': lane * self.lane_height
-            })
+        if visible_count > self.lod_threshold and self.timeline_scale and self.timeline_scale.time_span > 0:
+            level_of_detail = 'aggregated'
+            aggregates = self._aggregate_visible()
+        else:
+            for event in self._apply_filters():
+                position = self.timeline_scale.time_to_position(event.timestamp)
+                lane = self._get_event_lane(event)
+                
+                rendered_events.append({
+                    'event': event.to_dict(),
+                    'position': position,
+                    'lane': lane,
+                    'y_position': lane * self.lane_height
+                })
         
         # Generate time markers
         time_markers = []
@@ -410,6 +648,7 @@ class EventTimelineVisualization(VisualizationComponent):
             'type': 'event_timeline',
             'data': {
                 'events': rendered_events,
+                'aggregates': aggregates,
                 'time_markers': time_markers
             },
             'config': {
@@ -418,7 +657,8 @@ class EventTimelineVisualization(VisualizationComponent):
                 'lane_height': self.lane_height,
                 'view_mode': self.view_mode.value,
                 'show_consequences': self.show_consequences,
-                'group_by_category': self.group_by_category
+                'group_by_category': self.group_by_category,
+                'level_of_detail': level_of_detail
             },
             'scale': {
                 'start_time': self.timeline_scale.start_time.isoformat() if self.timeline_scale else None,
@@ -432,7 +672,7 @@ class EventTimelineVisualization(VisualizationComponent):
             },
             'metadata': {
                 'total_events': len(self.events),
-                'visible_events': len(filtered_events),
+                'visible_events': visible_count,
                 'time_range': self.time_range_filter,
                 'last_update': self.last_update.isoformat() if self.last_update else None
             }
@@ -609,25 +849,45 @@ class EventTimelineVisualization(VisualizationComponent):
         except ValueError:
             return {'status': 'error', 'message': 'Invalid view mode'}
     
+    def _filter_arguments(self) -> Dict[str, Any]:
+        start_time, end_time = self.time_range_filter or (None, None)
+        return {
+            'start': start_time,
+            'end': end_time,
+            'categories': self.visible_categories,
+            'severity_range': self.severity_filter
+        }
+    
     def _apply_filters(self) -> List[TimelineEvent]:
         """Apply current filters to events."""
-        filtered_events = []
+        return self.index.query(**self._filter_arguments())
+    
+    def _count_visible(self) -> int:
+        """Count events passing the current filters."""
+        return self.index.count(**self._filter_arguments())
+    
+    def _aggregate_visible(self) -> List[Dict[str, Any]]:
+        """Bucket visible events into per-category counts across the current scale."""
+        scale = self.timeline_scale
+        arguments = self._filter_arguments()
+        bins = self.index.histogram(
+            scale.start_time, scale.end_time, self.lod_bucket_count,
+            categories=arguments['categories'], severity_range=arguments['severity_range']
+        )
+        bucket_span = scale.time_span / self.lod_bucket_count
+        bucket_width = self.width / self.lod_bucket_count
         
-        for event in self.events:
-            # Category filter
-            if event.category not in self.visible_categories:
-                continue
-            
-            # Severity filter
-            if not (self.severity_filter[0] <= event.severity <= self.severity_filter[1]):
+        aggregates = []
+        for i, counts in enumerate(bins):
+            if not counts:
                 continue
-            
-            # Time range filter
-            if self.time_range_filter:
-                start_time, end_time = self.time_range_filter
-                if not (start_time <= event.timestamp <= end_time):
-                    continue
-            
-            filtered_events.append(event)
-        
-        return filtered_events
+            bucket_start = scale.start_time + timedelta(seconds=bucket_span * i)
+            aggregates.append({
+                'start_time': bucket_start.isoformat(),
+                'end_time': (bucket_start + timedelta(seconds=bucket_span)).isoformat(),
+                'position': bucket_width * i,
+                'width': bucket_width,
+                'count': sum(counts.values()),
+                'categories': {category.value: count for category, count in counts.items()}
+            })
+        return aggregates
@@ -0,0 +1,250 @@
+"""
+Ring-Buffer Time-Series Store
+
+This module keeps dashboard metric history in fixed-capacity NumPy ring
+buffers. Every sample lands in a raw buffer and is folded into minute and hour
+rollups, so long windows are served from coarse data while recent windows stay
+exact. Queries are downsampled to min/max/mean buckets matching the chart's
+pixel width, and serialized chart payloads are cached until new data arrives.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple, Hashable
+
+import numpy as np
+
+
+class RollupBuffer:
+    """Fixed-capacity ring of (bucket start, min, max, sum, count) rows."""
+
+    def __init__(self, capacity: int, resolution: float):
+        self.capacity = max(1, capacity)
+        self.resolution = resolution  # Bucket width in seconds; 0 keeps raw samples
+        self.starts = np.zeros(self.capacity, dtype=np.float64)
+        self.minimum = np.zeros(self.capacity, dtype=np.float64)
+        self.maximum = np.zeros(self.capacity, dtype=np.float64)
+        self.total = np.zeros(self.capacity, dtype=np.float64)
+        self.count = np.zeros(self.capacity, dtype=np.int64)
+        self.head = 0  # Next slot to write
+        self.size = 0
+        self.evicted = 0  # Rows overwritten once the ring is full
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def oldest(self) -> Optional[float]:
+        if not self.size:
+            return None
+        return float(self.starts[(self.head - self.size) % self.capacity])
+
+    @property
+    def newest(self) -> Optional[float]:
+        if not self.size:
+            return None
+        return float(self.starts[(self.head - 1) % self.capacity])
+
+    def add(self, timestamp: float, value: float):
+        """Fold a sample into the newest bucket or open a new one."""
+        start = timestamp - timestamp % self.resolution if self.resolution else timestamp
+        last = (self.head - 1) % self.capacity
+        if self.resolution and self.size and self.starts[last] == start:
+            self.minimum[last] = min(self.minimum[last], value)
+            self.maximum[last] = max(self.maximum[last], value)
+            self.total[last] += value
+            self.count[last] += 1
+            return
+
+        slot = self.head
+        self.starts[slot] = start
+        self.minimum[slot] = self.maximum[slot] = self.total[slot] = value
+        self.count[slot] = 1
+        self.head = (self.head + 1) % self.capacity
+        if self.size == self.capacity:
+            self.evicted += 1
+        else:
+            self.size += 1
+
+    def window(self, start: float, end: float) -> Dict[str, np.ndarray]:
+        """Return chronologically ordered rows whose bucket start lies in [start, end]."""
+        first = (self.head - self.size) % self.capacity
+        if first + self.size <= self.capacity:
+            segments = [slice(first, first + self.size)]
+        else:
+            segments = [slice(first, self.capacity), slice(0, self.head)]
+
+        columns = {'starts': [], 'minimum': [], 'maximum': [], 'total': [], 'count': []}
+        for segment in segments:
+            starts = self.starts[segment]
+            low = np.searchsorted(starts, start, side='left')
+            high = np.searchsorted(starts, end, side='right')
+            if low >= high:
+                continue
+            for name in columns:
+                columns[name].append(getattr(self, name)[segment][low:high])
+        return {
+            name: np.concatenate(parts) if parts else np.empty(0, dtype=getattr(self, name).dtype)
+            for name, parts in columns.items()
+        }
+
+
+class MetricTimeSeries:
+    """Raw, minute and hour resolution history for a single numeric metric."""
+
+    RESOLUTIONS = (('raw', 0.0), ('minute', 60.0), ('hour', 3600.0))
+
+    def __init__(self, raw_capacity: int = 4096, minute_capacity: int = 1440,
+                 hour_capacity: int = 24 * 7):
+        capacities = {'raw': raw_capacity, 'minute': minute_capacity, 'hour': hour_capacity}
+        self.levels: Dict[str, RollupBuffer] = {
+            name: RollupBuffer(capacities[name], resolution)
+            for name, resolution in self.RESOLUTIONS
+        }
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.levels['raw'])
+
+    def append(self, timestamp: float, value: float):
+        """Record a sample; timestamps are expected in non-decreasing order."""
+        raw = self.levels['raw']
+        if raw.size and timestamp < raw.newest:
+            timestamp = raw.newest  # Keep buffers sorted if the clock steps backwards
+        for buffer in self.levels.values():
+            buffer.add(timestamp, float(value))
+        self.version += 1
+
+    def resolution_for(self, start: float) -> str:
+        """Finest resolution still holding every sample recorded since ``start``."""
+        for name, _ in self.RESOLUTIONS:
+            buffer = self.levels[name]
+            if not buffer.evicted or (buffer.oldest is not None and buffer.oldest <= start):
+                return name
+        return 'hour'
+
+    def count(self, start: float, end: float) -> int:
+        """Number of samples recorded in [start, end]."""
+        level = self.resolution_for(start)
+        # Coarse buckets may straddle ``start``; step back one bucket so they are included
+        rows = self.levels[level].window(start - self.levels[level].resolution, end)
+        if level != 'raw' and len(rows['starts']):
+            keep = rows['starts'] + self.levels[level].resolution > start
+            return int(rows['count'][keep].sum())
+        return int(rows['count'].sum())
+
+    def query(self, start: float, end: float, max_points: Optional[int] = None
+              ) -> Dict[str, np.ndarray]:
+        """
+        Return min/max/mean points for [start, end].
+
+        Results come from the finest resolution covering the window and are
+        bucketed down to at most ``max_points`` evenly spaced points.
+        """
+        level = self.resolution_for(start)
+        rows = self.levels[level].window(start, end)
+        starts, counts = rows['starts'], rows['count']
+        if not max_points or len(starts) <= max_points:
+            return {
+                'timestamps': starts,
+                'minimum': rows['minimum'],
+                'maximum': rows['maximum'],
+                'mean': rows['total'] / np.maximum(counts, 1),
+                'resolution': level
+            }
+
+        span = max(end - start, 1e-9)
+        bucket = np.minimum(((starts - start) / span * max_points).astype(np.int64), max_points - 1)
+        occupied, first = np.unique(bucket, return_index=True)
+        totals = np.bincount(bucket, weights=rows['total'], minlength=max_points)[occupied]
+        weights = np.bincount(bucket, weights=counts, minlength=max_points)[occupied]
+        return {
+            'timestamps': starts[first],
+            'minimum': np.minimum.reduceat(rows['minimum'], first),
+            'maximum': np.maximum.reduceat(rows['maximum'], first),
+            'mean': totals / np.maximum(weights, 1),
+            'resolution': level
+        }
+
+    def samples(self) -> List[Tuple[float, float]]:
+        """All retained raw samples in chronological order."""
+        raw = self.levels['raw']
+        rows = raw.window(-np.inf, np.inf)
+        return list(zip(rows['starts'].tolist(), rows['total'].tolist()))
+
+
+class TimeSeriesStore:
+    """Per-metric ring-buffer histories with cached, downsampled chart payloads."""
+
+    def __init__(self, raw_capacity: int = 4096, minute_capacity: int = 1440,
+                 hour_capacity: int = 24 * 7, max_cached_payloads: int = 256):
+        self.raw_capacity = raw_capacity
+        self.minute_capacity = minute_capacity
+        self.hour_capacity = hour_capacity
+        self.max_cached_payloads = max_cached_payloads
+        self.series: Dict[Hashable, MetricTimeSeries] = {}
+        self._payloads: Dict[Tuple, Tuple[int, List[Dict[str, Any]]]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __contains__(self, metric: Hashable) -> bool:
+        return metric in self.series
+
+    def ensure(self, metric: Hashable) -> MetricTimeSeries:
+        if metric not in self.series:
+            self.series[metric] = MetricTimeSeries(self.raw_capacity, self.minute_capacity,
+                                                   self.hour_capacity)
+        return self.series[metric]
+
+    def append(self, metric: Hashable, timestamp: datetime, value: float):
+        self.ensure(metric).append(timestamp.timestamp(), value)
+
+    def count(self, metric: Hashable, start: datetime, end: Optional[datetime] = None) -> int:
+        if metric not in self.series:
+            return 0
+        end_seconds = end.timestamp() if end is not None else np.inf
+        return self.series[metric].count(start.timestamp(), end_seconds)
+
+    def chart_points(self, metric: Hashable, start: datetime, end: datetime,
+                     max_points: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Serialized points for a chart covering [start, end].
+
+        Payloads are cached per (metric, window, width) and reused until the
+        metric records a new sample, so idle refreshes skip recomputation and
+        the cached window is only rolled forward when new data lands.
+        """
+        series = self.series.get(metric)
+        if series is None:
+            return []
+
+        key = (metric, round(end.timestamp() - start.timestamp()), max_points)
+        cached = self._payloads.get(key)
+        if cached is not None and cached[0] == series.version:
+            self.cache_hits += 1
+            return cached[1]
+
+        self.cache_misses += 1
+        result = series.query(start.timestamp(), end.timestamp(), max_points)
+        points = [
+            {
+                'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+                'value': mean,
+                'min': low,
+                'max': high
+            }
+            for timestamp, mean, low, high in zip(
+                result['timestamps'].tolist(), result['mean'].tolist(),
+                result['minimum'].tolist(), result['maximum'].tolist()
+            )
+        ]
+        if key not in self._payloads and len(self._payloads) >= self.max_cached_payloads:
+            self._payloads.pop(next(iter(self._payloads)))
+        self._payloads[key] = (series.version, points)
+        return points
+
+    def export(self, metric: Hashable) -> List[Tuple[datetime, float]]:
+        """Retained raw samples for ``metric`` as (datetime, value) pairs."""
+        series = self.series.get(metric)
+        if series is None:
+            return []
+        return [(datetime.fromtimestamp(ts), value) for ts, value in series.samples()]
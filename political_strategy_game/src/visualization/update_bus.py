@@ -0,0 +1,244 @@
+"""
+Coalescing Visualization Update Bus
+
+Updates submitted during a busy turn are not delivered to components one by
+one. The bus marks each target component dirty and merges its pending updates,
+then a frame scheduler delivers them on a fixed cadence: components with
+pending real-time events go first, bulk refreshes follow, and delivery stops
+once the frame's time budget is spent so the rest carry over to the next frame.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Any
+
+from .base import DataPoint, UpdateType, VisualizationUpdate
+
+
+# Higher values are delivered first
+UPDATE_PRIORITIES = {
+    UpdateType.REAL_TIME_EVENT: 2,
+    UpdateType.INCREMENTAL_UPDATE: 1,
+    UpdateType.FULL_REFRESH: 0
+}
+
+DeliverCallback = Callable[[str, VisualizationUpdate], Awaitable[bool]]
+
+
+@dataclass
+class PendingUpdates:
+    """Coalesced updates waiting for one component."""
+    component_id: str
+    dirty_since: float
+    runs: List[VisualizationUpdate] = field(default_factory=list)
+    submitted: int = 0
+    priority: int = 0
+    deferred_frames: int = 0
+
+    def add(self, update: VisualizationUpdate) -> None:
+        """
+        Merge ``update`` into the pending runs.
+
+        Consecutive updates of the same type share one run so their relative
+        order with other types is preserved. Within a full refresh run only
+        the latest point per data type is kept, since each replaces the last.
+        """
+        self.submitted += 1
+        self.priority = max(self.priority, UPDATE_PRIORITIES.get(update.update_type, 0))
+        last = self.runs[-1] if self.runs else None
+        if last is None or last.update_type != update.update_type:
+            self.runs.append(VisualizationUpdate(update.update_type, list(update.data),
+                                                 update.timestamp, update.source))
+            return
+
+        if update.update_type == UpdateType.FULL_REFRESH:
+            replaced = {point.data_type for point in update.data}
+            last.data = [point for point in last.data if point.data_type not in replaced]
+        last.data.extend(update.data)
+        last.timestamp = max(last.timestamp, update.timestamp)
+        if last.source != update.source:
+            last.source = "update_bus"
+
+
+@dataclass
+class FrameStatistics:
+    """Work done by a single frame."""
+    frame: int = 0
+    delivered_components: int = 0
+    delivered_updates: int = 0
+    coalesced_updates: int = 0
+    deferred_components: int = 0
+    elapsed_ms: float = 0.0
+    over_budget: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'frame': self.frame,
+            'delivered_components': self.delivered_components,
+            'delivered_updates': self.delivered_updates,
+            'coalesced_updates': self.coalesced_updates,
+            'deferred_components': self.deferred_components,
+            'elapsed_ms': self.elapsed_ms,
+            'over_budget': self.over_budget
+        }
+
+
+@dataclass
+class UpdateBusStatistics:
+    """Cumulative counters across all frames."""
+    frames: int = 0
+    submitted_updates: int = 0
+    delivered_updates: int = 0
+    coalesced_updates: int = 0
+    deferred_components: int = 0
+    failed_updates: int = 0
+    over_budget_frames: int = 0
+    max_frame_ms: float = 0.0
+    total_frame_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'frames': self.frames,
+            'submitted_updates': self.submitted_updates,
+            'delivered_updates': self.delivered_updates,
+            'coalesced_updates': self.coalesced_updates,
+            'deferred_components': self.deferred_components,
+            'failed_updates': self.failed_updates,
+            'over_budget_frames': self.over_budget_frames,
+            'max_frame_ms': self.max_frame_ms,
+            'average_frame_ms': self.total_frame_ms / self.frames if self.frames else 0.0
+        }
+
+
+class UpdateBus:
+    """
+    Per-component dirty tracking with frame-budgeted, prioritised delivery.
+
+    ``submit`` only records work. Each frame orders dirty components by their
+    most urgent pending update type and then by how long they have been dirty,
+    and delivers their coalesced updates through ``deliver`` until
+    ``frame_budget`` seconds have elapsed. At least one component is served per
+    frame, and a component deferred for ``aging_frames`` frames gains a
+    priority level so bulk refreshes cannot be starved by a stream of events.
+    """
+
+    def __init__(self, deliver: DeliverCallback, frame_budget: float = 0.008,
+                 frame_interval: float = 1 / 30, aging_frames: int = 10):
+        self.deliver = deliver
+        self.frame_budget = frame_budget
+        self.frame_interval = frame_interval
+        self.aging_frames = max(1, aging_frames)
+        self.pending: Dict[str, PendingUpdates] = {}
+        self.statistics = UpdateBusStatistics()
+        self.last_frame = FrameStatistics()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def is_dirty(self, component_id: str) -> bool:
+        return component_id in self.pending
+
+    def submit(self, component_id: str, update: VisualizationUpdate) -> None:
+        """Mark ``component_id`` dirty and merge ``update`` into its pending work."""
+        pending = self.pending.get(component_id)
+        if pending is None:
+            pending = self.pending[component_id] = PendingUpdates(component_id, time.monotonic())
+        pending.add(update)
+        self.statistics.submitted_updates += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def submit_points(self, component_id: str, update_type: UpdateType, points: List[DataPoint],
+                      source: str = "update_bus") -> None:
+        self.submit(component_id, VisualizationUpdate(update_type, points, datetime.now(), source))
+
+    def discard(self, component_id: str) -> None:
+        """Drop pending work for a component that is going away."""
+        self.pending.pop(component_id, None)
+
+    async def run_frame(self) -> FrameStatistics:
+        """Deliver pending updates until the frame budget is spent."""
+        start = time.perf_counter()
+        frame = FrameStatistics(frame=self.statistics.frames + 1)
+        ordered = sorted(
+            self.pending.values(),
+            key=lambda p: (-(p.priority + p.deferred_frames // self.aging_frames), p.dirty_since)
+        )
+
+        for index, pending in enumerate(ordered):
+            if index and time.perf_counter() - start >= self.frame_budget:
+                for deferred in ordered[index:]:
+                    deferred.deferred_frames += 1
+                frame.deferred_components = len(ordered) - index
+                break
+
+            # Updates submitted while delivering start a fresh pending entry
+            self.pending.pop(pending.component_id, None)
+            frame.delivered_components += 1
+            frame.coalesced_updates += pending.submitted - len(pending.runs)
+            for update in pending.runs:
+                frame.delivered_updates += 1
+                try:
+                    if not await self.deliver(pending.component_id, update):
+                        self.statistics.failed_updates += 1
+                except Exception as e:
+                    self.statistics.failed_updates += 1
+                    print(f"Error delivering update to {pending.component_id}: {e}")
+
+        frame.elapsed_ms = (time.perf_counter() - start) * 1000
+        frame.over_budget = frame.elapsed_ms > self.frame_budget * 1000
+        self._record(frame)
+        return frame
+
+    async def flush(self, max_frames: Optional[int] = None) -> int:
+        """Run frames back to back until nothing is dirty; returns the frame count."""
+        frames = 0
+        while self.pending and (max_frames is None or frames < max_frames):
+            await self.run_frame()
+            frames += 1
+        return frames
+
+    async def run(self) -> None:
+        """
+        Run frames on the frame cadence while there is work.
+
+        The bus sleeps while clean; the first submission wakes it, and updates
+        arriving before the next frame boundary are coalesced into that frame.
+        """
+        self._running = True
+        self._wakeup = asyncio.Event()
+        try:
+            while self._running:
+                if not self.pending:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                started = time.monotonic()
+                await self.run_frame()
+                await asyncio.sleep(max(0.0, self.frame_interval - (time.monotonic() - started)))
+        finally:
+            self._wakeup = None
+
+    def stop(self) -> None:
+        self._running = False
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return dict(self.statistics.to_dict(), dirty_components=len(self.pending),
+                    last_frame=self.last_frame.to_dict())
+
+    def _record(self, frame: FrameStatistics) -> None:
+        stats = self.statistics
+        stats.frames += 1
+        stats.delivered_updates += frame.delivered_updates
+        stats.coalesced_updates += frame.coalesced_updates
+        stats.deferred_components += frame.deferred_components
+        stats.over_budget_frames += int(frame.over_budget)
+        stats.max_frame_ms = max(stats.max_frame_ms, frame.elapsed_ms)
+        stats.total_frame_ms += frame.elapsed_ms
+        self.last_frame = frame
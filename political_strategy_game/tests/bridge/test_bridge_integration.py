@@ -13,15 +13,19 @@ from typing import List, Dict, Any
 
 from src.bridge import (
     MessageType, GameState, CivilizationState, AdvisorState, 
-    TurnState, PoliticalEvent, EventPriority
+    TurnState, PoliticalEvent, EventPriority, BridgeMessage, MessageFactory
 )
-from src.bridge.event_broadcaster import SubscriptionFilter, EventCategory
+from src.bridge.event_broadcaster import SubscriptionFilter, EventCategory, EventPriority
 from src.bridge.bridge_manager import GameEngineBridgeManager
 from src.bridge.game_engine_bridge import GameEngineBridge
 from src.bridge.turn_synchronizer import TurnSynchronizer
 from src.bridge.state_serializer import GameStateSerializer
 from src.bridge.event_broadcaster import PoliticalEventBroadcaster
 from src.bridge.performance_profiler import PerformanceProfiler
+from src.bridge.wire_protocol import (
+    WireCodec, WireOptions, WireProtocolError, FRAME_HEADER,
+    WIRE_FORMAT_BINARY, WIRE_FORMAT_JSON, COMPRESSION_DEFLATE, COMPRESSION_NONE
+)
 
 
 @pytest.fixture
@@ -235,6 +239,71 @@ class TestStateSerializer:
         assert updated_state.advisors[0].loyalty == 0.5
         assert updated_state.turn_state.turn_number == 2
     
+    def test_incremental_update_from_dirty_sets(self, sample_game_state, monkeypatch):
+        """Test that tracked states produce deltas without a full diff."""
+        serializer = GameStateSerializer()
+        serializer.serialize_full_state(sample_game_state)
+        base_state = serializer.current_state
+        first_snapshot = serializer.current_snapshot
+        
+        def full_diff(*args):
+            raise AssertionError("tracked state should not be diffed")
+        
+        monkeypatch.setattr(serializer, '_detect_changes', full_diff)
+        
+        # Unchanged state needs no update
+        assert serializer.create_incremental_update(sample_game_state) is None
+        
+        civilization = sample_game_state.civilizations[0]
+        civilization.political_stability = 0.4
+        civilization.diplomatic_relations["enemy_civ"] = -0.9
+        civilization.touch("diplomatic_relations")
+        assert sample_game_state.changed_children() == {("civilizations", 0)}
+        assert civilization.changed_fields() == {"political_stability", "diplomatic_relations"}
+        
+        update = serializer.create_incremental_update(sample_game_state)
+        
+        assert sorted(change.path for change in update.changes) == [
+            "civilizations.0.diplomatic_relations",
+            "civilizations.0.political_stability"
+        ]
+        assert not sample_game_state.changed_children()
+        assert not civilization.changed_fields()
+        
+        # Unchanged nodes are shared with the previous snapshot
+        snapshot = serializer.current_snapshot
+        assert snapshot.advisors is first_snapshot.advisors
+        assert snapshot.turn_state is first_snapshot.turn_state
+        assert snapshot.civilizations[0] is not first_snapshot.civilizations[0]
+        assert [entry[1] for entry in serializer.state_history] == [first_snapshot, snapshot]
+        
+        updated_state = serializer.apply_incremental_update(base_state, update)
+        assert updated_state.civilizations[0].political_stability == 0.4
+        assert updated_state.civilizations[0].diplomatic_relations["enemy_civ"] == -0.9
+    
+    def test_untracked_state_is_diffed(self, sample_game_state):
+        """Test incremental updates for states the serializer did not sync."""
+        serializer = GameStateSerializer()
+        serialized = serializer.serialize_full_state(sample_game_state)
+        
+        new_state = serializer.deserialize_full_state(json.loads(json.dumps(serialized)))
+        assert new_state.baseline is None
+        new_state.advisors[0].relationships["advisor_3"] = 0.2
+        new_state.global_events.append({"type": "festival"})
+        
+        update = serializer.create_incremental_update(new_state)
+        
+        assert sorted(change.path for change in update.changes) == [
+            "advisors.0.relationships",
+            "global_events"
+        ]
+        assert new_state.baseline == serializer.current_snapshot.token
+        assert serializer.current_snapshot.civilizations is serializer.state_history[0][1].civilizations
+        
+        updated_state = serializer.apply_incremental_update(sample_game_state, update)
+        assert updated_state.advisors[0].relationships == {"advisor_2": 0.6, "advisor_3": 0.2}
+        assert updated_state.global_events == [{"type": "festival"}]
+    
     def test_state_validation(self, sample_game_state):
         """Test game state validation."""
         serializer = GameStateSerializer()
@@ -251,6 +320,223 @@ class TestStateSerializer:
         assert len(errors) > 0
 
 
+class TestWireProtocol:
+    """Test the binary wire protocol."""
+    
+    def test_binary_round_trip(self, sample_game_state, sample_political_event):
+        """Test that binary frames decode to the same messages as JSON."""
+        options = WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_DEFLATE)
+        sender, receiver = WireCodec(options), WireCodec(options)
+        messages = [
+            MessageFactory.create_game_state_sync("political_engine", sample_game_state),
+            MessageFactory.create_political_event("political_engine", sample_political_event),
+            MessageFactory.create_heartbeat("political_engine"),
+            MessageFactory.create_game_state_sync("political_engine", sample_game_state)
+        ]
+        
+        frames = [sender.encode(message) for message in messages]
+        decoded = [receiver.decode(frame)[0] for frame in frames]
+        
+        for message, frame, copy in zip(messages, frames, decoded):
+            assert copy.to_json() == message.to_json()
+            assert FRAME_HEADER.size < len(frame) < len(message.to_json()) / 3
+        
+        # Repeated strings and structure cost far less the second time
+        assert len(frames[3]) < len(frames[0]) / 2
+        
+        # Several frames can share one websocket message
+        batch = sender.encode_batch(messages[1:3])
+        assert [m.header.message_type for m in receiver.decode(batch)] == [
+            MessageType.POLITICAL_EVENT, MessageType.HEARTBEAT
+        ]
+    
+    def test_negotiation_and_invalid_frames(self, sample_game_state):
+        """Test handshake negotiation fallbacks and frame validation."""
+        request = WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_DEFLATE, True).to_dict()
+        assert WireOptions.negotiate(request) == WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_DEFLATE, True)
+        assert WireOptions.negotiate({}).wire_format == WIRE_FORMAT_JSON
+        assert WireOptions.negotiate({**request, 'schema_version': 99}).wire_format == WIRE_FORMAT_JSON
+        assert WireOptions.negotiate({**request, 'dictionary_id': 1}).compression == COMPRESSION_NONE
+        
+        message = MessageFactory.create_game_state_sync("political_engine", sample_game_state)
+        frame = WireCodec(WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_DEFLATE)).encode(message)
+        with pytest.raises(WireProtocolError):
+            WireCodec(WireOptions(WIRE_FORMAT_BINARY)).decode(frame)
+        with pytest.raises(WireProtocolError):
+            WireCodec(WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_DEFLATE)).decode(frame[:-3])
+    
+    def test_rejected_frame_leaves_codec_in_step(self, sample_game_state):
+        """Test that a frame rejected while encoding does not desynchronize the peer."""
+        import os
+        for compression in (COMPRESSION_NONE, COMPRESSION_DEFLATE):
+            options = WireOptions(WIRE_FORMAT_BINARY, compression)
+            sender, receiver = WireCodec(options), WireCodec(options)
+            receiver.decode(sender.encode(MessageFactory.create_heartbeat("political_engine")))
+            
+            oversized = MessageFactory.create_game_state_sync("political_engine", sample_game_state)
+            oversized.payload["fresh_key"] = {"another_new_key": os.urandom(700 * 1024).hex()}
+            with pytest.raises(WireProtocolError):
+                sender.encode(oversized)
+            unencodable = MessageFactory.create_heartbeat("political_engine")
+            unencodable.payload["unseen_key"] = object()
+            with pytest.raises(WireProtocolError):
+                sender.encode(unencodable)
+            
+            message = MessageFactory.create_game_state_sync("political_engine", sample_game_state)
+            message.payload["fresh_key"] = {"another_new_key": "fits"}
+            decoded = receiver.decode(sender.encode(message))[0]
+            assert decoded.payload == message.payload
+    
+    @pytest.mark.asyncio
+    async def test_binary_connection_with_state_deltas(self, sample_game_state):
+        """Test negotiating binary frames and receiving state deltas over a connection."""
+        bridge = GameEngineBridge(port=8896)
+        server_task = asyncio.create_task(bridge.start_server())
+        await asyncio.sleep(0.5)
+        
+        async def receive(websocket, codec, message_type):
+            while True:
+                data = await asyncio.wait_for(websocket.recv(), timeout=5)
+                messages = codec.decode(data) if isinstance(data, bytes) else [BridgeMessage.from_json(data)]
+                for message in messages:
+                    if message.header.message_type == message_type:
+                        return message
+        
+        try:
+            async with websockets.connect("ws://localhost:8896") as websocket:
+                greeting = json.loads(await websocket.recv())
+                assert WIRE_FORMAT_BINARY in greeting['payload']['wire_formats']
+                
+                options = WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_DEFLATE, state_deltas=True)
+                request = MessageFactory.create_handshake("game_engine", wire_options=options.to_dict())
+                await websocket.send(request.to_json())
+                codec = WireCodec(options)
+                
+                ack = await receive(websocket, codec, MessageType.HANDSHAKE)
+                assert ack.payload['wire_format'] == WIRE_FORMAT_BINARY
+                assert ack.header.correlation_id == request.header.message_id
+                
+                serializer = GameStateSerializer()
+                serializer.serialize_full_state(sample_game_state)
+                bridge.queue_game_state_sync(sample_game_state, checksum=serializer.current_checksum)
+                full_sync = await receive(websocket, codec, MessageType.FULL_STATE_SYNC)
+                assert full_sync.payload['game_state'] == sample_game_state.to_dict()
+                
+                sample_game_state.advisors[0].loyalty = 0.4
+                update = serializer.create_incremental_update(sample_game_state)
+                bridge.queue_game_state_sync(sample_game_state, checksum=serializer.current_checksum,
+                                             update=update.to_dict())
+                delta = await receive(websocket, codec, MessageType.INCREMENTAL_UPDATE)
+                assert [change['path'] for change in delta.payload['update']['changes']] == ['advisors.0.loyalty']
+                
+                # Binary frames from the client are accepted too
+                received = bridge.performance_metrics["messages_received"]
+                await websocket.send(codec.encode(MessageFactory.create_heartbeat("game_engine")))
+                await asyncio.sleep(0.2)
+                assert bridge.performance_metrics["messages_received"] == received + 1
+                
+        finally:
+            bridge.stop()
+            server_task.cancel()
+            try:
+                await server_task
+            except asyncio.CancelledError:
+                pass
+
+
+    @pytest.mark.asyncio
+    async def test_state_is_captured_when_queued(self, sample_game_state):
+        """Test that changes made after queueing a sync do not leak into the broadcast."""
+        bridge = GameEngineBridge(port=8897)
+        
+        class RecordingSocket:
+            def __init__(self):
+                self.sent = []
+            
+            async def send(self, data):
+                self.sent.append(data)
+        
+        websocket = RecordingSocket()
+        bridge.connections["client"] = websocket
+        bridge.wire_codecs[websocket] = WireCodec(WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_NONE, state_deltas=True))
+        client_codec = WireCodec(WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_NONE, state_deltas=True))
+        
+        serializer = GameStateSerializer()
+        serializer.serialize_full_state(sample_game_state)
+        bridge.queue_game_state_sync(sample_game_state, checksum=serializer.current_checksum)
+        
+        # The game thread keeps mutating before the bridge thread drains the queue
+        sample_game_state.advisors[0].loyalty = 0.4
+        update = serializer.create_incremental_update(sample_game_state)
+        bridge.queue_game_state_sync(sample_game_state, checksum=serializer.current_checksum,
+                                     update=update.to_dict())
+        
+        await bridge.broadcast_state(bridge.outbound_queue.get_nowait())
+        await bridge.broadcast_state(bridge.outbound_queue.get_nowait())
+        full_sync, delta = [client_codec.decode(frame)[0] for frame in websocket.sent]
+        
+        assert full_sync.header.message_type == MessageType.FULL_STATE_SYNC
+        assert full_sync.payload['game_state']['advisors'][0]['loyalty'] == 0.9
+        assert delta.header.message_type == MessageType.INCREMENTAL_UPDATE
+        
+        client_state = serializer.deserialize_full_state({'state': full_sync.payload['game_state'], 'metadata': {}})
+        client_state = serializer.apply_incremental_update(client_state, update)
+        assert client_state.advisors[0].loyalty == 0.4
+
+
+    @pytest.mark.asyncio
+    async def test_failed_send_is_not_recorded_as_synced(self, sample_game_state):
+        """Test that clients whose sync failed are never sent deltas against it."""
+        bridge = GameEngineBridge(port=8898)
+        options = WireOptions(WIRE_FORMAT_BINARY, COMPRESSION_NONE, state_deltas=True)
+        
+        class FlakySocket:
+            def __init__(self, failures):
+                self.failures = failures
+                self.sent = []
+                self.closed = False
+            
+            async def send(self, data):
+                if self.failures:
+                    self.failures -= 1
+                    raise OSError("send failed")
+                self.sent.append(data)
+            
+            async def close(self):
+                self.closed = True
+        
+        healthy, flaky_json, flaky_binary = FlakySocket(0), FlakySocket(1), FlakySocket(1)
+        bridge.connections.update({"healthy": healthy, "flaky_json": flaky_json, "flaky_binary": flaky_binary})
+        bridge.wire_codecs[healthy] = WireCodec(options)
+        bridge.wire_codecs[flaky_binary] = WireCodec(options)
+        
+        serializer = GameStateSerializer()
+        serializer.serialize_full_state(sample_game_state)
+        bridge.queue_game_state_sync(sample_game_state, checksum=serializer.current_checksum)
+        await bridge.broadcast_state(bridge.outbound_queue.get_nowait())
+        
+        assert bridge.synced_checksums[healthy] == serializer.current_checksum
+        assert flaky_json not in bridge.synced_checksums
+        # An undelivered binary frame leaves the client's decoder behind, so it is disconnected
+        assert flaky_binary.closed and "flaky_binary" not in bridge.connections
+        assert flaky_binary not in bridge.synced_checksums
+        
+        sample_game_state.advisors[0].loyalty = 0.4
+        update = serializer.create_incremental_update(sample_game_state)
+        bridge.queue_game_state_sync(sample_game_state, checksum=serializer.current_checksum,
+                                     update=update.to_dict())
+        await bridge.broadcast_state(bridge.outbound_queue.get_nowait())
+        
+        client = WireCodec(options)
+        assert [message.header.message_type for frame in healthy.sent for message in client.decode(frame)] == [
+            MessageType.FULL_STATE_SYNC, MessageType.INCREMENTAL_UPDATE
+        ]
+        assert [BridgeMessage.from_json(text).header.message_type for text in flaky_json.sent] == [
+            MessageType.FULL_STATE_SYNC
+        ]
+        assert bridge.synced_checksums[flaky_json] == serializer.current_checksum
+
+
 class TestEventBroadcaster:
     """Test political event broadcasting functionality."""
     
@@ -299,6 +585,61 @@ class TestEventBroadcaster:
             civilizations=["other_civ"]
         )
         assert strict_filter.matches(sample_political_event) == False
+    
+    def test_indexed_routing_matches_linear_scan(self):
+        """Test indexed subscription routing against a scan of every filter."""
+        import random
+        rng = random.Random(7)
+        broadcaster = PoliticalEventBroadcaster()
+        
+        civs = ["civ_a", "civ_b", "civ_c"]
+        participants = ["advisor_1", "advisor_2", "advisor_3"]
+        severities = ["minor", "moderate", "major", "critical"]
+        event_types = ["advisor_loyalty_change", "crisis_emergency", "trade_deal", "war_declared", "festival"]
+        priorities = [EventPriority.LOW, EventPriority.NORMAL, EventPriority.HIGH, EventPriority.CRITICAL]
+        
+        sub_ids = []
+        for i in range(120):
+            filter = SubscriptionFilter(
+                categories=rng.sample(list(EventCategory), rng.randint(0, 2)),
+                severities=rng.sample(severities, rng.randint(0, 2)),
+                civilizations=rng.sample(civs, rng.randint(0, 1)),
+                participants=rng.sample(participants, rng.randint(0, 1)),
+                keywords=["deal"] if i % 11 == 0 else None,
+                min_priority=rng.choice([None] + priorities),
+                predicate=(lambda event: event.severity != "minor") if i % 7 == 0 else None
+            )
+            sub_ids.append(broadcaster.subscribe_to_events(f"client_{i % 5}", filter))
+        assert len(set(sub_ids)) == len(sub_ids)
+        assert len(broadcaster.subscription_index) == 120
+        
+        for sub_id in sub_ids[::3]:
+            broadcaster.unsubscribe_from_events(sub_id)
+        assert len(broadcaster.subscription_index) == len(broadcaster.subscriptions)
+        
+        for i in range(200):
+            event_type = rng.choice(event_types)
+            event = PoliticalEvent(
+                event_id=f"event_{i}",
+                event_type=event_type,
+                civilization_id=rng.choice(civs),
+                title=event_type.replace("_", " "),
+                description="",
+                severity=rng.choice(severities),
+                participants=rng.sample(participants, rng.randint(0, 2)),
+                consequences={},
+                timestamp=datetime.now()
+            )
+            priority = rng.choice([None] + priorities)
+            expected = [sub for sub in broadcaster.subscriptions.values()
+                        if sub.filter.matches(event, priority)]
+            assert broadcaster._find_matching_subscriptions(event, priority) == expected
+        
+        # Priority cutoffs only apply to known broadcast priorities
+        filter = SubscriptionFilter(min_priority=EventPriority.HIGH)
+        assert filter.matches(event, EventPriority.CRITICAL)
+        assert not filter.matches(event, EventPriority.NORMAL)
+        assert filter.matches(event)
 
 
 class TestPerformanceProfiler:
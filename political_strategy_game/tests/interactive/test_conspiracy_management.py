@@ -218,6 +218,31 @@ async def test_conspiracy_management():
     return True
 
 
+async def test_turn_driven_alert_monitoring():
+    """Test that threat scans run per game turn and time-sensitive alerts expire in game time."""
+    from datetime import datetime
+    from src.core.turn_scheduler import TurnScheduler, SimulatedClock
+    
+    scheduler = TurnScheduler(clock=SimulatedClock(datetime(2026, 1, 1)))
+    conspiracy_manager = InteractiveConspiracyManager(None, None, None, None, scheduler=scheduler)
+    conspiracy_manager.scan_interval_turns = 4
+    activity = conspiracy_manager._get_recent_suspicious_activities()[0]
+    activity.suspicion_level = 0.9
+    conspiracy_manager._get_recent_suspicious_activities = lambda: [activity]
+    await conspiracy_manager.start_alert_monitoring()
+    
+    await scheduler.fast_forward(3)
+    assert conspiracy_manager.get_pending_alerts() == []
+    
+    await scheduler.advance_turn()
+    alerts = conspiracy_manager.get_pending_alerts()
+    assert len(alerts) == 1 and alerts[0].time_sensitive
+    
+    await conspiracy_manager.stop_alert_monitoring()
+    await scheduler.fast_forward(24)
+    assert conspiracy_manager.get_pending_alerts() == []
+
+
 async def main():
     """Main test function."""
     try:
@@ -834,6 +834,138 @@ async def test_comprehensive_scenario():
     
     return final_profile
 
+async def test_bounded_incremental_tracking():
+    """Test archival, streaming aggregates and lazy reputation decay over a long campaign."""
+    print("\n🗄️ Testing Bounded Incremental Tracking...")
+    
+    import tempfile
+    from core.turn_scheduler import SimulatedClock
+    
+    clock = SimulatedClock()
+    with tempfile.TemporaryDirectory() as archive_dir:
+        archive_path = os.path.join(archive_dir, "decisions.jsonl.gz")
+        tracker = PlayerDecisionTracker(
+            MockLLMManager(), MockAdvisorCouncil(), MockMultiAdvisorDialogue(),
+            archive_path=archive_path, max_resident_decisions=50, clock=clock
+        )
+        
+        for i in range(600):
+            context = DecisionContext(
+                game_turn=i,
+                active_crises=[],
+                advisor_recommendations={"economic": "Careful economic investment"},
+                available_resources={"economic": 100.0},
+                public_approval=0.5,
+                political_stability=0.5,
+                time_pressure=0.9 if i % 2 else 0.2,
+                alternatives_considered=2
+            )
+            decision = PlayerDecision(
+                decision_id=f"long_campaign_{i}",
+                domain=DecisionDomain.ECONOMIC if i % 3 else DecisionDomain.MILITARY,
+                decision_type=DecisionType.RESOURCE_INVESTMENT,
+                title=f"Budget decision {i}",
+                description="Careful economic investment",
+                chosen_option="Invest",
+                context=context,
+                rationale="Growth",
+                advisor_consultation=i % 4 != 0,
+                complexity_score=0.8
+            )
+            await tracker.track_decision(decision)
+        
+        # Resident state stays bounded while aggregates cover the whole history
+        assert len(tracker.decisions) <= 50 + tracker.archive_batch_size
+        assert len(tracker.decision_lookup) == len(tracker.decisions)
+        assert sum(len(ids) for ids in tracker.decisions_by_domain.values()) == len(tracker.decisions)
+        assert tracker.archive.count + len(tracker.decisions) == 600
+        
+        profile = await tracker.get_player_profile()
+        assert profile["total_decisions"] == 600
+        assert profile["decisions_by_domain"] == {"military": 200, "economic": 400}
+        assert abs(profile["decision_statistics"]["consultation_rate"] - 0.75) < 1e-9
+        economic = profile["decision_statistics"]["categories"]["domain:economic"]
+        assert abs(economic["complexity"]["mean"] - 0.8) < 1e-9
+        assert profile["decision_statistics"]["advisors"]["economic"]["alignment"]["count"] == 600
+        
+        await tracker._comprehensive_pattern_analysis()
+        assert any(p.pattern_id == "high_risk_taker" for p in tracker.behavior_patterns)
+        assert all(len(p.decisions_supporting) <= tracker.max_supporting_decisions
+                   for p in tracker.behavior_patterns)
+        
+        export_data = await tracker.export_player_data()
+        assert [d["id"] for d in export_data["decisions"]] == [f"long_campaign_{i}" for i in range(600)]
+        
+        # Decay is computed on read without touching the stored scores
+        stored = tracker.player_reputation.dimensions[ReputationDimension.DECISIVENESS]
+        clock.advance(timedelta(days=5))
+        profile = await tracker.get_player_profile()
+        expected = max(0.0, stored - tracker.reputation_decay_rate * 5)
+        assert abs(profile["reputation"]["decisiveness"] - expected) < 1e-9
+        assert tracker.player_reputation.dimensions[ReputationDimension.DECISIVENESS] == stored
+    
+    print(f"   ✅ 600 decisions tracked with {len(tracker.decisions)} resident")
+    return tracker
+
+async def test_eviction_without_archive_path_keeps_summaries():
+    """Test that evicted decisions are kept as capped compact records when no archive file is set."""
+    tracker = PlayerDecisionTracker(
+        MockLLMManager(), MockAdvisorCouncil(), MockMultiAdvisorDialogue(), max_resident_decisions=20,
+        max_archived_records=30
+    )
+    
+    for i in range(100):
+        context = DecisionContext(
+            game_turn=i, active_crises=[], advisor_recommendations={}, available_resources={},
+            public_approval=0.5, political_stability=0.5, time_pressure=0.5, alternatives_considered=1
+        )
+        await tracker.track_decision(PlayerDecision(
+            decision_id=f"short_campaign_{i}", domain=DecisionDomain.DIPLOMATIC,
+            decision_type=DecisionType.POLICY_ADOPTION, title=f"Decision {i}", description="Policy",
+            chosen_option="Adopt", context=context, rationale="Stability", advisor_consultation=False
+        ))
+    
+    assert len(tracker.decisions) <= 20 + tracker.archive_batch_size
+    assert tracker.archive.path is None
+    assert tracker.archive.count + len(tracker.decisions) == 100
+    assert len(tracker.archive.records) == 30
+    
+    # Only the newest archived records are kept; the rest are counted
+    export_data = await tracker.export_player_data()
+    dropped = export_data["archived_decisions_dropped"]
+    assert dropped == tracker.archive.count - 30
+    assert [d["id"] for d in export_data["decisions"]] == [f"short_campaign_{i}" for i in range(dropped, 100)]
+    return tracker
+
+async def test_pending_impacts_follow_tracker_clock():
+    """Test that impact checks come due on the tracker's clock rather than wall time."""
+    from core.turn_scheduler import SimulatedClock
+    
+    clock = SimulatedClock(datetime(2026, 1, 1))
+    tracker = PlayerDecisionTracker(
+        MockLLMManager(), MockAdvisorCouncil(), MockMultiAdvisorDialogue(), clock=clock
+    )
+    context = DecisionContext(
+        game_turn=1, active_crises=[], advisor_recommendations={}, available_resources={},
+        public_approval=0.5, political_stability=0.5, time_pressure=0.5, alternatives_considered=1
+    )
+    await tracker.track_decision(PlayerDecision(
+        decision_id="treaty", domain=DecisionDomain.DIPLOMATIC,
+        decision_type=DecisionType.POLICY_ADOPTION, title="Treaty", description="Policy",
+        chosen_option="Sign", context=context, rationale="Peace", advisor_consultation=False,
+        timestamp=clock.now()
+    ))
+    scheduled = sorted(impact["delay_hours"] for impact in tracker.pending_impacts["treaty"])
+    
+    await tracker.process_pending_impacts()
+    assert sorted(impact["delay_hours"] for impact in tracker.pending_impacts["treaty"]) == scheduled
+    
+    clock.advance(timedelta(hours=200))
+    await tracker.process_pending_impacts()
+    remaining = sorted(impact["delay_hours"] for impact in tracker.pending_impacts["treaty"])
+    assert remaining == [hours for hours in scheduled if hours > 200]
+    assert 720 in remaining
+
 async def main():
     """Run comprehensive testing of the Player Decision Impact Tracking System."""
     print("🎯 Player Decision Impact Tracking System - Comprehensive Testing")
@@ -852,6 +984,8 @@ async def main():
         test_results['impacts'] = await test_impact_tracking()
         test_results['export'] = await test_data_export()
         test_results['scenario'] = await test_comprehensive_scenario()
+        test_results['bounded'] = await test_bounded_incremental_tracking()
+        test_results['unarchived'] = await test_eviction_without_archive_path_keeps_summaries()
         
         # Summary
         print("\n" + "=" * 70)
@@ -58,7 +58,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from interactive.diplomatic_negotiations import (
     RealTimeDiplomaticNegotiations, NegotiationType, NegotiationStage, 
     NegotiationTactic, PartyRole, NegotiationPosition, NegotiationParty,
-    NegotiationEvent, NegotiationOutcome
+    NegotiationEvent, NegotiationOutcome, HeadlessNegotiationRunner, NegotiationRequest
 )
 
 async def test_negotiation_setup():
@@ -839,6 +839,68 @@ async def test_comprehensive_scenario():
     
     return final_analytics
 
+async def test_headless_batch_negotiations():
+    """Test concurrent headless negotiations against a local stand-in LLM."""
+    print("\n⚡ Testing Headless Batch Negotiations...")
+    
+    class StandInLLM:
+        def __init__(self):
+            self.active = 0
+            self.peak = 0
+            self.calls = 0
+        
+        async def generate(self, messages, max_tokens=150, temperature=0.7):
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.01)
+            self.active -= 1
+            return type("Response", (), {
+                "content": "We seek a fair settlement.",
+                "usage": {"prompt_tokens": 40, "completion_tokens": 6}
+            })()
+    
+    def make_request(i, complexity):
+        parties = [
+            NegotiationParty(
+                party_id=f"civ_{i}_{side}",
+                name=f"Civ {i} {side}",
+                role=PartyRole.PRIMARY_NEGOTIATOR if side == "a" else PartyRole.SECONDARY_PARTY,
+                negotiator_name=f"Envoy {i} {side}",
+                power_level=0.6,
+                diplomatic_skill=0.7,
+                cooperation_tendency=0.6
+            )
+            for side in ("a", "b")
+        ]
+        issues = {"border_trade": {"description": "Border trade quotas", "complexity": complexity}}
+        return NegotiationRequest(NegotiationType.TRADE_AGREEMENT, parties, issues)
+    
+    llm = StandInLLM()
+    runner = HeadlessNegotiationRunner(llm, max_concurrent_llm_calls=3)
+    requests = [make_request(i, 0.8) for i in range(6)] + [make_request(i + 6, 0.2) for i in range(4)]
+    
+    outcomes = await runner.run_batch(requests)
+    metrics = runner.get_metrics()
+    
+    assert len(outcomes) == 10
+    assert all(isinstance(outcome, NegotiationOutcome) for outcome in outcomes)
+    assert not runner.negotiations.active_negotiations
+    assert len(runner.negotiations.negotiation_history) == 10
+    
+    # Only full sessions reach the LLM, one opening statement per party
+    assert llm.calls == 6 * 2
+    assert llm.peak <= 3
+    assert metrics["sessions"] == {"fast_path": 4, "full": 6}
+    assert metrics["llm"]["calls"] == 12
+    assert metrics["llm"]["prompt_tokens"] == 12 * 40
+    assert metrics["stages"]["opening_statements"]["llm_calls"] == 12
+    assert metrics["stages"]["fast_path"]["runs"] == 4
+    assert metrics["stages"]["fast_path"]["llm_calls"] == 0
+    
+    print(f"   ✅ {len(outcomes)} sessions, {llm.calls} LLM calls, peak concurrency {llm.peak}")
+    return runner
+
 async def main():
     """Run comprehensive testing of the Real-time Diplomatic Negotiations Interface."""
     print("🤝 Real-time Diplomatic Negotiations Interface - Comprehensive Testing")
@@ -857,6 +919,7 @@ async def main():
         test_results['analytics'] = await test_analytics_and_export()
         test_results['multiple'] = await test_multiple_negotiations()
         test_results['scenario'] = await test_comprehensive_scenario()
+        test_results['headless'] = await test_headless_batch_negotiations()
         
         # Summary
         print("\n" + "=" * 75)
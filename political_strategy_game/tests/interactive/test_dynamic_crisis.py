@@ -525,6 +525,65 @@ async def test_comprehensive_crisis_scenario():
         "crises_remaining": len(final_crises)
     }
 
+async def test_turn_driven_crisis_monitoring():
+    """Test that crisis escalation and timeouts follow game turns on a simulated clock."""
+    from core.turn_scheduler import TurnScheduler, SimulatedClock
+    
+    scheduler = TurnScheduler(clock=SimulatedClock(datetime(2026, 1, 1)))
+    crisis_manager = DynamicCrisisManager(
+        MockLLMManager(), MockAdvisorCouncil(), MockDialogueSystem(),
+        MockStorytellingManager(), MockInformationWarfareManager(), scheduler=scheduler
+    )
+    crisis_manager.crisis_probability = 0.0
+    await crisis_manager.start_crisis_monitoring()
+    
+    crisis_id = await crisis_manager.force_crisis_generation()
+    crisis = crisis_manager.get_crisis_status(crisis_id)
+    deadline_turns = int((crisis.resolution_deadline - scheduler.clock.now()).total_seconds() // 3600)
+    
+    await scheduler.advance_turn()
+    assert crisis.status in [CrisisStatus.ACTIVE, CrisisStatus.ESCALATING]
+    
+    # Fast forward to just past the deadline without waiting on wall time
+    await scheduler.fast_forward(deadline_turns)
+    assert crisis_manager.get_crisis_status(crisis_id) is None
+    assert crisis.status == CrisisStatus.FAILED
+    assert crisis in crisis_manager.get_crisis_history()
+    
+    await crisis_manager.stop_crisis_monitoring()
+    await scheduler.fast_forward(10)
+    assert len(scheduler) == 0
+    return crisis
+
+async def test_registered_crisis_manager_follows_game_turns():
+    """Test that registering with GameStateManager moves monitoring onto the game's scheduler."""
+    from core.game_state import GameStateManager
+    from core.turn_scheduler import TurnScheduler, SimulatedClock
+    
+    crisis_manager = DynamicCrisisManager(
+        MockLLMManager(), MockAdvisorCouncil(), MockDialogueSystem(),
+        MockStorytellingManager(), MockInformationWarfareManager()
+    )
+    crisis_manager.crisis_probability = 0.0
+    private_scheduler = crisis_manager.scheduler
+    await crisis_manager.start_crisis_monitoring()
+    crisis_id = await crisis_manager.force_crisis_generation()
+    crisis = crisis_manager.get_crisis_status(crisis_id)
+    
+    scheduler = TurnScheduler(clock=SimulatedClock(private_scheduler.clock.now()))
+    game_manager = GameStateManager(turn_scheduler=scheduler)
+    game_manager.register_system_manager("crisis", crisis_manager)
+    assert crisis_manager.scheduler is scheduler
+    assert len(private_scheduler) == 0
+    
+    deadline_turns = int((crisis.resolution_deadline - scheduler.clock.now()).total_seconds() // 3600)
+    await scheduler.fast_forward(deadline_turns + 1)
+    assert crisis.status == CrisisStatus.FAILED
+    assert crisis_manager.get_crisis_status(crisis_id) is None
+    
+    await crisis_manager.stop_crisis_monitoring()
+    assert len(scheduler) == 0
+
 async def main():
     """Run comprehensive testing of the Dynamic Crisis Management System."""
     print("🎯 Dynamic Crisis Management System - Comprehensive Testing")
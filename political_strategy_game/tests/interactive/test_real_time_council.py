@@ -145,6 +145,85 @@ async def test_real_time_council():
     return True
 
 
+async def test_pipelined_council_pacing():
+    """Test speculative turn generation, acknowledgement pacing and invalidation."""
+    
+    class TimedLLMManager:
+        def __init__(self):
+            self.calls = []
+        
+        async def generate(self, messages, **kwargs):
+            self.calls.append(messages[-1].content)
+            await asyncio.sleep(0.05)
+            return type("Response", (), {"content": "We should proceed with measured caution."})()
+    
+    llm_manager = TimedLLMManager()
+    advisor_council = AdvisorCouncil([
+        AdvisorAI(AdvisorPersonality.get_personality(role), llm_manager)
+        for role in (AdvisorRole.MILITARY, AdvisorRole.ECONOMIC)
+    ])
+    dialogue_system = MultiAdvisorDialogue(llm_manager, advisor_council)
+    async def skip_outcomes(session):
+        session.outcomes = {}
+    dialogue_system._process_dialogue_outcomes = skip_outcomes  # Outcome analysis is not under test
+    council_interface = RealTimeCouncilInterface(llm_manager, advisor_council, dialogue_system)
+    council_interface.turn_delay_seconds = 30.0  # Only acknowledgements should move the meeting on
+    
+    turns = []
+    async def update_callback(update_data):
+        if update_data["update_type"] == "new_turn":
+            turns.append(update_data["data"])
+    council_interface.register_update_callback(update_callback)
+    
+    participants = [AdvisorRole.MILITARY, AdvisorRole.ECONOMIC]
+    meeting_id = await council_interface.start_council_meeting(
+        topic="Border fortifications", urgency=0.3, participants=participants
+    )
+    pipeline = council_interface.turn_pipelines[meeting_id]
+    
+    # First turn is shown, and the next speaker is already being generated
+    for _ in range(100):
+        if turns:
+            break
+        await asyncio.sleep(0.01)
+    assert len(turns) == 1
+    assert pipeline.generation_speaker == AdvisorRole.ECONOMIC
+    
+    # Without an acknowledgement the meeting holds at one turn
+    await asyncio.sleep(0.15)
+    assert len(turns) == 1
+    
+    # Acknowledging takes the finished speculative response immediately
+    council_interface.acknowledge_turn(meeting_id)
+    for _ in range(100):
+        if len(turns) == 2:
+            break
+        await asyncio.sleep(0.01)
+    assert len(turns) == 2
+    assert pipeline.speculative_hits == 1
+    
+    # An intervention discards the speculative response and regenerates it
+    assert pipeline.generation_task is not None and not pipeline.generation_task.done()
+    calls_before = len(llm_manager.calls)
+    intervention = PlayerIntervention(
+        intervention_type=InterventionType.REDIRECT_DISCUSSION,
+        content="Focus on the budget impact."
+    )
+    assert await council_interface.handle_player_intervention(meeting_id, intervention)
+    assert pipeline.discarded_generations == 1
+    for _ in range(100):
+        if len(turns) == 3:
+            break
+        await asyncio.sleep(0.01)
+    assert len(turns) == 3
+    assert len(llm_manager.calls) == calls_before + 2  # Regenerated turn plus the next speculation
+    
+    assert await council_interface.end_meeting(meeting_id)
+    await asyncio.sleep(0.1)
+    assert pipeline.generation_task is None
+    assert not council_interface.get_active_meetings()
+
+
 async def main():
     """Main test function."""
     try:
@@ -4,15 +4,18 @@ Tests for the Advanced Memory Integration system.
 
 import pytest
 import asyncio
+import numpy as np
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta
 from collections import defaultdict
 
 from src.llm.advanced_memory import (
     AdvancedMemoryManager, MemoryEntry, MemoryType, MemoryImportance, 
-    ContextRelevance, ContextPackage, create_memory_manager,
+    ContextRelevance, ContextPackage, ContextCache, create_memory_manager,
     add_decision_memory, add_event_memory
 )
+from src.llm.memory_retrieval import MemoryRetrievalIndex
+from src.llm.semantic_memory import HashingEmbedder, SemanticMemoryIndex
 from src.llm.llm_providers import LLMManager, LLMMessage, LLMResponse, LLMProvider
 
 
@@ -538,6 +541,275 @@ class TestAdvancedMemoryManager:
         assert memory.outcome_impact == 0.7
 
 
+class TestContextCache:
+    @pytest.fixture
+    def mock_llm_manager(self):
+        llm_manager = Mock()
+        llm_manager.generate = AsyncMock(return_value=LLMResponse(
+            content="1. Garrisons deter raids on the frontier",
+            provider=LLMProvider.OPENAI,
+            model="mock-model"
+        ))
+        return llm_manager
+    
+    @pytest.fixture
+    def memory_manager(self, mock_llm_manager):
+        return AdvancedMemoryManager(mock_llm_manager, max_memory_entries=100, max_cached_contexts=2)
+    
+    @pytest.mark.asyncio
+    async def test_empty_context_is_cached(self, memory_manager):
+        """Contexts without memories are cached instead of crashing on lookup."""
+        first = await memory_manager.get_enhanced_context("frontier raids", ["General Marcus"])
+        second = await memory_manager.get_enhanced_context("frontier raids", ["General Marcus"])
+        
+        assert first.relevant_memories == []
+        assert second is first
+        assert memory_manager.context_cache.hits == 1
+    
+    @pytest.mark.asyncio
+    async def test_new_memory_for_same_advisor_invalidates(self, memory_manager):
+        """Adding a memory for a cached advisor invalidates exactly that entry."""
+        await memory_manager.get_enhanced_context("frontier raids", ["General Marcus"])
+        await memory_manager.get_enhanced_context("harvest yields", ["Steward Anna"])
+        
+        memory_manager.add_memory("Garrison reinforced", MemoryType.DECISION,
+                                  MemoryImportance.HIGH, ["General Marcus"])
+        
+        marcus_key = ContextCache.make_key("frontier raids", ["General Marcus"], "general")
+        anna_key = ContextCache.make_key("harvest yields", ["Steward Anna"], "general")
+        assert marcus_key not in memory_manager.context_cache
+        assert anna_key in memory_manager.context_cache
+        
+        refreshed = await memory_manager.get_enhanced_context("frontier raids", ["General Marcus"])
+        assert [m.content for m in refreshed.relevant_memories] == ["Garrison reinforced"]
+        assert memory_manager.context_cache.get_metrics()["invalidations"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_removed_memory_invalidates_dependents(self, memory_manager):
+        """Removing a memory drops cached contexts that returned it."""
+        memory_id = memory_manager.add_memory("Frontier raids intensified", MemoryType.EVENT,
+                                              MemoryImportance.HIGH, [])
+        context = await memory_manager.get_enhanced_context("frontier raids", [])
+        assert context.relevant_memories[0].memory_id == memory_id
+        
+        memory_manager._remove_memory(memory_id)
+        
+        assert len(memory_manager.context_cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_lru_bound_and_metrics(self, memory_manager):
+        """The cache keeps at most max_entries contexts, evicting the least recently used."""
+        await memory_manager.get_enhanced_context("query one", [])
+        await memory_manager.get_enhanced_context("query two", [])
+        await memory_manager.get_enhanced_context("Query   ONE", [])  # same fingerprint, refreshes LRU
+        await memory_manager.get_enhanced_context("query three", [])
+        
+        metrics = memory_manager.get_memory_statistics()["context_cache"]
+        
+        assert len(memory_manager.context_cache) == 2
+        assert ContextCache.make_key("query two", [], "general") not in memory_manager.context_cache
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 3
+        assert metrics["evictions"] == 1
+    
+    def test_expired_entries_are_dropped(self):
+        """Entries older than the TTL are treated as misses."""
+        cache = ContextCache(ttl=timedelta(minutes=5))
+        key = ContextCache.make_key("query", [], "general")
+        package = ContextPackage("query", [], [], {}, [], 0, {})
+        cache.put(key, package, cache.snapshot(set(), []))
+        
+        assert cache.get(key) is package
+        assert cache.get(key, now=datetime.now() + timedelta(minutes=10)) is None
+        assert cache.expirations == 1
+
+
+class TestMemoryRetrievalIndex:
+    @pytest.fixture
+    def memory_manager(self):
+        """Create a memory manager without LLM access."""
+        return AdvancedMemoryManager(Mock(), max_memory_entries=1000)
+    
+    def test_bm25_prefers_rarer_terms(self):
+        """Documents matching rarer query terms should score higher."""
+        index = MemoryRetrievalIndex()
+        now = datetime.now()
+        for i in range(20):
+            index.add(f"common_{i}", Mock(access_count=0, decay_factor=1.0),
+                      {"military": 1, "campaign": 1}, [], now, 0.6)
+        index.add("rare", Mock(access_count=0, decay_factor=1.0),
+                  {"treaty": 1, "campaign": 1}, [], now, 0.6)
+        
+        scores = index.keyword_scores({"treaty", "military"})
+        rare_doc = index._doc_ids["rare"]
+        common_doc = index._doc_ids["common_0"]
+        
+        assert scores[rare_doc] > scores[common_doc]
+        assert all(0.0 <= score <= 1.0 for score in scores.values())
+    
+    def test_index_matches_manager_state(self, memory_manager):
+        """Adding and removing memories keeps the retrieval index in sync."""
+        memory_id = memory_manager.add_memory(
+            "Border fortification ordered",
+            MemoryType.DECISION,
+            MemoryImportance.HIGH,
+            ["General Marcus"]
+        )
+        
+        assert memory_id in memory_manager.retrieval_index
+        assert "General Marcus" in memory_manager.retrieval_index.advisor_bitmaps
+        
+        memory_manager._remove_memory(memory_id)
+        
+        assert memory_id not in memory_manager.retrieval_index
+        assert "fortification" not in memory_manager.retrieval_index.postings
+        assert "General Marcus" not in memory_manager.retrieval_index.advisor_bitmaps
+        assert memory_manager._find_relevant_memories({"fortification"}, ["General Marcus"]) == []
+    
+    def test_advisor_only_scan_terminates_early(self, memory_manager):
+        """Old low-importance advisor memories are skipped once the top-k is full."""
+        now = datetime.now()
+        for i in range(20):
+            memory_manager.add_memory(f"Recent critical briefing {i}", MemoryType.EVENT,
+                                      MemoryImportance.CRITICAL, ["Spymaster"], timestamp=now)
+        for i in range(50):
+            memory_manager.add_memory(f"Stale minor note {i}", MemoryType.EVENT,
+                                      MemoryImportance.MINIMAL, ["Spymaster"],
+                                      timestamp=now - timedelta(days=60 + i))
+        
+        results = memory_manager._find_relevant_memories(set(), ["Spymaster"], limit=5)
+        stats = memory_manager.retrieval_index.statistics
+        
+        assert len(results) == 5
+        assert all(memory.importance == MemoryImportance.CRITICAL for memory in results)
+        assert stats.buckets_skipped > 0
+        assert stats.scored_documents < 70
+    
+    def test_ranking_agrees_with_relevance_score_ordering(self, memory_manager):
+        """Keyword and advisor matches outrank memories matching neither signal well."""
+        strong_id = memory_manager.add_memory(
+            "Military defense strategy implemented",
+            MemoryType.STRATEGY,
+            MemoryImportance.HIGH,
+            ["General Marcus"]
+        )
+        memory_manager.add_memory(
+            "Harvest festival celebrated",
+            MemoryType.EVENT,
+            MemoryImportance.HIGH,
+            ["General Marcus"]
+        )
+        
+        ranked = memory_manager._rank_relevant_memories(
+            {"military", "defense"}, ["General Marcus"], limit=2
+        )
+        
+        assert ranked[0][0].memory_id == strong_id
+        assert ranked[0][1] > ranked[1][1]
+
+
+class TestSemanticMemoryIndex:
+    def test_hashing_embedder_relates_word_forms(self):
+        """Related phrasings should be closer than unrelated text."""
+        embedder = HashingEmbedder()
+        vectors = embedder.embed([
+            "negotiations with the northern kingdom",
+            "negotiate a treaty with northern kingdoms",
+            "harvest festival in the capital"
+        ])
+        
+        assert vectors.dtype == np.float32
+        assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+    
+    def test_batched_embedding_and_removal(self):
+        """Memories are embedded in batches and removed rows are reused."""
+        index = SemanticMemoryIndex(batch_size=4)
+        for i in range(6):
+            index.add(f"mem_{i}", f"memory number {i}")
+        
+        assert index.statistics.embedding_batches == 1
+        assert len(index.pending) == 2
+        
+        index.remove("mem_0")
+        results = index.search("memory number 3", limit=1)
+        
+        assert index.statistics.embedding_batches == 2
+        assert results[0][0] == "mem_3"
+        assert "mem_0" not in index
+        
+        index.add("mem_new", "memory number new")
+        index.flush()
+        assert index.store.size == 6  # freed row was reused
+    
+    def test_memory_mapped_storage(self, tmp_path):
+        """Vectors can be stored in a memory-mapped float32 matrix that grows on demand."""
+        index = SemanticMemoryIndex(storage_path=tmp_path / "vectors.f32", batch_size=16)
+        for i in range(1500):
+            index.add(f"mem_{i}", f"record {i}")
+        index.flush()
+        
+        assert isinstance(index.store.matrix, np.memmap)
+        assert index.store.capacity >= 1500
+        assert (tmp_path / "vectors.f32").stat().st_size == index.store.capacity * index.store.dimension * 4
+    
+    def test_ivf_search_finds_clustered_neighbours(self):
+        """Approximate search finds a memory's topical neighbours once the IVF index is trained."""
+        index = SemanticMemoryIndex(batch_size=256, train_threshold=512)
+        topics = ["cavalry regiment training", "grain harvest storage", "temple priesthood rituals",
+                  "merchant guild tariffs", "naval shipyard construction", "border fortress garrison"]
+        for i in range(1200):
+            index.add(f"mem_{i}", f"{topics[i % len(topics)]} report {i}")
+        
+        results = index.search("harvest storage of grain", limit=5)
+        
+        assert index.ivf.is_trained
+        assert index.statistics.approximate_searches == 1
+        assert all(int(memory_id.split("_")[1]) % len(topics) == 1 for memory_id, _ in results)
+    
+    @pytest.mark.asyncio
+    async def test_hybrid_retrieval_finds_paraphrases(self):
+        """Semantic hits are ranked alongside keyword matches."""
+        llm_manager = Mock()
+        llm_manager.generate = AsyncMock(return_value=LLMResponse(
+            content="1. Negotiations favour patient envoys",
+            provider=LLMProvider.OPENAI,
+            model="mock-model"
+        ))
+        manager = AdvancedMemoryManager(llm_manager, semantic_index=SemanticMemoryIndex())
+        paraphrase_id = manager.add_memory(
+            "Envoys negotiated with the northern kingdoms",
+            MemoryType.EVENT,
+            MemoryImportance.MEDIUM
+        )
+        manager.add_memory("Harvest festival celebrated", MemoryType.EVENT, MemoryImportance.MEDIUM)
+        
+        query = "negotiation talks kingdom"
+        assert manager._find_relevant_memories(manager._extract_keywords(query), []) == []
+        
+        context = await manager.get_enhanced_context(query, [])
+        
+        assert [m.memory_id for m in context.relevant_memories] == [paraphrase_id]
+    
+    @pytest.mark.asyncio
+    async def test_pattern_analysis_reused_for_similar_queries(self):
+        """Equivalent queries over the same memories reuse the LLM pattern analysis."""
+        llm_manager = Mock()
+        llm_manager.generate = AsyncMock(return_value=LLMResponse(
+            content="1. Border skirmishes precede larger invasions",
+            provider=LLMProvider.OPENAI,
+            model="mock-model"
+        ))
+        manager = create_memory_manager(llm_manager, enable_semantic_index=True)
+        manager.add_memory("Border skirmish with eastern raiders", MemoryType.EVENT, MemoryImportance.HIGH)
+        
+        first = await manager.get_enhanced_context("eastern border skirmish raiders", [])
+        second = await manager.get_enhanced_context("eastern border skirmish raiders again", [])
+        
+        assert first.historical_patterns == second.historical_patterns
+        assert llm_manager.generate.call_count == 1
+        assert manager.get_memory_statistics()["pattern_cache"]["hits"] == 1
+
+
 class TestHelperFunctions:
     @pytest.fixture
     def mock_llm_manager(self):
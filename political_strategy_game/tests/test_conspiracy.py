@@ -19,6 +19,7 @@ from src.llm.conspiracy import (
 from src.llm.dialogue import MultiAdvisorDialogue, EmotionalState
 from src.llm.advisors import AdvisorRole, AdvisorCouncil, AdvisorAI, AdvisorPersonality
 from src.llm.llm_providers import LLMManager, LLMResponse, LLMProvider
+from src.llm.structured_batch import StructuredQuery, StructuredQueryBatcher, clamp_unit_fields, scoped_key
 
 
 class TestConspiracyDataStructures:
@@ -638,3 +639,151 @@ class TestConspiracyIntegration:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestStructuredBatching:
+    """Test batched structured LLM analysis for conspiracies."""
+    
+    @staticmethod
+    def _response(payload):
+        return LLMResponse(content=json.dumps(payload), provider=LLMProvider.VLLM, model="test-model")
+    
+    @pytest.mark.asyncio
+    async def test_batch_resolves_keyed_results_in_one_request(self, mock_llm_manager):
+        """Test that well-formed keyed answers need a single round trip."""
+        batcher = StructuredQueryBatcher(mock_llm_manager)
+        mock_llm_manager.generate.return_value = self._response({
+            "a": {"score": 0.4}, "b": {"score": 1.7}, "c": {"score": 0.1}
+        })
+        
+        queries = [StructuredQuery(key=key, prompt=f"Rate {key}", validator=clamp_unit_fields(["score"]))
+                   for key in ("a", "b", "c")]
+        results = await batcher.run(queries)
+        
+        assert results == {"a": {"score": 0.4}, "b": {"score": 1.0}, "c": {"score": 0.1}}
+        assert mock_llm_manager.generate.await_count == 1
+        assert batcher.statistics.round_trips == 1
+    
+    @pytest.mark.asyncio
+    async def test_malformed_items_are_retried_individually(self, mock_llm_manager):
+        """Test that only missing or invalid items are re-requested."""
+        batcher = StructuredQueryBatcher(mock_llm_manager)
+        mock_llm_manager.generate.side_effect = [
+            self._response({"a": {"score": 0.4}, "b": {"score": "high"}}),
+            self._response({"score": 0.9}),
+            LLMResponse(content="not json", provider=LLMProvider.VLLM, model="test-model")
+        ]
+        
+        queries = [StructuredQuery(key=key, prompt=f"Rate {key}", validator=clamp_unit_fields(["score"]))
+                   for key in ("a", "b", "c")]
+        results = await batcher.run(queries)
+        
+        assert results == {"a": {"score": 0.4}, "b": {"score": 0.9}}
+        assert batcher.statistics.retried_queries == 2
+        assert batcher.statistics.failed_queries == 1
+        assert mock_llm_manager.generate.await_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_submissions_share_one_request(self, mock_llm_manager):
+        """Test that analyses submitted concurrently are coalesced."""
+        batcher = StructuredQueryBatcher(mock_llm_manager)
+        mock_llm_manager.generate.return_value = self._response({
+            "first": {"score": 0.2}, "second": {"score": 0.8}
+        })
+        
+        first, second = await asyncio.gather(
+            batcher.submit(StructuredQuery("first", "Rate first", clamp_unit_fields(["score"]))),
+            batcher.submit(StructuredQuery("second", "Rate second", clamp_unit_fields(["score"])))
+        )
+        
+        assert first == {"score": 0.2}
+        assert second == {"score": 0.8}
+        assert mock_llm_manager.generate.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_submission_during_flush_is_resolved(self, mock_llm_manager):
+        """Test that a query submitted while a batch is in flight gets its own flush."""
+        batcher = StructuredQueryBatcher(mock_llm_manager)
+        release = asyncio.Event()
+        
+        async def generate(messages):
+            await release.wait()
+            return self._response({"score": 0.5})
+        
+        mock_llm_manager.generate.side_effect = generate
+        first = asyncio.ensure_future(batcher.submit(StructuredQuery("first", "Rate first", clamp_unit_fields(["score"]))))
+        await asyncio.sleep(0.01)
+        second = asyncio.ensure_future(batcher.submit(StructuredQuery("second", "Rate second", clamp_unit_fields(["score"]))))
+        await asyncio.sleep(0.01)
+        release.set()
+        
+        results = await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+        assert results == [{"score": 0.5}, {"score": 0.5}]
+        assert mock_llm_manager.generate.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_generators_sharing_a_batcher_get_their_own_answers(self, mock_llm_manager, mock_dialogue_system):
+        """Test that condition analyses from separate generators are keyed apart."""
+        batcher = StructuredQueryBatcher(mock_llm_manager)
+        generators = [ConspiracyGenerator(mock_llm_manager, mock_dialogue_system, query_batcher=batcher)
+                      for _ in range(2)]
+        states = [Mock(stability=30, legitimacy=40, political_power=50) for _ in generators]
+        fields = ConspiracyGenerator.CONDITION_FIELDS
+        mock_llm_manager.generate.return_value = self._response({
+            scoped_key("conspiracy_conditions", generator, state): {field: value for field in fields}
+            for generator, state, value in zip(generators, states, (0.1, 0.9))
+        })
+        
+        first, second = await asyncio.gather(*(
+            generator._llm_analyze_conspiracy_conditions(state, {})
+            for generator, state in zip(generators, states)
+        ))
+        
+        assert set(first.values()) == {0.1}
+        assert set(second.values()) == {0.9}
+        assert mock_llm_manager.generate.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_large_query_sets_send_chunks_concurrently(self, mock_llm_manager):
+        """Test that chunks of a large batch are requested concurrently."""
+        batcher = StructuredQueryBatcher(mock_llm_manager, max_batch_size=4)
+        in_flight = []
+        
+        async def generate(messages):
+            in_flight.append(messages)
+            await asyncio.sleep(0.01)
+            prompt = messages[-1].content
+            return self._response({f"q{n}": {"score": 0.3} for n in range(10) if f"REQUEST ID: q{n}\n" in prompt})
+        
+        mock_llm_manager.generate.side_effect = generate
+        queries = [StructuredQuery(f"q{n}", f"Rate {n}", clamp_unit_fields(["score"])) for n in range(10)]
+        
+        task = asyncio.ensure_future(batcher.run(queries))
+        await asyncio.sleep(0.005)
+        assert len(in_flight) == 3
+        results = await task
+        
+        assert len(results) == 10
+        assert batcher.statistics.batched_requests == 3
+        assert batcher.statistics.retried_queries == 0
+    
+    @pytest.mark.asyncio
+    async def test_recruitment_targets_assessed_in_one_request(self, conspiracy_generator, mock_dialogue_system):
+        """Test that every recruitment target is assessed in a single batched call."""
+        names = list(mock_dialogue_system.advisor_council.advisors.keys())
+        initiator, targets = names[0], names[1:]
+        conspiracy = Mock()
+        conspiracy.conspiracy_type = ConspiracyType.COUP
+        conspiracy.title = "Test Conspiracy"
+        conspiracy.primary_motive = Mock(primary_driver="Test driver")
+        conspiracy.participants = [Mock(advisor_name=initiator)]
+        
+        conspiracy_generator.llm_manager.generate.return_value = self._response({
+            f"0:{target}": {"relationship_quality": 0.9, "ideological_alignment": 0.9, "risk_tolerance": 0.9}
+            for target in targets
+        })
+        
+        results = await conspiracy_generator.evaluate_recruitment_targets(conspiracy)
+        
+        assert {name for name, _ in results} == set(targets)
+        assert conspiracy_generator.llm_manager.generate.await_count == 1
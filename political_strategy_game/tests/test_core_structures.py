@@ -181,6 +181,56 @@ def test_data_structure_integration():
     except ImportError:
         pytest.skip("Dependencies not available - skipping integration tests")
 
+async def test_turn_scheduler_fires_turn_and_deadline_timers():
+    """Test that turn timers, clock deadlines and subscribers fire on turn advances."""
+    from datetime import datetime, timedelta
+    from core.turn_scheduler import TurnScheduler, SimulatedClock
+    
+    clock = SimulatedClock(datetime(2026, 1, 1))
+    scheduler = TurnScheduler(clock=clock, turn_duration=timedelta(hours=6))
+    fired = []
+    
+    async def on_deadline(label):
+        fired.append((scheduler.current_turn, label))
+    
+    scheduler.call_at_turn(3, fired.append, "turn_3")
+    scheduler.call_at(datetime(2026, 1, 1, 13), on_deadline, "day_1_13h")
+    cancelled = scheduler.call_after_turns(2, fired.append, "cancelled")
+    cancelled.cancel()
+    scheduler.subscribe(lambda turn: fired.append(("turn", turn)))
+    
+    assert await scheduler.fast_forward(4) == 4
+    assert fired == [("turn", 1), ("turn", 2), "turn_3", (3, "day_1_13h"), ("turn", 3), ("turn", 4)]
+    assert clock.now() == datetime(2026, 1, 2)
+    assert len(scheduler) == 0
+    
+    # Headless batch runs can fast forward through many turns instantly
+    await scheduler.fast_forward(1000)
+    assert scheduler.current_turn == 1004
+
+def test_turn_scheduler_notify_turn_without_event_loop():
+    """Test that turn notifications outside an event loop dispatch synchronously."""
+    from core.turn_scheduler import TurnScheduler
+    
+    scheduler = TurnScheduler()
+    fired = []
+    
+    async def on_turn(turn):
+        fired.append(("async", turn))
+    
+    scheduler.subscribe(lambda turn: fired.append(("sync", turn)))
+    scheduler.subscribe(on_turn)
+    scheduler.call_at_turn(2, fired.append, "turn_2")
+    
+    assert scheduler.notify_turn() is None
+    loop = scheduler._sync_loop
+    scheduler.notify_turn()
+    
+    assert fired == [("sync", 1), ("async", 1), "turn_2", ("sync", 2), ("async", 2)]
+    assert scheduler._sync_loop is loop  # One loop for coroutine callbacks, not one per turn
+    scheduler.close()
+
+
 if __name__ == "__main__":
     # Run tests directly
     test_import_core_modules()
@@ -449,6 +449,77 @@ class TestBenchmarkSuite:
         assert "memories_added" in result.metadata
         assert "successful_retrievals" in result.metadata
     
+    @pytest.mark.asyncio
+    async def test_memory_retrieval_benchmark(self, benchmark_suite):
+        """Test indexed memory retrieval benchmark."""
+        benchmark_suite.benchmark_config["retrieval_index_entries"] = 500
+        benchmark_suite.benchmark_config["retrieval_queries_count"] = 5
+        
+        result = await benchmark_suite._benchmark_memory_retrieval()
+        
+        assert result.success
+        assert result.metadata["entries"] == 500
+        assert result.metadata["max_memory_entries"] == 500
+        assert result.metadata["index_query_ms"] > 0
+        assert result.metadata["legacy_query_ms"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_network_layout_benchmark(self, benchmark_suite):
+        """Test force-directed layout benchmark."""
+        benchmark_suite.benchmark_config["layout_nodes"] = 200
+        benchmark_suite.benchmark_config["layout_iterations"] = 5
+        
+        result = await benchmark_suite._benchmark_network_layout()
+        
+        assert result.success
+        assert result.metadata["nodes"] == 200
+        assert result.metadata["legacy_iteration_ms"] > 0
+        assert result.metadata["hierarchical_ms"] >= 0
+        assert result.metadata["circular_ms"] >= 0
+    
+    @pytest.mark.asyncio
+    async def test_save_format_benchmark(self, benchmark_suite):
+        """Test the save format comparison benchmark."""
+        benchmark_suite.benchmark_config["save_format_civilizations"] = 8
+        
+        result = await benchmark_suite._benchmark_save_formats()
+        
+        assert result.success
+        assert set(result.metadata["formats"]) == {"json", "json.gz", "binary.gz", "pack"}
+        assert result.metadata["packed_size_vs_json"] < 1.0
+        assert all(timing["single_civilization_ms"] >= 0 for timing in result.metadata["formats"].values())
+    
+    @pytest.mark.asyncio
+    async def test_bridge_wire_benchmark(self, benchmark_suite):
+        """Test the bridge wire format benchmark."""
+        benchmark_suite.benchmark_config["wire_civilizations"] = 4
+        benchmark_suite.benchmark_config["wire_turns"] = 3
+        
+        result = await benchmark_suite._benchmark_bridge_wire_protocol()
+        
+        assert result.success
+        assert set(result.metadata["formats"]) == {
+            "json", "json_gzip_base64_state", "binary", "binary_deflate", "binary_deflate_deltas"
+        }
+        assert result.metadata["binary_size_vs_json"] < 0.5
+        assert result.metadata["deflate_size_vs_json"] < result.metadata["binary_size_vs_json"]
+        assert result.metadata["formats"]["binary"]["encode_ms_per_message"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_event_routing_benchmark(self, benchmark_suite):
+        """Test the event routing benchmark."""
+        benchmark_suite.benchmark_config["routing_subscriptions"] = 500
+        benchmark_suite.benchmark_config["routing_events"] = 1000
+        benchmark_suite.benchmark_config["routing_linear_sample"] = 200
+        
+        result = await benchmark_suite._benchmark_event_routing()
+        
+        assert result.test_name == "event_routing_500"
+        assert result.success
+        assert result.metadata["linear_sample"] == 200
+        assert result.metadata["deliveries_per_event"] > 0
+        assert result.operations_per_second > 0
+    
     @pytest.mark.asyncio
     async def test_civilization_processing_benchmark(self, benchmark_suite):
         """Test civilization processing benchmark."""
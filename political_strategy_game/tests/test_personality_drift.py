@@ -4,6 +4,7 @@ Tests for the Personality Drift Detection and Correction system.
 
 import pytest
 import asyncio
+import json
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, timedelta
 from collections import deque
@@ -11,8 +12,10 @@ from collections import deque
 from src.llm.personality_drift import (
     PersonalityDriftDetector, PersonalitySnapshot, PersonalityDrift,
     PersonalityAspect, DriftSeverity, CorrectionStrategy, CorrectionAttempt,
-    PersonalityProfile
+    PersonalityProfile, DriftScreeningResult,
+    response_drift_score
 )
+from src.llm.semantic_memory import HashingEmbedder
 from src.llm.advisors import AdvisorRole, AdvisorPersonality, AdvisorAI
 from src.llm.dialogue import EmotionalState
 from src.llm.llm_providers import LLMMessage, LLMResponse, LLMProvider
@@ -470,6 +473,28 @@ class TestPersonalityDriftDetector:
         assert "Diplomat Elena" in results["snapshots_captured"]
         assert len(results["drifts_detected"]) > 0
     
+    def test_monitoring_without_recorded_history(self, drift_detector, mock_dialogue_system):
+        """Advisors without real responses are not screened against profile keywords."""
+        drift_detector.initialize_personality_profiles(mock_dialogue_system.advisor_council)
+        pipeline = drift_detector.monitoring_pipeline
+        responses = {"General Marcus": ["Hold the northern pass and reinforce the garrison",
+                                        "Our tactical position at the border is secure"]}
+        
+        for _ in range(3):
+            results = drift_detector.process_personality_monitoring_turn(["General Marcus"])
+            assert results["monitoring_summary"]["escalated_advisors"] == []
+        
+        # The first real responses become the baseline; consistent ones stay below the threshold
+        first = drift_detector.process_personality_monitoring_turn(["General Marcus"], recent_responses=responses)
+        second = drift_detector.process_personality_monitoring_turn(["General Marcus"], recent_responses=responses)
+        
+        assert first["monitoring_summary"]["screening_scores"] == {}
+        assert second["monitoring_summary"]["escalated_advisors"] == []
+        assert pipeline.metrics["advisors_escalated"] == 0
+        assert not pipeline.analysis_pending
+        assert len(drift_detector.personality_history["General Marcus"]) == 0
+        drift_detector.llm_manager.generate.assert_not_called()
+    
     def test_calculate_personality_stability(self, drift_detector):
         """Test calculating personality stability."""
         # Create history with stable personality
@@ -589,5 +614,163 @@ class TestPersonalityDriftDetector:
         assert "most_common_drift_aspects" in summary
 
 
+
+class TestPersonalityMonitoringPipeline:
+    BASELINE = {
+        "General Marcus": ["Strategic military analysis of the border", "Tactical defense of the fortress"],
+        "Diplomat Elena": ["Patient negotiation with the envoys", "Diplomatic relations with neighbours"]
+    }
+    
+    @pytest.fixture
+    def drift_detector(self):
+        """Create a detector with two advisors and recorded baselines."""
+        dialogue_system = Mock()
+        dialogue_system.advisor_council = Mock()
+        dialogue_system.advisor_council.advisors = {
+            "General Marcus": AdvisorAI(personality=AdvisorPersonality(
+                name="General Marcus", role=AdvisorRole.MILITARY, background="Military strategist",
+                personality_traits=["Strategic", "Disciplined"], communication_style="Direct",
+                expertise_areas=["Military tactics"]
+            ), llm_manager=Mock()),
+            "Diplomat Elena": AdvisorAI(personality=AdvisorPersonality(
+                name="Diplomat Elena", role=AdvisorRole.DIPLOMATIC, background="Envoy",
+                personality_traits=["Patient", "Persuasive"], communication_style="Measured",
+                expertise_areas=["Negotiation"]
+            ), llm_manager=Mock())
+        }
+        dialogue_system.get_advisor_emotional_state = Mock(return_value={"emotion": "calm", "intensity": 0.4})
+        
+        llm_manager = Mock()
+        llm_manager.generate = AsyncMock()
+        detector = PersonalityDriftDetector(llm_manager=llm_manager, dialogue_system=dialogue_system)
+        for name, responses in self.BASELINE.items():
+            detector.personality_history[name].append(PersonalitySnapshot(
+                timestamp=datetime.now() - timedelta(days=1),
+                advisor_name=name,
+                personality_aspects={aspect: 0.9 for aspect in PersonalityAspect},
+                recent_responses=responses
+            ))
+        return detector
+    
+    @staticmethod
+    def _analysis(*names, score=0.3):
+        return {
+            name: {
+                "aspect_scores": {aspect.value: score for aspect in PersonalityAspect},
+                "specific_changes": ["Abandoned formal tone"],
+                "potential_causes": ["Prolonged court intrigue"]
+            }
+            for name in names
+        }
+    
+    def test_response_drift_score(self):
+        """Similar response sets score lower than unrelated ones."""
+        embedder = HashingEmbedder()
+        baseline = ["Strategic military analysis", "Tactical defense planning"]
+        
+        similar = response_drift_score(embedder, baseline, ["Strategic defense analysis"])
+        different = response_drift_score(embedder, baseline, ["Poetry about spring flowers"])
+        
+        assert 0.0 <= similar < different <= 1.0
+        assert response_drift_score(embedder, [], ["anything"]) == 0.0
+    
+    @pytest.mark.asyncio
+    async def test_consistent_advisors_skip_llm(self, drift_detector):
+        """Advisors below the escalation threshold never reach the LLM."""
+        results = drift_detector.process_personality_monitoring_turn(
+            list(self.BASELINE), recent_responses=self.BASELINE
+        )
+        
+        assert results["monitoring_summary"]["escalated_advisors"] == []
+        assert not drift_detector.monitoring_pipeline.analysis_pending
+        drift_detector.llm_manager.generate.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_advisors_without_responses_are_not_screened(self, drift_detector):
+        """Placeholder interactions are never scored against a real baseline."""
+        results = drift_detector.process_personality_monitoring_turn(
+            list(self.BASELINE), recent_responses={"Diplomat Elena": self.BASELINE["Diplomat Elena"]}
+        )
+        
+        assert list(results["monitoring_summary"]["screening_scores"]) == ["Diplomat Elena"]
+        assert results["monitoring_summary"]["escalated_advisors"] == []
+        drift_detector.llm_manager.generate.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_flagged_advisors_batched_and_applied_next_turn(self, drift_detector):
+        """All escalated advisors share one background LLM request applied on the next turn."""
+        drifted = {
+            "General Marcus": ["Lovely poems about spring gardens", "Let us hold a flower festival"],
+            "Diplomat Elena": ["Crush them all without mercy", "Burn the granaries tonight"]
+        }
+        drift_detector.llm_manager.generate.return_value = LLMResponse(
+            content=json.dumps(self._analysis("General Marcus", "Diplomat Elena")),
+            provider=LLMProvider.OPENAI,
+            model="mock-model"
+        )
+        
+        first = drift_detector.process_personality_monitoring_turn(list(drifted), recent_responses=drifted)
+        
+        assert sorted(first["monitoring_summary"]["escalated_advisors"]) == sorted(drifted)
+        assert first["monitoring_summary"]["analysis_started"]
+        assert drift_detector.detected_drifts == []  # not applied on the critical path
+        
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        # The finished analysis waits for the turn boundary
+        assert drift_detector.detected_drifts == []
+        assert all(len(drift_detector.personality_history[name]) == 1 for name in drifted)
+        second = drift_detector.process_personality_monitoring_turn(list(drifted), recent_responses=self.BASELINE)
+        
+        assert drift_detector.llm_manager.generate.call_count == 1
+        assert second["monitoring_summary"]["drifts_applied"] == 2 * len(PersonalityAspect)
+        assert {drift.advisor_name for drift in drift_detector.detected_drifts} == set(drifted)
+        assert all(drift.severity == DriftSeverity.SIGNIFICANT for drift in drift_detector.detected_drifts)
+        assert drift_detector.detected_drifts[0].potential_causes == ["Prolonged court intrigue"]
+    
+    @pytest.mark.asyncio
+    async def test_missing_batch_items_retried_individually(self, drift_detector):
+        """Advisors missing from the batched response get one individual retry."""
+        drift_detector.llm_manager.generate.side_effect = [
+            LLMResponse(content=json.dumps(self._analysis("General Marcus")),
+                        provider=LLMProvider.OPENAI, model="mock-model"),
+            LLMResponse(content=json.dumps(self._analysis("Diplomat Elena", score=0.85)),
+                        provider=LLMProvider.OPENAI, model="mock-model")
+        ]
+        pipeline = drift_detector.monitoring_pipeline
+        screening = [
+            DriftScreeningResult(name, 0.9, True, responses, ["Unexpected outburst"])
+            for name, responses in self.BASELINE.items()
+        ]
+        
+        analyses = await pipeline.analyze_batch(screening)
+        assert len(drift_detector.personality_history["Diplomat Elena"]) == 1
+        drifts = pipeline.apply_analyses(analyses)
+        
+        assert pipeline.metrics["llm_calls"] == 2
+        assert pipeline.metrics["individual_retries"] == 1
+        assert {drift.advisor_name for drift in drifts} == {"General Marcus"}
+        assert len(drift_detector.personality_history["Diplomat Elena"]) == 2
+    
+    def test_analysis_deferred_without_event_loop(self, drift_detector):
+        """Outside an event loop escalations wait for drain() instead of blocking the turn."""
+        drift_detector.llm_manager.generate.return_value = LLMResponse(
+            content=json.dumps(self._analysis("General Marcus")),
+            provider=LLMProvider.OPENAI,
+            model="mock-model"
+        )
+        results = drift_detector.process_personality_monitoring_turn(
+            ["General Marcus"], recent_responses={"General Marcus": ["Poems about gardens"]}
+        )
+        
+        assert not results["monitoring_summary"]["analysis_started"]
+        assert drift_detector.monitoring_pipeline.analysis_pending
+        
+        drifts = asyncio.run(drift_detector.monitoring_pipeline.drain())
+        
+        assert len(drifts) == len(PersonalityAspect)
+        assert not drift_detector.monitoring_pipeline.analysis_pending
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -12,6 +12,7 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+from src.persistence.save_catalog import read_save_header, strip_save_header
 from src.persistence.save_game_manager import (
     SaveGameManager, SaveGameData, SaveGameMetadata, SaveFileFormat, 
     SaveFileVersion, CompressionManager, VersionManager, 
@@ -142,8 +143,9 @@ def test_file_format_handling(temp_save_dir):
     assert json_path.exists()
     
     # Verify JSON content
-    with open(json_path, 'r') as f:
-        loaded_json = json.load(f)
+    # The body after the fixed-size metadata header is plain JSON
+    assert read_save_header(json_path)['save_id'] == 'format_test'
+    loaded_json = json.loads(strip_save_header(json_path.read_bytes()))
     assert loaded_json['metadata']['save_id'] == 'format_test'
     
     # Test compressed JSON format
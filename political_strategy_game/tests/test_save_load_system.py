@@ -32,6 +32,11 @@ from src.persistence.encryption import (
     KeyDerivationMethod, EncryptedSaveManager, CRYPTO_AVAILABLE
 )
 from src.persistence.save_file_debugger import SaveFileDebugger, AnalysisLevel
+from src.persistence.save_stream import StreamingSaveWriter, JSON_TRAILER_PREFIX, SaveIntegrityError
+from src.persistence.save_catalog import SaveCatalog, SAVE_HEADER_SIZE, read_save_header, strip_save_header
+from src.persistence.packed_format import PackedSaveWriter, PackedSaveReader, encode_value, decode_value
+from src.persistence import save_diff
+from src.persistence.save_diff import diff_saves, iter_save_sections
 
 # Mock data structures for testing
 @pytest.fixture
@@ -289,6 +294,417 @@ class TestSaveGameManager:
         assert not save_path.exists()
 
 
+class TestStreamingSaveWriter:
+    """Test the single-pass streaming save pipeline."""
+    
+    def test_json_save_carries_verified_trailer(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
+        """The trailer checksum covers the payload and surfaces as the metadata checksum."""
+        manager = SaveGameManager(temp_save_dir)
+        save_path = manager.save_game("stream_json", mock_game_state, mock_memory_manager,
+                                      mock_civilizations, SaveFileFormat.JSON_COMPRESSED)
+        
+        payload = gzip.decompress(strip_save_header(save_path.read_bytes()))
+        document = json.loads(payload)
+        trailer = document['trailer']
+        assert trailer['sections'] == ['metadata', 'game_state', 'memory_banks', 'civilizations', 'custom_data']
+        assert hashlib.sha256(payload[:payload.rfind(JSON_TRAILER_PREFIX)]).hexdigest() == trailer['checksum']
+        assert document['civilizations']['test_civ']['name'] == "Test Civilization"
+        
+        loaded = manager.load_game(save_path)
+        assert loaded.metadata.checksum == trailer['checksum']
+        assert loaded.metadata.file_size == save_path.stat().st_size
+        assert not list(temp_save_dir.glob("*.tmp"))
+    
+    def test_tampered_save_fails_checksum(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
+        """Edits to the payload are caught on load."""
+        manager = SaveGameManager(temp_save_dir)
+        save_path = manager.save_game("stream_tamper", mock_game_state, mock_memory_manager,
+                                      mock_civilizations, SaveFileFormat.JSON)
+        save_path.write_bytes(save_path.read_bytes().replace(b'"turn_number": 42', b'"turn_number": 99'))
+        
+        with pytest.raises(SaveIntegrityError):
+            manager.load_game(save_path)
+    
+    def test_binary_save_round_trip(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
+        """Binary saves are sequences of records ending in a trailer."""
+        manager = SaveGameManager(temp_save_dir)
+        save_path = manager.save_game("stream_binary", mock_game_state, mock_memory_manager,
+                                      mock_civilizations, SaveFileFormat.BINARY_COMPRESSED)
+        
+        loaded = manager.load_game(save_path)
+        assert loaded.game_state.turn_state.turn_number == 42
+        assert loaded.civilizations['test_civ']['leader'] == 'Test Leader'
+        assert len(loaded.metadata.checksum) == 64
+    
+    def test_failed_save_keeps_previous_file(self, temp_save_dir):
+        """An exception mid-save leaves the existing file untouched and no temp file behind."""
+        target = temp_save_dir / "atomic.json"
+        target.write_bytes(b'{"previous": true}')
+        
+        with pytest.raises(RuntimeError):
+            with StreamingSaveWriter(target) as writer:
+                writer.write_section('metadata', {'save_id': 'partial'})
+                raise RuntimeError("simulated crash")
+        
+        assert target.read_bytes() == b'{"previous": true}'
+        assert not list(temp_save_dir.glob(".*.tmp"))
+    
+    def test_peak_memory_bounded_by_largest_section(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """Streaming allocates on the order of one civilization, not the whole save."""
+        import tracemalloc
+        
+        class LargeCivilization:
+            def __init__(self, index):
+                self.index = index
+            
+            def model_dump(self):
+                return {'name': f'Civ {self.index}', 'leader': 'Leader', 'advisors': [],
+                        'history': [f'event {self.index}-{i} ' * 4 for i in range(1500)]}
+        
+        manager = SaveGameManager(temp_save_dir)
+        metadata = SaveGameMetadata(
+            save_id="large", game_name="Large", timestamp=datetime.now(),
+            version=SaveFileVersion.CURRENT, format=SaveFileFormat.JSON_COMPRESSED,
+            compression_level=6, game_turn=1, civilization_count=120, advisor_count=0,
+            memory_count=0, file_size=0, checksum=""
+        )
+        save_data = SaveGameData(
+            metadata=metadata,
+            game_state={'turn_state': {'turn_number': 1}},
+            memory_banks={},
+            civilizations={f'civ_{i}': LargeCivilization(i) for i in range(120)}
+        )
+        
+        tracemalloc.start()
+        try:
+            result = manager._write_save_file(save_data, temp_save_dir / "large.json.gz",
+                                              SaveFileFormat.JSON_COMPRESSED)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        assert result.payload_size > 120 * result.largest_section * 0.9
+        assert peak < result.payload_size / 4
+        assert metadata.checksum == result.checksum
+
+
+class TestSaveCatalog:
+    """Test header-only save listing and the directory index."""
+    
+    def test_save_writes_fixed_size_header(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
+        """The header carries final metadata, including checksum and file size."""
+        manager = SaveGameManager(temp_save_dir)
+        save_path = manager.save_game("header_save", mock_game_state, mock_memory_manager,
+                                      mock_civilizations, SaveFileFormat.BINARY_COMPRESSED)
+        
+        header = read_save_header(save_path)
+        assert header['game_name'] == "header_save"
+        assert header['file_size'] == save_path.stat().st_size > SAVE_HEADER_SIZE
+        assert header['checksum'] == manager.load_game(save_path).metadata.checksum
+    
+    def test_listing_reads_only_headers_and_index(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
+        """Listing never falls back to full reads for saves with headers."""
+        manager = SaveGameManager(temp_save_dir)
+        for name in ("first", "second"):
+            manager.save_game(name, mock_game_state, mock_memory_manager, mock_civilizations,
+                              SaveFileFormat.JSON_COMPRESSED)
+        
+        listed = SaveGameManager(temp_save_dir).list_save_games()
+        assert {metadata.game_name for metadata in listed} == {"first", "second"}
+        
+        fresh = SaveGameManager(temp_save_dir)
+        fresh._read_save_file_dict = Mock(side_effect=AssertionError("full read"))
+        assert len(fresh.list_save_games()) == 2
+        assert fresh.catalog.statistics['index_hits'] == 2
+    
+    def test_index_tracks_external_changes(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
+        """Replaced, removed and legacy files are reconciled on the next listing."""
+        manager = SaveGameManager(temp_save_dir)
+        kept = manager.save_game("kept", mock_game_state, mock_memory_manager, mock_civilizations, SaveFileFormat.JSON)
+        removed = manager.save_game("removed", mock_game_state, mock_memory_manager, mock_civilizations, SaveFileFormat.BINARY)
+        assert len(manager.list_save_games()) == 2
+        
+        removed.unlink()
+        legacy = temp_save_dir / "legacy.json"
+        legacy_dict = json.loads(strip_save_header(kept.read_bytes()))
+        del legacy_dict['trailer']
+        legacy_dict['metadata']['game_name'] = "legacy"
+        legacy.write_text(json.dumps(legacy_dict))
+        
+        names = sorted(metadata.game_name for metadata in manager.list_save_games())
+        assert names == ["kept", "legacy"]
+        assert manager.catalog.statistics['full_reads'] == 1
+        
+        assert manager.delete_save_game(kept, create_backup=False)
+        assert set(SaveCatalog(temp_save_dir)._load()) == {"legacy.json"}
+    
+    def test_corrupt_index_is_rebuilt(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
+        """An unreadable index is discarded and rebuilt from headers."""
+        manager = SaveGameManager(temp_save_dir)
+        manager.save_game("rebuild", mock_game_state, mock_memory_manager, mock_civilizations, SaveFileFormat.JSON)
+        manager.catalog.index_path.write_text("{not json")
+        
+        fresh = SaveGameManager(temp_save_dir)
+        assert [metadata.game_name for metadata in fresh.list_save_games()] == ["rebuild"]
+        assert fresh.catalog.statistics['rebuilds'] == 1
+        assert fresh.catalog.statistics['header_reads'] == 1
+        assert "rebuild_" in manager.catalog.index_path.read_text()
+
+
+class TestDeltaSaves:
+    """Test incremental delta saves, keyframes and compaction."""
+    
+    @staticmethod
+    def _civilizations(count=6):
+        return {f'civ_{i}': {'name': f'Civ {i}', 'leader': f'Leader {i}', 'advisors': [],
+                             'history': [f'event {i}-{n}' for n in range(200)]}
+                for i in range(count)}
+    
+    @staticmethod
+    def _leaders(civilizations):
+        return {civ_id: (civ['leader'], civ['history'][-1]) for civ_id, civ in civilizations.items()}
+    
+    def test_delta_writes_only_changed_sections(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """Unchanged civilizations are referenced and reconstructed from the keyframe."""
+        manager = SaveGameManager(temp_save_dir)
+        civilizations = self._civilizations()
+        keyframe = manager.save_game("campaign", mock_game_state, mock_memory_manager, civilizations,
+                                     SaveFileFormat.JSON, incremental=True)
+        civilizations['civ_3']['leader'] = 'Usurper'
+        delta = manager.save_game("campaign", mock_game_state, mock_memory_manager, civilizations,
+                                  SaveFileFormat.JSON, incremental=True)
+        
+        assert delta.stat().st_size - SAVE_HEADER_SIZE < (keyframe.stat().st_size - SAVE_HEADER_SIZE) / 3
+        assert read_save_header(delta)['delta_references'] == [keyframe.name]
+        
+        loaded = manager.load_game(delta)
+        assert self._leaders(loaded.civilizations) == self._leaders(civilizations)
+        assert loaded.metadata.delta_sequence == 1
+        assert loaded.game_state.turn_state.turn_number == 42
+        assert manager.load_game(keyframe).civilizations['civ_3']['leader'] == 'Leader 3'
+    
+    def test_keyframe_every_interval(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """A new chain starts every ``keyframe_interval`` saves or when its files disappear."""
+        manager = SaveGameManager(temp_save_dir, keyframe_interval=3)
+        civilizations = self._civilizations(2)
+        paths = []
+        for turn in range(5):
+            civilizations['civ_0']['history'].append(f'turn {turn}')
+            paths.append(manager.save_game("interval", mock_game_state, mock_memory_manager, civilizations,
+                                           SaveFileFormat.BINARY_COMPRESSED, incremental=True))
+        
+        assert [read_save_header(path)['delta_sequence'] for path in paths] == [0, 1, 2, 0, 1]
+        assert read_save_header(paths[4])['delta_references'] == [paths[3].name]
+        assert manager.load_game(paths[2]).civilizations['civ_0']['history'][-1] == 'turn 2'
+        
+        paths[3].unlink()
+        with pytest.raises(SaveIntegrityError):
+            manager.load_game(paths[4])
+        restarted = manager.save_game("interval", mock_game_state, mock_memory_manager, civilizations,
+                                      SaveFileFormat.BINARY_COMPRESSED, incremental=True)
+        assert read_save_header(restarted)['delta_sequence'] == 0
+    
+    def test_compaction_folds_chain_into_keyframe(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """Compaction makes the save self-contained and removes unreferenced history."""
+        manager = SaveGameManager(temp_save_dir)
+        civilizations = self._civilizations(3)
+        paths = []
+        for turn in range(3):
+            civilizations['civ_1']['leader'] = f'Leader of turn {turn}'
+            paths.append(manager.save_game("compact", mock_game_state, mock_memory_manager, civilizations,
+                                           SaveFileFormat.JSON_COMPRESSED, incremental=True))
+        
+        assert not manager.delete_save_game(paths[0], create_backup=False)
+        assert paths[0].exists()
+        
+        manager.compact_delta_chain(paths[2])
+        assert not paths[0].exists() and not paths[1].exists()
+        assert read_save_header(paths[2])['delta_references'] == []
+        assert self._leaders(manager.load_game(paths[2]).civilizations) == self._leaders(civilizations)
+        
+        civilizations['civ_2']['leader'] = 'Newcomer'
+        following = manager.save_game("compact", mock_game_state, mock_memory_manager, civilizations,
+                                      SaveFileFormat.JSON_COMPRESSED, incremental=True)
+        assert read_save_header(following)['delta_references'] == [paths[2].name]
+        assert self._leaders(manager.load_game(following).civilizations) == self._leaders(civilizations)
+        assert len(manager.list_save_games()) == 2
+
+
+class TestPackedSaveFormat:
+    """Test the packed binary container and partial loading."""
+    
+    @staticmethod
+    def _civilizations(count=5):
+        return {f'civ_{i}': {'name': f'Civ {i}', 'leader': f'Leader {i}', 'advisors': [],
+                             'resources': [float(i * n) for n in range(50)],
+                             'citizens': [{'id': n, 'loyalty': n / 100, 'faction': 'rural'} for n in range(100)]}
+                for i in range(count)}
+    
+    def test_value_encoding_round_trip(self):
+        """Arrays, record tables and nested values survive encoding."""
+        value = {
+            'floats': [0.5, 1.5, -2.25, 3.0],
+            'ints': [1, -2, 3, 1 << 40],
+            'huge': 1 << 80,
+            'records': [{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'b'}],
+            'mixed': [None, True, 'text', {'nested': [1, 2]}, b'raw'],
+            7: 'integer key'
+        }
+        assert decode_value(encode_value(value)) == value
+        samples = [n / 7 for n in range(1000)]
+        assert len(encode_value(samples)) < len(json.dumps(samples)) / 2
+    
+    def test_value_encoding_dict_keys(self):
+        """Int keys round-trip as ints; keys that cannot round-trip are rejected up front."""
+        value = {1: 'one', -2: [{3: 'three'}, {3: 'four'}], 'name': {0: None}}
+        decoded = decode_value(encode_value(value))
+        assert decoded == value
+        assert all(type(key) is int for key in decoded if key != 'name')
+        assert type(next(iter(decoded['name']))) is int
+        
+        for bad in ({(1, 2): 'tuple'}, {'records': [{(0, 0): 1}, {(0, 0): 2}]}, {1.5: 'float'}, {None: 'none'}):
+            with pytest.raises(TypeError):
+                encode_value(bad)
+    
+    def test_packed_save_round_trip(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """Packed saves load fully, list from their header and report a checksum."""
+        manager = SaveGameManager(temp_save_dir)
+        civilizations = self._civilizations()
+        save_path = manager.save_game("packed", mock_game_state, mock_memory_manager, civilizations,
+                                      SaveFileFormat.PACKED)
+        
+        loaded = manager.load_game(save_path)
+        assert loaded.civilizations['civ_3']['citizens'][42] == {'id': 42, 'loyalty': 0.42, 'faction': 'rural'}
+        assert loaded.game_state.turn_state.turn_number == 42
+        assert loaded.metadata.checksum == read_save_header(save_path)['checksum']
+        assert manager.load_save_metadata(save_path).format == SaveFileFormat.PACKED
+        assert [metadata.game_name for metadata in manager.list_save_games()] == ["packed"]
+        assert save_path.stat().st_size < manager.save_game(
+            "json", mock_game_state, mock_memory_manager, civilizations, SaveFileFormat.JSON
+        ).stat().st_size / 3
+    
+    def test_partial_load_reads_one_civilization(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """Only the requested civilization's section is read and decoded."""
+        manager = SaveGameManager(temp_save_dir)
+        save_path = manager.save_game("partial", mock_game_state, mock_memory_manager,
+                                      self._civilizations(20), SaveFileFormat.PACKED)
+        
+        loaded = manager.load_game(save_path, civilization_ids=['civ_7'])
+        assert list(loaded.civilizations) == ['civ_7']
+        assert loaded.civilizations['civ_7']['leader'] == 'Leader 7'
+        
+        with PackedSaveReader(save_path) as reader:
+            reader.read('civilizations/civ_7')
+            assert reader.bytes_read < save_path.stat().st_size / 10
+            reader.verify()
+    
+    def test_corrupted_packed_save_is_rejected(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """A flipped byte fails the checksum on load."""
+        manager = SaveGameManager(temp_save_dir)
+        save_path = manager.save_game("corrupt", mock_game_state, mock_memory_manager,
+                                      self._civilizations(), SaveFileFormat.PACKED)
+        data = bytearray(save_path.read_bytes())
+        data[SAVE_HEADER_SIZE + 64] ^= 0xFF
+        save_path.write_bytes(bytes(data))
+        
+        with pytest.raises(SaveIntegrityError):
+            manager.load_game(save_path)
+    
+    def test_section_versions_drive_migration(self, temp_save_dir):
+        """Sections tagged with an older schema version are migrated on load."""
+        manager = SaveGameManager(temp_save_dir)
+        save_path = temp_save_dir / "old.pack"
+        metadata = {
+            'save_id': 'old', 'game_name': 'Old', 'timestamp': datetime.now().isoformat(),
+            'version': '1.0', 'format': 'pack', 'compression_level': 6, 'game_turn': 1,
+            'civilization_count': 1, 'advisor_count': 0, 'memory_count': 0,
+            'file_size': 0, 'checksum': ''
+        }
+        with PackedSaveWriter(save_path, SaveFileVersion.V1_0.value) as writer:
+            writer.write_section('metadata', metadata)
+            writer.write_section('game_state', {'turn_state': {'turn_number': 1}})
+            writer.write_mapping('memory_banks', [])
+            writer.write_mapping('civilizations', [('civ_0', {'name': 'Old Civ'})])
+            writer.finish()
+        
+        with PackedSaveReader(save_path) as reader:
+            assert reader.section_version('civilizations/civ_0') == '1.0'
+        loaded = manager.load_game(save_path)
+        assert 'enhanced_politics' in loaded.civilizations['civ_0']
+
+
+class TestSaveDiff:
+    """Test streaming section reads and the structural save diff."""
+    
+    @staticmethod
+    def _civilizations(count=4):
+        return {f'civ_{i}': {'name': f'Civ {i}', 'leader': f'Leader {i}',
+                             'advisors': [{'advisor_id': f'adv_{i}_{n}', 'loyalty': 0.5} for n in range(3)],
+                             'history': [f'event {i}-{n}' for n in range(50)]}
+                for i in range(count)}
+    
+    @pytest.mark.parametrize("save_format", [SaveFileFormat.JSON, SaveFileFormat.JSON_COMPRESSED,
+                                             SaveFileFormat.BINARY_COMPRESSED, SaveFileFormat.PACKED])
+    def test_sections_stream_from_every_format(self, temp_save_dir, mock_game_state, mock_memory_manager,
+                                               save_format, monkeypatch):
+        """Streamed sections match a full read, even with tiny JSON reads."""
+        monkeypatch.setattr(save_diff, 'JSON_READ_SIZE', 7)
+        manager = SaveGameManager(temp_save_dir)
+        civilizations = self._civilizations()
+        save_path = manager.save_game("stream", mock_game_state, mock_memory_manager, civilizations, save_format)
+        
+        sections = dict(iter_save_sections(save_path))
+        assert sections['civilizations'] == {}
+        assert {path: value for path, value in sections.items() if path.startswith('civilizations/')} == {
+            f'civilizations/{civ_id}': civ for civ_id, civ in civilizations.items()
+        }
+        assert sections['game_state']['turn_state']['turn_number'] == 42
+        assert sections['metadata']['game_name'] == "stream"
+        assert 'trailer' not in sections
+    
+    def test_diff_matches_ids_and_pages(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """Identical sections are skipped, list items pair by id and reports page."""
+        manager = SaveGameManager(temp_save_dir)
+        civilizations = self._civilizations()
+        before = manager.save_game("before", mock_game_state, mock_memory_manager, civilizations,
+                                   SaveFileFormat.JSON_COMPRESSED)
+        
+        advisors = civilizations['civ_1']['advisors']
+        advisors.reverse()  # Reordering alone is not a difference
+        advisors[0]['loyalty'] = 0.9
+        del civilizations['civ_2']
+        civilizations['civ_9'] = {'name': 'Civ 9', 'leader': 'Newcomer', 'advisors': [], 'history': []}
+        after = manager.save_game("after", mock_game_state, mock_memory_manager, civilizations,
+                                  SaveFileFormat.BINARY_COMPRESSED)
+        
+        report = diff_saves(before, after, page_size=2)
+        paths = {difference['path']: difference for difference in report.iter_differences()}
+        assert paths['civilizations.civ_1.advisors[advisor_id=adv_1_2].loyalty']['value_b'] == 0.9
+        assert paths['civilizations.civ_2']['type'] == 'removed'
+        assert paths['civilizations.civ_9']['type'] == 'added'
+        assert not any(path.startswith('civilizations.civ_0') for path in paths)
+        assert report.sections_identical >= 3  # game_state, civ_0, civ_3, ...
+        assert len(paths) == report.total_differences
+        assert report.page_count == -(-report.total_differences // 2)
+        assert 0 < report.similarity_score < 1
+        report.close()
+    
+    def test_diff_resolves_delta_references(self, temp_save_dir, mock_game_state, mock_memory_manager):
+        """Sections a delta save references are read from its keyframe."""
+        manager = SaveGameManager(temp_save_dir)
+        civilizations = self._civilizations()
+        keyframe = manager.save_game("chain", mock_game_state, mock_memory_manager, civilizations,
+                                     SaveFileFormat.JSON, incremental=True)
+        civilizations['civ_3']['leader'] = 'Usurper'
+        delta = manager.save_game("chain", mock_game_state, mock_memory_manager, civilizations,
+                                  SaveFileFormat.JSON, incremental=True)
+        
+        with diff_saves(keyframe, delta) as report:
+            civ_paths = [d['path'] for d in report.differences if d['path'].startswith('civilizations')]
+            assert civ_paths == ['civilizations.civ_3.leader']
+            assert report.sections_added == report.sections_removed == 0
+
+
 class TestCompressionManager:
     """Test compression functionality."""
     
@@ -338,6 +754,43 @@ class TestCompressionManager:
         ratio_empty = manager.calculate_compression_ratio(0, 0)
         assert ratio_empty == 0.0
 
+    def test_chunked_compression(self):
+        """Chunks are independent gzip members that can be located and read by range."""
+        manager = CompressionManager(chunk_size=4096)
+        data = json.dumps([{'id': n, 'loyalty': n / 100} for n in range(2000)]).encode('utf-8')
+
+        compressed = manager.compress_data(data)
+        frames = manager.frame_index(compressed)
+        assert len(frames) == -(-len(data) // 4096)
+        assert sum(frame.length for frame in frames) == len(compressed)
+        assert gzip.decompress(compressed) == data  # Still plain multi-member gzip
+        assert manager.decompress_data(compressed) == data
+        assert manager.decompress_range(compressed, 5000, 9000) == data[5000:9000]
+
+        # Single-member gzip from elsewhere still reads, just not by frame
+        legacy = gzip.compress(data)
+        assert manager.frame_index(legacy) is None
+        assert manager.decompress_data(legacy) == data
+
+    def test_adaptive_level_is_remembered(self, temp_save_dir, mock_game_state, mock_memory_manager,
+                                          mock_civilizations):
+        """The level is sampled once per content profile and recorded in saves."""
+        manager = CompressionManager()
+        data = json.dumps({'values': list(range(5000))}).encode('utf-8')
+        level = manager.optimize_compression_level(data)
+        assert 1 <= level <= 9
+        assert manager.level_cache == {'json': level}
+        with patch('src.persistence.chunked_compression.zlib.compress') as trial:
+            assert manager.optimize_compression_level(data) == level
+        trial.assert_not_called()
+
+        save_manager = SaveGameManager(temp_save_dir, compression_level=None)
+        save_path = save_manager.save_game("adaptive", mock_game_state, mock_memory_manager,
+                                           mock_civilizations)
+        chosen = save_manager.compression_manager.level_cache[SaveFileFormat.JSON_COMPRESSED.value]
+        assert read_save_header(save_path)['compression_level'] == chosen
+        assert save_manager.load_game(save_path).metadata.compression_level == chosen
+
 
 class TestVersionManager:
     """Test version migration functionality."""
@@ -621,6 +1074,62 @@ class TestSaveFileEncryption:
         assert b"BEGIN PRIVATE KEY" in private_key
         assert b"BEGIN PUBLIC KEY" in public_key
 
+    @pytest.mark.skipif(not CRYPTO_AVAILABLE, reason="Cryptography library not available")
+    def test_streaming_chunks_are_authenticated(self):
+        """Chunks are sealed independently; tampering and truncation are caught."""
+        encryption = SaveFileEncryption()
+        key = encryption.generate_random_key()
+        config = EncryptionConfig(method=EncryptionMethod.KEY_AES256, chunk_size=1024)
+        data = os.urandom(5000)
+
+        encryptor, metadata = encryption.create_encryptor(config, key=key)
+        encrypted = b''.join(encryptor.update(data[i:i + 700]) for i in range(0, len(data), 700))
+        encrypted += encryptor.finalize()
+        assert len(encrypted) == len(data) + 5 * 16  # One tag per chunk
+        assert encryption.decrypt_save_data(encrypted, metadata, key=key) == data
+
+        tampered = bytearray(encrypted)
+        tampered[2000] ^= 1
+        with pytest.raises(ValueError):
+            encryption.decrypt_save_data(bytes(tampered), metadata, key=key)
+        with pytest.raises(ValueError):
+            encryption.decrypt_save_data(encrypted[:1024 + 16], metadata, key=key)
+
+    @pytest.mark.skipif(not CRYPTO_AVAILABLE, reason="Cryptography library not available")
+    def test_password_check_and_key_cache(self, temp_save_dir):
+        """Passwords verify from the header, and derivation runs once per session."""
+        manager = EncryptedSaveManager(temp_save_dir)
+        config = EncryptionConfig(method=EncryptionMethod.PASSWORD_AES256,
+                                  key_derivation=KeyDerivationMethod.PBKDF2, iterations=1000)
+
+        with patch.object(manager.encryption, '_run_key_derivation',
+                          wraps=manager.encryption._run_key_derivation) as derive:
+            first = manager.save_encrypted_stream([b'turn 1 ', b'state'], "autosave_1", config, password="pw")
+            second = manager.save_encrypted(b'turn 2 state', "autosave_2", config, password="pw")
+            assert manager.load_encrypted(first, password="pw") == b'turn 1 state'
+            assert manager.load_encrypted(second, password="pw") == b'turn 2 state'
+            assert derive.call_count == 1
+
+        with patch.object(manager, 'load_encrypted') as full_load:
+            assert manager.verify_password(second, "pw")
+            assert not manager.verify_password(second, "wrong")
+        full_load.assert_not_called()
+
+        # Wrong passwords are not cached, so they cannot evict the real key
+        manager.encryption.key_cache.max_entries = 1
+        for attempt in range(3):
+            assert not manager.verify_password(second, f"wrong {attempt}")
+            with pytest.raises(ValueError):
+                manager.load_encrypted(first, password=f"wrong {attempt}")
+        assert len(manager.encryption.key_cache) == 1
+        with patch.object(manager.encryption, '_run_key_derivation') as derive:
+            assert manager.load_encrypted(first, password="pw") == b'turn 1 state'
+        derive.assert_not_called()
+
+        manager.close()
+        assert len(manager.encryption.key_cache) == 0
+        assert manager.load_encrypted(first, password="pw") == b'turn 1 state'
+
 
 class TestSaveFileDebugger:
     """Test save file debugging tools."""
@@ -673,12 +1182,17 @@ class TestSaveFileDebugger:
         )
         
         # Compare
-        comparison = debugger.compare_save_files(save_path_1, save_path_2)
-        
-        assert comparison.file_a == save_path_1
-        assert comparison.file_b == save_path_2
-        assert len(comparison.differences) > 0
-        assert comparison.similarity_score < 1.0  # Should be different
+        with debugger.compare_save_files(save_path_1, save_path_2, page_size=1) as comparison:
+            assert comparison.file_a == save_path_1
+            assert comparison.file_b == save_path_2
+            assert len(comparison.differences) > 0
+            assert comparison.similarity_score < 1.0  # Should be different
+            spill = comparison.report._spill
+            assert spill is not None and not spill.closed
+        
+        # Leaving the block discards the spilled difference pages
+        assert spill.closed
+        assert comparison.report._spill is None
     
     def test_extract_save_data(self, temp_save_dir, mock_game_state, mock_memory_manager, mock_civilizations):
         """Test save data extraction."""
@@ -6,6 +6,9 @@ Tests all visualization components and integration functionality.
 
 import pytest
 import asyncio
+import gzip
+import json
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 
@@ -20,6 +23,20 @@ from visualization import (
     PoliticalDashboard, MemoryBrowserVisualization,
     IntegratedVisualizationManager, create_political_visualization_system
 )
+from visualization.layout_engine import ForceLayoutEngine
+from visualization.timeline import TimelineIndex, TimelineEvent, EventCategory
+from visualization.network_graph import NetworkLayout
+from visualization.timeseries import MetricTimeSeries, TimeSeriesStore
+from visualization.memory_browser import (
+    MemoryEntry, MemoryGraph, MemorySearchFilter, MemorySearchIndex,
+    MemoryType, MemoryImportance, MemoryEmotion
+)
+from visualization.dashboard import MetricType
+from visualization.base import RealTimeDataProvider
+from visualization.update_bus import UpdateBus
+from visualization.serving import (
+    VisualizationPublisher, VisualizationHTTPServer, diff_documents, apply_delta
+)
 
 
 class TestVisualizationComponents:
@@ -289,6 +306,377 @@ class TestVisualizationComponents:
         await browser.stop()
 
 
+class TestNetworkLayoutEngine:
+    """Test the vectorized force-directed layout engine."""
+    
+    @staticmethod
+    def _graph(node_count):
+        nodes = [{'id': f"node_{i}"} for i in range(node_count)]
+        links = [
+            {'source': f"node_{i}", 'target': f"node_{(i * 7 + 3) % node_count}", 'strength': 0.6}
+            for i in range(node_count)
+        ]
+        return nodes, links
+    
+    def test_positions_stay_within_bounds(self):
+        """Test that every node is placed inside the canvas margins."""
+        nodes, links = self._graph(60)
+        positions = NetworkLayout.force_directed_layout(nodes, links, 800, 600)
+        
+        assert set(positions) == {node['id'] for node in nodes}
+        assert all(50 <= p['x'] <= 750 and 50 <= p['y'] <= 550 for p in positions.values())
+    
+    def test_barnes_hut_approximates_exact_repulsion(self):
+        """Test that the quadtree approximation tracks exact pairwise repulsion."""
+        import numpy as np
+        positions = np.random.default_rng(7).uniform(0, 2000, (800, 2))
+        exact = ForceLayoutEngine()._exact_repulsion(positions)
+        approximate = ForceLayoutEngine(theta=0.5)._barnes_hut_repulsion(positions)
+        
+        error = np.linalg.norm(exact - approximate, axis=1) / np.linalg.norm(exact, axis=1)
+        assert np.median(error) < 0.05
+    
+    def test_warm_start_converges_quickly(self):
+        """Test that an incremental update settles in a handful of iterations."""
+        engine = ForceLayoutEngine()
+        nodes, links = self._graph(150)
+        positions = engine.layout(nodes, links, 1200, 1200, iterations=300)
+        cold_iterations = engine.statistics.iterations
+        
+        nodes.append({'id': 'newcomer'})
+        links.append({'source': 'newcomer', 'target': 'node_0', 'strength': 0.9})
+        updated = engine.layout(nodes, links, 1200, 1200, iterations=300, initial_positions=positions)
+        
+        assert engine.statistics.warm_started == 150
+        assert engine.statistics.converged
+        assert engine.statistics.iterations < cold_iterations
+        assert 'newcomer' in updated
+    
+    def test_time_budget_limits_iterations(self):
+        """Test that the layout stops once its time budget is spent."""
+        engine = ForceLayoutEngine(barnes_hut_threshold=100)
+        nodes, links = self._graph(600)
+        engine.layout(nodes, links, 2000, 2000, iterations=1000, time_budget=0.0)
+        
+        assert engine.statistics.method == "barnes_hut"
+        assert engine.statistics.iterations == 1
+
+
+class TestTimelineIndex:
+    """Test the time-sorted timeline event index."""
+    
+    @staticmethod
+    def _events(count, spacing_minutes=10):
+        base = datetime(2026, 1, 1)
+        categories = list(EventCategory)
+        return [
+            TimelineEvent(f"event_{i}", base + timedelta(minutes=(i * 37) % count * spacing_minutes),
+                          f"Event {i}", categories[i % len(categories)], severity=(i % 10) / 10 + 0.05)
+            for i in range(count)
+        ]
+    
+    def test_query_matches_linear_filter(self):
+        """Test that indexed range and filter queries match a linear scan."""
+        events = self._events(500)
+        index = TimelineIndex()
+        index.rebuild(events)
+        
+        start, end = datetime(2026, 1, 1, 10), datetime(2026, 1, 2, 20)
+        categories = {EventCategory.MILITARY, EventCategory.CRISIS, EventCategory.ECONOMIC}
+        severity_range = (0.25, 0.7)
+        expected = sorted(
+            (e for e in events if start <= e.timestamp <= end and e.category in categories
+             and severity_range[0] <= e.severity <= severity_range[1]),
+            key=lambda e: e.timestamp
+        )
+        
+        result = index.query(start, end, categories, severity_range)
+        assert [e.timestamp for e in result] == [e.timestamp for e in expected]
+        assert {e.event_id for e in result} == {e.event_id for e in expected}
+        assert index.count(start, end, categories, severity_range) == len(expected)
+    
+    def test_in_band_severity_update_is_filtered(self):
+        """Test that a severity change within the same band is honored by filters."""
+        base = datetime(2026, 1, 1)
+        events = [TimelineEvent(f"e{i}", base + timedelta(minutes=i), "t", EventCategory.POLITICAL, severity=severity)
+                  for i, severity in enumerate([0.55, 0.58])]
+        index = TimelineIndex()
+        index.rebuild(events)
+        
+        events[0].severity = 0.51
+        index.reindex(events[0])
+        
+        assert [e.event_id for e in index.query(severity_range=(0.53, 1.0))] == ["e1"]
+        assert index.count(severity_range=(0.53, 1.0)) == 1
+        assert index.count(severity_range=(0.5, 0.52)) == 1
+    
+    def test_emptied_buckets_are_dropped(self):
+        """Test that a bucket and its severity bounds go away with its last event."""
+        base = datetime(2026, 1, 1)
+        events = [TimelineEvent(f"e{i}", base + timedelta(minutes=i), "t", EventCategory.POLITICAL, severity=severity)
+                  for i, severity in enumerate([0.51, 0.59])]
+        index = TimelineIndex()
+        index.rebuild(events)
+        bucket_key = (EventCategory.POLITICAL, 5)
+        
+        index.remove(events[0])
+        events[1].severity = 0.9
+        index.reindex(events[1])
+        assert bucket_key not in index._buckets
+        assert bucket_key not in index._severity_bounds
+        
+        # A refilled bucket starts from fresh bounds rather than the old range
+        late = TimelineEvent("e2", base + timedelta(minutes=5), "t", EventCategory.POLITICAL, severity=0.55)
+        index.add(late)
+        assert index._severity_bounds[bucket_key] == (0.55, 0.55)
+        assert [e.event_id for e in index.query(severity_range=(0.5, 0.6))] == ["e2"]
+    
+    def test_lanes_separate_nearby_events(self):
+        """Test that events closer than the lane gap never share a lane."""
+        index = TimelineIndex(lane_gap_seconds=3600, max_lanes=4)
+        base = datetime(2026, 1, 1)
+        for i, minutes in enumerate([0, 20, 40, 200, 10]):
+            index.add(TimelineEvent(f"e{i}", base + timedelta(minutes=minutes), "t", EventCategory.POLITICAL))
+        
+        assert index.lanes["e0"] == 0
+        assert index.lanes["e1"] == 1
+        assert index.lanes["e2"] == 2
+        assert index.lanes["e3"] == 0  # Far enough from e0 to reuse the first lane
+        assert index.lanes["e4"] == 3
+    
+    def test_histogram_counts_all_visible_events(self):
+        """Test level-of-detail buckets account for every matching event."""
+        events = self._events(1000)
+        index = TimelineIndex()
+        index.rebuild(events)
+        start, end = datetime(2026, 1, 1), datetime(2026, 1, 8)
+        
+        bins = index.histogram(start, end, 20, severity_range=(0.3, 1.0))
+        
+        assert len(bins) == 20
+        assert sum(sum(counts.values()) for counts in bins) == index.count(start, end, severity_range=(0.3, 1.0))
+    
+    @pytest.mark.asyncio
+    async def test_timeline_switches_to_aggregates_when_zoomed_out(self):
+        """Test that a dense timeline renders bucketed counts until zoomed in."""
+        config = VisualizationConfig(
+            component_id="timeline_lod", component_type="event_timeline",
+            layout_options={'width': 1000, 'height': 400, 'lod_threshold': 100}
+        )
+        timeline = EventTimelineVisualization(config)
+        await timeline.initialize()
+        for event in self._events(2000):
+            await timeline._add_event({
+                'event_id': event.event_id, 'timestamp': event.timestamp.isoformat(),
+                'title': event.title, 'category': event.category.value, 'severity': event.severity
+            })
+        await timeline._update_timeline_scale()
+        
+        render_data = await timeline.render()
+        assert render_data['config']['level_of_detail'] == 'aggregated'
+        assert sum(a['count'] for a in render_data['data']['aggregates']) == 2000
+        
+        await timeline.handle_interaction({
+            'type': 'zoom', 'factor': 100, 'center_time': datetime(2026, 1, 5).isoformat()
+        })
+        render_data = await timeline.render()
+        assert render_data['config']['level_of_detail'] == 'events'
+        assert 0 < len(render_data['data']['events']) <= 100
+        
+        await timeline._remove_event(render_data['data']['events'][0]['event']['event_id'])
+        assert len(timeline.index) == 1999
+        await timeline.stop()
+
+
+class TestDashboardTimeSeries:
+    """Test the ring-buffer metric history behind dashboard charts."""
+    
+    def test_ring_buffer_rollups_and_downsampling(self):
+        """Test bounded raw history, rollup fallback and min/max/mean buckets."""
+        series = MetricTimeSeries(raw_capacity=100, minute_capacity=200, hour_capacity=10)
+        base = 1_800_000_000.0
+        for i in range(600):
+            series.append(base + i * 10, float(i % 60))
+        
+        assert len(series) == 100
+        assert series.resolution_for(base + 5500) == 'raw'
+        assert series.resolution_for(base) == 'minute'
+        assert series.count(base + 5000, base + 5990) == 100
+        assert series.count(base, base + 6000) == 600
+        
+        result = series.query(base, base + 6000, max_points=20)
+        assert len(result['timestamps']) <= 20
+        assert result['minimum'].min() == 0.0
+        assert result['maximum'].max() == 59.0
+        assert np.all(result['minimum'] <= result['mean'])
+        assert np.all(result['mean'] <= result['maximum'])
+        assert abs(result['mean'].mean() - 29.5) < 1.0
+    
+    def test_chart_payload_cached_until_new_data(self):
+        """Test that chart payloads are reused until a new sample lands."""
+        store = TimeSeriesStore()
+        now = datetime.now()
+        for i in range(50):
+            store.append('stability', now - timedelta(minutes=50 - i), i / 50)
+        
+        start = now - timedelta(hours=2)
+        first = store.chart_points('stability', start, now, max_points=10)
+        assert store.chart_points('stability', start, now, max_points=10) is first
+        assert store.cache_hits == 1 and len(first) <= 10
+        
+        store.append('stability', now, 1.0)
+        refreshed = store.chart_points('stability', start, now + timedelta(seconds=1), max_points=10)
+        assert refreshed is not first
+        assert refreshed[-1]['max'] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_dashboard_line_chart_uses_time_series(self):
+        """Test that dashboard line charts and crisis counts read the ring buffers."""
+        dashboard = PoliticalDashboard(VisualizationConfig(
+            component_id="dashboard", component_type="dashboard",
+            layout_options={'auto_refresh': False}
+        ))
+        await dashboard.initialize()
+        
+        for i in range(300):
+            await dashboard._store_metric(MetricType.POLITICAL_STABILITY, (i % 10) / 10)
+        dashboard.widgets['stability_trend'].config['pixel_width'] = 50
+        await dashboard._update_widgets()
+        
+        points = dashboard.widgets['stability_trend'].data['series'][0]['data']
+        assert 0 < len(points) <= 50
+        assert min(p['min'] for p in points) == 0.0
+        assert max(p['max'] for p in points) == 0.9
+        
+        await dashboard._update_crisis_metrics({})
+        await dashboard._update_crisis_metrics({})
+        assert dashboard.current_values[MetricType.CRISIS_FREQUENCY].value == 1
+        
+        export = await dashboard.handle_interaction({'type': 'export_data'})
+        assert len(export['data']['historical_data']['political_stability']) == 300
+        await dashboard.stop()
+
+
+class TestMemoryBrowserIndex:
+    """Test the memory browser search index, cursors and cluster maintenance."""
+    
+    WORDS = ['treaty', 'border', 'harvest', 'rebellion', 'council', 'victory', 'famine', 'trade']
+    
+    @classmethod
+    def _memory(cls, i, related=None):
+        return MemoryEntry(
+            memory_id=f"memory_{i}", advisor_id=f"advisor_{i % 7}",
+            title=f"{cls.WORDS[i % 8].title()} report {i}",
+            content=f"The {cls.WORDS[(i * 3) % 8]} after the {cls.WORDS[(i * 5) % 8]} changed everything",
+            memory_type=list(MemoryType)[i % len(MemoryType)],
+            importance=list(MemoryImportance)[i % len(MemoryImportance)],
+            emotional_tone=list(MemoryEmotion)[i % len(MemoryEmotion)],
+            timestamp=datetime(2026, 1, 1) + timedelta(minutes=(i * 37) % 1000),
+            tags=[cls.WORDS[i % 5], f"turn_{i % 11}"], participants=[f"advisor_{(i + 1) % 7}"],
+            related_memories=related or [], metadata={}
+        )
+    
+    @staticmethod
+    def _linear_filter(memories, search_filter):
+        results = []
+        for memory in memories:
+            if search_filter.advisor_ids and memory.advisor_id not in search_filter.advisor_ids:
+                continue
+            if memory.memory_type not in search_filter.memory_types:
+                continue
+            if memory.importance not in search_filter.importance_levels:
+                continue
+            if search_filter.tags and not any(tag in memory.tags for tag in search_filter.tags):
+                continue
+            if search_filter.date_range and not (
+                    search_filter.date_range[0] <= memory.timestamp <= search_filter.date_range[1]):
+                continue
+            text = f"{memory.title} {memory.content} {' '.join(memory.tags)}".lower()
+            if search_filter.search_text and search_filter.search_text.lower() not in text:
+                continue
+            results.append(memory.memory_id)
+        return set(results)
+    
+    def test_search_matches_linear_filter(self):
+        """Test that indexed filters match substring and facet semantics of a scan."""
+        memories = [self._memory(i) for i in range(400)]
+        by_id = {memory.memory_id: memory for memory in memories}
+        index = MemorySearchIndex()
+        index.rebuild(memories)
+        
+        filters = [
+            MemorySearchFilter(search_text='ARVES'),
+            MemorySearchFilter(search_text='famine changed'),
+            MemorySearchFilter(search_text='after the trade', advisor_ids={'advisor_2', 'advisor_3'}),
+            MemorySearchFilter(tags={'council', 'turn_4'}, importance_levels={MemoryImportance.HIGH}),
+            MemorySearchFilter(memory_types={MemoryType.PERSONAL_EXPERIENCE},
+                               date_range=(datetime(2026, 1, 1, 3), datetime(2026, 1, 1, 9))),
+            MemorySearchFilter()
+        ]
+        for search_filter in filters:
+            assert set(index.search(search_filter, by_id)) == self._linear_filter(memories, search_filter)
+        
+        updated = by_id['memory_5']
+        updated.content = 'A secret coronation'
+        index.add(updated)
+        index.remove('memory_6')
+        del by_id['memory_6']
+        assert set(index.search(MemorySearchFilter(search_text='coronat'), by_id)) == {'memory_5'}
+        assert 'memory_6' not in set(index.search(MemorySearchFilter(), by_id))
+    
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_walks_sorted_results(self):
+        """Test that following cursors visits every match once in sort order."""
+        browser = MemoryBrowserVisualization(VisualizationConfig(
+            component_id="memories", component_type="memory_browser",
+            layout_options={'page_size': 25}
+        ))
+        for i in range(300):
+            await browser._add_memory(self._memory(i).to_dict())
+        await browser.handle_interaction({'type': 'filter_change', 'filters': {'advisor_ids': ['advisor_1', 'advisor_4']}})
+        await browser.handle_interaction({'type': 'sort_change', 'sort_by': 'importance', 'sort_order': 'desc'})
+        
+        seen = []
+        render_data = await browser.render()
+        while True:
+            seen.extend(item['memory']['memory_id'] for item in render_data['data']['memories'])
+            cursor = render_data['data']['pagination']['next_cursor']
+            if cursor is None:
+                break
+            result = await browser.handle_interaction({'type': 'page_change', 'cursor': cursor})
+            assert result['status'] == 'success'
+            render_data = await browser.render()
+        
+        assert seen == browser.search_results
+        assert len(seen) == len(set(seen)) == render_data['data']['pagination']['total_results']
+        ranks = [MemorySearchIndex.IMPORTANCE_RANK[browser.memories[m].importance.value] for m in seen]
+        assert ranks == sorted(ranks, reverse=True)
+        
+        await browser.handle_interaction({'type': 'page_change', 'page': 2})
+        render_data = await browser.render()
+        assert [item['memory']['memory_id'] for item in render_data['data']['memories']] == seen[50:75]
+        assert (await browser.handle_interaction({'type': 'page_change', 'cursor': 'bogus'}))['status'] == 'error'
+    
+    def test_union_find_clusters_track_edges(self):
+        """Test that clusters merge on edge insertion and split on removal."""
+        graph = MemoryGraph()
+        for i in range(6):
+            graph.add_memory(self._memory(i))
+        graph.add_edge('memory_0', 'memory_1')
+        graph.add_edge('memory_1', 'memory_2')
+        graph.add_edge('memory_3', 'memory_4')
+        
+        clusters = sorted(sorted(members) for members in graph.find_memory_clusters().values())
+        assert clusters == [['memory_0', 'memory_1', 'memory_2'], ['memory_3', 'memory_4'], ['memory_5']]
+        assert len(graph.find_memory_clusters(min_size=2)) == 2
+        
+        graph.remove_memory('memory_1')
+        clusters = sorted(sorted(members) for members in graph.find_memory_clusters(min_size=2).values())
+        assert clusters == [['memory_3', 'memory_4']]
+        assert graph.get_memory_connections('memory_0') == []
+        assert all('memory_1' not in (edge['source'], edge['target']) for edge in graph.edges)
+
+
 class TestIntegratedVisualizationManager:
     """Test the integrated visualization manager."""
     
@@ -516,6 +904,249 @@ class TestVisualizationSystemIntegration:
         await system.shutdown()
 
 
+class TestUpdateBus:
+    """Test coalesced, prioritised and frame-budgeted update delivery."""
+    
+    @staticmethod
+    def _update(update_type, data_type='advisor_update', value=None):
+        return VisualizationUpdate(
+            update_type=update_type,
+            data=[DataPoint(data_type=data_type, value=value, timestamp=datetime.now())],
+            timestamp=datetime.now(),
+            source="test"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_frame_coalesces_and_delivers_events_first(self):
+        """Pending updates merge per component and real-time events jump the queue."""
+        delivered = []
+        
+        async def deliver(component_id, update):
+            delivered.append((component_id, update.update_type, [p.value for p in update.data]))
+            return True
+        
+        bus = UpdateBus(deliver, frame_budget=1.0)
+        for i in range(5):
+            bus.submit('network', self._update(UpdateType.INCREMENTAL_UPDATE, value=i))
+        bus.submit('dashboard', self._update(UpdateType.FULL_REFRESH, 'political_stability', 'old'))
+        bus.submit('dashboard', self._update(UpdateType.FULL_REFRESH, 'political_stability', 'new'))
+        bus.submit('timeline', self._update(UpdateType.REAL_TIME_EVENT, 'live_event', 'crisis'))
+        assert bus.is_dirty('network') and len(bus) == 3
+        
+        frame = await bus.run_frame()
+        assert [component for component, _, _ in delivered] == ['timeline', 'network', 'dashboard']
+        assert delivered[1] == ('network', UpdateType.INCREMENTAL_UPDATE, [0, 1, 2, 3, 4])
+        assert delivered[2][2] == ['new']
+        assert frame.delivered_updates == 3
+        assert frame.coalesced_updates == 5
+        assert len(bus) == 0
+    
+    @pytest.mark.asyncio
+    async def test_frame_budget_defers_remaining_components(self):
+        """An exhausted budget carries work over, one component per frame at minimum."""
+        delivered = []
+        
+        async def deliver(component_id, update):
+            delivered.append(component_id)
+            return True
+        
+        bus = UpdateBus(deliver, frame_budget=0.0)
+        for component_id in ('a', 'b', 'c'):
+            bus.submit(component_id, self._update(UpdateType.INCREMENTAL_UPDATE))
+        
+        frame = await bus.run_frame()
+        assert frame.delivered_components == 1
+        assert frame.deferred_components == 2
+        assert await bus.flush() == 2
+        assert delivered == ['a', 'b', 'c']
+        assert bus.statistics.frames == 3
+        assert bus.get_statistics()['deferred_components'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_manager_routes_updates_through_bus(self):
+        """Bursts of manager updates reach each component once per frame."""
+        manager = IntegratedVisualizationManager()
+        await manager.initialize()
+        await manager.create_component('political_dashboard', 'dashboard',
+                                       {'layout_options': {'auto_refresh': False}})
+        await manager.enable_update_bus(start=False)
+        dashboard = manager.components['dashboard']
+        calls = []
+        original_update = dashboard.update
+        
+        async def counting_update(update):
+            calls.append(len(update.data))
+            return await original_update(update)
+        
+        dashboard.update = counting_update
+        for i in range(10):
+            await manager.update_all_components([DataPoint(
+                data_type='political_stability', value={'stability_score': i / 10},
+                timestamp=datetime.now()
+            )])
+        
+        assert calls == []
+        assert manager.get_component_version('dashboard') == 1
+        assert await manager.flush_updates() == 1
+        assert calls == [10]
+        assert manager.get_component_version('dashboard') == 2
+        assert dashboard.current_values[MetricType.POLITICAL_STABILITY].value == 0.9
+        assert manager.get_system_status()['update_bus']['coalesced_updates'] == 9
+        await manager.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_data_provider_batches_bursts(self):
+        """The provider sleeps while idle and groups a burst into one batch."""
+        provider = RealTimeDataProvider(batch_interval=0.01)
+        await provider.initialize()
+        batches = []
+        
+        async def on_data(data):
+            if isinstance(data, list):
+                batches.append(len(data))
+        
+        await provider.subscribe('political_stability', on_data)
+        for i in range(4):
+            await provider.publish_data(DataPoint('political_stability', i, datetime.now()))
+        await asyncio.sleep(0.05)
+        assert batches == [4]
+        await provider.stop()
+
+
+class TestVisualizationServing:
+    """Test the cached publisher, delta encoding and async HTTP server."""
+    
+    @staticmethod
+    def _advisor(advisor_id, loyalty=0.5):
+        return DataPoint(
+            data_type='advisor_added',
+            value={'advisor_id': advisor_id, 'name': advisor_id.title(), 'role': 'military',
+                   'loyalty': loyalty, 'influence': 0.5},
+            timestamp=datetime.now()
+        )
+    
+    @staticmethod
+    async def _read_response(reader):
+        head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').split('\r\n')
+        status = int(head[0].split(' ')[1])
+        headers = {}
+        for line in head[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get('content-length', 0)))
+        return status, headers, body
+    
+    def test_keyed_list_diff_round_trips(self):
+        """Keyed lists produce element operations that rebuild the new document."""
+        old = {'nodes': [{'id': 'a', 'v': 1}, {'id': 'b', 'v': 2}, {'id': 'c', 'v': 3}],
+               'links': [{'source': 'a', 'target': 'b', 'strength': 0.2}],
+               'labels': ['x', 'y'], 'stale': True}
+        new = {'nodes': [{'id': 'c', 'v': 3}, {'id': 'a', 'v': 5}, {'id': 'd', 'v': 4}],
+               'links': [{'source': 'a', 'target': 'b', 'strength': 0.2}],
+               'labels': ['x', 'z']}
+        
+        ops = diff_documents(old, new)
+        by_op = {(op['op'], tuple(op['path'])): op for op in ops}
+        assert by_op[('delete', ('nodes',))]['keys'] == ['b']
+        assert by_op[('upsert', ('nodes',))]['keys'] == ['a', 'd']
+        assert ('order', ('nodes',)) in by_op
+        assert by_op[('set', ('labels',))]['value'] == ['x', 'z']
+        assert ('remove', ('stale',)) in by_op
+        assert not any(op['path'][0] == 'links' for op in ops)
+        assert apply_delta(json.loads(json.dumps(old)), ops) == new
+    
+    @pytest.mark.asyncio
+    async def test_publisher_renders_once_per_version_and_pushes_deltas(self):
+        """Unchanged components are served from cache; changes push element deltas."""
+        manager = IntegratedVisualizationManager()
+        await manager.initialize()
+        await manager.create_component('advisor_network', 'net')
+        await manager.update_all_components([self._advisor('a1'), self._advisor('a2')])
+        
+        publisher = VisualizationPublisher(manager, max_age=None)
+        publisher.publish('network', 'net', section='data')
+        assert await publisher.refresh() == ['network']
+        assert await publisher.refresh() == []
+        assert publisher.statistics.renders == 1
+        assert publisher.statistics.cache_hits == 1
+        
+        subscription = publisher.subscribe()
+        event, message = subscription.queue.get_nowait()
+        assert event == 'snapshot'
+        snapshot = json.loads(message)
+        document = snapshot['data']
+        
+        # In-place mutation of one node must be picked up from the decoupled copy
+        await manager.update_all_components([DataPoint(
+            data_type='advisor_update', value={'advisor_id': 'a1', 'loyalty': 0.9},
+            timestamp=datetime.now()
+        )])
+        assert await publisher.refresh() == ['network']
+        event, message = subscription.queue.get_nowait()
+        delta = json.loads(message)
+        assert event == 'delta'
+        assert delta['base_etag'] == snapshot['etag']
+        node_ops = [op for op in delta['ops'] if op['path'] == ['nodes']]
+        assert [op['keys'] for op in node_ops if op['op'] == 'upsert'] == [['a1']]
+        assert apply_delta(document, delta['ops']) == json.loads(publisher.get('network').body)
+        
+        publisher.unsubscribe(subscription)
+        await manager.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_http_server_etag_gzip_and_event_stream(self):
+        """Polling honours ETags and gzip; the event stream carries snapshot then delta."""
+        manager = IntegratedVisualizationManager()
+        await manager.initialize()
+        await manager.create_component('advisor_network', 'net')
+        await manager.update_all_components([self._advisor(f'a{i}') for i in range(20)])
+        
+        publisher = VisualizationPublisher(manager, max_age=None, gzip_min_size=0)
+        publisher.publish('network', 'net', section='data')
+        await publisher.refresh()
+        server = VisualizationHTTPServer(publisher, port=0)
+        await server.start()
+        
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(b'GET /api/network HTTP/1.1\r\nHost: x\r\nAccept-Encoding: gzip\r\n\r\n')
+            status, headers, body = await self._read_response(reader)
+            payload = publisher.get('network')
+            assert status == 200
+            assert headers['content-encoding'] == 'gzip'
+            assert headers['etag'] == payload.etag
+            assert gzip.decompress(body) == payload.body
+            
+            # Same keep-alive connection, conditional request
+            writer.write(f'GET /api/network HTTP/1.1\r\nIf-None-Match: {payload.etag}\r\n\r\n'.encode())
+            status, headers, body = await self._read_response(reader)
+            assert status == 304 and body == b''
+            
+            writer.write(b'GET /api/missing HTTP/1.1\r\nConnection: close\r\n\r\n')
+            status, _, _ = await self._read_response(reader)
+            assert status == 404
+            writer.close()
+            
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            writer.write(b'GET /api/stream?channels=network HTTP/1.1\r\n\r\n')
+            await reader.readuntil(b'\r\n\r\n')
+            first = await asyncio.wait_for(reader.readuntil(b'\n\n'), 2)
+            assert first.startswith(b'event: snapshot')
+            
+            await manager.update_all_components([self._advisor('late')])
+            await publisher.refresh()
+            second = await asyncio.wait_for(reader.readuntil(b'\n\n'), 2)
+            assert second.startswith(b'event: delta')
+            delta = json.loads(second.split(b'data: ', 1)[1])
+            upserts = [op for op in delta['ops'] if op['op'] == 'upsert' and op['path'] == ['nodes']]
+            assert upserts[0]['keys'] == ['late']
+            writer.close()
+        finally:
+            await server.close()
+            await manager.shutdown()
+
+
 # Mock game interface for testing
 class MockGameInterface:
     """Mock game interface for testing visualization integration."""
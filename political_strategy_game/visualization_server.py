@@ -9,22 +9,32 @@ import sys
 import os
 from datetime import datetime
 from typing import Dict, List, Any
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from visualization.integrated_manager import IntegratedVisualizationManager
 from visualization.base import DataPoint
+from visualization.serving import VisualizationPublisher
 
 app = FastAPI(title="Political Strategy Game Visualization Server")
 
 # Global state
 visualization_manager = None
+publisher = None
 connected_clients: List[WebSocket] = []
 
+# API channel -> (component ID, rendered section)
+CHANNELS = {
+    'network': ('main_network', 'data'),
+    'timeline': ('main_timeline', 'data'),
+    'dashboard': ('main_dashboard', 'data'),
+    'memory': ('main_memory', 'data')
+}
+
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
@@ -52,7 +62,7 @@ manager = ConnectionManager()
 @app.on_event("startup")
 async def startup_event():
     """Initialize the visualization system on startup."""
-    global visualization_manager
+    global visualization_manager, publisher
     
     print("🚀 Starting Political Strategy Game Visualization Server...")
     
@@ -71,6 +81,16 @@ async def startup_event():
         
         print("✅ All visualization components created")
         
+        # Coalesce bursts of updates into budgeted frames
+        await visualization_manager.enable_update_bus()
+        
+        # Render cache and delta fan-out; requests never render components themselves
+        publisher = VisualizationPublisher(visualization_manager, refresh_interval=0.5)
+        for channel, (component_id, section) in CHANNELS.items():
+            publisher.publish(channel, component_id, section)
+        await publisher.refresh()
+        asyncio.create_task(publisher.run())
+        
         # Start background task to generate sample data
         asyncio.create_task(generate_sample_data())
         
@@ -82,12 +102,15 @@ async def shutdown_event():
     """Clean shutdown of visualization system."""
     global visualization_manager
     
+    if publisher:
+        publisher.stop()
+    
     if visualization_manager:
         await visualization_manager.shutdown()
         print("✅ Visualization manager shut down cleanly")
 
 async def generate_sample_data():
-    """Generate sample political data and broadcast updates."""
+    """Generate sample political data; the publisher pushes the resulting deltas."""
     await asyncio.sleep(2)  # Wait for everything to initialize
     
     advisor_names = ["Chancellor Vex", "Admiral Rex", "Minister Kala", "General Thane", "Diplomat Zara"]
@@ -130,26 +153,6 @@ async def generate_sample_data():
             # Update visualization components
             if visualization_manager:
                 await visualization_manager.update_all_components(sample_data)
-                
-                # Get rendered data from components
-                network_data = await get_network_data()
-                timeline_data = await get_timeline_data()
-                dashboard_data = await get_dashboard_data()
-                memory_data = await get_memory_data()
-                
-                # Broadcast to all connected clients
-                update_message = {
-                    'type': 'visualization_update',
-                    'timestamp': datetime.now().isoformat(),
-                    'data': {
-                        'network': network_data,
-                        'timeline': timeline_data,
-                        'dashboard': dashboard_data,
-                        'memory': memory_data
-                    }
-                }
-                
-                await manager.broadcast(json.dumps(update_message))
             
             counter += 1
             await asyncio.sleep(5)  # Update every 5 seconds
@@ -158,54 +161,34 @@ async def generate_sample_data():
             print(f"Error generating sample data: {e}")
             await asyncio.sleep(5)
 
-async def get_network_data():
-    """Get network visualization data."""
-    try:
-        if 'main_network' in visualization_manager.components:
-            component = visualization_manager.components['main_network']
-            rendered = await component.render()
-            return rendered.get('data', {})
-    except Exception as e:
-        print(f"Error getting network data: {e}")
-    return {}
-
-async def get_timeline_data():
-    """Get timeline visualization data."""
-    try:
-        if 'main_timeline' in visualization_manager.components:
-            component = visualization_manager.components['main_timeline']
-            rendered = await component.render()
-            return rendered.get('data', {})
-    except Exception as e:
-        print(f"Error getting timeline data: {e}")
-    return {}
-
-async def get_dashboard_data():
-    """Get dashboard visualization data."""
-    try:
-        if 'main_dashboard' in visualization_manager.components:
-            component = visualization_manager.components['main_dashboard']
-            rendered = await component.render()
-            return rendered.get('data', {})
-    except Exception as e:
-        print(f"Error getting dashboard data: {e}")
-    return {}
+def cached_response(request: Request, channel: str) -> Response:
+    """Serve a published payload with ETag revalidation and gzip negotiation."""
+    payload = publisher.get(channel) if publisher else None
+    if payload is None:
+        return Response(content=b'{}', media_type='application/json')
+    
+    headers = {'ETag': payload.etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if payload.etag in [tag.strip() for tag in request.headers.get('if-none-match', '').split(',')]:
+        return Response(status_code=304, headers=headers)
+    
+    body = payload.body
+    if payload.gzipped is not None and 'gzip' in request.headers.get('accept-encoding', ''):
+        body = payload.gzipped
+        headers['Content-Encoding'] = 'gzip'
+    return Response(content=body, media_type='application/json', headers=headers)
 
-async def get_memory_data():
-    """Get memory browser visualization data."""
-    try:
-        if 'main_memory' in visualization_manager.components:
-            component = visualization_manager.components['main_memory']
-            rendered = await component.render()
-            return rendered.get('data', {})
-    except Exception as e:
-        print(f"Error getting memory data: {e}")
-    return {}
+async def forward_deltas(websocket: WebSocket, subscription):
+    """Relay snapshot and delta messages from the publisher to one client."""
+    while True:
+        _, message = await subscription.queue.get()
+        await websocket.send_text(message.decode('utf-8'))
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time visualization updates."""
+    """WebSocket endpoint pushing snapshots followed by element-level deltas."""
     await manager.connect(websocket)
+    subscription = None
+    sender = None
     
     try:
         # Send initial data
@@ -216,34 +199,30 @@ async def websocket_endpoint(websocket: WebSocket):
         }
         await websocket.send_text(json.dumps(initial_message))
         
+        if publisher:
+            subscription = publisher.subscribe()
+            sender = asyncio.create_task(forward_deltas(websocket, subscription))
+        
         # Keep connection alive and handle incoming messages
         while True:
             data = await websocket.receive_text()
             message = json.loads(data)
             
-            if message.get('type') == 'request_update':
-                # Send current visualization state
-                network_data = await get_network_data()
-                timeline_data = await get_timeline_data()
-                dashboard_data = await get_dashboard_data()
-                memory_data = await get_memory_data()
-                
-                response = {
-                    'type': 'visualization_update',
-                    'timestamp': datetime.now().isoformat(),
-                    'data': {
-                        'network': network_data,
-                        'timeline': timeline_data,
-                        'dashboard': dashboard_data,
-                        'memory': memory_data
-                    }
-                }
-                
-                await websocket.send_text(json.dumps(response))
+            if message.get('type') == 'request_update' and publisher:
+                # Resend current snapshots; subsequent deltas apply on top of them
+                for channel in CHANNELS:
+                    payload = publisher.get(channel)
+                    if payload is not None:
+                        await websocket.send_text(payload.snapshot_message().decode('utf-8'))
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
         print("Client disconnected from WebSocket")
+    finally:
+        if sender:
+            sender.cancel()
+        if subscription:
+            publisher.unsubscribe(subscription)
 
 @app.get("/")
 async def get_visualization_page():
@@ -256,12 +235,13 @@ async def get_visualization_page():
 async def get_status():
     """Get current system status."""
     if visualization_manager:
-        status = await visualization_manager.get_system_status()
+        status = visualization_manager.get_system_status()
         return {
             'status': 'running',
             'components': status.get('active_components', 0),
             'initialized': status.get('initialized', False),
             'connected_clients': len(manager.active_connections),
+            'serving': publisher.get_status() if publisher else None,
             'timestamp': datetime.now().isoformat()
         }
     else:
@@ -274,24 +254,24 @@ async def get_status():
         }
 
 @app.get("/api/network")
-async def get_network_api():
+async def get_network_api(request: Request):
     """Get current network visualization data."""
-    return await get_network_data()
+    return cached_response(request, 'network')
 
 @app.get("/api/timeline")
-async def get_timeline_api():
+async def get_timeline_api(request: Request):
     """Get current timeline visualization data."""
-    return await get_timeline_data()
+    return cached_response(request, 'timeline')
 
 @app.get("/api/dashboard")
-async def get_dashboard_api():
+async def get_dashboard_api(request: Request):
     """Get current dashboard visualization data."""
-    return await get_dashboard_data()
+    return cached_response(request, 'dashboard')
 
 @app.get("/api/memory")
-async def get_memory_api():
+async def get_memory_api(request: Request):
     """Get current memory browser visualization data."""
-    return await get_memory_data()
+    return cached_response(request, 'memory')
 
 if __name__ == "__main__":
     import uvicorn